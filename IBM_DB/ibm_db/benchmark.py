@@ -0,0 +1,46 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+#  Measures query throughput with one connection per thread.  Each thread
+#  waits on its own connection, so with the GIL released around the CLI
+#  calls the throughput should grow with the number of threads.
+#
+#  Usage: python benchmark.py [threads] [queries]
+#
+
+import sys, threading, time
+import ibm_db
+import config
+
+def worker(conn, queries):
+  for i in range(queries):
+    stmt = ibm_db.exec_immediate(conn, "SELECT COUNT(*) FROM animals a, animals b, animals c")
+    ibm_db.fetch_tuple(stmt)
+    ibm_db.free_stmt(stmt)
+
+def throughput(threads, queries):
+  conns = [ibm_db.connect(config.database, config.user, config.password) for i in range(threads)]
+  workers = [threading.Thread(target=worker, args=(conn, queries)) for conn in conns]
+  start = time.time()
+  for w in workers:
+    w.start()
+  for w in workers:
+    w.join()
+  elapsed = time.time() - start
+  for conn in conns:
+    ibm_db.close(conn)
+  return threads * queries / elapsed
+
+if __name__ == '__main__':
+  threads = 4
+  queries = 200
+  if len(sys.argv) > 1:
+    threads = int(sys.argv[1])
+  if len(sys.argv) > 2:
+    queries = int(sys.argv[2])
+  single = throughput(1, queries)
+  multi = throughput(threads, queries)
+  print "1 thread:   %.1f queries/s" % single
+  print "%d threads: %.1f queries/s (%.2fx)" % (threads, multi, multi / single)
@@ -27,13 +27,18 @@
 #include <datetime.h>
 #include "ibm_db.h"
 #include <ctype.h>
+#include <time.h>
 #ifdef _WIN32
 #include <windows.h>
+#include <process.h>
+#define IBM_DB_GETPID() ((long)_getpid())
 #else
 #include <dlfcn.h>
+#include <unistd.h>
+#define IBM_DB_GETPID() ((long)getpid())
 #endif
 
-/* True global resources - no need for thread safety here */
+/* Globals of threads without a thread state dict, see _python_ibm_db_get_globals */
 static struct _ibm_db_globals *ibm_db_globals;
 
 static void _python_ibm_db_check_sql_errors( SQLHANDLE handle, SQLSMALLINT hType, int rc, int cpy_to_global, char* ret_str, int API, SQLSMALLINT recno );
@@ -81,15 +86,33 @@ typedef struct _param_cache_node {
 	char	*varname;			/* bound variable name */
 	PyObject  *var_pyvalue;			/* bound variable value */
 	SQLINTEGER	  ivalue;		/* Temp storage value */
+	SQLBIGINT	bivalue;		/* Temp storage value */
 	double	fvalue;				/* Temp storage value */
 	char	  *svalue;			/* Temp storage value */
 	SQLWCHAR *uvalue;			/* Temp storage value */
 	DATE_STRUCT *date_value;		/* Temp storage value */
 	TIME_STRUCT *time_value;		/* Temp storage value */
 	TIMESTAMP_STRUCT *ts_value;		/* Temp storage value */
+	PyObject  *stream;			/* file-like object or iterator sent at execute */
+	PyObject  *stream_chunk;		/* first chunk read from stream */
+	Py_buffer	buffer_view;		/* bytes-like value bound without a copy */
 	struct _param_cache_node *next;		/* Pointer to next node */
 } param_node;
 
+/* Counters of a statement, a connection or the process, see ibm_db.stats */
+typedef struct _ibm_db_stats_struct {
+	long calls[ST_COUNT];		/* prepare, execute and fetch calls */
+	double seconds[ST_COUNT];	/* wall time spent in them */
+	long rows_fetched;
+	long rows_affected;
+	long lob_bytes;			/* LOB data fetched and sent */
+	long cache_hits;		/* prepares served by the statement cache */
+	double gil_released;		/* seconds in CLI calls without the GIL */
+} ibm_db_call_stats;
+
+/* Counters of all the statements of the process */
+static ibm_db_call_stats ibm_db_process_stats;
+
 typedef struct _conn_handle_struct {
 	PyObject_HEAD
 	SQLHANDLE henv;
@@ -97,13 +120,60 @@ typedef struct _conn_handle_struct {
 	long auto_commit;
 	long c_bin_mode;
 	long c_case_mode;
+	long c_char_mode;
 	long c_cursor_type;
 	int handle_active;
 	SQLSMALLINT error_recno_tracker;
 	SQLSMALLINT errormsg_recno_tracker;
+	char err_state[SQL_SQLSTATE_SIZE + 1];	/* last error raised on this handle */
+	char err_msg[DB2_MAX_ERR_MSG_LEN];
 	int flag_pconnect; /* Indicates that this connection is persistent */
+	long owner_pid;		/* Process that opened the connection */
+	long query_timeout;	/* SQL_ATTR_QUERY_TIMEOUT given to its statements */
+	long fetch_buffer_size;	/* ATTR_FETCH_BUFFER_SIZE given to its statements */
+	long round_trips[RT_COUNT];	/* Requests of its statements, see ibm_db.round_trips */
+	ibm_db_call_stats stats;		/* Counters of its statements, see ibm_db.stats */
+
+	/* Prepared statement cache */
+	PyObject *stmt_cache;		/* SQL text -> idle prepared stmt_handle */
+	long stmt_cache_size;		/* Maximum number of cached statements */
+	unsigned long stmt_cache_tick;	/* Use counter for LRU eviction */
+	long stmt_cache_hits;
+	long stmt_cache_misses;
+	unsigned long stmt_cache_gen;	/* Bumped when cached statements become stale */
+
+	PyObject *pool;			/* ibm_db.Pool the connection is checked out from */
+	time_t pool_idle_since;	/* when the connection was returned to its pool */
 } conn_handle;
 
+typedef struct _ibm_db_pool_struct {
+	PyObject_HEAD
+	PyObject *dsn;
+	PyObject *uid;
+	PyObject *password;
+	PyObject *options;
+	PyObject *idle;			/* idle connections, least recently used first */
+	long min_size;
+	long max_size;
+	long max_idle;			/* seconds an idle connection above min_size is kept */
+	long validate;			/* idle seconds after which checkout pings the server */
+	long in_use;			/* checked out connections, including connects in progress */
+	long hits;
+	long misses;
+	long discarded;
+	int closed;
+
+	/* Connection settings restored on checkin */
+	int have_defaults;
+	long auto_commit;
+	long c_bin_mode;
+	long c_case_mode;
+	long c_char_mode;
+	long c_cursor_type;
+	long query_timeout;
+	long fetch_buffer_size;
+} ibm_db_pool;
+
 static void _python_ibm_db_free_conn_struct(conn_handle *handle);
 
 static PyTypeObject conn_handleType = {
@@ -149,6 +219,7 @@ static PyTypeObject conn_handleType = {
 
 typedef union {
 	SQLINTEGER i_val;
+	SQLBIGINT bi_val;
 	SQLDOUBLE d_val;
 	SQLFLOAT f_val;
 	SQLSMALLINT s_val;
@@ -163,6 +234,7 @@ typedef union {
 
 typedef struct {
 	SQLINTEGER out_length;
+	SQLINTEGER buf_length;	/* Bytes bound for a character column */
 	ibm_db_row_data_type data;
 } ibm_db_row_type;
 
@@ -175,6 +247,24 @@ typedef struct _ibm_db_result_set_info_struct {
 	unsigned char *mem_alloc;  /* Mem free */
 } ibm_db_result_set_info;
 
+/* Column-wise array of values used for block (rowset) fetch and array execute */
+typedef struct _ibm_db_rowset_col_struct {
+	SQLSMALLINT ctype;		/* C type the column is bound as */
+	SQLINTEGER elem_size;		/* Size of a single element in bytes */
+	void *buf;			/* rowset_alloc elements */
+	SQLINTEGER *ind;		/* rowset_alloc length/indicator values */
+	char **chars;			/* Decimal parameters of an array execute, per row */
+} ibm_db_rowset_col;
+
+/* Parameter description kept so a re-executed statement is not described again,
+   or declared by ibm_db.set_input_sizes(). SQL_UNKNOWN_TYPE if not known */
+typedef struct _ibm_db_param_desc_struct {
+	SQLSMALLINT data_type;
+	SQLUINTEGER precision;
+	SQLSMALLINT scale;
+	SQLSMALLINT nullable;
+} ibm_db_param_desc;
+
 typedef struct _row_hash_struct {
 	PyObject *hash;
 } row_hash_struct;
@@ -186,8 +276,23 @@ typedef struct _stmt_handle_struct {
 	long s_bin_mode;
 	long cursor_type;
 	long s_case_mode;
+	long s_char_mode;
 	SQLSMALLINT error_recno_tracker;
 	SQLSMALLINT errormsg_recno_tracker;
+	char err_state[SQL_SQLSTATE_SIZE + 1];	/* last error raised on this handle */
+	char err_msg[DB2_MAX_ERR_MSG_LEN];
+	long owner_pid;		  /* Process that allocated the statement */
+	long query_timeout;	  /* SQL_ATTR_QUERY_TIMEOUT set on hstmt */
+	long fetch_buffer_size;	  /* Bytes the rowset buffers may take, 0 for no block fetch */
+	long round_trips[RT_COUNT];	  /* Requests sent to the server, see ibm_db.round_trips */
+	ibm_db_call_stats stats;		  /* Counters, see ibm_db.stats */
+	int prepare_pending;		  /* Deferred prepare not sent yet */
+	int params_described;		  /* SQLDescribeParam called since the prepare */
+	int attrs_set;			  /* Statement attributes set by ibm_db.set_option() */
+	int sizes_declared;		  /* param_desc set by ibm_db.set_input_sizes() */
+	SQLINTEGER exec_row_count;	  /* Rows affected by the last execute, for ibm_db.stats */
+	struct _conn_handle_struct *conn_res; /* Its connection, NULL while in the statement cache */
+	unsigned long row_gen;		  /* Bumped when the cursor moves, see ibm_db.lob_reader() */
 
 	/* Parameter Caching variables */
 	param_node *head_cache_list;
@@ -198,8 +303,43 @@ typedef struct _stmt_handle_struct {
 	int num_columns;
 	ibm_db_result_set_info *column_info;
 	ibm_db_row_type *row_data;
+
+	/* Block fetch variables */
+	ibm_db_rowset_col *rowset;
+	SQLUINTEGER rowset_alloc;	  /* Number of rows the rowset buffers hold */
+	SQLUINTEGER rowset_size;	  /* Current SQL_ATTR_ROW_ARRAY_SIZE */
+	SQLUINTEGER rows_fetched;	  /* SQL_ATTR_ROWS_FETCHED_PTR target */
+	SQLINTEGER array_row_cnt;	  /* Rows of the last array execute_many, -1 if none */
+
+	/* Column names shared by the rows of fetch_assoc and fetch_both */
+	PyObject *row_names;		  /* name of each column */
+	long row_names_case;		  /* s_case_mode the names were built with */
+
+	/* Prepared statement cache variables */
+	PyObject *cache_key;		  /* SQL text if the statement can be cached */
+	struct _conn_handle_struct *cache_conn; /* Connection it returns to, NULL while cached */
+	unsigned long cache_tick;	  /* Last use, for LRU eviction */
+	unsigned long cache_gen;	  /* stmt_cache_gen of the connection at prepare */
+	ibm_db_param_desc *param_desc;	  /* Described parameters */
+	int num_param_desc;
+	int param_desc_alloc;
+
+	/* Character column buffer sizes set by ibm_db.set_output_size() */
+	long output_size;		  /* For all columns, 0 for the default */
+	PyObject *output_sizes;	  /* column index -> size */
+	char *overflow;			  /* Values longer than their bound buffer */
+	SQLINTEGER overflow_size;	  /* Bytes allocated for overflow */
 } stmt_handle;
 
+/* C type, terminator size and largest size of a character of the character
+   columns of a statement, up to 4 bytes in UTF-8 */
+#define CHAR_CTYPE(stmt_res) ((stmt_res)->s_char_mode == CHAR_WCHAR ? SQL_C_WCHAR : SQL_C_CHAR)
+#define CHAR_TERM_SIZE(stmt_res) ((stmt_res)->s_char_mode == CHAR_WCHAR ? sizeof(SQLWCHAR) : sizeof(char))
+#define CHAR_MAX_SIZE(stmt_res) ((stmt_res)->s_char_mode == CHAR_WCHAR ? sizeof(SQLWCHAR) : 4)
+
+static void _python_ibm_db_stmt_cache_trim(conn_handle *conn_res, long size);
+static void _python_ibm_db_stmt_cache_invalidate(conn_handle *conn_res);
+
 static void _python_ibm_db_free_stmt_struct(stmt_handle *handle);
 
 static PyTypeObject stmt_handleType = {
@@ -244,8 +384,10 @@ static PyTypeObject stmt_handleType = {
 /* equivalent functions on different platforms */
 #ifdef _WIN32
 #define STRCASECMP stricmp
+#define STRNCASECMP strnicmp
 #else
 #define STRCASECMP strcasecmp
+#define STRNCASECMP strncasecmp
 #endif
 
 static void python_ibm_db_init_globals(struct _ibm_db_globals *ibm_db_globals) {
@@ -258,8 +400,362 @@ static void python_ibm_db_init_globals(struct _ibm_db_globals *ibm_db_globals) {
 	memset(ibm_db_globals->__python_stmt_err_state, 0, SQL_SQLSTATE_SIZE + 1);
 }
 
+/* Key of the globals in the thread state dict and the last thread looked up */
+static PyObject *ibm_db_globals_key;
+static PyThreadState *ibm_db_globals_tstate = NULL;
+static struct _ibm_db_globals *ibm_db_globals_cached = NULL;
+
+/*	static void _python_ibm_db_free_globals(PyObject *capsule)
+	Frees the globals of a thread when its thread state is cleared
+*/
+static void _python_ibm_db_free_globals(PyObject *capsule)
+{
+	struct _ibm_db_globals *globals = (struct _ibm_db_globals *)PyCapsule_GetPointer(capsule, NULL);
+
+	if ( globals == ibm_db_globals_cached ) {
+		ibm_db_globals_cached = NULL;
+		ibm_db_globals_tstate = NULL;
+	}
+	PyMem_Del(globals);
+}
+
+/*	static struct _ibm_db_globals *_python_ibm_db_get_globals(void)
+	Returns the globals of the calling thread, creating them on first use.
+	Must be called with the GIL held
+*/
+static struct _ibm_db_globals *_python_ibm_db_get_globals(void)
+{
+	PyThreadState *tstate = PyThreadState_GET();
+	PyObject *dict = NULL, *capsule = NULL;
+	struct _ibm_db_globals *globals = NULL;
+
+	if ( tstate == ibm_db_globals_tstate && ibm_db_globals_cached != NULL ) {
+		return ibm_db_globals_cached;
+	}
+
+	dict = PyThreadState_GetDict();
+	if ( dict == NULL || ibm_db_globals_key == NULL ) {
+		return ibm_db_globals;
+	}
+	capsule = PyDict_GetItem(dict, ibm_db_globals_key);
+	if ( capsule != NULL ) {
+		globals = (struct _ibm_db_globals *)PyCapsule_GetPointer(capsule, NULL);
+	} else {
+		globals = ALLOC(struct _ibm_db_globals);
+		if ( globals == NULL ) {
+			return ibm_db_globals;
+		}
+		memset(globals, 0, sizeof(struct _ibm_db_globals));
+		python_ibm_db_init_globals(globals);
+		capsule = PyCapsule_New(globals, NULL, _python_ibm_db_free_globals);
+		if ( capsule == NULL ) {
+			PyMem_Del(globals);
+			PyErr_Clear();
+			return ibm_db_globals;
+		}
+		if ( PyDict_SetItem(dict, ibm_db_globals_key, capsule) != 0 ) {
+			Py_DECREF(capsule);
+			PyErr_Clear();
+			return ibm_db_globals;
+		}
+		Py_DECREF(capsule);
+	}
+	ibm_db_globals_tstate = tstate;
+	ibm_db_globals_cached = globals;
+	return globals;
+}
+
+/* Map CLI handles to the conn_handle or stmt_handle that owns them. They are
+ * kept apart since a connection and a statement handle may have the same value
+ */
+static PyObject *ibm_db_conn_owners;
+static PyObject *ibm_db_stmt_owners;
+
+/*	static PyObject *_python_ibm_db_owner_registry(PyTypeObject *type) */
+static PyObject *_python_ibm_db_owner_registry(PyTypeObject *type)
+{
+	return type == &conn_handleType ? ibm_db_conn_owners : ibm_db_stmt_owners;
+}
+
+/*	static PyObject *_python_ibm_db_handle_key(SQLHANDLE handle) */
+static PyObject *_python_ibm_db_handle_key(SQLHANDLE handle)
+{
+	return PyLong_FromVoidPtr((void *)(Py_intptr_t)handle);
+}
+
+/*	static void _python_ibm_db_register_handle(SQLHANDLE handle, PyObject *owner)
+	Records the owner of a CLI handle so that errors found on the CLI handle
+	are kept on the owner as well
+*/
+static void _python_ibm_db_register_handle(SQLHANDLE handle, PyObject *owner)
+{
+	PyObject *key = _python_ibm_db_handle_key(handle);
+	PyObject *value = PyLong_FromVoidPtr(owner);
+
+	if ( key == NULL || value == NULL || PyDict_SetItem(_python_ibm_db_owner_registry(Py_TYPE(owner)), key, value) != 0 ) {
+		PyErr_Clear();
+	}
+	Py_XDECREF(key);
+	Py_XDECREF(value);
+}
+
+/*	static void _python_ibm_db_unregister_handle(SQLHANDLE handle, PyObject *owner)
+	Forgets a CLI handle, unless it has been registered again by another owner.
+	It runs from deallocators, so an exception already set is kept
+*/
+static void _python_ibm_db_unregister_handle(SQLHANDLE handle, PyObject *owner)
+{
+	PyObject *key = NULL;
+	PyObject *registry = NULL;
+	PyObject *value = NULL;
+	PyObject *err_type, *err_value, *err_traceback;
+
+	PyErr_Fetch(&err_type, &err_value, &err_traceback);
+	key = _python_ibm_db_handle_key(handle);
+	if ( key != NULL ) {
+		registry = _python_ibm_db_owner_registry(Py_TYPE(owner));
+		value = PyDict_GetItem(registry, key);
+		if ( value != NULL && PyLong_AsVoidPtr(value) == (void *)owner ) {
+			PyDict_DelItem(registry, key);
+		}
+		Py_DECREF(key);
+	}
+	PyErr_Clear();
+	PyErr_Restore(err_type, err_value, err_traceback);
+}
+
+/*	static void *_python_ibm_db_handle_owner(SQLHANDLE handle, PyTypeObject *type)
+	Returns the conn_handle or stmt_handle, as type tells, owning a CLI handle
+*/
+static void *_python_ibm_db_handle_owner(SQLHANDLE handle, PyTypeObject *type)
+{
+	PyObject *key = _python_ibm_db_handle_key(handle);
+	PyObject *value = NULL;
+
+	if ( key == NULL ) {
+		PyErr_Clear();
+		return NULL;
+	}
+	value = PyDict_GetItem(_python_ibm_db_owner_registry(type), key);
+	Py_DECREF(key);
+	return value == NULL ? NULL : PyLong_AsVoidPtr(value);
+}
+
+/*	static void _python_ibm_db_count_request(stmt_handle *stmt_res, int op)
+	counts a CLI call on the statement that needs an answer from the server,
+	for the statement and its connection. With SQL_ATTR_DEFERRED_PREPARE the
+	prepare is not sent until the first describe or execute, which carries
+	it. Describing the result set once it is known, or the parameters again,
+	is answered by the driver
+*/
+static void _python_ibm_db_count_request(stmt_handle *stmt_res, int op)
+{
+	conn_handle *conn_res;
+	SQLINTEGER deferred = 0;
+	int rc;
+
+	switch (op) {
+		case RT_PREPARE:
+			stmt_res->params_described = 0;
+			rc = SQLGetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_DEFERRED_PREPARE, 
+				&deferred, SQL_IS_INTEGER, NULL);
+			stmt_res->prepare_pending = (rc != SQL_ERROR && deferred == SQL_DEFERRED_PREPARE_ON);
+			if ( stmt_res->prepare_pending ) {
+				return;
+			}
+			break;
+		case RT_DESCRIBE:
+			if ( !stmt_res->prepare_pending ) {
+				return;
+			}
+			break;
+		case RT_DESCRIBE_PARAMS:
+			if ( stmt_res->params_described ) {
+				return;
+			}
+			stmt_res->params_described = 1;
+			op = RT_DESCRIBE;
+			break;
+	}
+	stmt_res->prepare_pending = 0;
+	stmt_res->round_trips[op]++;
+	conn_res = stmt_res->conn_res;
+	if ( conn_res != NULL ) {
+		conn_res->round_trips[op]++;
+	}
+}
+
+/*	static double _python_ibm_db_clock(void)
+	seconds of a monotonic clock, to time calls
+*/
+static double _python_ibm_db_clock(void)
+{
+#ifdef _WIN32
+	LARGE_INTEGER count, frequency;
+
+	QueryPerformanceCounter(&count);
+	QueryPerformanceFrequency(&frequency);
+	return (double)count.QuadPart / (double)frequency.QuadPart;
+#else
+	struct timespec now;
+
+	clock_gettime(CLOCK_MONOTONIC, &now);
+	return now.tv_sec + now.tv_nsec / 1e9;
+#endif
+}
+
+/*	static int _python_ibm_db_stats_targets(stmt_handle *stmt_res, ibm_db_call_stats **targets)
+	stores the counters a statement event adds to, those of the statement,
+	of its connection and of the process, and returns their number
+*/
+static int _python_ibm_db_stats_targets(stmt_handle *stmt_res, ibm_db_call_stats **targets)
+{
+	conn_handle *conn_res;
+	int count = 0;
+
+	targets[count++] = &stmt_res->stats;
+	conn_res = stmt_res->conn_res;
+	if ( conn_res != NULL ) {
+		targets[count++] = &conn_res->stats;
+	}
+	targets[count++] = &ibm_db_process_stats;
+	return count;
+}
+
+/*	static void _python_ibm_db_stats_call(stmt_handle *stmt_res, int op, double start, long rows)
+	counts a call of op on the statement that started at start, and the rows
+	it fetched or affected
+*/
+static void _python_ibm_db_stats_call(stmt_handle *stmt_res, int op, double start, long rows)
+{
+	ibm_db_call_stats *targets[3];
+	double seconds = _python_ibm_db_clock() - start;
+	int i, count;
+
+	count = _python_ibm_db_stats_targets(stmt_res, targets);
+	for ( i = 0; i < count; i++ ) {
+		targets[i]->calls[op]++;
+		targets[i]->seconds[op] += seconds;
+		if ( op == ST_FETCH ) {
+			targets[i]->rows_fetched += rows;
+		} else if ( op == ST_EXECUTE ) {
+			targets[i]->rows_affected += rows;
+		}
+	}
+}
+
+/*	static void _python_ibm_db_stats_gil(stmt_handle *stmt_res, double start)
+	adds the time since start, spent in a CLI call without the GIL
+*/
+static void _python_ibm_db_stats_gil(stmt_handle *stmt_res, double start)
+{
+	ibm_db_call_stats *targets[3];
+	double seconds = _python_ibm_db_clock() - start;
+	int i, count;
+
+	count = _python_ibm_db_stats_targets(stmt_res, targets);
+	for ( i = 0; i < count; i++ ) {
+		targets[i]->gil_released += seconds;
+	}
+}
+
+/*	static int _python_ibm_db_is_lob_type(SQLSMALLINT data_type)
+	tells whether values of data_type are counted in lob_bytes
+*/
+static int _python_ibm_db_is_lob_type(SQLSMALLINT data_type)
+{
+	switch ( data_type ) {
+		case SQL_BLOB:
+		case SQL_CLOB:
+		case SQL_DBCLOB:
+		case SQL_XML:
+			return 1;
+		default:
+			return 0;
+	}
+}
+
+/*	static void _python_ibm_db_stats_lob(stmt_handle *stmt_res, long bytes)
+	counts LOB bytes fetched or sent by the statement
+*/
+static void _python_ibm_db_stats_lob(stmt_handle *stmt_res, long bytes)
+{
+	ibm_db_call_stats *targets[3];
+	int i, count;
+
+	count = _python_ibm_db_stats_targets(stmt_res, targets);
+	for ( i = 0; i < count; i++ ) {
+		targets[i]->lob_bytes += bytes;
+	}
+}
+
+/*	static void _python_ibm_db_exec_row_count(stmt_handle *stmt_res)
+	keeps the rows affected by the execute just done on the statement, 0 for
+	a query, for ibm_db.stats. Called right after the execute, without the GIL
+*/
+static void _python_ibm_db_exec_row_count(stmt_handle *stmt_res)
+{
+	SQLSMALLINT num_columns = 0;
+	SQLINTEGER row_count = 0;
+
+	stmt_res->exec_row_count = 0;
+	if ( SQLNumResultCols((SQLHSTMT)stmt_res->hstmt, &num_columns) != SQL_ERROR &&
+			num_columns == 0 &&
+			SQLRowCount((SQLHSTMT)stmt_res->hstmt, &row_count) != SQL_ERROR ) {
+		stmt_res->exec_row_count = row_count;
+	}
+}
+
+/*	static void _python_ibm_db_stats_cache_hit(stmt_handle *stmt_res)
+	counts a prepare served by the statement cache
+*/
+static void _python_ibm_db_stats_cache_hit(stmt_handle *stmt_res)
+{
+	ibm_db_call_stats *targets[3];
+	int i, count;
+
+	count = _python_ibm_db_stats_targets(stmt_res, targets);
+	for ( i = 0; i < count; i++ ) {
+		targets[i]->cache_hits++;
+	}
+}
+
+/*	static PyObject *_python_ibm_db_stats_result(stmt_handle *stmt_res, int op, double start, PyObject *result)
+	counts an execute or fetch call that started at start and returned
+	result, with the rows it affected or fetched, and returns result
+*/
+static PyObject *_python_ibm_db_stats_result(stmt_handle *stmt_res, int op, double start, PyObject *result)
+{
+	long rows = 0;
+
+	if ( result == NULL || result == Py_None || result == Py_False ) {
+		rows = 0;
+	} else if ( op == ST_FETCH ) {
+		rows = PyList_Check(result) ? (long)PyList_GET_SIZE(result) : 1;
+	} else if ( PyInt_Check(result) || PyLong_Check(result) ) {
+		/* ibm_db.execute_many() returns the rows it affected */
+		rows = PyInt_AsLong(result);
+		if ( rows == -1 && PyErr_Occurred() ) {
+			PyErr_Clear();
+		}
+	} else if ( op == ST_EXECUTE ) {
+		rows = stmt_res->exec_row_count;
+	}
+	if ( op == ST_EXECUTE ) {
+		stmt_res->exec_row_count = 0;
+	}
+	if ( rows < 0 ) {
+		rows = 0;
+	}
+	_python_ibm_db_stats_call(stmt_res, op, start, rows);
+	return result;
+}
+
 static PyObject *persistent_list;
 
+/* decimal.Decimal, imported on first use */
+static PyObject *decimal_type = NULL;
+
 char *estrdup(char *data) {
 	int len = strlen(data);
 	char *dup = ALLOC_N(char, len+1);
@@ -301,16 +797,40 @@ char *strtoupper(char *data, int max) {
 } 
 
 /*	static void _python_ibm_db_free_conn_struct */
+/*	static void _python_ibm_db_abandon_conn(conn_handle *conn_res)
+	forgets a connection inherited from the parent process across fork().
+	Its CLI handles share the session of the parent, so nothing is sent on
+	them: a rollback or disconnect would end the session of the parent
+*/
+static void _python_ibm_db_abandon_conn(conn_handle *conn_res)
+{
+	conn_res->handle_active = 0;
+	_python_ibm_db_stmt_cache_invalidate(conn_res);
+}
+
 static void _python_ibm_db_free_conn_struct(conn_handle *handle) {
 
+	_python_ibm_db_unregister_handle(handle->hdbc, (PyObject *)handle);
+	if ( handle->owner_pid != IBM_DB_GETPID() ) {
+		_python_ibm_db_abandon_conn(handle);
+	}
+	/* A connection dropped while checked out no longer counts against its pool */
+	if ( handle->pool != NULL ) {
+		((ibm_db_pool *)handle->pool)->in_use--;
+		Py_CLEAR(handle->pool);
+	}
+	/* Cached statements free their handles before the disconnect */
+	Py_CLEAR(handle->stmt_cache);
 	/* Disconnect from DB. If stmt is allocated, it is freed automatically */
 	if ( handle->handle_active && !handle->flag_pconnect) {
+		Py_BEGIN_ALLOW_THREADS;
 		if(handle->auto_commit == 0){
 			SQLEndTran(SQL_HANDLE_DBC, (SQLHDBC)handle->hdbc, SQL_ROLLBACK);
 		}
 		SQLDisconnect((SQLHDBC)handle->hdbc);
 		SQLFreeHandle(SQL_HANDLE_DBC, handle->hdbc);
 		SQLFreeHandle(SQL_HANDLE_ENV, handle->henv);
+		Py_END_ALLOW_THREADS;
 	}
 	Py_TYPE(handle)->tp_free((PyObject*)handle);
 }
@@ -322,6 +842,84 @@ static void _python_ibm_db_free_conn_struct(conn_handle *handle) {
  * }
  */
 
+/*	static void _python_ibm_db_free_row_data(stmt_handle* handle) */
+static void _python_ibm_db_free_row_data(stmt_handle* handle) {
+	int i;
+
+	/* free row data cache */
+	if (handle->row_data) {
+		for (i = 0; i<handle->num_columns; i++) {
+			switch (handle->column_info[i].type) {
+				case SQL_CHAR:
+				case SQL_VARCHAR:
+				case SQL_LONGVARCHAR:
+				case SQL_WCHAR:
+				case SQL_WVARCHAR:
+				case SQL_GRAPHIC:
+				case SQL_VARGRAPHIC:
+				case SQL_LONGVARGRAPHIC:
+				case SQL_DECIMAL:
+				case SQL_NUMERIC:
+				case SQL_XML:
+				case SQL_DECFLOAT:
+					if ( handle->row_data[i].data.str_val != NULL ) {
+						PyMem_Del(handle->row_data[i].data.str_val);
+						handle->row_data[i].data.str_val = NULL;
+					}
+					if ( handle->row_data[i].data.w_val != NULL ) {
+						PyMem_Del(handle->row_data[i].data.w_val);
+						handle->row_data[i].data.w_val = NULL;
+					}
+					break;
+				case SQL_TYPE_TIMESTAMP:
+					if ( handle->row_data[i].data.ts_val != NULL ) {
+						PyMem_Del(handle->row_data[i].data.ts_val);
+						handle->row_data[i].data.ts_val = NULL;
+					}
+					break;
+				case SQL_TYPE_DATE:
+					if ( handle->row_data[i].data.date_val != NULL ) {
+						PyMem_Del(handle->row_data[i].data.date_val);
+						handle->row_data[i].data.date_val = NULL;
+					}
+					break;
+				case SQL_TYPE_TIME:
+					if ( handle->row_data[i].data.time_val != NULL ) {
+						PyMem_Del(handle->row_data[i].data.time_val);
+						handle->row_data[i].data.time_val = NULL;
+					}
+					break;
+			}
+		}
+		PyMem_Del(handle->row_data);
+		handle->row_data = NULL;
+	}
+}
+
+/*	static void _python_ibm_db_free_rowset_data(stmt_handle* handle) */
+static void _python_ibm_db_free_rowset_data(stmt_handle* handle) {
+	int i;
+
+	/* free block fetch buffers */
+	if (handle->rowset) {
+		for (i = 0; i<handle->num_columns; i++) {
+			if ( handle->rowset[i].buf != NULL ) {
+				PyMem_Del(handle->rowset[i].buf);
+				handle->rowset[i].buf = NULL;
+			}
+			if ( handle->rowset[i].ind != NULL ) {
+				PyMem_Del(handle->rowset[i].ind);
+				handle->rowset[i].ind = NULL;
+			}
+		}
+		PyMem_Del(handle->rowset);
+		handle->rowset = NULL;
+	}
+	handle->rowset_alloc = 0;
+	handle->rowset_size = 1;
+	handle->rows_fetched = 0;
+}
+
 /*	static void _python_ibm_db_free_result_struct(stmt_handle* handle) */
 static void _python_ibm_db_free_result_struct(stmt_handle* handle) {
 	int i;
@@ -346,60 +944,18 @@ static void _python_ibm_db_free_result_struct(stmt_handle* handle) {
 				PyMem_Del(prev_ptr->uvalue);
 				prev_ptr->uvalue = NULL;
 			}
+			Py_XDECREF(prev_ptr->stream_chunk);
+			Py_XDECREF(prev_ptr->stream);
+			if ( prev_ptr->buffer_view.obj != NULL ) {
+				PyBuffer_Release(&(prev_ptr->buffer_view));
+			}
 			PyMem_Del(prev_ptr);
 
 			prev_ptr = curr_ptr;
 		}
 		handle->head_cache_list = NULL;
-		/* free row data cache */
-		if (handle->row_data) {
-			for (i = 0; i<handle->num_columns; i++) {
-				switch (handle->column_info[i].type) {
-					case SQL_CHAR:
-					case SQL_VARCHAR:
-					case SQL_LONGVARCHAR:
-					case SQL_WCHAR:
-					case SQL_WVARCHAR:
-					case SQL_GRAPHIC:
-					case SQL_VARGRAPHIC:
-					case SQL_LONGVARGRAPHIC:
-					case SQL_BIGINT:
-					case SQL_DECIMAL:
-					case SQL_NUMERIC:
-					case SQL_XML:
-					case SQL_DECFLOAT:
-						if ( handle->row_data[i].data.str_val != NULL ) {
-							PyMem_Del(handle->row_data[i].data.str_val);
-							handle->row_data[i].data.str_val = NULL;
-						}
-						if ( handle->row_data[i].data.w_val != NULL ) {
-							PyMem_Del(handle->row_data[i].data.w_val);
-							handle->row_data[i].data.w_val = NULL;
-						}
-						break;
-					case SQL_TYPE_TIMESTAMP:
-						if ( handle->row_data[i].data.ts_val != NULL ) {
-							PyMem_Del(handle->row_data[i].data.ts_val);
-							handle->row_data[i].data.ts_val = NULL;
-						}
-						break;
-					case SQL_TYPE_DATE:
-						if ( handle->row_data[i].data.date_val != NULL ) {
-							PyMem_Del(handle->row_data[i].data.date_val);
-							handle->row_data[i].data.date_val = NULL;
-						}
-						break;
-					case SQL_TYPE_TIME:
-						if ( handle->row_data[i].data.time_val != NULL ) {
-							PyMem_Del(handle->row_data[i].data.time_val);
-							handle->row_data[i].data.time_val = NULL;
-						}
-						break;
-				}
-			}
-			PyMem_Del(handle->row_data);
-			handle->row_data = NULL;
-		}
+		_python_ibm_db_free_row_data(handle);
+		_python_ibm_db_free_rowset_data(handle);
 
 		/* free column info cache */
 		if ( handle->column_info ) {
@@ -414,6 +970,8 @@ static void _python_ibm_db_free_result_struct(stmt_handle* handle) {
 			handle->column_info = NULL;
 			handle->num_columns = 0;
 		}
+		Py_CLEAR(handle->row_names);
+		handle->row_gen++;
 	}
 }
 
@@ -429,9 +987,25 @@ static stmt_handle *_ibm_db_new_stmt_struct(conn_handle* conn_res) {
 	stmt_res->s_bin_mode = conn_res->c_bin_mode;
 	stmt_res->cursor_type = conn_res->c_cursor_type;
 	stmt_res->s_case_mode = conn_res->c_case_mode;
+	stmt_res->s_char_mode = conn_res->c_char_mode;
 
 	stmt_res->head_cache_list = NULL;
 	stmt_res->current_node = NULL;
+	stmt_res->err_state[0] = '\0';
+	stmt_res->err_msg[0] = '\0';
+	stmt_res->owner_pid = conn_res->owner_pid;
+	stmt_res->query_timeout = 0;
+	stmt_res->fetch_buffer_size = conn_res->fetch_buffer_size;
+	memset(stmt_res->round_trips, 0, sizeof(stmt_res->round_trips));
+	memset(&stmt_res->stats, 0, sizeof(stmt_res->stats));
+	stmt_res->prepare_pending = 0;
+	stmt_res->params_described = 0;
+	stmt_res->attrs_set = 0;
+	stmt_res->sizes_declared = 0;
+	stmt_res->exec_row_count = 0;
+	stmt_res->row_gen = 0;
+	Py_INCREF(conn_res);
+	stmt_res->conn_res = conn_res;
 
 	stmt_res->num_params = 0;
 	stmt_res->file_param = 0;
@@ -444,24 +1018,82 @@ static stmt_handle *_ibm_db_new_stmt_struct(conn_handle* conn_res) {
 
 	stmt_res->row_data = NULL;
 
+	stmt_res->rowset = NULL;
+	stmt_res->rowset_alloc = 0;
+	stmt_res->rowset_size = 1;
+	stmt_res->rows_fetched = 0;
+	stmt_res->array_row_cnt = -1;
+
+	stmt_res->row_names = NULL;
+	stmt_res->row_names_case = CASE_NATURAL;
+
+	stmt_res->cache_key = NULL;
+	stmt_res->cache_conn = NULL;
+	stmt_res->cache_tick = 0;
+	stmt_res->cache_gen = 0;
+	stmt_res->param_desc = NULL;
+	stmt_res->num_param_desc = 0;
+	stmt_res->param_desc_alloc = 0;
+
+	stmt_res->output_size = 0;
+	stmt_res->output_sizes = NULL;
+	stmt_res->overflow = NULL;
+	stmt_res->overflow_size = 0;
+
 	return stmt_res;
 }
 
 /*	static _python_ibm_db_free_stmt_struct */
 static void _python_ibm_db_free_stmt_struct(stmt_handle *handle) {
 	if ( handle->hstmt != -1 ) {
-		SQLFreeHandle( SQL_HANDLE_STMT, handle->hstmt);
+		_python_ibm_db_unregister_handle(handle->hstmt, (PyObject *)handle);
+		/* Statements inherited across fork() are left to the parent */
+		if ( handle->owner_pid == IBM_DB_GETPID() ) {
+			Py_BEGIN_ALLOW_THREADS;
+			SQLFreeHandle( SQL_HANDLE_STMT, handle->hstmt);
+			Py_END_ALLOW_THREADS;
+		}
 		if ( handle ) {
 			_python_ibm_db_free_result_struct(handle);
 		}
 	}
+	Py_XDECREF(handle->row_names);
+	Py_XDECREF(handle->cache_key);
+	Py_XDECREF((PyObject *)handle->cache_conn);
+	Py_XDECREF((PyObject *)handle->conn_res);
+	Py_XDECREF(handle->output_sizes);
+	if ( handle->param_desc != NULL ) {
+		PyMem_Del(handle->param_desc);
+	}
+	if ( handle->overflow != NULL ) {
+		PyMem_Del(handle->overflow);
+	}
 	Py_TYPE(handle)->tp_free((PyObject*)handle);
 }
 
+/*	static void _python_ibm_db_clear_handle_error(conn_handle *conn_res, stmt_handle *stmt_res)
+	forgets the last error of a statement and of its connection, or of a 
+	connection when stmt_res is NULL, at the start of an operation on them
+*/
+static void _python_ibm_db_clear_handle_error(conn_handle *conn_res, stmt_handle *stmt_res) {
+	if ( stmt_res != NULL ) {
+		stmt_res->err_state[0] = '\0';
+		stmt_res->err_msg[0] = '\0';
+		if ( conn_res == NULL ) {
+			conn_res = stmt_res->conn_res;
+		}
+	}
+	if ( conn_res != NULL ) {
+		conn_res->err_state[0] = '\0';
+		conn_res->err_msg[0] = '\0';
+	}
+}
+
 /*	static void _python_ibm_db_init_error_info(stmt_handle *stmt_res) */
 static void _python_ibm_db_init_error_info(stmt_handle *stmt_res) {
 	stmt_res->error_recno_tracker = 1;
 	stmt_res->errormsg_recno_tracker = 1;
+	_python_ibm_db_clear_handle_error(NULL, stmt_res);
 }
 
 /*	static void _python_ibm_db_check_sql_errors( SQLHANDLE handle, SQLSMALLINT hType, int rc, int cpy_to_global, char* ret_str, int API SQLSMALLINT recno)
@@ -474,6 +1106,8 @@ static void _python_ibm_db_check_sql_errors( SQLHANDLE handle, SQLSMALLINT hType
 	SQLINTEGER sqlcode;
 	SQLSMALLINT length;
 	char *p;
+	conn_handle *conn_res = NULL;
+	stmt_handle *stmt_res = NULL;
 
 	memset(errMsg, '\0', DB2_MAX_ERR_MSG_LEN);
 	memset(msg, '\0', SQL_MAX_MESSAGE_LENGTH + 1);
@@ -497,11 +1131,21 @@ static void _python_ibm_db_check_sql_errors( SQLHANDLE handle, SQLSMALLINT hType
 							case SQL_HANDLE_DBC:
 								strncpy(IBM_DB_G(__python_conn_err_state), (char*)sqlstate, SQL_SQLSTATE_SIZE+1);
 								strncpy(IBM_DB_G(__python_conn_err_msg), (char*)errMsg, DB2_MAX_ERR_MSG_LEN);
+								conn_res = (conn_handle *)_python_ibm_db_handle_owner(handle, &conn_handleType);
+								if ( conn_res != NULL ) {
+									strncpy(conn_res->err_state, (char*)sqlstate, SQL_SQLSTATE_SIZE+1);
+									strncpy(conn_res->err_msg, (char*)errMsg, DB2_MAX_ERR_MSG_LEN);
+								}
 								break;
 
 							case SQL_HANDLE_STMT:
 								strncpy(IBM_DB_G(__python_stmt_err_state), (char*)sqlstate, SQL_SQLSTATE_SIZE+1);
 								strncpy(IBM_DB_G(__python_stmt_err_msg), (char*)errMsg, DB2_MAX_ERR_MSG_LEN);
+								stmt_res = (stmt_handle *)_python_ibm_db_handle_owner(handle, &stmt_handleType);
+								if ( stmt_res != NULL ) {
+									strncpy(stmt_res->err_state, (char*)sqlstate, SQL_SQLSTATE_SIZE+1);
+									strncpy(stmt_res->err_msg, (char*)errMsg, DB2_MAX_ERR_MSG_LEN);
+								}
 								break;
 						}
 					}
@@ -533,6 +1177,7 @@ static int _python_ibm_db_assign_options( void *handle, int type, long opt_key,
 {
 	int rc = 0;
 	long option_num = 0;
+	SQLINTEGER cursor_type = 0;
 	SQLWCHAR *option_str = NULL;
 	int isNewBuffer;
 
@@ -573,17 +1218,67 @@ static int _python_ibm_db_assign_options( void *handle, int type, long opt_key,
 			PyErr_SetString(PyExc_Exception, "Connection or statement handle must be passed in.");
 			return -1;
 		}
-	} else if (type == SQL_HANDLE_STMT) {
-		if (PyString_Check(data)|| PyUnicode_Check(data)) {
-			data = PyUnicode_FromObject(data);
-			option_str = getUnicodeDataAsSQLWCHAR(data, &isNewBuffer);
-			rc = SQLSetStmtAttrW((SQLHSTMT)((stmt_handle *)handle)->hstmt, opt_key, (SQLPOINTER)option_str, SQL_IS_INTEGER );
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-			}
-			if (isNewBuffer)
-				PyMem_Del(option_str);
-			
+	} else if (opt_key == ATTR_STMT_CACHE_SIZE) {
+		if (type != SQL_HANDLE_DBC) {
+			PyErr_SetString(PyExc_Exception, "ATTR_STMT_CACHE_SIZE attribute can only be set on a connection");
+			return -1;
+		}
+		option_num = NUM2LONG(data);
+		if (option_num < 0) {
+			PyErr_SetString(PyExc_Exception, "ATTR_STMT_CACHE_SIZE attribute must not be negative");
+			return -1;
+		}
+		((conn_handle*)handle)->stmt_cache_size = option_num;
+		_python_ibm_db_stmt_cache_trim((conn_handle*)handle, option_num);
+	} else if (opt_key == ATTR_FETCH_BUFFER_SIZE) {
+		option_num = NUM2LONG(data);
+		if (option_num < 0) {
+			PyErr_SetString(PyExc_Exception, "ATTR_FETCH_BUFFER_SIZE attribute must not be negative");
+			return -1;
+		}
+		if (type == SQL_HANDLE_STMT) {
+			((stmt_handle*)handle)->fetch_buffer_size = option_num;
+		} else if (type == SQL_HANDLE_DBC) {
+			((conn_handle*)handle)->fetch_buffer_size = option_num;
+		} else {
+			PyErr_SetString(PyExc_Exception, "Connection or statement handle must be passed in.");
+			return -1;
+		}
+	} else if (opt_key == ATTR_CHAR_MODE) {
+		option_num = NUM2LONG(data);
+		if (option_num != CHAR_WCHAR && option_num != CHAR_UTF8 && option_num != CHAR_BYTES) {
+			PyErr_SetString(PyExc_Exception, "ATTR_CHAR_MODE attribute must be one of CHAR_WCHAR, CHAR_UTF8, or CHAR_BYTES");
+			return -1;
+		}
+		if (type == SQL_HANDLE_STMT) {
+			((stmt_handle*)handle)->s_char_mode = option_num;
+		} else if (type == SQL_HANDLE_DBC) {
+			((conn_handle*)handle)->c_char_mode = option_num;
+		} else {
+			PyErr_SetString(PyExc_Exception, "Connection or statement handle must be passed in.");
+			return -1;
+		}
+	} else if (opt_key == SQL_ATTR_QUERY_TIMEOUT && type == SQL_HANDLE_DBC) {
+		/* Kept on the connection and set on each statement it executes */
+		option_num = NUM2LONG(data);
+		if (option_num < 0) {
+			PyErr_SetString(PyExc_Exception, "SQL_ATTR_QUERY_TIMEOUT attribute must not be negative");
+			return -1;
+		}
+		((conn_handle*)handle)->query_timeout = option_num;
+	} else if (type == SQL_HANDLE_STMT) {
+		if (PyString_Check(data)|| PyUnicode_Check(data)) {
+			data = PyUnicode_FromObject(data);
+			option_str = getUnicodeDataAsSQLWCHAR(data, &isNewBuffer);
+			rc = SQLSetStmtAttrW((SQLHSTMT)((stmt_handle *)handle)->hstmt, opt_key, (SQLPOINTER)option_str, SQL_IS_INTEGER );
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			} else {
+				((stmt_handle *)handle)->attrs_set = 1;
+			}
+			if (isNewBuffer)
+				PyMem_Del(option_str);
+			
 		} else {
 			option_num = NUM2LONG(data);
 			if (opt_key == SQL_ATTR_AUTOCOMMIT && option_num == SQL_AUTOCOMMIT_OFF) ((conn_handle*)handle)->auto_commit = 0;
@@ -591,13 +1286,32 @@ static int _python_ibm_db_assign_options( void *handle, int type, long opt_key,
 			rc = SQLSetStmtAttr((SQLHSTMT)((stmt_handle *)handle)->hstmt, opt_key, (SQLPOINTER)option_num, SQL_IS_INTEGER );
 			if ( rc == SQL_ERROR ) {
 				_python_ibm_db_check_sql_errors((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			} else if (opt_key == SQL_ATTR_QUERY_TIMEOUT) {
+				((stmt_handle *)handle)->query_timeout = option_num;
+			} else {
+				((stmt_handle *)handle)->attrs_set = 1;
+			}
+			if (rc != SQL_ERROR && opt_key == SQL_ATTR_CURSOR_TYPE) {
+				/* Kept for ibm_db.cursor_type(); the driver may substitute another type */
+				cursor_type = (SQLINTEGER)option_num;
+				if ( rc == SQL_SUCCESS_WITH_INFO ) {
+					SQLGetStmtAttr((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_ATTR_CURSOR_TYPE, 
+						&cursor_type, SQL_IS_INTEGER, NULL);
+				}
+				((stmt_handle *)handle)->cursor_type = cursor_type;
 			}
 		}
 	} else if (type == SQL_HANDLE_DBC) {
+		if (opt_key == SQL_ATTR_CURRENT_SCHEMA) {
+			/* Unqualified names in cached statements resolve to the old schema */
+			_python_ibm_db_stmt_cache_invalidate((conn_handle*)handle);
+		}
 		if (PyString_Check(data)|| PyUnicode_Check(data)) {
 			data = PyUnicode_FromObject(data);
 			option_str = getUnicodeDataAsSQLWCHAR(data, &isNewBuffer);
+			Py_BEGIN_ALLOW_THREADS;
 			rc = SQLSetConnectAttrW((SQLHSTMT)((conn_handle*)handle)->hdbc, opt_key, (SQLPOINTER)option_str, SQL_NTS);
+			Py_END_ALLOW_THREADS;
 			if ( rc == SQL_ERROR ) {
 				_python_ibm_db_check_sql_errors((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
 			}
@@ -608,7 +1322,9 @@ static int _python_ibm_db_assign_options( void *handle, int type, long opt_key,
 			option_num = NUM2LONG(data);
 			if (opt_key == SQL_ATTR_AUTOCOMMIT && option_num == SQL_AUTOCOMMIT_OFF) ((conn_handle*)handle)->auto_commit = 0;
 			else if (opt_key == SQL_ATTR_AUTOCOMMIT && option_num == SQL_AUTOCOMMIT_ON) ((conn_handle*)handle)->auto_commit = 1;
+			Py_BEGIN_ALLOW_THREADS;
 			rc = SQLSetConnectAttrW((SQLHSTMT)((conn_handle*)handle)->hdbc, opt_key, (SQLPOINTER)option_num, SQL_IS_INTEGER);
+			Py_END_ALLOW_THREADS;
 			if ( rc == SQL_ERROR ) {
 				_python_ibm_db_check_sql_errors((SQLHSTMT)((stmt_handle *)handle)->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
 			}
@@ -667,6 +1383,7 @@ static int _python_ibm_db_get_result_set_info(stmt_handle *stmt_res)
 	SQLSMALLINT nResultCols = 0, name_length;
 	SQLCHAR tmp_name[BUFSIZ];
 
+	_python_ibm_db_count_request(stmt_res, RT_DESCRIBE);
 	Py_BEGIN_ALLOW_THREADS;
 	rc = SQLNumResultCols((SQLHSTMT)stmt_res->hstmt, &nResultCols);
 	Py_END_ALLOW_THREADS;
@@ -740,6 +1457,27 @@ static int _python_ibm_db_get_result_set_info(stmt_handle *stmt_res)
 	return 0;
 }
 
+/*	static long _python_ibm_db_output_size(stmt_handle *stmt_res, int col)
+	returns the characters bound for a character column, set with
+	ibm_db.set_output_size(), 0 for the default
+*/
+static long _python_ibm_db_output_size(stmt_handle *stmt_res, int col)
+{
+	PyObject *key, *size = NULL;
+
+	if ( stmt_res->output_sizes != NULL ) {
+		key = PyInt_FromLong(col);
+		if ( key != NULL ) {
+			size = PyDict_GetItem(stmt_res->output_sizes, key);
+			Py_DECREF(key);
+		}
+		if ( size != NULL ) {
+			return PyInt_AsLong(size);
+		}
+	}
+	return stmt_res->output_size;
+}
+
 /*	static int _python_ibn_bind_column_helper(stmt_handle *stmt_res)
 	bind columns to data, this must be done once
 */
@@ -748,6 +1486,7 @@ static int _python_ibm_db_bind_column_helper(stmt_handle *stmt_res)
 	SQLINTEGER in_length = 0;
 	SQLSMALLINT column_type;
 	ibm_db_row_data_type *row_data;
+	long output_size;
 	int i, rc = SQL_SUCCESS;
 
 	stmt_res->row_data = ALLOC_N(ibm_db_row_type, stmt_res->num_columns);
@@ -770,9 +1509,23 @@ static int _python_ibm_db_bind_column_helper(stmt_handle *stmt_res)
 			case SQL_VARGRAPHIC:
 			case SQL_LONGVARGRAPHIC:
 				in_length = stmt_res->column_info[i].size+1;
-				row_data->w_val = (SQLWCHAR *) ALLOC_N(SQLWCHAR, in_length);
+				/* Longer values are read into the overflow buffer when fetched */
+				output_size = _python_ibm_db_output_size(stmt_res, i);
+				if ( output_size == 0 ) {
+					output_size = COLUMN_INLINE_SIZE;
+				}
+				if ( output_size < stmt_res->column_info[i].size ) {
+					in_length = output_size + 1;
+				}
+				stmt_res->row_data[i].buf_length = (in_length - 1) * CHAR_MAX_SIZE(stmt_res) + 
+					CHAR_TERM_SIZE(stmt_res);
+				row_data->w_val = (SQLWCHAR *) ALLOC_N(char, stmt_res->row_data[i].buf_length);
+				if ( row_data->w_val == NULL ) {
+					PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+					return -1;
+				}
 				rc = SQLBindCol((SQLHSTMT)stmt_res->hstmt, (SQLUSMALLINT)(i+1),
-					SQL_C_WCHAR, row_data->w_val, in_length * sizeof(SQLWCHAR),
+					CHAR_CTYPE(stmt_res), row_data->w_val, stmt_res->row_data[i].buf_length,
 					(SQLINTEGER *)(&stmt_res->row_data[i].out_length));
 				if ( rc == SQL_ERROR ) {
 					_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
@@ -826,6 +1579,20 @@ static int _python_ibm_db_bind_column_helper(stmt_handle *stmt_res)
 				break;
 
 			case SQL_BIGINT:
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindCol((SQLHSTMT)stmt_res->hstmt, (SQLUSMALLINT)(i+1),
+					SQL_C_SBIGINT, &row_data->bi_val, 
+					sizeof(row_data->bi_val),
+					(SQLINTEGER *)(&stmt_res->row_data[i].out_length));
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
+						SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+				}
+				break;
+
 			case SQL_DECFLOAT:
 				in_length = stmt_res->column_info[i].size+2;
 				row_data->str_val = (SQLCHAR *)ALLOC_N(char, in_length);
@@ -1021,2175 +1788,2367 @@ static int _python_ibm_db_bind_column_helper(stmt_handle *stmt_res)
 	return rc;
 }
 
-/*	static void _python_ibm_db_clear_stmt_err_cache () */
-static void _python_ibm_db_clear_stmt_err_cache(void)
+/*	static void _python_ibm_db_unbind_columns(stmt_handle *stmt_res)
+	drop the column bindings of both fetch modes and go back to single row fetch
+*/
+static void _python_ibm_db_unbind_columns(stmt_handle *stmt_res)
 {
-	memset(IBM_DB_G(__python_stmt_err_msg), 0, DB2_MAX_ERR_MSG_LEN);
-	memset(IBM_DB_G(__python_stmt_err_state), 0, SQL_SQLSTATE_SIZE + 1);
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_UNBIND);
+	if ( stmt_res->rowset_size != 1 ) {
+		SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_ROW_ARRAY_SIZE, 
+			(SQLPOINTER)1, SQL_IS_INTEGER);
+	}
+	if ( stmt_res->rowset != NULL ) {
+		SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_ROWS_FETCHED_PTR, 
+			NULL, SQL_IS_INTEGER);
+	}
+	_python_ibm_db_free_row_data(stmt_res);
+	_python_ibm_db_free_rowset_data(stmt_res);
 }
 
-/*	static int _python_ibm_db_connect_helper( argc, argv, isPersistent ) */
-static PyObject *_python_ibm_db_connect_helper( PyObject *self, PyObject *args, int isPersistent )
+/* Statements that change the objects or name resolution cached plans depend on */
+static const char *ibm_db_ddl_keywords[] = { "CREATE", "ALTER", "DROP", "RENAME",
+	"TRUNCATE", "GRANT", "REVOKE", "COMMENT", "SET", NULL };
+
+/*	static int _python_ibm_db_is_ddl(PyObject *py_stmt)
+	whether the statement text starts with one of ibm_db_ddl_keywords
+*/
+static int _python_ibm_db_is_ddl(PyObject *py_stmt)
 {
-	PyObject *databaseObj = NULL;
-	PyObject *uidObj = NULL;
-	PyObject *passwordObj = NULL;
-	SQLWCHAR *database = NULL;
-	SQLWCHAR *uid = NULL;
-	SQLWCHAR *password = NULL;
-	PyObject *options = NULL;
-	PyObject *literal_replacementObj = NULL;
-	SQLINTEGER literal_replacement;
-	PyObject *equal = StringOBJ_FromASCII("=");
-	int rc = 0;
-	SQLINTEGER conn_alive;
-	conn_handle *conn_res = NULL;
-	int reused = 0;
-	PyObject *hKey = NULL;
-	PyObject *entry = NULL;
-	char server[2048];
-	int isNewBuffer;
-	
-	conn_alive = 1;	
+	PyObject *head, *ascii;
+	char *p;
+	int i, len, is_ddl = 0;
 
-	if (!PyArg_ParseTuple(args, "OOO|OO", &databaseObj, &uidObj, &passwordObj, &options, &literal_replacementObj)){
-		return NULL;
+	head = PySequence_GetSlice(py_stmt, 0, 64);
+	if ( head == NULL ) {
+		PyErr_Clear();
+		return 0;
 	}
-	do {
-		databaseObj = PyUnicode_FromObject(databaseObj);
-		uidObj = PyUnicode_FromObject(uidObj);
-		passwordObj = PyUnicode_FromObject(passwordObj);
-
-		/* Check if we already have a connection for this userID & database 
-		* combination
-		*/ 
-		if (isPersistent) {
-			hKey = PyUnicode_Concat(StringOBJ_FromASCII("__ibm_db_"), uidObj);
-			hKey = PyUnicode_Concat(hKey, databaseObj);
-			hKey = PyUnicode_Concat(hKey, passwordObj);
+	ascii = PyUnicode_AsEncodedString(head, "ascii", "replace");
+	Py_DECREF(head);
+	if ( ascii == NULL ) {
+		PyErr_Clear();
+		return 0;
+	}
+	p = PyBytes_AsString(ascii);
+	while ( isspace((unsigned char)*p) || *p == '(' ) {
+		p++;
+	}
+	for ( i = 0; ibm_db_ddl_keywords[i] != NULL; i++ ) {
+		len = strlen(ibm_db_ddl_keywords[i]);
+		if ( STRNCASECMP(p, ibm_db_ddl_keywords[i], len) == 0 &&
+				!isalnum((unsigned char)p[len]) && p[len] != '_' ) {
+			is_ddl = 1;
+			break;
+		}
+	}
+	Py_DECREF(ascii);
+	return is_ddl;
+}
 
-			entry = PyDict_GetItem(persistent_list, hKey);
+/*	static void _python_ibm_db_stmt_cache_trim(conn_handle *conn_res, long size)
+	evicts the least recently used statements until at most size are cached
+*/
+static void _python_ibm_db_stmt_cache_trim(conn_handle *conn_res, long size)
+{
+	PyObject *key, *value, *lru_key;
+	Py_ssize_t pos;
+	unsigned long lru_tick;
 
-			if (entry != NULL) {
-				Py_INCREF(entry);
-				conn_res = (conn_handle *)entry;
-#ifndef PASE /* i5/OS server mode is persistant */
-				/* Need to reinitialize connection? */
-				rc = SQLGetConnectAttr(conn_res->hdbc, SQL_ATTR_PING_DB, 
-					(SQLPOINTER)&conn_alive, 0, NULL);
-				if ( (rc == SQL_SUCCESS) && conn_alive ) {
-					_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, 
-						rc, 1, NULL, -1, 1);
-					reused = 1;
-				} /* else will re-connect since connection is dead */
-#endif /* PASE */
-				reused = 1;
+	if ( conn_res->stmt_cache == NULL ) {
+		return;
+	}
+	if ( size <= 0 ) {
+		Py_CLEAR(conn_res->stmt_cache);
+		return;
+	}
+	while ( PyDict_Size(conn_res->stmt_cache) > size ) {
+		pos = 0;
+		lru_key = NULL;
+		lru_tick = 0;
+		while ( PyDict_Next(conn_res->stmt_cache, &pos, &key, &value) ) {
+			if ( lru_key == NULL || ((stmt_handle *)value)->cache_tick < lru_tick ) {
+				lru_key = key;
+				lru_tick = ((stmt_handle *)value)->cache_tick;
 			}
-		} else {
-			/* Need to check for max pconnections? */
 		}
+		Py_INCREF(lru_key);
+		PyDict_DelItem(conn_res->stmt_cache, lru_key);
+		Py_DECREF(lru_key);
+	}
+}
 
-		if ( !NIL_P(literal_replacementObj) ) {
-			literal_replacement = (SQLINTEGER) PyInt_AsLong(literal_replacementObj);
-		} else {
-			literal_replacement = SET_QUOTED_LITERAL_REPLACEMENT_OFF; /*QUOTED LITERAL replacemnt is OFF by default*/
-		}
-				
-		if (conn_res == NULL) {
-			conn_res = PyObject_NEW(conn_handle, &conn_handleType);
-			conn_res->henv = 0;
-			conn_res->hdbc = 0;
-		}
+/*	static void _python_ibm_db_stmt_cache_invalidate(conn_handle *conn_res)
+	frees the cached statements and keeps the ones in use from being cached again
+*/
+static void _python_ibm_db_stmt_cache_invalidate(conn_handle *conn_res)
+{
+	conn_res->stmt_cache_gen++;
+	Py_CLEAR(conn_res->stmt_cache);
+}
 
-		/* We need to set this early, in case we get an error below,
-		so we know how to free the connection */
-		conn_res->flag_pconnect = isPersistent;
-		/* Allocate ENV handles if not present */
-		if ( !conn_res->henv ) {
-			rc = SQLAllocHandle(SQL_HANDLE_ENV, SQL_NULL_HANDLE, &(conn_res->henv));
-			if (rc != SQL_SUCCESS) {
-				_python_ibm_db_check_sql_errors( conn_res->henv, SQL_HANDLE_ENV, rc,
-					1, NULL, -1, 1);
-				break;
-			}
-			rc = SQLSetEnvAttr((SQLHENV)conn_res->henv, SQL_ATTR_ODBC_VERSION, 
-				(void *)SQL_OV_ODBC3, 0);
-		}
+/*	static int _python_ibm_db_stmt_cache_usable(conn_handle *conn_res, stmt_handle *stmt_res)
+	whether a cached statement behaves like one newly prepared on the connection.
+	The query timeout is given back on reuse, other attributes set on the
+	handle would stay with it
+*/
+static int _python_ibm_db_stmt_cache_usable(conn_handle *conn_res, stmt_handle *stmt_res)
+{
+	return conn_res->handle_active && conn_res->stmt_cache_size > 0 &&
+		stmt_res->cache_gen == conn_res->stmt_cache_gen && !stmt_res->attrs_set &&
+		stmt_res->cursor_type == conn_res->c_cursor_type &&
+		stmt_res->s_case_mode == conn_res->c_case_mode &&
+		stmt_res->s_char_mode == conn_res->c_char_mode &&
+		stmt_res->s_bin_mode == conn_res->c_bin_mode;
+}
 
-		if (!reused) {
-			/* Alloc CONNECT Handle */
-			rc = SQLAllocHandle(SQL_HANDLE_DBC, conn_res->henv, &(conn_res->hdbc));
-			if (rc != SQL_SUCCESS) {
-				_python_ibm_db_check_sql_errors(conn_res->henv, SQL_HANDLE_ENV, rc, 
-					1, NULL, -1, 1);
-				break;
-			}
+/*	static stmt_handle *_python_ibm_db_stmt_cache_get(conn_handle *conn_res, PyObject *py_stmt)
+	takes the prepared statement for the SQL text out of the cache, NULL if
+	there is none
+*/
+static stmt_handle *_python_ibm_db_stmt_cache_get(conn_handle *conn_res, PyObject *py_stmt)
+{
+	stmt_handle *stmt_res;
+
+	if ( conn_res->stmt_cache == NULL ) {
+		return NULL;
+	}
+	stmt_res = (stmt_handle *)PyDict_GetItem(conn_res->stmt_cache, py_stmt);
+	if ( stmt_res == NULL ) {
+		return NULL;
+	}
+	Py_INCREF(stmt_res);
+	PyDict_DelItem(conn_res->stmt_cache, py_stmt);
+	if ( !_python_ibm_db_stmt_cache_usable(conn_res, stmt_res) ) {
+		Py_DECREF(stmt_res);
+		return NULL;
+	}
+	stmt_res->cache_tick = ++conn_res->stmt_cache_tick;
+	Py_INCREF(conn_res);
+	stmt_res->cache_conn = conn_res;
+	Py_INCREF(conn_res);
+	stmt_res->conn_res = conn_res;
+	return stmt_res;
+}
+
+/*	static int _python_ibm_db_stmt_cache_put(stmt_handle *stmt_res)
+	closes the cursor of a statement taken from ibm_db.prepare() and moves its
+	prepared handle into the cache of the connection. stmt_res is left freed.
+	Returns 1 if the handle was cached
+*/
+static int _python_ibm_db_stmt_cache_put(stmt_handle *stmt_res)
+{
+	conn_handle *conn_res = stmt_res->cache_conn;
+	stmt_handle *cached;
+
+	if ( conn_res == NULL || stmt_res->cache_key == NULL || stmt_res->hstmt == -1 ||
+			!_python_ibm_db_stmt_cache_usable(conn_res, stmt_res) ) {
+		return 0;
+	}
+	if ( conn_res->stmt_cache == NULL ) {
+		conn_res->stmt_cache = PyDict_New();
+		if ( conn_res->stmt_cache == NULL ) {
+			PyErr_Clear();
+			return 0;
 		}
+	} else if ( PyDict_GetItem(conn_res->stmt_cache, stmt_res->cache_key) != NULL ) {
+		/* The same statement is prepared on another cursor and already cached */
+		return 0;
+	}
 
-		/* Set this after the connection handle has been allocated to avoid
-		unnecessary network flows. Initialize the structure to default values */
-		conn_res->auto_commit = SQL_AUTOCOMMIT_ON;
-		rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, 
-			(SQLPOINTER)(conn_res->auto_commit), SQL_NTS);
+	Py_BEGIN_ALLOW_THREADS;
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_RESET_PARAMS);
+	Py_END_ALLOW_THREADS;
+	_python_ibm_db_unbind_columns(stmt_res);
+	_python_ibm_db_free_result_struct(stmt_res);
+
+	/* Hand the prepared handle over to a fresh statement object */
+	cached = _ibm_db_new_stmt_struct(conn_res);
+	/* The cache of the connection holds cached, which must not hold it back */
+	Py_CLEAR(cached->conn_res);
+	_python_ibm_db_unregister_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+	cached->hstmt = stmt_res->hstmt;
+	_python_ibm_db_register_handle(cached->hstmt, (PyObject *)cached);
+	cached->cache_key = stmt_res->cache_key;
+	cached->cache_tick = ++conn_res->stmt_cache_tick;
+	cached->cache_gen = stmt_res->cache_gen;
+	cached->query_timeout = stmt_res->query_timeout;
+	cached->prepare_pending = stmt_res->prepare_pending;
+	if ( !stmt_res->sizes_declared ) {
+		/* Declared sizes belong to the statement object, the next user describes */
+		cached->param_desc = stmt_res->param_desc;
+		cached->num_param_desc = stmt_res->num_param_desc;
+		cached->param_desc_alloc = stmt_res->param_desc_alloc;
+		cached->params_described = stmt_res->params_described;
+		stmt_res->param_desc = NULL;
+		stmt_res->num_param_desc = 0;
+		stmt_res->param_desc_alloc = 0;
+	}
+	stmt_res->hstmt = -1;
+	stmt_res->cache_key = NULL;
+
+	if ( PyDict_SetItem(conn_res->stmt_cache, cached->cache_key, (PyObject *)cached) != 0 ) {
+		PyErr_Clear();
+	}
+	Py_DECREF(cached);
+	_python_ibm_db_stmt_cache_trim(conn_res, conn_res->stmt_cache_size);
+	Py_CLEAR(stmt_res->cache_conn);
+	return 1;
+}
 
-		conn_res->c_bin_mode = IBM_DB_G(bin_mode);
-		conn_res->c_case_mode = CASE_NATURAL;
-		conn_res->c_cursor_type = SQL_SCROLL_FORWARD_ONLY;
+/*	static PyObject *_python_ibm_db_char_value(stmt_handle *stmt_res, void *data, SQLINTEGER length)
+	builds the value of length bytes of character data fetched in the
+	ATTR_CHAR_MODE of the statement
+*/
+static PyObject *_python_ibm_db_char_value(stmt_handle *stmt_res, void *data, SQLINTEGER length)
+{
+	switch ( stmt_res->s_char_mode ) {
+		case CHAR_UTF8:
+			return PyUnicode_DecodeUTF8((char *)data, length, NULL);
+		case CHAR_BYTES:
+			return PyBytes_FromStringAndSize((char *)data, length);
+		default:
+			return getSQLWCharAsPyUnicodeObject((SQLWCHAR *)data, length);
+	}
+}
 
-		conn_res->error_recno_tracker = 1;
-		conn_res->errormsg_recno_tracker = 1;
+/*	static long _python_ibm_db_rowset_col_size(stmt_handle *stmt_res, int col, SQLSMALLINT *ctype)
+	size of one element of a column bound for block fetch. Returns 0 if the
+	column is not bound and -1 if it has to be read with SQLGetData
+*/
+static long _python_ibm_db_rowset_col_size(stmt_handle *stmt_res, int col, SQLSMALLINT *ctype)
+{
+	long size = stmt_res->column_info[col].size;
+	long elem_size = 0;
 
-		/* handle not active as of yet */
-		conn_res->handle_active = 0;
+	switch(stmt_res->column_info[col].type) {
+		case SQL_CHAR:
+		case SQL_VARCHAR:
+		case SQL_WCHAR:
+		case SQL_WVARCHAR:
+		case SQL_GRAPHIC:
+		case SQL_VARGRAPHIC:
+		case SQL_LONGVARGRAPHIC:
+			*ctype = CHAR_CTYPE(stmt_res);
+			elem_size = size * CHAR_MAX_SIZE(stmt_res) + CHAR_TERM_SIZE(stmt_res);
+			break;
 
-		/* Set Options */
-		if ( !NIL_P(options) ) {
-			if(!PyDict_Check(options)) {
-				PyErr_SetString(PyExc_Exception, "options Parameter must be of type dictionay");
-				return NULL;
+		case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+		case SQL_LONGVARBINARY:
+#endif /* PASE */
+		case SQL_VARBINARY:
+			if ( stmt_res->s_bin_mode == CONVERT ) {
+				*ctype = SQL_C_CHAR;
+				elem_size = 2 * size + 1;
+			} else {
+				*ctype = SQL_C_DEFAULT;
+				elem_size = size + 1;
 			}
-			rc = _python_ibm_db_parse_options( options, SQL_HANDLE_DBC, conn_res );
-			if (rc != SQL_SUCCESS) {
-				SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
-				SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
-				break;
-			}
-		}
+			break;
 
-		if (! reused) {
-			/* Connect */
-			/* If the string contains a =, use SQLDriverConnect */
-			if (NIL_P(databaseObj)) {
-				PyErr_SetString(PyExc_Exception, "Supplied Parameter is invalid");
-				return NULL;
-			}
-			database = getUnicodeDataAsSQLWCHAR(databaseObj, &isNewBuffer);
-			if ( PyUnicode_Contains(databaseObj, equal) > 0 ) {
-				rc = SQLDriverConnectW((SQLHDBC)conn_res->hdbc, (SQLHWND)NULL,
-					database, SQL_NTS, NULL, 0, NULL, 
-					SQL_DRIVER_NOPROMPT );
-			} else {
-				if (NIL_P(uidObj) || NIL_P(passwordObj)) { 
-					PyErr_SetString(PyExc_Exception, "Supplied Parameter is invalid");
-					return NULL;
-				}
-				uid = getUnicodeDataAsSQLWCHAR(uidObj, &isNewBuffer);
-				password = getUnicodeDataAsSQLWCHAR(passwordObj, &isNewBuffer);
-				rc = SQLConnectW((SQLHDBC)conn_res->hdbc,
-					database,
-					PyUnicode_GetSize(databaseObj),
-					uid, 
-					PyUnicode_GetSize(uidObj),
-					password,
-					PyUnicode_GetSize(passwordObj));
-			} 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
-					1, NULL, -1, 1);
-				SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
-				SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
-				break;
-			}
-			
-#ifdef CLI_DBC_SERVER_TYPE_DB2LUW
-#ifdef SQL_ATTR_DECFLOAT_ROUNDING_MODE
-			/**
-			* Code for setting SQL_ATTR_DECFLOAT_ROUNDING_MODE
-			* for implementation of Decfloat Datatype
-			*/
+		case SQL_BIGINT:
+			*ctype = SQL_C_SBIGINT;
+			elem_size = sizeof(SQLBIGINT);
+			break;
 
-			rc = _python_ibm_db_set_decfloat_rounding_mode_client(conn_res->hdbc);
-			if (rc != SQL_SUCCESS){
-				  _python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc,
-								  1, NULL, -1, 1);
-			}
-#endif
-#endif
+		case SQL_DECFLOAT:
+			*ctype = SQL_C_CHAR;
+			elem_size = size + 2;
+			break;
 
-			/* Get the server name */
-			memset(server, 0, sizeof(server));
+		case SQL_DECIMAL:
+		case SQL_NUMERIC:
+			*ctype = SQL_C_CHAR;
+			elem_size = size + stmt_res->column_info[col].scale + 2 + 1;
+			break;
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLGetInfo(conn_res->hdbc, SQL_DBMS_NAME, (SQLPOINTER)server, 
-				2048, NULL);
-			Py_END_ALLOW_THREADS;
+		case SQL_TYPE_DATE:
+			*ctype = SQL_C_TYPE_DATE;
+			elem_size = sizeof(DATE_STRUCT);
+			break;
 
-			if (!strcmp(server, "AS")) is_systemi = 1;
-			if (!strncmp(server, "IDS", 3)) is_informix = 1;
+		case SQL_TYPE_TIME:
+			*ctype = SQL_C_TYPE_TIME;
+			elem_size = sizeof(TIME_STRUCT);
+			break;
 
-			/* Set SQL_ATTR_REPLACE_QUOTED_LITERALS connection attribute to
-			* enable CLI numeric literal feature. This is equivalent to
-			* PATCH2=71 in the db2cli.ini file
-			* Note, for backward compatibility with older CLI drivers having a
-			* different value for SQL_ATTR_REPLACE_QUOTED_LITERALS, we call
-			* SQLSetConnectAttr() with both the old and new value
-			*/
-			/* Only enable this feature if we are not connected to an Informix data 
-			* server 
-			*/
-			if (!is_informix && (literal_replacement == SET_QUOTED_LITERAL_REPLACEMENT_ON)) {
-				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, 
-					SQL_ATTR_REPLACE_QUOTED_LITERALS, 
-					(SQLPOINTER) (ENABLE_NUMERIC_LITERALS), 
-					SQL_IS_INTEGER);
-				if (rc != SQL_SUCCESS)
-					rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc,
-					SQL_ATTR_REPLACE_QUOTED_LITERALS_OLDVALUE,
-					(SQLPOINTER)(ENABLE_NUMERIC_LITERALS), 
-					SQL_IS_INTEGER);
-			}
-			if (rc != SQL_SUCCESS) {
-				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
-					1, NULL, -1, 1);
-			}
-		}
-		Py_XDECREF(databaseObj);
-		Py_XDECREF(uidObj);
-		Py_XDECREF(passwordObj);
-		conn_res->handle_active = 1;
-	} while (0);
+		case SQL_TYPE_TIMESTAMP:
+			*ctype = SQL_C_TYPE_TIMESTAMP;
+			elem_size = sizeof(TIMESTAMP_STRUCT);
+			break;
 
-	if (hKey != NULL) {
-		if (! reused && rc == SQL_SUCCESS) {
-			/* If we created a new persistent connection, add it to the 
-			*  persistent_list
-			*/
-			PyDict_SetItem(persistent_list, hKey, (PyObject *)conn_res);
-		}
-		Py_DECREF(hKey);
-	}
+		case SQL_SMALLINT:
+			*ctype = SQL_C_DEFAULT;
+			elem_size = sizeof(SQLSMALLINT);
+			break;
 
-	if (isNewBuffer) {
-		PyMem_Del(database);
-		PyMem_Del(uid);
-		PyMem_Del(password);
+		case SQL_INTEGER:
+			*ctype = SQL_C_DEFAULT;
+			elem_size = sizeof(SQLINTEGER);
+			break;
+
+		case SQL_REAL:
+			*ctype = SQL_C_FLOAT;
+			elem_size = sizeof(SQLREAL);
+			break;
+
+		case SQL_FLOAT:
+			*ctype = SQL_C_DEFAULT;
+			elem_size = sizeof(SQLFLOAT);
+			break;
+
+		case SQL_DOUBLE:
+			*ctype = SQL_C_DEFAULT;
+			elem_size = sizeof(SQLDOUBLE);
+			break;
+
+#ifndef PASE /* i5/OS SQL_LONGVARCHAR is SQL_VARCHAR */
+		case SQL_LONGVARCHAR:
+		case SQL_WLONGVARCHAR:
+#endif /* PASE */
+		case SQL_BLOB:
+		case SQL_CLOB:
+		case SQL_DBCLOB:
+		case SQL_XML:
+			return -1;
+
+		default:
+			return 0;
 	}
-	
-	if ( rc != SQL_SUCCESS ) {
-		if (conn_res != NULL && conn_res->handle_active) {
-			rc = SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
-			rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
-		}
-		if (conn_res != NULL) {
-			PyObject_Del(conn_res);
-		}
-		return NULL;						  
-	} 
-	return (PyObject *)conn_res;
+	/* very long columns are fetched row by row */
+	if ( elem_size > stmt_res->fetch_buffer_size ) {
+		return -1;
+	}
+	return elem_size;
 }
 
-
-/**
-*This function takes a SQLWCHAR buffer (UCS-2) and returns back a PyUnicode object 
-* of it that is in the correct current UCS encoding (either UCS2 or UCS4)of
-* the current executing python VM
-*
-* @sqlwcharBytesLen - the length of sqlwcharData in bytes (not characters)
-**/
-static PyObject* getSQLWCharAsPyUnicodeObject(SQLWCHAR* sqlwcharData, int sqlwcharBytesLen)
+/*	static long _python_ibm_db_rowset_limit(stmt_handle *stmt_res)
+	number of rows that fit in the fetch buffer size of the statement, -1 if
+	the result set cannot be fetched in blocks
+*/
+static long _python_ibm_db_rowset_limit(stmt_handle *stmt_res)
 {
-	PyObject *sysmodule = NULL, *maxuni = NULL;
-	long maxuniValue;
-	PyObject* u;
-	sysmodule = PyImport_ImportModule("sys");
-	maxuni = PyObject_GetAttrString(sysmodule, "maxunicode");
-	maxuniValue = PyInt_AsLong(maxuni);
+	long elem_size, row_width = 0;
+	SQLSMALLINT ctype;
+	int i;
 
-	if (maxuniValue <= 65536) {
-	/* this is UCS2 python.. nothing to do really */
-		return PyUnicode_FromUnicode((Py_UNICODE *)sqlwcharData, sqlwcharBytesLen / sizeof(SQLWCHAR));
-    	}
-	
-	if (is_bigendian()) {
-		int bo = 1;
-		u = PyUnicode_DecodeUTF16((char *)sqlwcharData, sqlwcharBytesLen, "strict", &bo);
-	} else {
-		int bo = -1;
-		u = PyUnicode_DecodeUTF16((char *)sqlwcharData, sqlwcharBytesLen, "strict", &bo);
+	for (i = 0; i < stmt_res->num_columns; i++) {
+		elem_size = _python_ibm_db_rowset_col_size(stmt_res, i, &ctype);
+		if ( elem_size < 0 ) {
+			return -1;
+		}
+		row_width += elem_size + sizeof(SQLINTEGER);
 	}
-	return u;
+	if ( row_width == 0 || row_width >= stmt_res->fetch_buffer_size ) {
+		return 1;
+	}
+	return stmt_res->fetch_buffer_size / row_width;
 }
 
+/*	static int _python_ibm_db_bind_rowset_helper(stmt_handle *stmt_res, SQLUINTEGER nrows)
+	bind columns to arrays of nrows elements for block fetch
+*/
+static int _python_ibm_db_bind_rowset_helper(stmt_handle *stmt_res, SQLUINTEGER nrows)
+{
+	ibm_db_rowset_col *rowset_col;
+	int i, rc = SQL_SUCCESS;
 
-/**
-*This function takes value as pyObject and convert it to SQLWCHAR and return it 
-*
-**/
-static SQLWCHAR* getUnicodeDataAsSQLWCHAR(PyObject *pyobj, int *isNewBuffer)
-{	
-	PyObject *sysmodule = NULL, *maxuni = NULL;
-	long maxuniValue;
-	PyObject *pyUTFobj;
-	SQLWCHAR* pNewBuffer = NULL;
-	int nCharLen = PyUnicode_GET_SIZE(pyobj);
-
-	sysmodule = PyImport_ImportModule("sys");
-	maxuni = PyObject_GetAttrString(sysmodule, "maxunicode");
-	maxuniValue = PyInt_AsLong(maxuni);
+	/* Replace the bindings of the previous fetch mode */
+	if ( stmt_res->row_data != NULL || stmt_res->rowset != NULL ) {
+		_python_ibm_db_unbind_columns(stmt_res);
+	}
 
-	if (maxuniValue <= 65536) {
-		*isNewBuffer = 0;
-		return (SQLWCHAR*)PyUnicode_AS_UNICODE(pyobj);
+	stmt_res->rowset = ALLOC_N(ibm_db_rowset_col, stmt_res->num_columns);
+	if ( stmt_res->rowset == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return -1;
 	}
+	memset(stmt_res->rowset, 0, sizeof(ibm_db_rowset_col)*stmt_res->num_columns);
+	stmt_res->rowset_alloc = nrows;
 
-	*isNewBuffer = 1;
-	pNewBuffer = (SQLWCHAR *)ALLOC_N(SQLWCHAR, nCharLen + 1);
-	memset(pNewBuffer, 0, sizeof(SQLWCHAR) * (nCharLen + 1));
-	if (is_bigendian()) {
-		pyUTFobj = PyCodec_Encode(pyobj, "utf-16-be", "strict");
-	} else {
-		pyUTFobj = PyCodec_Encode(pyobj, "utf-16-le", "strict");
+	for (i = 0; i<stmt_res->num_columns; i++) {
+		rowset_col = &stmt_res->rowset[i];
+		rowset_col->elem_size = (SQLINTEGER)_python_ibm_db_rowset_col_size(stmt_res, i, &rowset_col->ctype);
+		rowset_col->ind = ALLOC_N(SQLINTEGER, nrows);
+		if ( rowset_col->ind == NULL ) {
+			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+			return -1;
+		}
+		if ( rowset_col->elem_size <= 0 ) {
+			/* Column is not bound, its value is returned as None */
+			rowset_col->elem_size = 0;
+			continue;
+		}
+		rowset_col->buf = (void *)ALLOC_N(char, rowset_col->elem_size * nrows);
+		if ( rowset_col->buf == NULL ) {
+			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+			return -1;
+		}
+
+		rc = SQLBindCol((SQLHSTMT)stmt_res->hstmt, (SQLUSMALLINT)(i+1),
+			rowset_col->ctype, rowset_col->buf, rowset_col->elem_size,
+			(SQLINTEGER *)rowset_col->ind);
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
+				SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			return rc;
+		}
 	}
-	memcpy(pNewBuffer, PyBytes_AsString(pyUTFobj), sizeof(SQLWCHAR) * (nCharLen) );
-	Py_DECREF(pyUTFobj);
-	return pNewBuffer;
 
+	rc = SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_ROWS_FETCHED_PTR, 
+		(SQLPOINTER)&stmt_res->rows_fetched, SQL_IS_INTEGER);
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
+			SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+	}
+	return rc;
 }
 
+/*	static PyObject *_python_ibm_db_get_decimal_type()
+	returns the borrowed reference to decimal.Decimal, importing the module on 
+	first use
+*/
+static PyObject *_python_ibm_db_get_decimal_type(void)
+{
+	PyObject *module = NULL;
 
-#ifdef CLI_DBC_SERVER_TYPE_DB2LUW
-#ifdef SQL_ATTR_DECFLOAT_ROUNDING_MODE
+	if ( decimal_type == NULL ) {
+		module = PyImport_ImportModule("decimal");
+		if ( module == NULL ) {
+			return NULL;
+		}
+		decimal_type = PyObject_GetAttrString(module, "Decimal");
+		Py_DECREF(module);
+	}
+	return decimal_type;
+}
 
-/**
- * Function for implementation of DECFLOAT Datatype
- *
- * Description :
- * This function retrieves the value of special register decflt_rounding
- * from the database server which signifies the current rounding mode set
- * on the server. For using decfloat, the rounding mode has to be in sync
- * on the client as well as server. Thus we set here on the client, the
- * same rounding mode as the server.
- *
- * @return: success or failure
- * */
-static int _python_ibm_db_set_decfloat_rounding_mode_client(SQLHANDLE hdbc)
+/*	static PyObject *_python_ibm_db_decimal_from_chars(char *data, Py_ssize_t len)
+	builds a decimal.Decimal from the character form of a DECIMAL value. The 
+	decimal separator follows the client locale, so ',' is accepted as well.
+*/
+static PyObject *_python_ibm_db_decimal_from_chars(char *data, Py_ssize_t len)
 {
-	SQLCHAR decflt_rounding[20];
-	SQLHANDLE hstmt;
-	int rc = 0;
-	int rounding_mode;
-	SQLINTEGER decfloat;
+	char digits[DECIMAL_BUFSIZ];
+	char *buf = digits;
+	PyObject *str_obj = NULL;
+	PyObject *converted = NULL;
+	Py_ssize_t i, n = 0;
 
+	if ( _python_ibm_db_get_decimal_type() == NULL ) {
+		return NULL;
+	}
+	if ( len < 0 ) {
+		len = strlen(data);
+	}
+	if ( len >= DECIMAL_BUFSIZ ) {
+		buf = ALLOC_N(char, len + 1);
+		if ( buf == NULL ) {
+			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+			return NULL;
+		}
+	}
+	for (i = 0; i < len && data[i] != '\0'; i++) {
+		if ( data[i] == ',' ) {
+			buf[n++] = '.';
+		} else if ( data[i] != ' ' ) {
+			buf[n++] = data[i];
+		}
+	}
+	buf[n] = '\0';
 
-	SQLCHAR *stmt = (SQLCHAR *)"values current decfloat rounding mode";
-
-	/* Allocate a Statement Handle */
-	rc = SQLAllocHandle(SQL_HANDLE_STMT, hdbc, &hstmt);
-	if (rc == SQL_ERROR) {
-		_python_ibm_db_check_sql_errors(hdbc, SQL_HANDLE_DBC, rc, 1,
-			NULL, -1, 1);
-		return rc;
+	str_obj = StringOBJ_FromASCII(buf);
+	if ( buf != digits ) {
+		PyMem_Del(buf);
+	}
+	if ( str_obj == NULL ) {
+		return NULL;
 	}
+	converted = PyObject_CallFunctionObjArgs(decimal_type, str_obj, NULL);
+	Py_DECREF(str_obj);
+	return converted;
+}
 
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLExecDirect((SQLHSTMT)hstmt, stmt, SQL_NTS);
-	Py_END_ALLOW_THREADS;
+/*	static char *_python_ibm_db_decimal_to_chars(PyObject *value)
+	returns the character form of a decimal.Decimal (or other number) bound to 
+	a parameter, allocated with PyMem. Exponents are expanded as the CLI 
+	character to DECIMAL conversion does not accept them.
+*/
+static char *_python_ibm_db_decimal_to_chars(PyObject *value)
+{
+	PyObject *str_obj = NULL;
+	PyObject *format_spec = NULL;
+	char *str, *svalue = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *str_ascii = NULL;
+#endif
 
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors((SQLHSTMT)hstmt,
-			SQL_HANDLE_STMT, rc, 1, NULL,
-			-1, 1);
-		return rc;
+	str_obj = PyObject_Str(value);
+	if ( str_obj == NULL ) {
+		return NULL;
+	}
+#if  PY_MAJOR_VERSION >= 3
+	str_ascii = PyUnicode_AsASCIIString(str_obj);
+	Py_DECREF(str_obj);
+	if ( str_ascii == NULL ) {
+		return NULL;
+	}
+	str_obj = str_ascii;
+#endif
+	str = PyBytes_AsString(str_obj);
+	if ( str != NULL && (strchr(str, 'E') != NULL || strchr(str, 'e') != NULL) && 
+		 _python_ibm_db_get_decimal_type() != NULL && 
+		 PyObject_IsInstance(value, decimal_type) == 1 ) {
+		Py_DECREF(str_obj);
+		format_spec = StringOBJ_FromASCII("f");
+		if ( format_spec == NULL ) {
+			return NULL;
+		}
+		str_obj = PyObject_Format(value, format_spec);
+		Py_DECREF(format_spec);
+		if ( str_obj == NULL ) {
+			return NULL;
+		}
+#if  PY_MAJOR_VERSION >= 3
+		str_ascii = PyUnicode_AsASCIIString(str_obj);
+		Py_DECREF(str_obj);
+		if ( str_ascii == NULL ) {
+			return NULL;
+		}
+		str_obj = str_ascii;
+#endif
+		str = PyBytes_AsString(str_obj);
 	}
+	if ( str != NULL ) {
+		svalue = estrdup(str);
+	}
+	Py_DECREF(str_obj);
+	return svalue;
+}
 
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLBindCol((SQLHSTMT)hstmt, 1, SQL_C_DEFAULT, decflt_rounding, 20, NULL);
-	Py_END_ALLOW_THREADS;
+/*	static PyObject *_python_ibm_db_convert_value(stmt_handle *stmt_res, int col, PyObject *value)
+	convert a fetched value to the type returned by the DB-API module: DECIMAL
+	and NUMERIC columns become decimal.Decimal and BLOB columns buffer objects.
+	The reference to value is stolen.
+*/
+static PyObject *_python_ibm_db_convert_value(stmt_handle *stmt_res, int col, PyObject *value)
+{
+	PyObject *converted = NULL;
+	char *str;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *value_ascii = NULL;
+#endif
 
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors((SQLHSTMT)hstmt,
-			SQL_HANDLE_STMT, rc, 1, NULL,
-			-1, 1);
-		return rc;
+	if ( value == NULL || value == Py_None ) {
+		return value;
 	}
 
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLFetch(hstmt);
-	Py_END_ALLOW_THREADS;
-
-	rc = SQLFreeHandle(SQL_HANDLE_STMT, hstmt);
-	
-	/* Now setting up the same rounding mode on the client*/
-	if (strcmp(decflt_rounding, "ROUND_HALF_EVEN") == 0) rounding_mode = ROUND_HALF_EVEN;
-	if (strcmp(decflt_rounding, "ROUND_HALF_UP") == 0) rounding_mode = ROUND_HALF_UP;
-	if (strcmp(decflt_rounding, "ROUND_DOWN") == 0) rounding_mode = ROUND_DOWN;
-	if (strcmp(decflt_rounding, "ROUND_CEILING") == 0) rounding_mode = ROUND_CEILING;
-	if (strcmp(decflt_rounding, "ROUND_FLOOR") == 0) rounding_mode = ROUND_FLOOR;
+	switch(stmt_res->column_info[col].type) {
+		case SQL_DECIMAL:
+		case SQL_NUMERIC:
+#if  PY_MAJOR_VERSION >= 3
+			value_ascii = PyUnicode_AsASCIIString(value);
+			Py_DECREF(value);
+			if ( value_ascii == NULL ) {
+				return NULL;
+			}
+			str = PyBytes_AsString(value_ascii);
+			converted = str != NULL ? _python_ibm_db_decimal_from_chars(str, -1) : NULL;
+			Py_DECREF(value_ascii);
+#else
+			str = PyString_AsString(value);
+			converted = str != NULL ? _python_ibm_db_decimal_from_chars(str, -1) : NULL;
+			Py_DECREF(value);
+#endif
+			return converted;
 
-#ifndef PASE
-	rc = SQLSetConnectAttr(hdbc, SQL_ATTR_DECFLOAT_ROUNDING_MODE, (SQLPOINTER)rounding_mode, SQL_NTS);
+		case SQL_BLOB:
+			if ( PyBytes_Check(value) ) {
+#if  PY_MAJOR_VERSION >= 3
+				converted = PyMemoryView_FromObject(value);
 #else
-	rc = SQLSetConnectAttr(hdbc, SQL_ATTR_DECFLOAT_ROUNDING_MODE, (SQLPOINTER)&rounding_mode, SQL_NTS);
+				converted = PyBuffer_FromObject(value, 0, Py_END_OF_BUFFER);
 #endif
+				Py_DECREF(value);
+				return converted;
+			}
+			break;
 
-	return rc;
+		default:
+			break;
+	}
+	return value;
+}
+
+/*	static PyObject *_python_ibm_db_rowset_value(stmt_handle *stmt_res, int col, SQLUINTEGER row, int convert)
+	build the Python value of a column in the row of the last fetched rowset,
+	with convert set DECIMAL and NUMERIC values are returned as decimal.Decimal
+*/
+static PyObject *_python_ibm_db_rowset_value(stmt_handle *stmt_res, int col, SQLUINTEGER row, int convert)
+{
+	ibm_db_rowset_col *rowset_col = &stmt_res->rowset[col];
+	SQLINTEGER out_length = rowset_col->ind[row];
+	char *data = (char *)rowset_col->buf + row * rowset_col->elem_size;
+
+	if ( rowset_col->buf == NULL || out_length == SQL_NULL_DATA ) {
+		Py_RETURN_NONE;
+	}
+
+	switch(stmt_res->column_info[col].type) {
+		case SQL_CHAR:
+		case SQL_VARCHAR:
+		case SQL_WCHAR:
+		case SQL_WVARCHAR:
+		case SQL_GRAPHIC:
+		case SQL_VARGRAPHIC:
+		case SQL_LONGVARGRAPHIC:
+			return _python_ibm_db_char_value(stmt_res, data, out_length);
+
+		case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+		case SQL_LONGVARBINARY:
+#endif /* PASE */
+		case SQL_VARBINARY:
+			if ( stmt_res->s_bin_mode == PASSTHRU ) {
+				return PyBytes_FromStringAndSize("", 0);
+			}
+			return PyBytes_FromStringAndSize(data, out_length);
+
+		case SQL_DECIMAL:
+		case SQL_NUMERIC:
+			if ( convert ) {
+				return _python_ibm_db_decimal_from_chars(data, out_length);
+			}
+			return StringOBJ_FromASCII(data);
+
+		case SQL_DECFLOAT:
+			return StringOBJ_FromASCII(data);
+
+		case SQL_BIGINT:
+			return PyLong_FromLongLong(*(SQLBIGINT *)data);
+
+		case SQL_TYPE_DATE:
+			return PyDate_FromDate(((DATE_STRUCT *)data)->year, 
+				((DATE_STRUCT *)data)->month, ((DATE_STRUCT *)data)->day);
+
+		case SQL_TYPE_TIME:
+			return PyTime_FromTime(((TIME_STRUCT *)data)->hour, 
+				((TIME_STRUCT *)data)->minute, ((TIME_STRUCT *)data)->second, 0);
 
+		case SQL_TYPE_TIMESTAMP:
+			return PyDateTime_FromDateAndTime(((TIMESTAMP_STRUCT *)data)->year, 
+				((TIMESTAMP_STRUCT *)data)->month, ((TIMESTAMP_STRUCT *)data)->day,
+				((TIMESTAMP_STRUCT *)data)->hour, ((TIMESTAMP_STRUCT *)data)->minute, 
+				((TIMESTAMP_STRUCT *)data)->second, 
+				((TIMESTAMP_STRUCT *)data)->fraction / 1000);
+
+		case SQL_SMALLINT:
+			return PyInt_FromLong(*(SQLSMALLINT *)data);
+
+		case SQL_INTEGER:
+			return PyInt_FromLong(*(SQLINTEGER *)data);
+
+		case SQL_REAL:
+			return PyFloat_FromDouble(*(SQLREAL *)data);
+
+		case SQL_FLOAT:
+			return PyFloat_FromDouble(*(SQLFLOAT *)data);
+
+		case SQL_DOUBLE:
+			return PyFloat_FromDouble(*(SQLDOUBLE *)data);
+
+		default:
+			break;
+	}
+	Py_RETURN_NONE;
 }
-#endif
-#endif
 
-/* static void _python_ibm_db_clear_conn_err_cache () */
-static void _python_ibm_db_clear_conn_err_cache(void)
+/*	static void _python_ibm_db_clear_stmt_err_cache () */
+static void _python_ibm_db_clear_stmt_err_cache(void)
 {
-	/* Clear out the cached conn messages */
-	memset(IBM_DB_G(__python_conn_err_msg), 0, DB2_MAX_ERR_MSG_LEN);
-	memset(IBM_DB_G(__python_conn_err_state), 0, SQL_SQLSTATE_SIZE + 1);
+	memset(IBM_DB_G(__python_stmt_err_msg), 0, DB2_MAX_ERR_MSG_LEN);
+	memset(IBM_DB_G(__python_stmt_err_state), 0, SQL_SQLSTATE_SIZE + 1);
 }
 
-/*!#
- * ibm_db.connect
- * ibm_db.pconnect
- * ibm_db.autocommit
- * ibm_db.bind_param
- * ibm_db.close
- * ibm_db.column_privileges
- * ibm_db.columns
- * ibm_db.foreign_keys
- * ibm_db.primary_keys
- * ibm_db.procedure_columns
- * ibm_db.procedures
- * ibm_db.special_columns
- * ibm_db.statistics
- * ibm_db.table_privileges
- * ibm_db.tables
- * ibm_db.commit
- * ibm_db.exec
- * ibm_db.free_result
- * ibm_db.prepare
- * ibm_db.execute
- * ibm_db.conn_errormsg
- * ibm_db.stmt_errormsg
- * ibm_db.conn_error
- * ibm_db.stmt_error
- * ibm_db.next_result
- * ibm_db.num_fields
- * ibm_db.num_rows
- * ibm_db.get_num_result
- * ibm_db.field_name
- * ibm_db.field_display_size
- * ibm_db.field_num
- * ibm_db.field_precision
- * ibm_db.field_scale
- * ibm_db.field_type
- * ibm_db.field_width
- * ibm_db.cursor_type
- * ibm_db.rollback
- * ibm_db.free_stmt
- * ibm_db.result
- * ibm_db.fetch_row
- * ibm_db.fetch_assoc
- * ibm_db.fetch_array
- * ibm_db.fetch_both
- * ibm_db.set_option
- * ibm_db.server_info
- * ibm_db.client_info
- * ibm_db.active
- * ibm_db.get_option
- */
+/*	static int _python_ibm_db_connect_helper( argc, argv, isPersistent ) */
+static PyObject *_python_ibm_db_connect_helper( PyObject *self, PyObject *args, int isPersistent )
+{
+	PyObject *databaseObj = NULL;
+	PyObject *uidObj = NULL;
+	PyObject *passwordObj = NULL;
+	SQLWCHAR *database = NULL;
+	SQLWCHAR *uid = NULL;
+	SQLWCHAR *password = NULL;
+	PyObject *options = NULL;
+	PyObject *literal_replacementObj = NULL;
+	SQLINTEGER literal_replacement;
+	PyObject *equal = StringOBJ_FromASCII("=");
+	int rc = 0;
+	SQLINTEGER conn_alive;
+	conn_handle *conn_res = NULL;
+	int reused = 0;
+	PyObject *hKey = NULL;
+	PyObject *entry = NULL;
+	char server[2048];
+	int isNewBuffer;
+	
+	conn_alive = 1;	
 
+	if (!PyArg_ParseTuple(args, "OOO|OO", &databaseObj, &uidObj, &passwordObj, &options, &literal_replacementObj)){
+		return NULL;
+	}
+	do {
+		databaseObj = PyUnicode_FromObject(databaseObj);
+		uidObj = PyUnicode_FromObject(uidObj);
+		passwordObj = PyUnicode_FromObject(passwordObj);
 
+		/* Check if we already have a connection for this userID & database 
+		* combination
+		*/ 
+		if (isPersistent) {
+			hKey = PyUnicode_Concat(StringOBJ_FromASCII("__ibm_db_"), uidObj);
+			hKey = PyUnicode_Concat(hKey, databaseObj);
+			hKey = PyUnicode_Concat(hKey, passwordObj);
 
-/*!# ibm_db.connect
- *
- * ===Description
- *
- *  --	Returns a connection to a database
- * IBM_DBConnection ibm_db.connect (dsn=<..>, user=<..>, password=<..>,
- *								  host=<..>, database=<..>, options=<..>)
- *
- * Creates a new connection to an IBM DB2 Universal Database, IBM Cloudscape,
- * or Apache Derby database.
- *
- * ===Parameters
- *
- * ====dsn
- *
- * For an uncataloged connection to a database, database represents a complete
- * connection string in the following format:
- * DRIVER={IBM DB2 ODBC DRIVER};DATABASE=database;HOSTNAME=hostname;PORT=port;
- * PROTOCOL=TCPIP;UID=username;PWD=password;
- *	  where the parameters represent the following values:
- *		hostname
- *			The hostname or IP address of the database server.
- *		port
- *			The TCP/IP port on which the database is listening for requests.
- *		username
- *			The username with which you are connecting to the database.
- *		password
- *			The password with which you are connecting to the database.
- *
- * ====user
- *
- * The username with which you are connecting to the database.
- * This is optional if username is specified in the "dsn" string
- *
- * ====password
- *
- * The password with which you are connecting to the database.
- * This is optional if password is specified in the "dsn" string
- *
- * ====host
- *
- * The hostname or IP address of the database server.
- * This is optional if hostname is specified in the "dsn" string
- *
- * ====database
- *
- * For a cataloged connection to a database, database represents the database
- * alias in the DB2 client catalog.
- * This is optional if database is specified in the "dsn" string
- *
- * ====options
- *
- *	  An dictionary of connection options that affect the behavior of the
- *	  connection,
- *	  where valid array keys include:
- *		SQL_ATTR_AUTOCOMMIT
- *			Passing the SQL_AUTOCOMMIT_ON value turns autocommit on for this
- *			connection handle.
- *			Passing the SQL_AUTOCOMMIT_OFF value turns autocommit off for this
- *			connection handle.
- *		ATTR_CASE
- *			Passing the CASE_NATURAL value specifies that column names are
- *			returned in natural case.
- *			Passing the CASE_LOWER value specifies that column names are
- *			returned in lower case.
- *			Passing the CASE_UPPER value specifies that column names are
- *			returned in upper case.
- *		SQL_ATTR_CURSOR_TYPE
- *			Passing the SQL_SCROLL_FORWARD_ONLY value specifies a forward-only
- *			cursor for a statement resource.
- *			This is the default cursor type and is supported on all database
- *			servers.
- *			Passing the SQL_CURSOR_KEYSET_DRIVEN value specifies a scrollable
- *			cursor for a statement resource.
- *			This mode enables random access to rows in a result set, but
- *			currently is supported only by IBM DB2 Universal Database.
- * ====set_replace_quoted_literal
- *	  This variable indicates if the CLI Connection attribute SQL_ATTR_REPLACE_QUOTED_LITERAL is to be set or not
- *	  To turn it ON pass  IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
- *	  To turn it OFF pass IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_OFF
- *
- *	  Default Setting: - IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
- *
- * ===Return Values
- *
- *
- * Returns a IBM_DBConnection connection object if the connection attempt is
- * successful.
- * If the connection attempt fails, ibm_db.connect() returns None.
- *
- */ 
-static PyObject *ibm_db_connect(PyObject *self, PyObject *args)
-{
-	_python_ibm_db_clear_conn_err_cache();
-	return _python_ibm_db_connect_helper( self, args, 0 );
-}
+			entry = PyDict_GetItem(persistent_list, hKey);
 
-/*!# ibm_db.pconnect
- *
- * ===Description
- *  --	Returns a persistent connection to a database
- * resource ibm_db.pconnect ( string database, string username, string password
- * [, array options] )
- *
- * Returns a persistent connection to an IBM DB2 Universal Database,
- * IBM Cloudscape, Apache Derby or Informix Dynamic Server database.
- *
- * Calling ibm_db.close() on a persistent connection always returns TRUE, but
- * the underlying DB2 client connection remains open and waiting to serve the
- * next matching ibm_db.pconnect() request.
- *
- * ===Parameters
- *
- * ====database
- *		The database alias in the DB2 client catalog.
- *
- * ====username
- *		The username with which you are connecting to the database.
- *
- * ====password
- *		The password with which you are connecting to the database.
- *
- * ====options
- *		An associative array of connection options that affect the behavior of
- * the connection,
- *		where valid array keys include:
- *
- *		autocommit
- *			 Passing the DB2_AUTOCOMMIT_ON value turns autocommit on for this
- * connection handle.
- *			 Passing the DB2_AUTOCOMMIT_OFF value turns autocommit off for
- * this connection handle.
- *
- *		DB2_ATTR_CASE
- *			 Passing the DB2_CASE_NATURAL value specifies that column names
- * are returned in natural case.
- *			 Passing the DB2_CASE_LOWER value specifies that column names are
- * returned in lower case.
- *			 Passing the DB2_CASE_UPPER value specifies that column names are
- * returned in upper case.
- *
- *		CURSOR
- *			 Passing the SQL_SCROLL_FORWARD_ONLY value specifies a
- * forward-only cursor for a statement resource.  This is the default cursor
- * type and is supported on all database servers.
- *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value specifies a scrollable
- * cursor for a statement resource. This mode enables random access to rows in a
- * result set, but currently is supported only by IBM DB2 Universal Database.
- *
- * ====set_replace_quoted_literal
- *	  This variable indicates if the CLI Connection attribute SQL_ATTR_REPLACE_QUOTED_LITERAL is to be set or not
- *	  To turn it ON pass  IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
- *	  To turn it OFF pass IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_OFF
- *
- *	  Default Setting: - IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
- *
- * ===Return Values
- *
- * Returns a connection handle resource if the connection attempt is successful.
- * ibm_db.pconnect() tries to reuse an existing connection resource that exactly
- * matches the database, username, and password parameters. If the connection
- * attempt fails, ibm_db.pconnect() returns FALSE.
- */
-static PyObject *ibm_db_pconnect(PyObject *self, PyObject *args)
-{
-	_python_ibm_db_clear_conn_err_cache();
-	return _python_ibm_db_connect_helper( self, args, 1);
-}
+			/* A connection inherited across fork() is replaced */
+			if (entry != NULL && ((conn_handle *)entry)->owner_pid != IBM_DB_GETPID()) {
+				_python_ibm_db_abandon_conn((conn_handle *)entry);
+				PyDict_DelItem(persistent_list, hKey);
+				entry = NULL;
+			}
 
-/*
- * static void _python_clear_local_var(PyObject *dbNameObj, SQLWCHAR *dbName, PyObject *codesetObj, SQLWCHAR *codesetObj, PyObject *modeObj, SQLWCHAR *mode, int isNewBuffer)
- */
-static void _python_clear_local_var(PyObject *dbNameObj, SQLWCHAR *dbName, PyObject *codesetObj, SQLWCHAR *codeset, PyObject *modeObj, SQLWCHAR *mode, int isNewBuffer)
-{
-	if ( !NIL_P( dbNameObj ) ) {
-		Py_XDECREF( dbNameObj );
-		if ( isNewBuffer ) {
-			PyMem_Del( dbName );
+			if (entry != NULL) {
+				Py_INCREF(entry);
+				conn_res = (conn_handle *)entry;
+#ifndef PASE /* i5/OS server mode is persistant */
+				/* Need to reinitialize connection? */
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLGetConnectAttr(conn_res->hdbc, SQL_ATTR_PING_DB, 
+					(SQLPOINTER)&conn_alive, 0, NULL);
+				Py_END_ALLOW_THREADS;
+				if ( (rc == SQL_SUCCESS) && conn_alive ) {
+					_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, 
+						rc, 1, NULL, -1, 1);
+					reused = 1;
+				} /* else will re-connect since connection is dead */
+#endif /* PASE */
+				reused = 1;
+			}
+		} else {
+			/* Need to check for max pconnections? */
 		}
-	}
 
-	if ( !NIL_P( codesetObj ) ) {
-		Py_XDECREF( codesetObj );
-		if ( isNewBuffer ) {
-			PyMem_Del( codeset );
+		if ( !NIL_P(literal_replacementObj) ) {
+			literal_replacement = (SQLINTEGER) PyInt_AsLong(literal_replacementObj);
+		} else {
+			literal_replacement = SET_QUOTED_LITERAL_REPLACEMENT_OFF; /*QUOTED LITERAL replacemnt is OFF by default*/
 		}
-	}
+				
+		if (conn_res == NULL) {
+			conn_res = PyObject_NEW(conn_handle, &conn_handleType);
+			conn_res->henv = 0;
+			conn_res->hdbc = 0;
+			conn_res->stmt_cache = NULL;
+			conn_res->stmt_cache_size = 0;
+			conn_res->stmt_cache_tick = 0;
+			conn_res->stmt_cache_hits = 0;
+			conn_res->stmt_cache_misses = 0;
+			conn_res->stmt_cache_gen = 0;
+			conn_res->pool = NULL;
+			conn_res->pool_idle_since = 0;
+			conn_res->query_timeout = 0;
+			conn_res->fetch_buffer_size = ROWSET_BUFSIZ;
+			memset(conn_res->round_trips, 0, sizeof(conn_res->round_trips));
+			memset(&conn_res->stats, 0, sizeof(conn_res->stats));
+		}
+		conn_res->owner_pid = IBM_DB_GETPID();
 
-	if ( !NIL_P( modeObj ) ) {
-		Py_XDECREF( modeObj );
-		if ( isNewBuffer ) {
-			PyMem_Del( mode );
+		/* We need to set this early, in case we get an error below,
+		so we know how to free the connection */
+		conn_res->flag_pconnect = isPersistent;
+		/* Allocate ENV handles if not present */
+		if ( !conn_res->henv ) {
+			rc = SQLAllocHandle(SQL_HANDLE_ENV, SQL_NULL_HANDLE, &(conn_res->henv));
+			if (rc != SQL_SUCCESS) {
+				_python_ibm_db_check_sql_errors( conn_res->henv, SQL_HANDLE_ENV, rc,
+					1, NULL, -1, 1);
+				break;
+			}
+			rc = SQLSetEnvAttr((SQLHENV)conn_res->henv, SQL_ATTR_ODBC_VERSION, 
+				(void *)SQL_OV_ODBC3, 0);
 		}
-	}
-}
-
-/*
- * static int _python_ibm_db_createdb(conn_handle *conn_res, PyObject *dbNameObj, PyObject *codesetObj, PyObject *modeObj, int createNX)
- */
-static int _python_ibm_db_createdb(conn_handle *conn_res, PyObject *dbNameObj, PyObject *codesetObj, PyObject *modeObj, int createNX)
-{
-	SQLWCHAR *dbName = NULL;
-	SQLWCHAR *codeset = NULL;
-	SQLWCHAR *mode = NULL;
-	SQLINTEGER sqlcode;
-	SQLSMALLINT length;
-	SQLCHAR msg[SQL_MAX_MESSAGE_LENGTH + 1];
-	SQLCHAR sqlstate[SQL_SQLSTATE_SIZE + 1];
-	int isNewBuffer;
-	int rc = 0;
-#ifdef _WIN32
-	HINSTANCE cliLib = NULL;
-	FARPROC sqlcreatedb;
-#else
-	void *cliLib = NULL;
-	typedef int (*sqlcreatedbType)( SQLHDBC, SQLWCHAR *, SQLINTEGER, SQLWCHAR *, SQLINTEGER, SQLWCHAR *, SQLINTEGER );
-	sqlcreatedbType sqlcreatedb;
-#endif
 
-#if defined __APPLE__ || defined _AIX
-	PyErr_SetString( PyExc_Exception, "Not supported: This function is currently not supported on this platform" );
-	return -1;
-#else
+		if (!reused) {
+			/* Alloc CONNECT Handle */
+			rc = SQLAllocHandle(SQL_HANDLE_DBC, conn_res->henv, &(conn_res->hdbc));
+			if (rc != SQL_SUCCESS) {
+				_python_ibm_db_check_sql_errors(conn_res->henv, SQL_HANDLE_ENV, rc, 
+					1, NULL, -1, 1);
+				break;
+			}
+		}
 
-	if ( !NIL_P( conn_res ) ) {
-		if ( NIL_P( dbNameObj ) ) {
-			PyErr_SetString( PyExc_Exception, "Supplied database name Parameter is invalid" );
-			return -1;
-		}
-		/* Check to ensure the connection resource given is active */
-		if ( !conn_res->handle_active ) {
-			PyErr_SetString( PyExc_Exception, "Connection is not active" );
-			return -1;
-		}
+		/* Set this after the connection handle has been allocated to avoid
+		unnecessary network flows. Initialize the structure to default values */
+		conn_res->auto_commit = SQL_AUTOCOMMIT_ON;
+		rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, 
+			(SQLPOINTER)(conn_res->auto_commit), SQL_NTS);
 
-		dbNameObj = PyUnicode_FromObject( dbNameObj );
-		if ( dbNameObj != NULL &&  dbNameObj != Py_None ) {
-			dbName = getUnicodeDataAsSQLWCHAR( dbNameObj, &isNewBuffer );
-		} else {
-			return -1;
-		}
-		
-		if ( !NIL_P( codesetObj ) ) {
-			codesetObj = PyUnicode_FromObject( codesetObj );
-			if ( codesetObj != NULL &&  codesetObj != Py_None ) {
-				codeset = getUnicodeDataAsSQLWCHAR( codesetObj, &isNewBuffer );
-			} else {
-				_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
-				return -1;
+		conn_res->c_bin_mode = IBM_DB_G(bin_mode);
+		conn_res->c_case_mode = CASE_NATURAL;
+		conn_res->c_char_mode = CHAR_WCHAR;
+		conn_res->c_cursor_type = SQL_SCROLL_FORWARD_ONLY;
+
+		conn_res->error_recno_tracker = 1;
+		conn_res->errormsg_recno_tracker = 1;
+		conn_res->err_state[0] = '\0';
+		conn_res->err_msg[0] = '\0';
+
+		/* handle not active as of yet */
+		conn_res->handle_active = 0;
+
+		/* Set Options */
+		if ( !NIL_P(options) ) {
+			if(!PyDict_Check(options)) {
+				PyErr_SetString(PyExc_Exception, "options Parameter must be of type dictionay");
+				return NULL;
 			}
-				
-		}
-		if ( !NIL_P( modeObj ) ) {
-			modeObj = PyUnicode_FromObject( modeObj );
-			if ( codesetObj != NULL &&  codesetObj != Py_None ) {
-				mode = getUnicodeDataAsSQLWCHAR( modeObj, &isNewBuffer );	
-			} else {
-				_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, NULL, NULL, isNewBuffer );
-				return -1;
+			rc = _python_ibm_db_parse_options( options, SQL_HANDLE_DBC, conn_res );
+			if (rc != SQL_SUCCESS) {
+				SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
+				SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
+				break;
 			}
 		}
 
-#ifdef _WIN32
-		cliLib = DLOPEN( LIBDB2 );
-#else
-		cliLib = DLOPEN( LIBDB2, RTLD_LAZY );
-#endif
-		if ( !cliLib ) {
-			sprintf( (char *)msg, "Error in loading %s library file", LIBDB2 );
-			PyErr_SetString( PyExc_Exception,  (char *)msg );
-			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );	
-			return -1;
-		}
-#ifdef _WIN32
-		sqlcreatedb =  DLSYM( cliLib, "SQLCreateDbW" );
-#else
-		sqlcreatedb = (sqlcreatedbType) DLSYM( cliLib, "SQLCreateDbW" );
-#endif
-		if ( sqlcreatedb == NULL )  {
-#ifdef _WIN32
-			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp4 version of cli on window" );
-#else
-			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp3 version of cli" );
-#endif
-			PyErr_SetString( PyExc_Exception, (char *)msg );
-			DLCLOSE( cliLib );
-			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
-			return -1;
-		}
+		if (! reused) {
+			/* Connect */
+			/* If the string contains a =, use SQLDriverConnect */
+			if (NIL_P(databaseObj)) {
+				PyErr_SetString(PyExc_Exception, "Supplied Parameter is invalid");
+				return NULL;
+			}
+			database = getUnicodeDataAsSQLWCHAR(databaseObj, &isNewBuffer);
+			if ( PyUnicode_Contains(databaseObj, equal) > 0 ) {
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLDriverConnectW((SQLHDBC)conn_res->hdbc, (SQLHWND)NULL,
+					database, SQL_NTS, NULL, 0, NULL, 
+					SQL_DRIVER_NOPROMPT );
+				Py_END_ALLOW_THREADS;
+			} else {
+				SQLSMALLINT database_len, uid_len, password_len;
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = (*sqlcreatedb)( (SQLHDBC)conn_res->hdbc, dbName, SQL_NTS, codeset, SQL_NTS, mode, SQL_NTS );
-		Py_END_ALLOW_THREADS;
-		
-		DLCLOSE( cliLib );		
-		if ( rc != SQL_SUCCESS ) {
-			if ( createNX == 1 ) {
-				if ( SQLGetDiagRec( SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 1, sqlstate, &sqlcode, msg, SQL_MAX_MESSAGE_LENGTH + 1, &length ) == SQL_SUCCESS ) {
-					if ( sqlcode == -1005 ) {
-						_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
-						return 0;
-					}
+				if (NIL_P(uidObj) || NIL_P(passwordObj)) { 
+					PyErr_SetString(PyExc_Exception, "Supplied Parameter is invalid");
+					return NULL;
 				}
+				uid = getUnicodeDataAsSQLWCHAR(uidObj, &isNewBuffer);
+				password = getUnicodeDataAsSQLWCHAR(passwordObj, &isNewBuffer);
+				database_len = PyUnicode_GetSize(databaseObj);
+				uid_len = PyUnicode_GetSize(uidObj);
+				password_len = PyUnicode_GetSize(passwordObj);
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLConnectW((SQLHDBC)conn_res->hdbc,
+					database, database_len,
+					uid, uid_len,
+					password, password_len);
+				Py_END_ALLOW_THREADS;
+			} 
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
+					1, NULL, -1, 1);
+				SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
+				SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
+				break;
 			}
-			_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1 );
-			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
-			return -1;
-		}
-		_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
-		return 0;
-	} else {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return -1;
-	}
-#endif
-}
+			
+#ifdef CLI_DBC_SERVER_TYPE_DB2LUW
+#ifdef SQL_ATTR_DECFLOAT_ROUNDING_MODE
+			/**
+			* Code for setting SQL_ATTR_DECFLOAT_ROUNDING_MODE
+			* for implementation of Decfloat Datatype
+			*/
 
-/*
- * static int _python_ibm_db_dropdb(conn_handle *conn_res, PyObject *dbNameObj, int recreate)
- */
-static int _python_ibm_db_dropdb(conn_handle *conn_res, PyObject *dbNameObj, int recreate)
-{
-	SQLWCHAR *dbName = NULL;
-	SQLINTEGER sqlcode;
-	SQLSMALLINT length;
-	SQLCHAR msg[SQL_MAX_MESSAGE_LENGTH + 1];
-	SQLCHAR sqlstate[SQL_SQLSTATE_SIZE + 1];
-	int isNewBuffer;
-	int rc = 0;
-#ifdef _WIN32
-	FARPROC sqldropdb;
-	HINSTANCE cliLib = NULL;
-#else
-	typedef int (*sqldropdbType)( SQLHDBC, SQLWCHAR *, SQLINTEGER );
-	sqldropdbType sqldropdb;	
-	void *cliLib;
+			rc = _python_ibm_db_set_decfloat_rounding_mode_client(conn_res->hdbc);
+			if (rc != SQL_SUCCESS){
+				  _python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc,
+								  1, NULL, -1, 1);
+			}
+#endif
 #endif
 
-#if defined __APPLE__ || defined _AIX
-	PyErr_SetString( PyExc_Exception, "Not supported: This function is currently not supported on this platform" );
-	return -1;
-#else
+			/* Get the server name */
+			memset(server, 0, sizeof(server));
 
-	if ( !NIL_P( conn_res ) ) {
-		if ( NIL_P( dbNameObj ) ) {
-			PyErr_SetString( PyExc_Exception, "Supplied database name Parameter is invalid" );
-			return -1;
-		}
-		/* Check to ensure the connection resource given is active */
-		if ( !conn_res->handle_active ) {
-			PyErr_SetString( PyExc_Exception, "Connection is not active" );
-			return -1;
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLGetInfo(conn_res->hdbc, SQL_DBMS_NAME, (SQLPOINTER)server, 
+				2048, NULL);
+			Py_END_ALLOW_THREADS;
+
+			if (!strcmp(server, "AS")) is_systemi = 1;
+			if (!strncmp(server, "IDS", 3)) is_informix = 1;
+
+			/* Set SQL_ATTR_REPLACE_QUOTED_LITERALS connection attribute to
+			* enable CLI numeric literal feature. This is equivalent to
+			* PATCH2=71 in the db2cli.ini file
+			* Note, for backward compatibility with older CLI drivers having a
+			* different value for SQL_ATTR_REPLACE_QUOTED_LITERALS, we call
+			* SQLSetConnectAttr() with both the old and new value
+			*/
+			/* Only enable this feature if we are not connected to an Informix data 
+			* server 
+			*/
+			if (!is_informix && (literal_replacement == SET_QUOTED_LITERAL_REPLACEMENT_ON)) {
+				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, 
+					SQL_ATTR_REPLACE_QUOTED_LITERALS, 
+					(SQLPOINTER) (ENABLE_NUMERIC_LITERALS), 
+					SQL_IS_INTEGER);
+				if (rc != SQL_SUCCESS)
+					rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc,
+					SQL_ATTR_REPLACE_QUOTED_LITERALS_OLDVALUE,
+					(SQLPOINTER)(ENABLE_NUMERIC_LITERALS), 
+					SQL_IS_INTEGER);
+			}
+			if (rc != SQL_SUCCESS) {
+				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
+					1, NULL, -1, 1);
+			}
 		}
+		Py_XDECREF(databaseObj);
+		Py_XDECREF(uidObj);
+		Py_XDECREF(passwordObj);
+		conn_res->handle_active = 1;
+	} while (0);
 
-		dbNameObj = PyUnicode_FromObject( dbNameObj );
-		if ( dbNameObj != NULL &&  dbNameObj != Py_None ) {
-			dbName = getUnicodeDataAsSQLWCHAR( dbNameObj, &isNewBuffer );	
-		} else {
-			return -1;
+	if (hKey != NULL) {
+		if (! reused && rc == SQL_SUCCESS) {
+			/* If we created a new persistent connection, add it to the 
+			*  persistent_list
+			*/
+			PyDict_SetItem(persistent_list, hKey, (PyObject *)conn_res);
 		}
+		Py_DECREF(hKey);
+	}
 
-#ifdef _WIN32
-		cliLib = DLOPEN( LIBDB2 );
-#else
-		cliLib = DLOPEN( LIBDB2, RTLD_LAZY );
-#endif
-		if ( !cliLib ) {
-			sprintf( (char *)msg, "Error in loading %s library file", LIBDB2 );
-			PyErr_SetString( PyExc_Exception, (char *)msg );
-			_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
-			return -1;
+	if (isNewBuffer) {
+		PyMem_Del(database);
+		PyMem_Del(uid);
+		PyMem_Del(password);
+	}
+	
+	if ( rc != SQL_SUCCESS ) {
+		if (conn_res != NULL && conn_res->handle_active) {
+			rc = SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
+			rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
 		}
-#ifdef _WIN32
-		sqldropdb = DLSYM( cliLib, "SQLDropDbW" );
-#else
-		sqldropdb = (sqldropdbType)DLSYM( cliLib, "SQLDropDbW" );
-#endif
-		if ( sqldropdb == NULL)  {
-#ifdef _WIN32
-			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp4 version of cli on window" );
-#else
-			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp3 version of cli" );
-#endif
-			PyErr_SetString( PyExc_Exception, (char *)msg );
-			DLCLOSE( cliLib );
-			_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
-			return -1;
-		}
-
-		Py_BEGIN_ALLOW_THREADS;
-		rc = sqldropdb( conn_res->hdbc, dbName, SQL_NTS );
-		Py_END_ALLOW_THREADS;
-		
-		DLCLOSE( cliLib );
-		if ( rc != SQL_SUCCESS ) {
-			if ( recreate ) {
-				if ( SQLGetDiagRec( SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 1, sqlstate, &sqlcode, msg, SQL_MAX_MESSAGE_LENGTH + 1, &length ) == SQL_SUCCESS ) {
-					if ( sqlcode == -1013 ) {
-						_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
-						return 0;
-					}
-				}
-			}
-			_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1 );
-			return -1;
+		if (conn_res != NULL) {
+			PyObject_Del(conn_res);
 		}
-		_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
-		return 0;
-	} else {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return -1;
-	}
-#endif
+		return NULL;						  
+	} 
+	_python_ibm_db_register_handle(conn_res->hdbc, (PyObject *)conn_res);
+	return (PyObject *)conn_res;
 }
 
-/*!# ibm_db.createdb
- *
- * ===Description
- *  True/None ibm_db.createdb ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
- *
- * Creates a database by using the specified database name, code set, and mode
- *
- * ===Parameters
- *
- * ====connection
- *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
- *
- * ====dbName
- *      Name of the database that is to be created.
- *
- * ====codeSet
- *      Database code set information.
- *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
- *
- * ====mode
- *      Database logging mode.
- *      Note: This value is applicable only to IDS data servers.
- *
- * ===Return Value
- *  Returns True on successful creation of database else return None
- */
-PyObject *ibm_db_createdb(PyObject *self, PyObject *args)
+
+/**
+*This function takes a SQLWCHAR buffer (UCS-2) and returns back a PyUnicode object 
+* of it that is in the correct current UCS encoding (either UCS2 or UCS4)of
+* the current executing python VM
+*
+* @sqlwcharBytesLen - the length of sqlwcharData in bytes (not characters)
+**/
+static PyObject* getSQLWCharAsPyUnicodeObject(SQLWCHAR* sqlwcharData, int sqlwcharBytesLen)
 {
-	PyObject *py_conn_res = NULL;
-	PyObject *dbNameObj = NULL;
-	PyObject *codesetObj = NULL;
-	PyObject *modeObj = NULL;
-	int rc = -1;
+	PyObject* u;
 
-	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
-		return NULL;
-	}
-	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return NULL;
-	}
-	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 0);
-	if ( rc == 0 ) {
-		Py_RETURN_TRUE;
+	/* Decoding as UTF-16 suits both UCS2 and UCS4 builds */
+	if (is_bigendian()) {
+		int bo = 1;
+		u = PyUnicode_DecodeUTF16((char *)sqlwcharData, sqlwcharBytesLen, "strict", &bo);
 	} else {
-		return NULL;
-	}	
+		int bo = -1;
+		u = PyUnicode_DecodeUTF16((char *)sqlwcharData, sqlwcharBytesLen, "strict", &bo);
+	}
+	return u;
 }
 
-/*!# ibm_db.dropdb
- *
- * ===Description
- *  True/None ibm_db.dropdb ( IBM_DBConnection connection, string dbName )
- *
- * Drops the specified database
- *
- * ===Parameters
- *
- * ====connection
- *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
- *
- * ====dbName
- *      Name of the database that is to be dropped.
- *
- * ===Return Value
- *  Returns True if specified database dropped sucessfully else None
- */
-PyObject *ibm_db_dropdb(PyObject *self, PyObject *args)
-{
-	PyObject *py_conn_res = NULL;
-	PyObject *dbNameObj = NULL;
-	int rc = -1;
 
-	if ( !PyArg_ParseTuple( args, "OO", &py_conn_res, &dbNameObj ) ) {
-		return NULL;
-	}
-	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return NULL;
+/**
+*This function takes value as pyObject and convert it to SQLWCHAR and return it 
+*
+**/
+static SQLWCHAR* getUnicodeDataAsSQLWCHAR(PyObject *pyobj, int *isNewBuffer)
+{	
+	PyObject *sysmodule = NULL, *maxuni = NULL;
+	long maxuniValue;
+	PyObject *pyUTFobj;
+	SQLWCHAR* pNewBuffer = NULL;
+	int nCharLen = PyUnicode_GET_SIZE(pyobj);
+
+	sysmodule = PyImport_ImportModule("sys");
+	maxuni = PyObject_GetAttrString(sysmodule, "maxunicode");
+	maxuniValue = PyInt_AsLong(maxuni);
+
+	if (maxuniValue <= 65536) {
+		*isNewBuffer = 0;
+		return (SQLWCHAR*)PyUnicode_AS_UNICODE(pyobj);
 	}
-	rc = _python_ibm_db_dropdb( (conn_handle *)py_conn_res, dbNameObj, 0 );
-	if ( rc == 0 ) {
-		Py_RETURN_TRUE;
+
+	*isNewBuffer = 1;
+	pNewBuffer = (SQLWCHAR *)ALLOC_N(SQLWCHAR, nCharLen + 1);
+	memset(pNewBuffer, 0, sizeof(SQLWCHAR) * (nCharLen + 1));
+	if (is_bigendian()) {
+		pyUTFobj = PyCodec_Encode(pyobj, "utf-16-be", "strict");
 	} else {
-		return NULL;
+		pyUTFobj = PyCodec_Encode(pyobj, "utf-16-le", "strict");
 	}
+	memcpy(pNewBuffer, PyBytes_AsString(pyUTFobj), sizeof(SQLWCHAR) * (nCharLen) );
+	Py_DECREF(pyUTFobj);
+	return pNewBuffer;
+
 }
 
-/*ibm_db.recreatedb
- *
- * ===Description
- *  True/None ibm_db.recreatedb ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
- *
- * Drop and then recreates a database by using the specified database name, code set, and mode
- *
- * ===Parameters
- *
- * ====connection
- *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
- *
- * ====dbName
- *      Name of the database that is to be created.
- *
- * ====codeSet
- *      Database code set information.
- *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
+
+#ifdef CLI_DBC_SERVER_TYPE_DB2LUW
+#ifdef SQL_ATTR_DECFLOAT_ROUNDING_MODE
+
+/**
+ * Function for implementation of DECFLOAT Datatype
  *
- * ====mode
- *      Database logging mode.
- *      Note: This value is applicable only to IDS data servers.
+ * Description :
+ * This function retrieves the value of special register decflt_rounding
+ * from the database server which signifies the current rounding mode set
+ * on the server. For using decfloat, the rounding mode has to be in sync
+ * on the client as well as server. Thus we set here on the client, the
+ * same rounding mode as the server.
  *
- * ===Return Value
- *  Returns True if specified database created successfully else return None
- */
-PyObject *ibm_db_recreatedb(PyObject *self, PyObject *args)
+ * @return: success or failure
+ * */
+static int _python_ibm_db_set_decfloat_rounding_mode_client(SQLHANDLE hdbc)
 {
-	PyObject *py_conn_res = NULL;
-	PyObject *dbNameObj = NULL;
-	PyObject *codesetObj = NULL;
-	PyObject *modeObj = NULL;
-	int rc = -1;
+	SQLCHAR decflt_rounding[20];
+	SQLHANDLE hstmt;
+	int rc = 0;
+	int rounding_mode;
+	SQLINTEGER decfloat;
 
-	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
-		return NULL;
-	}
-	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return NULL;
+
+	SQLCHAR *stmt = (SQLCHAR *)"values current decfloat rounding mode";
+
+	/* Allocate a Statement Handle */
+	rc = SQLAllocHandle(SQL_HANDLE_STMT, hdbc, &hstmt);
+	if (rc == SQL_ERROR) {
+		_python_ibm_db_check_sql_errors(hdbc, SQL_HANDLE_DBC, rc, 1,
+			NULL, -1, 1);
+		return rc;
 	}
-	rc = _python_ibm_db_dropdb((conn_handle *)py_conn_res, dbNameObj, 1 );
-	if ( rc != 0 ) {
-		return NULL; 
-	} 
 
-	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 0);
-	if ( rc == 0 ) {
-		Py_RETURN_TRUE;
-	} else {
-		return NULL;
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLExecDirect((SQLHSTMT)hstmt, stmt, SQL_NTS);
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors((SQLHSTMT)hstmt,
+			SQL_HANDLE_STMT, rc, 1, NULL,
+			-1, 1);
+		return rc;
 	}
-}
 
-/*!# ibm_db.createdbNX 
- *
- * ===Description
- *  True/None ibm_db.createdbNX ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
- *
- * Creates the database if not exist by using the specified database name, code set, and mode
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLBindCol((SQLHSTMT)hstmt, 1, SQL_C_DEFAULT, decflt_rounding, 20, NULL);
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors((SQLHSTMT)hstmt,
+			SQL_HANDLE_STMT, rc, 1, NULL,
+			-1, 1);
+		return rc;
+	}
+
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLFetch(hstmt);
+	Py_END_ALLOW_THREADS;
+
+	rc = SQLFreeHandle(SQL_HANDLE_STMT, hstmt);
+	
+	/* Now setting up the same rounding mode on the client*/
+	if (strcmp(decflt_rounding, "ROUND_HALF_EVEN") == 0) rounding_mode = ROUND_HALF_EVEN;
+	if (strcmp(decflt_rounding, "ROUND_HALF_UP") == 0) rounding_mode = ROUND_HALF_UP;
+	if (strcmp(decflt_rounding, "ROUND_DOWN") == 0) rounding_mode = ROUND_DOWN;
+	if (strcmp(decflt_rounding, "ROUND_CEILING") == 0) rounding_mode = ROUND_CEILING;
+	if (strcmp(decflt_rounding, "ROUND_FLOOR") == 0) rounding_mode = ROUND_FLOOR;
+
+#ifndef PASE
+	rc = SQLSetConnectAttr(hdbc, SQL_ATTR_DECFLOAT_ROUNDING_MODE, (SQLPOINTER)rounding_mode, SQL_NTS);
+#else
+	rc = SQLSetConnectAttr(hdbc, SQL_ATTR_DECFLOAT_ROUNDING_MODE, (SQLPOINTER)&rounding_mode, SQL_NTS);
+#endif
+
+	return rc;
+
+}
+#endif
+#endif
+
+/* static void _python_ibm_db_clear_conn_err_cache () */
+static void _python_ibm_db_clear_conn_err_cache(void)
+{
+	/* Clear out the cached conn messages */
+	memset(IBM_DB_G(__python_conn_err_msg), 0, DB2_MAX_ERR_MSG_LEN);
+	memset(IBM_DB_G(__python_conn_err_state), 0, SQL_SQLSTATE_SIZE + 1);
+}
+
+/*!#
+ * ibm_db.connect
+ * ibm_db.pconnect
+ * ibm_db.autocommit
+ * ibm_db.bind_param
+ * ibm_db.close
+ * ibm_db.column_privileges
+ * ibm_db.columns
+ * ibm_db.foreign_keys
+ * ibm_db.primary_keys
+ * ibm_db.procedure_columns
+ * ibm_db.procedures
+ * ibm_db.special_columns
+ * ibm_db.statistics
+ * ibm_db.table_privileges
+ * ibm_db.tables
+ * ibm_db.commit
+ * ibm_db.exec
+ * ibm_db.free_result
+ * ibm_db.prepare
+ * ibm_db.execute
+ * ibm_db.conn_errormsg
+ * ibm_db.stmt_errormsg
+ * ibm_db.conn_error
+ * ibm_db.stmt_error
+ * ibm_db.next_result
+ * ibm_db.num_fields
+ * ibm_db.num_rows
+ * ibm_db.get_num_result
+ * ibm_db.field_name
+ * ibm_db.field_display_size
+ * ibm_db.field_num
+ * ibm_db.field_precision
+ * ibm_db.field_scale
+ * ibm_db.field_type
+ * ibm_db.field_width
+ * ibm_db.cursor_type
+ * ibm_db.rollback
+ * ibm_db.free_stmt
+ * ibm_db.result
+ * ibm_db.fetch_row
+ * ibm_db.fetch_assoc
+ * ibm_db.fetch_array
+ * ibm_db.fetch_both
+ * ibm_db.set_option
+ * ibm_db.server_info
+ * ibm_db.client_info
+ * ibm_db.active
+ * ibm_db.get_option
+ */
+
+
+
+/*!# ibm_db.connect
+ *
+ * ===Description
+ *
+ *  --	Returns a connection to a database
+ * IBM_DBConnection ibm_db.connect (dsn=<..>, user=<..>, password=<..>,
+ *								  host=<..>, database=<..>, options=<..>)
+ *
+ * Creates a new connection to an IBM DB2 Universal Database, IBM Cloudscape,
+ * or Apache Derby database.
  *
  * ===Parameters
  *
- * ====connection
- *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
+ * ====dsn
  *
- * ====dbName
- *      Name of the database that is to be created.
+ * For an uncataloged connection to a database, database represents a complete
+ * connection string in the following format:
+ * DRIVER={IBM DB2 ODBC DRIVER};DATABASE=database;HOSTNAME=hostname;PORT=port;
+ * PROTOCOL=TCPIP;UID=username;PWD=password;
+ *	  where the parameters represent the following values:
+ *		hostname
+ *			The hostname or IP address of the database server.
+ *		port
+ *			The TCP/IP port on which the database is listening for requests.
+ *		username
+ *			The username with which you are connecting to the database.
+ *		password
+ *			The password with which you are connecting to the database.
  *
- * ====codeSet
- *      Database code set information.
- *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
+ * ====user
  *
- * ====mode
- *      Database logging mode.
- *      Note: This value is applicable only to IDS data servers.
+ * The username with which you are connecting to the database.
+ * This is optional if username is specified in the "dsn" string
  *
- * ===Return Value
- *  Returns True if database already exists or created sucessfully else return None
- */
-PyObject *ibm_db_createdbNX(PyObject *self, PyObject *args)
-{
-	PyObject *py_conn_res = NULL;
-	PyObject *dbNameObj = NULL;
-	PyObject *codesetObj = NULL;
-	PyObject *modeObj = NULL;
-	int rc = -1;
-	
-	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
-		return NULL;
-	}
-	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-		return NULL;
-	}	
-	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 1);
-	if ( rc == 0 ) {
-		Py_RETURN_TRUE;
-	} else {
-		return NULL;
-	}
-}
-
-/*!# ibm_db.autocommit
+ * ====password
  *
- * ===Description
+ * The password with which you are connecting to the database.
+ * This is optional if password is specified in the "dsn" string
  *
- * mixed ibm_db.autocommit ( resource connection [, bool value] )
+ * ====host
  *
- * Returns or sets the AUTOCOMMIT behavior of the specified connection resource.
+ * The hostname or IP address of the database server.
+ * This is optional if hostname is specified in the "dsn" string
  *
- * ===Parameters
+ * ====database
  *
- * ====connection
- *	A valid database connection resource variable as returned from connect()
- * or pconnect().
+ * For a cataloged connection to a database, database represents the database
+ * alias in the DB2 client catalog.
+ * This is optional if database is specified in the "dsn" string
  *
- * ====value
- *	One of the following constants:
- *	SQL_AUTOCOMMIT_OFF
- *		  Turns AUTOCOMMIT off.
- *	SQL_AUTOCOMMIT_ON
- *		  Turns AUTOCOMMIT on.
+ * ====options
+ *
+ *	  An dictionary of connection options that affect the behavior of the
+ *	  connection,
+ *	  where valid array keys include:
+ *		SQL_ATTR_AUTOCOMMIT
+ *			Passing the SQL_AUTOCOMMIT_ON value turns autocommit on for this
+ *			connection handle.
+ *			Passing the SQL_AUTOCOMMIT_OFF value turns autocommit off for this
+ *			connection handle.
+ *		ATTR_CASE
+ *			Passing the CASE_NATURAL value specifies that column names are
+ *			returned in natural case.
+ *			Passing the CASE_LOWER value specifies that column names are
+ *			returned in lower case.
+ *			Passing the CASE_UPPER value specifies that column names are
+ *			returned in upper case.
+ *		SQL_ATTR_CURSOR_TYPE
+ *			Passing the SQL_SCROLL_FORWARD_ONLY value specifies a forward-only
+ *			cursor for a statement resource.
+ *			This is the default cursor type and is supported on all database
+ *			servers.
+ *			Passing the SQL_CURSOR_KEYSET_DRIVEN value specifies a scrollable
+ *			cursor for a statement resource.
+ *			This mode enables random access to rows in a result set, but
+ *			currently is supported only by IBM DB2 Universal Database.
+ *		ATTR_FETCH_BUFFER_SIZE
+ *			Passing a number of bytes bounds the column buffers allocated to
+ *			fetch a block of rows at a time, 1048576 by default. Larger
+ *			buffers fetch more rows per call on large result sets.
+ *			Passing 0 fetches one row at a time.
+ *		ATTR_CHAR_MODE
+ *			Passing the CHAR_WCHAR value transfers character data as UTF-16.
+ *			This is the default.
+ *			Passing the CHAR_UTF8 value transfers character data in the
+ *			client code page, which must be UTF-8 (DB2CODEPAGE=1208, or
+ *			CLIENT_LOCALE=en_US.utf8 for Informix), and decodes it as UTF-8.
+ *			Passing the CHAR_BYTES value transfers character data in the
+ *			client code page and returns it as bytes, without decoding.
+ * ====set_replace_quoted_literal
+ *	  This variable indicates if the CLI Connection attribute SQL_ATTR_REPLACE_QUOTED_LITERAL is to be set or not
+ *	  To turn it ON pass  IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
+ *	  To turn it OFF pass IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_OFF
+ *
+ *	  Default Setting: - IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
  *
  * ===Return Values
  *
- * When ibm_db.autocommit() receives only the connection parameter, it returns
- * the current state of AUTOCOMMIT for the requested connection as an integer
- * value. A value of 0 indicates that AUTOCOMMIT is off, while a value of 1
- * indicates that AUTOCOMMIT is on.
  *
- * When ibm_db.autocommit() receives both the connection parameter and
- * autocommit parameter, it attempts to set the AUTOCOMMIT state of the
- * requested connection to the corresponding state.
+ * Returns a IBM_DBConnection connection object if the connection attempt is
+ * successful.
+ * If the connection attempt fails, ibm_db.connect() returns None.
  *
- * Returns TRUE on success or FALSE on failure.
  */ 
-static PyObject *ibm_db_autocommit(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_connect(PyObject *self, PyObject *args)
 {
-	PyObject *py_autocommit = NULL;
-	PyObject *py_conn_res = NULL;
-	conn_handle *conn_res = NULL;
-	int rc;
-	SQLINTEGER autocommit = -1;
-
-	if (!PyArg_ParseTuple(args, "O|O", &py_conn_res, &py_autocommit)){
-		return NULL;
-	}
+	_python_ibm_db_clear_conn_err_cache();
+	return _python_ibm_db_connect_helper( self, args, 0 );
+}
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
-		}
-		if (!NIL_P(py_autocommit)) {
-			if (PyInt_Check(py_autocommit)) { 
-				autocommit = (SQLINTEGER)PyInt_AsLong(py_autocommit);
-			} else {
-				PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-				return NULL;
-			}
-		}
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			return NULL;
-		}
+/*!# ibm_db.pconnect
+ *
+ * ===Description
+ *  --	Returns a persistent connection to a database
+ * resource ibm_db.pconnect ( string database, string username, string password
+ * [, array options] )
+ *
+ * Returns a persistent connection to an IBM DB2 Universal Database,
+ * IBM Cloudscape, Apache Derby or Informix Dynamic Server database.
+ *
+ * Calling ibm_db.close() on a persistent connection always returns TRUE, but
+ * the underlying DB2 client connection remains open and waiting to serve the
+ * next matching ibm_db.pconnect() request.
+ *
+ * ===Parameters
+ *
+ * ====database
+ *		The database alias in the DB2 client catalog.
+ *
+ * ====username
+ *		The username with which you are connecting to the database.
+ *
+ * ====password
+ *		The password with which you are connecting to the database.
+ *
+ * ====options
+ *		An associative array of connection options that affect the behavior of
+ * the connection,
+ *		where valid array keys include:
+ *
+ *		autocommit
+ *			 Passing the DB2_AUTOCOMMIT_ON value turns autocommit on for this
+ * connection handle.
+ *			 Passing the DB2_AUTOCOMMIT_OFF value turns autocommit off for
+ * this connection handle.
+ *
+ *		DB2_ATTR_CASE
+ *			 Passing the DB2_CASE_NATURAL value specifies that column names
+ * are returned in natural case.
+ *			 Passing the DB2_CASE_LOWER value specifies that column names are
+ * returned in lower case.
+ *			 Passing the DB2_CASE_UPPER value specifies that column names are
+ * returned in upper case.
+ *
+ *		CURSOR
+ *			 Passing the SQL_SCROLL_FORWARD_ONLY value specifies a
+ * forward-only cursor for a statement resource.  This is the default cursor
+ * type and is supported on all database servers.
+ *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value specifies a scrollable
+ * cursor for a statement resource. This mode enables random access to rows in a
+ * result set, but currently is supported only by IBM DB2 Universal Database.
+ *
+ * ====set_replace_quoted_literal
+ *	  This variable indicates if the CLI Connection attribute SQL_ATTR_REPLACE_QUOTED_LITERAL is to be set or not
+ *	  To turn it ON pass  IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
+ *	  To turn it OFF pass IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_OFF
+ *
+ *	  Default Setting: - IBM_DB::SET_QUOTED_LITERAL_REPLACEMENT_ON
+ *
+ * ===Return Values
+ *
+ * Returns a connection handle resource if the connection attempt is successful.
+ * ibm_db.pconnect() tries to reuse an existing connection resource that exactly
+ * matches the database, username, and password parameters. If the connection
+ * attempt fails, ibm_db.pconnect() returns FALSE.
+ */
+static PyObject *ibm_db_pconnect(PyObject *self, PyObject *args)
+{
+	_python_ibm_db_clear_conn_err_cache();
+	return _python_ibm_db_connect_helper( self, args, 1);
+}
 
-	  /* If value in handle is different from value passed in */
-		if (PyTuple_Size(args) == 2) {
-			if(autocommit != (conn_res->auto_commit)) {
-#ifndef PASE
-				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, (SQLPOINTER) (autocommit == 0 ? SQL_AUTOCOMMIT_OFF : SQL_AUTOCOMMIT_ON), SQL_IS_INTEGER);
-#else
-				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, (SQLPOINTER)&autocommit, SQL_IS_INTEGER);
-#endif
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, 
-												rc, 1, NULL, -1, 1);
-				}
-				conn_res->auto_commit = autocommit;
+/*	static void _python_ibm_db_pool_discard(conn_handle *conn_res)
+	disconnects a connection dropped by its pool. Errors are ignored, the
+	connection is usually dropped because it is broken
+*/
+static void _python_ibm_db_pool_discard(conn_handle *conn_res)
+{
+	if ( !conn_res->handle_active ) {
+		return;
+	}
+	if ( conn_res->owner_pid != IBM_DB_GETPID() ) {
+		_python_ibm_db_abandon_conn(conn_res);
+		return;
+	}
+	conn_res->handle_active = 0;
+	_python_ibm_db_stmt_cache_invalidate(conn_res);
+	Py_BEGIN_ALLOW_THREADS;
+	if ( conn_res->auto_commit == 0 ) {
+		SQLEndTran(SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, SQL_ROLLBACK);
+	}
+	SQLDisconnect((SQLHDBC)conn_res->hdbc);
+	SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
+	SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
+	Py_END_ALLOW_THREADS;
+}
+
+/*	static void _python_ibm_db_pool_evict(ibm_db_pool *pool, int all)
+	disconnects idle connections, least recently used first, that were idle
+	for max_idle seconds while the pool holds more than min connections
+*/
+static void _python_ibm_db_pool_evict(ibm_db_pool *pool, int all)
+{
+	conn_handle *conn_res = NULL;
+	time_t now = time(NULL);
+
+	while ( PyList_GET_SIZE(pool->idle) > 0 ) {
+		conn_res = (conn_handle *)PyList_GET_ITEM(pool->idle, 0);
+		if ( !all ) {
+			if ( pool->in_use + PyList_GET_SIZE(pool->idle) <= pool->min_size ) {
+				break;
+			}
+			if ( pool->max_idle < 0 || 
+				difftime(now, conn_res->pool_idle_since) < pool->max_idle ) {
+				break;
 			}
-			Py_INCREF(Py_True);
-			return Py_True;
-		} else {
-			return PyInt_FromLong(conn_res->auto_commit);
 		}
+		Py_INCREF(conn_res);
+		PyList_SetSlice(pool->idle, 0, 1, NULL);
+		_python_ibm_db_pool_discard(conn_res);
+		Py_DECREF(conn_res);
+		pool->discarded++;
 	}
-	return NULL;
 }
 
-/*	static void _python_ibm_db_add_param_cache( stmt_handle *stmt_res, int param_no, PyObject *var_pyvalue, char *varname, int varname_len, int param_type, int size, SQLSMALLINT data_type, SQLSMALLINT precision, SQLSMALLINT scale, SQLSMALLINT nullable )
+/*	static int _python_ibm_db_pool_validate(ibm_db_pool *pool, conn_handle *conn_res)
+	checks an idle connection before it is handed out. SQL_ATTR_CONNECTION_DEAD
+	only looks at the client side state, the server is pinged when the
+	connection was idle for validate seconds
 */
-static void _python_ibm_db_add_param_cache( stmt_handle *stmt_res, int param_no, PyObject *var_pyvalue, int param_type, int size, SQLSMALLINT data_type, SQLUINTEGER precision, SQLSMALLINT scale, SQLSMALLINT nullable )
+static int _python_ibm_db_pool_validate(ibm_db_pool *pool, conn_handle *conn_res)
 {
-	param_node *tmp_curr = NULL, *prev = stmt_res->head_cache_list, *curr = stmt_res->head_cache_list;
+	SQLINTEGER conn_dead = 0;
+	SQLINTEGER conn_alive = 1;
+	int rc;
 
-	while ( (curr != NULL) && (curr->param_num < param_no) ) {
-		prev = curr;
-		curr = curr->next;
+	if ( !conn_res->handle_active || conn_res->owner_pid != IBM_DB_GETPID() ) {
+		return 0;
+	}
+	rc = SQLGetConnectAttr(conn_res->hdbc, SQL_ATTR_CONNECTION_DEAD, 
+		(SQLPOINTER)&conn_dead, 0, NULL);
+	if ( rc == SQL_SUCCESS && conn_dead == SQL_CD_TRUE ) {
+		return 0;
 	}
+#ifndef PASE
+	if ( pool->validate >= 0 && 
+		difftime(time(NULL), conn_res->pool_idle_since) >= pool->validate ) {
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLGetConnectAttr(conn_res->hdbc, SQL_ATTR_PING_DB, 
+			(SQLPOINTER)&conn_alive, 0, NULL);
+		Py_END_ALLOW_THREADS;
+		if ( rc == SQL_ERROR || conn_alive == 0 ) {
+			return 0;
+		}
+	}
+#endif /* PASE */
+	return 1;
+}
 
-	if ( curr == NULL || curr->param_num != param_no ) {
-		/* Allocate memory and make new node to be added */
-		tmp_curr = ALLOC(param_node);
-		memset(tmp_curr, 0, sizeof(param_node));
+/*	static conn_handle *_python_ibm_db_pool_connect(ibm_db_pool *pool)
+	opens a new connection for the pool
+*/
+static conn_handle *_python_ibm_db_pool_connect(ibm_db_pool *pool)
+{
+	PyObject *args = NULL;
+	conn_handle *conn_res = NULL;
 
-		/* assign values */
-		tmp_curr->data_type = data_type;
-		tmp_curr->param_size = precision;
-		tmp_curr->nullable = nullable;
-		tmp_curr->scale = scale;
-		tmp_curr->param_num = param_no;
-		tmp_curr->file_options = SQL_FILE_READ;
-		tmp_curr->param_type = param_type;
-		tmp_curr->size = size;
+	if ( NIL_P(pool->options) ) {
+		args = PyTuple_Pack(3, pool->dsn, pool->uid, pool->password);
+	} else {
+		args = PyTuple_Pack(4, pool->dsn, pool->uid, pool->password, pool->options);
+	}
+	if ( args == NULL ) {
+		return NULL;
+	}
+	_python_ibm_db_clear_conn_err_cache();
+	conn_res = (conn_handle *)_python_ibm_db_connect_helper(NULL, args, 0);
+	Py_DECREF(args);
+
+	if ( conn_res != NULL && !pool->have_defaults ) {
+		pool->auto_commit = conn_res->auto_commit;
+		pool->c_bin_mode = conn_res->c_bin_mode;
+		pool->c_case_mode = conn_res->c_case_mode;
+		pool->c_char_mode = conn_res->c_char_mode;
+		pool->c_cursor_type = conn_res->c_cursor_type;
+		pool->query_timeout = conn_res->query_timeout;
+		pool->fetch_buffer_size = conn_res->fetch_buffer_size;
+		pool->have_defaults = 1;
+	}
+	return conn_res;
+}
 
-		/* Set this flag in stmt_res if a FILE INPUT is present */
-		if ( param_type == PARAM_FILE) {
-			stmt_res->file_param = 1;
-		}
+/*	static PyObject *_python_ibm_db_pool_checkin(ibm_db_pool *pool, conn_handle *conn_res)
+	puts a checked out connection back on the idle list of its pool after
+	rolling back the open transaction and restoring the settings the pool
+	opened it with
+*/
+static PyObject *_python_ibm_db_pool_checkin(ibm_db_pool *pool, conn_handle *conn_res)
+{
+	int rc = SQL_SUCCESS;
 
-		if ( var_pyvalue != NULL) {
-			tmp_curr->var_pyvalue = var_pyvalue;
-		}
+	/* The reference of the connection to the pool is released below */
+	conn_res->pool = NULL;
+	pool->in_use--;
 
-		/* link pointers for the list */
-		if ( prev == NULL ) {
-			stmt_res->head_cache_list = tmp_curr;
-		} else {
-			prev->next = tmp_curr;
+	if ( conn_res->owner_pid != IBM_DB_GETPID() ) {
+		_python_ibm_db_abandon_conn(conn_res);
+	}
+	if ( !pool->closed && conn_res->handle_active ) {
+		if ( conn_res->auto_commit == 0 ) {
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLEndTran(SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, SQL_ROLLBACK);
+			Py_END_ALLOW_THREADS;
 		}
-		tmp_curr->next = curr;
+		if ( rc != SQL_ERROR && conn_res->auto_commit != pool->auto_commit ) {
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, 
+				(SQLPOINTER)(pool->auto_commit), SQL_NTS);
+			Py_END_ALLOW_THREADS;
+			conn_res->auto_commit = pool->auto_commit;
+		}
+		conn_res->c_bin_mode = pool->c_bin_mode;
+		conn_res->c_case_mode = pool->c_case_mode;
+		conn_res->c_char_mode = pool->c_char_mode;
+		conn_res->c_cursor_type = pool->c_cursor_type;
+		conn_res->query_timeout = pool->query_timeout;
+		conn_res->fetch_buffer_size = pool->fetch_buffer_size;
+	}
 
-		/* Increment num params added */
-		stmt_res->num_params++;
+	if ( pool->closed || !conn_res->handle_active || rc == SQL_ERROR ) {
+		_python_ibm_db_pool_discard(conn_res);
+		pool->discarded++;
 	} else {
-		/* Both the nodes are for the same param no */
-		/* Replace Information */
-		curr->data_type = data_type;
-		curr->param_size = precision;
-		curr->nullable = nullable;
-		curr->scale = scale;
-		curr->param_num = param_no;
-		curr->file_options = SQL_FILE_READ;
-		curr->param_type = param_type;
-		curr->size = size;
+		conn_res->pool_idle_since = time(NULL);
+		PyList_Append(pool->idle, (PyObject *)conn_res);
+		_python_ibm_db_pool_evict(pool, 0);
+	}
+	Py_DECREF(pool);
+	Py_RETURN_TRUE;
+}
 
-		/* Set this flag in stmt_res if a FILE INPUT is present */
-		if ( param_type == PARAM_FILE) {
-			stmt_res->file_param = 1;
-		}
+/*!# ibm_db.Pool
+ *
+ * ===Description
+ * IBM_DBPool ibm_db.Pool ( string dsn [, int min [, int max [, int max_idle
+ * [, int validate [, string user [, string password [, dict options]]]]]]] )
+ *
+ * Creates a bounded pool of non persistent connections to a database.
+ *
+ * pool.checkout() returns an idle connection of the pool, or opens a new one
+ * while fewer than max connections are checked out. pool.checkin(conn), or
+ * ibm_db.close(conn), rolls back the open transaction of the connection and
+ * returns it to the pool, where it keeps its prepared statement cache.
+ * Unlike ibm_db.pconnect(), connections idle for longer than max_idle
+ * seconds are disconnected, least recently used first, as long as the pool
+ * holds more than min connections.
+ *
+ * Before an idle connection is handed out the pool checks the
+ * SQL_ATTR_CONNECTION_DEAD state of the client, which needs no network flow,
+ * and pings the server if the connection was idle for validate seconds.
+ * Connections failing the check are disconnected and replaced.
+ *
+ * ===Parameters
+ *
+ * ====dsn
+ *		The database alias or connection string, as for ibm_db.connect().
+ *
+ * ====min
+ *		Number of connections opened when the pool is created and kept when
+ * idle. The default is 0.
+ *
+ * ====max
+ *		Maximum number of connections checked out at a time. The default is 10.
+ *
+ * ====max_idle
+ *		Seconds an idle connection is kept above min connections. A negative
+ * value keeps idle connections. The default is 300.
+ *
+ * ====validate
+ *		Seconds a connection may be idle before checkout pings the server.
+ * True pings on every checkout, None or False never pings. The default is 30.
+ *
+ * ====user, password, options
+ *		As for ibm_db.connect().
+ *
+ * ===Return Values
+ *
+ * An IBM_DBPool object with the methods checkout(), checkin(conn), close()
+ * and info(). checkout() raises an exception if max connections are checked
+ * out. info() returns a dictionary with the keys min, max, idle, in_use,
+ * hits (checkouts served by an idle connection), misses (connections opened)
+ * and discarded (connections disconnected by the pool).
+ */
+static int ibm_db_pool_init(ibm_db_pool *self, PyObject *args, PyObject *kwargs)
+{
+	static char *kwlist[] = {"dsn", "min", "max", "max_idle", "validate", "user", "password", "options", NULL};
+	PyObject *dsn = NULL;
+	PyObject *py_validate = NULL;
+	PyObject *uid = NULL;
+	PyObject *password = NULL;
+	PyObject *options = NULL;
+	conn_handle *conn_res = NULL;
+	long min_size = 0;
+	long max_size = 10;
+	long max_idle = 300;
+	long validate = 30;
 
-		if ( var_pyvalue != NULL) {
-			curr->var_pyvalue = var_pyvalue;
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|lllOOOO", kwlist, &dsn, 
+		&min_size, &max_size, &max_idle, &py_validate, &uid, &password, &options)) {
+		return -1;
+	}
+	if ( self->idle != NULL ) {
+		PyErr_SetString(PyExc_Exception, "Pool is already initialized");
+		return -1;
+	}
+	if ( max_size < 1 || min_size < 0 || min_size > max_size ) {
+		PyErr_SetString(PyExc_Exception, "Pool size must satisfy 0 <= min <= max and max >= 1");
+		return -1;
+	}
+	if ( options == Py_None ) {
+		options = NULL;
+	}
+	if ( !NIL_P(options) && !PyDict_Check(options) ) {
+		PyErr_SetString(PyExc_Exception, "options Parameter must be of type dictionay");
+		return -1;
+	}
+	if ( py_validate == Py_None || py_validate == Py_False ) {
+		validate = -1;
+	} else if ( py_validate == Py_True ) {
+		validate = 0;
+	} else if ( py_validate != NULL ) {
+		validate = PyInt_AsLong(py_validate);
+		if ( validate == -1 && PyErr_Occurred() ) {
+			return -1;
 		}
+	}
 
+	self->dsn = dsn;
+	Py_INCREF(dsn);
+	self->uid = NIL_P(uid) ? StringOBJ_FromASCII("") : uid;
+	self->password = NIL_P(password) ? StringOBJ_FromASCII("") : password;
+	Py_XINCREF(uid);
+	Py_XINCREF(password);
+	self->options = options;
+	Py_XINCREF(options);
+	self->idle = PyList_New(0);
+	self->min_size = min_size;
+	self->max_size = max_size;
+	self->max_idle = max_idle;
+	self->validate = validate;
+
+	while ( PyList_GET_SIZE(self->idle) < self->min_size ) {
+		conn_res = _python_ibm_db_pool_connect(self);
+		if ( conn_res == NULL ) {
+			return -1;
+		}
+		self->misses++;
+		conn_res->pool_idle_since = time(NULL);
+		PyList_Append(self->idle, (PyObject *)conn_res);
+		Py_DECREF(conn_res);
 	}
+	return 0;
 }
 
-/*
- * static PyObject *_python_ibm_db_bind_param_helper(int argc, stmt_handle *stmt_res, SQLUSMALLINT param_no, PyObject *var_pyvalue, long param_type,
- * 					 long data_type, long precision, long scale, long size)
- */
-static PyObject *_python_ibm_db_bind_param_helper(int argc, stmt_handle *stmt_res, SQLUSMALLINT param_no, PyObject *var_pyvalue, long param_type, long data_type, long precision, long scale, long size)
+static void _python_ibm_db_free_pool(ibm_db_pool *self)
 {
-	SQLSMALLINT sql_data_type = 0;
-	SQLUINTEGER sql_precision = 0;
-	SQLSMALLINT sql_scale = 0;
-	SQLSMALLINT sql_nullable = SQL_NO_NULLS;
-	char error[DB2_MAX_ERR_MSG_LEN];
-	int rc = 0;
-	
-	/* Check for Param options */
-	switch (argc) {
-		/* if argc == 3, then the default value for param_type will be used */
-		case 3:
-			param_type = SQL_PARAM_INPUT;
+	if ( self->idle != NULL ) {
+		_python_ibm_db_pool_evict(self, 1);
+	}
+	Py_XDECREF(self->idle);
+	Py_XDECREF(self->dsn);
+	Py_XDECREF(self->uid);
+	Py_XDECREF(self->password);
+	Py_XDECREF(self->options);
+	Py_TYPE(self)->tp_free((PyObject*)self);
+}
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, (SQLUSMALLINT)param_no, &sql_data_type, &sql_precision, &sql_scale, &sql_nullable);
-			Py_END_ALLOW_THREADS;
+static PyObject *ibm_db_pool_checkout(ibm_db_pool *self, PyObject *args)
+{
+	conn_handle *conn_res = NULL;
+	Py_ssize_t last;
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-				sprintf(error, "Describe Param Failed: %s", 
-				IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
-			/* Add to cache */
-			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue, 
-										param_type, size, 
-										sql_data_type, sql_precision, 
-										sql_scale, sql_nullable );
-			break;
-
-		case 4:
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
-								(SQLUSMALLINT)param_no, &sql_data_type, 
-								&sql_precision, &sql_scale, &sql_nullable);
-			Py_END_ALLOW_THREADS;
+	if ( self->idle == NULL || self->closed ) {
+		PyErr_SetString(PyExc_Exception, "Pool is closed");
+		return NULL;
+	}
+	_python_ibm_db_pool_evict(self, 0);
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
-												rc, 1, NULL, -1, 1);
-				sprintf(error, "Describe Param Failed: %s", 
-						IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
-			/* Add to cache */
-			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
-											param_type, size, 
-											sql_data_type, sql_precision, 
-											sql_scale, sql_nullable );
+	/* Most recently used first, so the least recently used can age out */
+	while ( (last = PyList_GET_SIZE(self->idle)) > 0 ) {
+		conn_res = (conn_handle *)PyList_GET_ITEM(self->idle, last - 1);
+		Py_INCREF(conn_res);
+		PyList_SetSlice(self->idle, last - 1, last, NULL);
+		self->in_use++;
+		if ( _python_ibm_db_pool_validate(self, conn_res) ) {
+			self->hits++;
 			break;
+		}
+		self->in_use--;
+		_python_ibm_db_pool_discard(conn_res);
+		self->discarded++;
+		Py_DECREF(conn_res);
+		conn_res = NULL;
+	}
 
-		case 5:
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
-								(SQLUSMALLINT)param_no, &sql_data_type, 
-								&sql_precision, &sql_scale, &sql_nullable);
-			Py_END_ALLOW_THREADS;
+	if ( conn_res == NULL ) {
+		if ( self->in_use >= self->max_size ) {
+			PyErr_SetString(PyExc_Exception, "Pool exhausted: all connections are checked out");
+			return NULL;
+		}
+		/* Count the connection while connecting, other threads may run */
+		self->in_use++;
+		conn_res = _python_ibm_db_pool_connect(self);
+		if ( conn_res == NULL ) {
+			self->in_use--;
+			return NULL;
+		}
+		self->misses++;
+	}
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-								rc, 1, NULL, -1, 1);
-				sprintf(error, "Describe Param Failed: %s", 
-								IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
-			sql_data_type = (SQLSMALLINT)data_type;
-			/* Add to cache */
-			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
-											param_type, size, 
-											sql_data_type, sql_precision, 
-											sql_scale, sql_nullable );
-			break;
+	Py_INCREF(self);
+	conn_res->pool = (PyObject *)self;
+	return (PyObject *)conn_res;
+}
 
-		case 6:
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
-								(SQLUSMALLINT)param_no, &sql_data_type, 
-							&sql_precision, &sql_scale, &sql_nullable);
-			Py_END_ALLOW_THREADS;
+static PyObject *ibm_db_pool_checkin(ibm_db_pool *self, PyObject *args)
+{
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res = NULL;
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
-												rc, 1, NULL, -1, 1);
-				sprintf(error, "Describe Param Failed: %s", 
-						IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
-			sql_data_type = (SQLSMALLINT)data_type;
-			sql_precision = (SQLUINTEGER)precision;
-			/* Add to cache */
-			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
-											param_type, size, 
-											sql_data_type, sql_precision, 
-											sql_scale, sql_nullable );
-			break;
+	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+		return NULL;
 
-		case 7:
-		case 8:
-			/* Cache param data passed 
-			* I am using a linked list of nodes here because I don't know 
-			* before hand how many params are being passed in/bound. 
-			* To determine this, a call to SQLNumParams is necessary. 
-			* This is take away any advantages an array would have over 
-			* linked list access 
-			* Data is being copied over to the correct types for subsequent 
-			* CLI call because this might cause problems on other platforms 
-			* such as AIX 
-			*/
-			sql_data_type = (SQLSMALLINT)data_type;
-			sql_precision = (SQLUINTEGER)precision;
-			sql_scale = (SQLSMALLINT)scale;
-			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
-											param_type, size, 
-											sql_data_type, sql_precision, 
-											sql_scale, sql_nullable );
-			break;
-	
-		default:
-			/* WRONG_PARAM_COUNT; */
-			return NULL;
+	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return NULL;
 	}
-	/* end Switch */
+	conn_res = (conn_handle *)py_conn_res;
+	if ( conn_res->pool != (PyObject *)self ) {
+		PyErr_SetString(PyExc_Exception, "Connection is not checked out from this pool");
+		return NULL;
+	}
+	return _python_ibm_db_pool_checkin(self, conn_res);
+}
 
-	/* We bind data with DB2 CLI in ibm_db.execute() */
-	/* This will save network flow if we need to override params in it */
+static PyObject *ibm_db_pool_close(ibm_db_pool *self, PyObject *args)
+{
+	self->closed = 1;
+	if ( self->idle != NULL ) {
+		_python_ibm_db_pool_evict(self, 1);
+	}
+	Py_RETURN_TRUE;
+}
 
-	Py_INCREF(Py_True);
-	return Py_True;
+static PyObject *ibm_db_pool_info(ibm_db_pool *self, PyObject *args)
+{
+	PyObject *info = PyDict_New();
+	PyObject *value = NULL;
+
+	if ( info == NULL ) {
+		return NULL;
+	}
+	value = PyInt_FromLong(self->min_size);
+	PyDict_SetItemString(info, "min", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->max_size);
+	PyDict_SetItemString(info, "max", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->idle == NULL ? 0 : (long)PyList_GET_SIZE(self->idle));
+	PyDict_SetItemString(info, "idle", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->in_use);
+	PyDict_SetItemString(info, "in_use", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->hits);
+	PyDict_SetItemString(info, "hits", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->misses);
+	PyDict_SetItemString(info, "misses", value);
+	Py_DECREF(value);
+	value = PyInt_FromLong(self->discarded);
+	PyDict_SetItemString(info, "discarded", value);
+	Py_DECREF(value);
+	return info;
 }
 
-/*!# ibm_db.bind_param
+static PyMethodDef pool_methods[] = {
+	{"checkout", (PyCFunction)ibm_db_pool_checkout, METH_NOARGS, "Returns an idle connection of the pool or opens a new one"},
+	{"checkin", (PyCFunction)ibm_db_pool_checkin, METH_VARARGS, "Returns a checked out connection to the pool"},
+	{"close", (PyCFunction)ibm_db_pool_close, METH_NOARGS, "Disconnects the idle connections and those checked in later"},
+	{"info", (PyCFunction)ibm_db_pool_info, METH_NOARGS, "Returns the size and counters of the pool"},
+	{NULL} /* Sentinel */
+};
+
+static PyTypeObject poolType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"ibm_db.IBM_DBPool",	 /*tp_name			 */
+	sizeof(ibm_db_pool),	 /*tp_basicsize		 */
+	0,						 /*tp_itemsize		*/
+	(destructor)_python_ibm_db_free_pool, /*tp_dealloc	*/
+	0,						 /*tp_print			*/
+	0,						 /*tp_getattr		 */
+	0,						 /*tp_setattr		 */
+	0,						 /*tp_compare		 */
+	0,						 /*tp_repr			*/
+	0,						 /*tp_as_number		*/
+	0,						 /*tp_as_sequence	 */
+	0,						 /*tp_as_mapping	  */
+	0,						 /*tp_hash			*/
+	0,						 /*tp_call			*/
+	0,						 /*tp_str			 */
+	0,						 /*tp_getattro		*/
+	0,						 /*tp_setattro		*/
+	0,						 /*tp_as_buffer		*/
+	Py_TPFLAGS_DEFAULT,		/*tp_flags			*/
+	"IBM DataServer connection pool", /* tp_doc		*/
+	0,						 /* tp_traverse		*/
+	0,						 /* tp_clear		  */
+	0,						 /* tp_richcompare	*/
+	0,						 /* tp_weaklistoffset */
+	0,						 /* tp_iter			*/
+	0,						 /* tp_iternext		*/
+	pool_methods,			 /* tp_methods		*/
+	0,						 /* tp_members		*/
+	0,						 /* tp_getset		 */
+	0,						 /* tp_base			*/
+	0,						 /* tp_dict			*/
+	0,						 /* tp_descr_get	  */
+	0,						 /* tp_descr_set	  */
+	0,						 /* tp_dictoffset	 */
+	(initproc)ibm_db_pool_init, /* tp_init			*/
+};
+
+/*!# ibm_db.after_fork
  *
  * ===Description
- * Py_True/Py_None ibm_db.bind_param (resource stmt, int parameter-number,
- *									string variable [, int parameter-type
- *									[, int data-type [, int precision
- *									[, int scale [, int size[]]]]]] )
- *
- * Binds a Python variable to an SQL statement parameter in a IBM_DBStatement
- * resource returned by ibm_db.prepare().
- * This function gives you more control over the parameter type, data type,
- * precision, and scale for the parameter than simply passing the variable as
- * part of the optional input array to ibm_db.execute().
- *
- * ===Parameters
- *
- * ====stmt
- *
- *	A prepared statement returned from ibm_db.prepare().
- *
- * ====parameter-number
- *
- *	Specifies the 1-indexed position of the parameter in the prepared
- * statement.
- *
- * ====variable
- *
- *	A Python variable to bind to the parameter specified by parameter-number.
- *
- * ====parameter-type
- *
- *	A constant specifying whether the Python variable should be bound to the
- * SQL parameter as an input parameter (SQL_PARAM_INPUT), an output parameter
- * (SQL_PARAM_OUTPUT), or as a parameter that accepts input and returns output
- * (SQL_PARAM_INPUT_OUTPUT). To avoid memory overhead, you can also specify
- * PARAM_FILE to bind the Python variable to the name of a file that contains
- * large object (BLOB, CLOB, or DBCLOB) data.
- *
- * ====data-type
- *
- *	A constant specifying the SQL data type that the Python variable should be
- * bound as: one of SQL_BINARY, DB2_CHAR, DB2_DOUBLE, or DB2_LONG .
- *
- * ====precision
- *
- *	Specifies the precision that the variable should be bound to the database. *
- * ====scale
+ * int ibm_db.after_fork ( )
  *
- *	  Specifies the scale that the variable should be bound to the database.
+ * Forgets the connections inherited from the parent process after fork().
  *
- * ====size
+ * A child process shares the sockets of the connections its parent opened,
+ * so it must neither use nor close them. ibm_db.after_fork() marks every
+ * connection opened by another process as inactive and drops it from the
+ * ibm_db.pconnect() list, without sending anything to the server. Pools
+ * replace their inherited connections on the next checkout.
  *
- *	  Specifies the size that should be retreived from an INOUT/OUT parameter.
+ * On Python 3.7 and later the function is registered with
+ * os.register_at_fork() and runs in the child automatically. Elsewhere call
+ * it first thing in the child, for instance from a post_fork hook of the
+ * server. Inherited connections met by ibm_db.pconnect(), ibm_db.close()
+ * and pools are dropped in the same way even without the call.
  *
  * ===Return Values
  *
- *	Returns Py_True on success or NULL on failure.
+ * The number of inherited connections dropped.
  */
-static PyObject *ibm_db_bind_param(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_after_fork(PyObject *self, PyObject *args)
 {
-	PyObject *var_pyvalue = NULL;
-	PyObject *py_param_type = NULL;
-	PyObject *py_data_type = NULL;
-	PyObject *py_precision = NULL;
-	PyObject *py_scale = NULL;
-	PyObject *py_size = NULL;
-	PyObject *py_param_no = NULL;
-	PyObject *py_stmt_res = NULL;
-
-	long param_type = SQL_PARAM_INPUT;
-	/* LONG types used for data being passed in */
-	SQLUSMALLINT param_no = 0;
-	long data_type = 0;
-	long precision = 0;
-	long scale = 0;
-	long size = 0;
-	stmt_handle *stmt_res;
-	
-	if (!PyArg_ParseTuple(args, "OOO|OOOOO", &py_stmt_res, &py_param_no, 
-						&var_pyvalue, &py_param_type, 
-						&py_data_type, &py_precision, 
-						&py_scale, &py_size)) {
-	
+	long pid = IBM_DB_GETPID();
+	PyObject *inherited = NULL;
+	PyObject *stale_keys = NULL;
+	PyObject *key = NULL;
+	PyObject *value = NULL;
+	PyObject *owner = NULL;
+	Py_ssize_t pos = 0;
+	Py_ssize_t i, count;
+
+	inherited = PyList_New(0);
+	stale_keys = PyList_New(0);
+	if ( inherited == NULL || stale_keys == NULL ) {
+		Py_XDECREF(inherited);
+		Py_XDECREF(stale_keys);
 		return NULL;
 	}
-
-	if (!NIL_P(py_param_no)) {
-		if (PyInt_Check(py_param_no)) {
-			param_no = (SQLUSMALLINT) PyInt_AsLong(py_param_no);
-		} else {
-			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-			return NULL;
+	/* Collect first, dropping statement caches changes the registry */
+	while ( PyDict_Next(ibm_db_conn_owners, &pos, &key, &value) ) {
+		owner = (PyObject *)PyLong_AsVoidPtr(value);
+		if ( owner != NULL && PyObject_TypeCheck(owner, &conn_handleType) &&
+			((conn_handle *)owner)->owner_pid != pid &&
+			((conn_handle *)owner)->handle_active ) {
+			PyList_Append(inherited, owner);
 		}
 	}
-	if (py_param_type != NULL && py_param_type != Py_None && 
-		TYPE(py_param_type) == PYTHON_FIXNUM) {
-		param_type = PyInt_AS_LONG(py_param_type);
+	pos = 0;
+	while ( PyDict_Next(persistent_list, &pos, &key, &value) ) {
+		if ( ((conn_handle *)value)->owner_pid != pid ) {
+			PyList_Append(stale_keys, key);
+		}
 	}
 
-	if (py_data_type != NULL && py_data_type != Py_None && 
-		TYPE(py_data_type) == PYTHON_FIXNUM) {
-		data_type = PyInt_AS_LONG(py_data_type);
+	for ( i = 0; i < PyList_GET_SIZE(stale_keys); i++ ) {
+		PyDict_DelItem(persistent_list, PyList_GET_ITEM(stale_keys, i));
 	}
+	count = PyList_GET_SIZE(inherited);
+	for ( i = 0; i < count; i++ ) {
+		_python_ibm_db_abandon_conn((conn_handle *)PyList_GET_ITEM(inherited, i));
+	}
+	Py_DECREF(stale_keys);
+	Py_DECREF(inherited);
+	return PyInt_FromLong((long)count);
+}
 
-	if (py_precision != NULL && py_precision != Py_None && 
-		TYPE(py_precision) == PYTHON_FIXNUM) {
-		precision = PyInt_AS_LONG(py_precision);
-	}
-
-	if (py_scale != NULL && py_scale != Py_None && 
-		TYPE(py_scale) == PYTHON_FIXNUM) {
-		scale = PyInt_AS_LONG(py_scale);
+/*
+ * static void _python_clear_local_var(PyObject *dbNameObj, SQLWCHAR *dbName, PyObject *codesetObj, SQLWCHAR *codesetObj, PyObject *modeObj, SQLWCHAR *mode, int isNewBuffer)
+ */
+static void _python_clear_local_var(PyObject *dbNameObj, SQLWCHAR *dbName, PyObject *codesetObj, SQLWCHAR *codeset, PyObject *modeObj, SQLWCHAR *mode, int isNewBuffer)
+{
+	if ( !NIL_P( dbNameObj ) ) {
+		Py_XDECREF( dbNameObj );
+		if ( isNewBuffer ) {
+			PyMem_Del( dbName );
+		}
 	}
 
-	if (py_size != NULL && py_size != Py_None && 
-		TYPE(py_size) == PYTHON_FIXNUM) {
-		size = PyInt_AS_LONG(py_size);
+	if ( !NIL_P( codesetObj ) ) {
+		Py_XDECREF( codesetObj );
+		if ( isNewBuffer ) {
+			PyMem_Del( codeset );
+		}
 	}
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
+	if ( !NIL_P( modeObj ) ) {
+		Py_XDECREF( modeObj );
+		if ( isNewBuffer ) {
+			PyMem_Del( mode );
 		}
-		return _python_ibm_db_bind_param_helper(PyTuple_Size(args), stmt_res, param_no, var_pyvalue, param_type, data_type, precision, scale, size);
-	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-		return NULL;
 	}
 }
 
-
-/*!# ibm_db.close
- *
- * ===Description
- *
- * bool ibm_db.close ( resource connection )
- *
- * This function closes a DB2 client connection created with ibm_db.connect()
- * and returns the corresponding resources to the database server.
- *
- * If you attempt to close a persistent DB2 client connection created with
- * ibm_db.pconnect(), the close request returns TRUE and the persistent IBM Data
- * Server client connection remains available for the next caller.
- *
- * ===Parameters
- *
- * ====connection
- *	Specifies an active DB2 client connection.
- *
- * ===Return Values
- * Returns TRUE on success or FALSE on failure.
+/*
+ * static int _python_ibm_db_createdb(conn_handle *conn_res, PyObject *dbNameObj, PyObject *codesetObj, PyObject *modeObj, int createNX)
  */
-static PyObject *ibm_db_close(PyObject *self, PyObject *args)			
+static int _python_ibm_db_createdb(conn_handle *conn_res, PyObject *dbNameObj, PyObject *codesetObj, PyObject *modeObj, int createNX)
 {
-	PyObject *py_conn_res = NULL;
-	conn_handle *conn_res = NULL;
-	int rc;
+	SQLWCHAR *dbName = NULL;
+	SQLWCHAR *codeset = NULL;
+	SQLWCHAR *mode = NULL;
+	SQLINTEGER sqlcode;
+	SQLSMALLINT length;
+	SQLCHAR msg[SQL_MAX_MESSAGE_LENGTH + 1];
+	SQLCHAR sqlstate[SQL_SQLSTATE_SIZE + 1];
+	int isNewBuffer;
+	int rc = 0;
+#ifdef _WIN32
+	HINSTANCE cliLib = NULL;
+	FARPROC sqlcreatedb;
+#else
+	void *cliLib = NULL;
+	typedef int (*sqlcreatedbType)( SQLHDBC, SQLWCHAR *, SQLINTEGER, SQLWCHAR *, SQLINTEGER, SQLWCHAR *, SQLINTEGER );
+	sqlcreatedbType sqlcreatedb;
+#endif
 
-	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
-		return NULL;
+#if defined __APPLE__ || defined _AIX
+	PyErr_SetString( PyExc_Exception, "Not supported: This function is currently not supported on this platform" );
+	return -1;
+#else
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
+	if ( !NIL_P( conn_res ) ) {
+		if ( NIL_P( dbNameObj ) ) {
+			PyErr_SetString( PyExc_Exception, "Supplied database name Parameter is invalid" );
+			return -1;
 		}
-
-		/* Check to see if it's a persistent connection; 
-		 * if so, just return true 
-		*/
-
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			return NULL;
+		/* Check to ensure the connection resource given is active */
+		if ( !conn_res->handle_active ) {
+			PyErr_SetString( PyExc_Exception, "Connection is not active" );
+			return -1;
 		}
 
-		if ( conn_res->handle_active && !conn_res->flag_pconnect ) {
-			/* Disconnect from DB. If stmt is allocated, 
-			* it is freed automatically 
-			*/
-			if (conn_res->auto_commit == 0) {
-				rc = SQLEndTran(SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 
-								SQL_ROLLBACK);
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, 
-													rc, 1, NULL, -1, 1);
-					return NULL;
-				}
+		dbNameObj = PyUnicode_FromObject( dbNameObj );
+		if ( dbNameObj != NULL &&  dbNameObj != Py_None ) {
+			dbName = getUnicodeDataAsSQLWCHAR( dbNameObj, &isNewBuffer );
+		} else {
+			return -1;
+		}
+		
+		if ( !NIL_P( codesetObj ) ) {
+			codesetObj = PyUnicode_FromObject( codesetObj );
+			if ( codesetObj != NULL &&  codesetObj != Py_None ) {
+				codeset = getUnicodeDataAsSQLWCHAR( codesetObj, &isNewBuffer );
+			} else {
+				_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
+				return -1;
 			}
-			rc = SQLDisconnect((SQLHDBC)conn_res->hdbc);
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
-												1, NULL, -1, 1);
-				return NULL;
+				
+		}
+		if ( !NIL_P( modeObj ) ) {
+			modeObj = PyUnicode_FromObject( modeObj );
+			if ( codesetObj != NULL &&  codesetObj != Py_None ) {
+				mode = getUnicodeDataAsSQLWCHAR( modeObj, &isNewBuffer );	
+			} else {
+				_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, NULL, NULL, isNewBuffer );
+				return -1;
 			}
+		}
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
-			Py_END_ALLOW_THREADS;
-
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
-												1, NULL, -1, 1);
-
-				rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
-				return NULL;
-			}
+#ifdef _WIN32
+		cliLib = DLOPEN( LIBDB2 );
+#else
+		cliLib = DLOPEN( LIBDB2, RTLD_LAZY );
+#endif
+		if ( !cliLib ) {
+			sprintf( (char *)msg, "Error in loading %s library file", LIBDB2 );
+			PyErr_SetString( PyExc_Exception,  (char *)msg );
+			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );	
+			return -1;
+		}
+#ifdef _WIN32
+		sqlcreatedb =  DLSYM( cliLib, "SQLCreateDbW" );
+#else
+		sqlcreatedb = (sqlcreatedbType) DLSYM( cliLib, "SQLCreateDbW" );
+#endif
+		if ( sqlcreatedb == NULL )  {
+#ifdef _WIN32
+			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp4 version of cli on window" );
+#else
+			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp3 version of cli" );
+#endif
+			PyErr_SetString( PyExc_Exception, (char *)msg );
+			DLCLOSE( cliLib );
+			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
+			return -1;
+		}
 
-			rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(conn_res->henv, SQL_HANDLE_ENV, rc, 
-												1, NULL, -1, 1);
-				return NULL;
+		Py_BEGIN_ALLOW_THREADS;
+		rc = (*sqlcreatedb)( (SQLHDBC)conn_res->hdbc, dbName, SQL_NTS, codeset, SQL_NTS, mode, SQL_NTS );
+		Py_END_ALLOW_THREADS;
+		
+		DLCLOSE( cliLib );		
+		if ( rc != SQL_SUCCESS ) {
+			if ( createNX == 1 ) {
+				if ( SQLGetDiagRec( SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 1, sqlstate, &sqlcode, msg, SQL_MAX_MESSAGE_LENGTH + 1, &length ) == SQL_SUCCESS ) {
+					if ( sqlcode == -1005 ) {
+						_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
+						return 0;
+					}
+				}
 			}
-
-			conn_res->handle_active = 0;
-			Py_INCREF(Py_True);
-			return Py_True;
-		} else if ( conn_res->flag_pconnect ) {
-			/* Do we need to call FreeStmt or something to close cursors? */
-			Py_INCREF(Py_True);
-			return Py_True;
-		} else {
-			return NULL;
+			_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1 );
+			_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
+			return -1;
 		}
+		_python_clear_local_var( dbNameObj, dbName, codesetObj, codeset, modeObj, mode, isNewBuffer );
+		return 0;
 	} else {
-		return NULL;
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return -1;
 	}
+#endif
 }
 
-/*!# ibm_db.column_privileges
- *
- * ===Description
- * resource ibm_db.column_privileges ( resource connection [, string qualifier
- * [, string schema [, string table-name [, string column-name]]]] )
- *
- * Returns a result set listing the columns and associated privileges for a
- * table.
- *
- * ===Parameters
- *
- * ====connection
- *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
- *
- * ====qualifier
- *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
- * other databases, pass NULL or an empty string.
- *
- * ====schema
- *		The schema which contains the tables. To match all schemas, pass NULL
- * or an empty string.
- *
- * ====table-name
- *		The name of the table or view. To match all tables in the database,
- * pass NULL or an empty string.
- *
- * ====column-name
- *		The name of the column. To match all columns in the table, pass NULL
- * or an empty string.
- *
- * ===Return Values
- * Returns a statement resource with a result set containing rows describing
- * the column privileges for columns matching the specified parameters. The rows
- * are composed of the following columns:
- *
- * TABLE_CAT:: Name of the catalog. The value is NULL if this table does not
- * have catalogs.
- * TABLE_SCHEM:: Name of the schema.
- * TABLE_NAME:: Name of the table or view.
- * COLUMN_NAME:: Name of the column.
- * GRANTOR:: Authorization ID of the user who granted the privilege.
- * GRANTEE:: Authorization ID of the user to whom the privilege was granted.
- * PRIVILEGE:: The privilege for the column.
- * IS_GRANTABLE:: Whether the GRANTEE is permitted to grant this privilege to
- * other users.
+/*
+ * static int _python_ibm_db_dropdb(conn_handle *conn_res, PyObject *dbNameObj, int recreate)
  */
-static PyObject *ibm_db_column_privileges(PyObject *self, PyObject *args)
+static int _python_ibm_db_dropdb(conn_handle *conn_res, PyObject *dbNameObj, int recreate)
 {
-	SQLWCHAR *qualifier = NULL;
-	SQLWCHAR *owner = NULL;
-	SQLWCHAR *table_name = NULL;
-	SQLWCHAR *column_name = NULL;
-	PyObject *py_qualifier = NULL;
-	PyObject *py_owner = NULL;
-	PyObject *py_table_name = NULL;
-	PyObject *py_column_name = NULL;
-	PyObject *py_conn_res = NULL;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	int rc;
+	SQLWCHAR *dbName = NULL;
+	SQLINTEGER sqlcode;
+	SQLSMALLINT length;
+	SQLCHAR msg[SQL_MAX_MESSAGE_LENGTH + 1];
+	SQLCHAR sqlstate[SQL_SQLSTATE_SIZE + 1];
 	int isNewBuffer;
+	int rc = 0;
+#ifdef _WIN32
+	FARPROC sqldropdb;
+	HINSTANCE cliLib = NULL;
+#else
+	typedef int (*sqldropdbType)( SQLHDBC, SQLWCHAR *, SQLINTEGER );
+	sqldropdbType sqldropdb;	
+	void *cliLib;
+#endif
 
-	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name, &py_column_name))
-		return NULL;
-	
-	if (py_qualifier != NULL && py_qualifier != Py_None) {
-		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
-			py_qualifier = PyUnicode_FromObject(py_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
-			return NULL;
-		}
-	}
-
-	if (py_owner != NULL && py_owner != Py_None) {
-		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
-			py_owner = PyUnicode_FromObject(py_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			return NULL;
-		}
-	}
-
-	if (py_table_name != NULL && py_table_name != Py_None) {
-		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
-			py_table_name = PyUnicode_FromObject(py_table_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			return NULL;
-		}
-	}
+#if defined __APPLE__ || defined _AIX
+	PyErr_SetString( PyExc_Exception, "Not supported: This function is currently not supported on this platform" );
+	return -1;
+#else
 
-	if (py_column_name != NULL && py_column_name != Py_None) {
-		if (PyString_Check(py_column_name) || PyUnicode_Check(py_table_name)){
-			py_column_name = PyUnicode_FromObject(py_column_name);
+	if ( !NIL_P( conn_res ) ) {
+		if ( NIL_P( dbNameObj ) ) {
+			PyErr_SetString( PyExc_Exception, "Supplied database name Parameter is invalid" );
+			return -1;
 		}
-		else {
-			PyErr_SetString(PyExc_Exception, "column_name must be a string");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			return NULL;
+		/* Check to ensure the connection resource given is active */
+		if ( !conn_res->handle_active ) {
+			PyErr_SetString( PyExc_Exception, "Connection is not active" );
+			return -1;
 		}
-	}
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
+		dbNameObj = PyUnicode_FromObject( dbNameObj );
+		if ( dbNameObj != NULL &&  dbNameObj != Py_None ) {
+			dbName = getUnicodeDataAsSQLWCHAR( dbNameObj, &isNewBuffer );	
 		} else {
-			conn_res = (conn_handle *)py_conn_res;
+			return -1;
 		}
 
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-			return NULL;
+#ifdef _WIN32
+		cliLib = DLOPEN( LIBDB2 );
+#else
+		cliLib = DLOPEN( LIBDB2, RTLD_LAZY );
+#endif
+		if ( !cliLib ) {
+			sprintf( (char *)msg, "Error in loading %s library file", LIBDB2 );
+			PyErr_SetString( PyExc_Exception, (char *)msg );
+			_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
+			return -1;
 		}
-
-		stmt_res = _ibm_db_new_stmt_struct(conn_res);
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		if (rc == SQL_ERROR) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-
-			Py_RETURN_FALSE;
+#ifdef _WIN32
+		sqldropdb = DLSYM( cliLib, "SQLDropDbW" );
+#else
+		sqldropdb = (sqldropdbType)DLSYM( cliLib, "SQLDropDbW" );
+#endif
+		if ( sqldropdb == NULL)  {
+#ifdef _WIN32
+			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp4 version of cli on window" );
+#else
+			sprintf( (char *)msg, "Not supported: This function is only supported from v97fp3 version of cli" );
+#endif
+			PyErr_SetString( PyExc_Exception, (char *)msg );
+			DLCLOSE( cliLib );
+			_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
+			return -1;
 		}
-		if (py_qualifier && py_qualifier != Py_None )
-			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
-		if (py_owner &&  py_owner != Py_None )
-			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_table_name && py_table_name != Py_None )
-			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLColumnPrivilegesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
-							owner, SQL_NTS, table_name, SQL_NTS, column_name,
-							SQL_NTS);
+		rc = sqldropdb( conn_res->hdbc, dbName, SQL_NTS );
 		Py_END_ALLOW_THREADS;
-
-		if (isNewBuffer) {
-			if(qualifier) PyMem_Del(qualifier);
-			if(owner) PyMem_Del(owner);
-			if(table_name) PyMem_Del(table_name);
-		}
 		
-		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
-							SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-
-			Py_RETURN_FALSE;
+		DLCLOSE( cliLib );
+		if ( rc != SQL_SUCCESS ) {
+			if ( recreate ) {
+				if ( SQLGetDiagRec( SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 1, sqlstate, &sqlcode, msg, SQL_MAX_MESSAGE_LENGTH + 1, &length ) == SQL_SUCCESS ) {
+					if ( sqlcode == -1013 ) {
+						_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
+						return 0;
+					}
+				}
+			}
+			_python_ibm_db_check_sql_errors( conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1 );
+			return -1;
 		}
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_column_name);
-
-		return (PyObject *)stmt_res;
+		_python_clear_local_var( dbNameObj, dbName, NULL, NULL, NULL, NULL, isNewBuffer );
+		return 0;
 	} else {
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_column_name);
-
-		Py_RETURN_FALSE;
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return -1;
 	}
+#endif
 }
 
-/*!# ibm_db.columns
+/*!# ibm_db.createdb
+ *
  * ===Description
- * resource ibm_db.columns ( resource connection [, string qualifier
- * [, string schema [, string table-name [, string column-name]]]] )
+ *  True/None ibm_db.createdb ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
  *
- * Returns a result set listing the columns and associated metadata for a table.
+ * Creates a database by using the specified database name, code set, and mode
  *
  * ===Parameters
- * ====connection
- *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
- *
- * ====qualifier
- *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
- * other databases, pass NULL or an empty string.
  *
- * ====schema
- *		The schema which contains the tables. To match all schemas, pass '%'.
+ * ====connection
+ *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
  *
- * ====table-name
- *		The name of the table or view. To match all tables in the database,
- * pass NULL or an empty string.
+ * ====dbName
+ *      Name of the database that is to be created.
  *
- * ====column-name
- *		The name of the column. To match all columns in the table, pass NULL or
- * an empty string.
+ * ====codeSet
+ *      Database code set information.
+ *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
  *
- * ===Return Values
- * Returns a statement resource with a result set containing rows describing the
- * columns matching the specified parameters.
- * The rows are composed of the following columns:
+ * ====mode
+ *      Database logging mode.
+ *      Note: This value is applicable only to IDS data servers.
  *
- * TABLE_CAT:: Name of the catalog. The value is NULL if this table does not
- * have catalogs.
- * TABLE_SCHEM:: Name of the schema.
- * TABLE_NAME:: Name of the table or view.
- * COLUMN_NAME:: Name of the column.
- * DATA_TYPE:: The SQL data type for the column represented as an integer value.
- * TYPE_NAME:: A string representing the data type for the column.
- * COLUMN_SIZE:: An integer value representing the size of the column.
- * BUFFER_LENGTH:: Maximum number of bytes necessary to store data from this
- * column.
- * DECIMAL_DIGITS:: The scale of the column, or NULL where scale is not
- * applicable.
- * NUM_PREC_RADIX:: An integer value of either 10 (representing an exact numeric
- * data type), 2 (representing an approximate numeric data type), or NULL
- * (representing a data type for which radix is not applicable).
- * NULLABLE:: An integer value representing whether the column is nullable or
- * not.
- * REMARKS:: Description of the column.
- * COLUMN_DEF:: Default value for the column.
- * SQL_DATA_TYPE:: An integer value representing the size of the column.
- * SQL_DATETIME_SUB:: Returns an integer value representing a datetime subtype
- * code, or NULL for SQL data types to which this does not apply.
- * CHAR_OCTET_LENGTH::	Maximum length in octets for a character data type
- * column, which matches COLUMN_SIZE for single-byte character set data, or
- * NULL for non-character data types.
- * ORDINAL_POSITION:: The 1-indexed position of the column in the table.
- * IS_NULLABLE:: A string value where 'YES' means that the column is nullable
- * and 'NO' means that the column is not nullable.
+ * ===Return Value
+ *  Returns True on successful creation of database else return None
  */
-static PyObject *ibm_db_columns(PyObject *self, PyObject *args)			
+PyObject *ibm_db_createdb(PyObject *self, PyObject *args)
 {
-	SQLWCHAR *qualifier = NULL;
-	SQLWCHAR *owner = NULL;
-	SQLWCHAR *table_name = NULL;
-	SQLWCHAR *column_name = NULL;
-	PyObject *py_qualifier = NULL;
-	PyObject *py_owner = NULL;
-	PyObject *py_table_name = NULL;
-	PyObject *py_column_name = NULL;
 	PyObject *py_conn_res = NULL;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	int rc;
-	int isNewBuffer;
+	PyObject *dbNameObj = NULL;
+	PyObject *codesetObj = NULL;
+	PyObject *modeObj = NULL;
+	int rc = -1;
 
-	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name, &py_column_name))
+	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
 		return NULL;
-
-	if (py_qualifier != NULL && py_qualifier != Py_None) {
-		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
-			py_qualifier = PyUnicode_FromObject(py_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
-			return NULL;
-		}
-	}
-
-	if (py_owner != NULL && py_owner != Py_None) {
-		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
-			py_owner = PyUnicode_FromObject(py_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			return NULL;
-		}
 	}
-
-	if (py_table_name != NULL && py_table_name != Py_None) {
-		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
-			py_table_name = PyUnicode_FromObject(py_table_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			return NULL;
-		}
-	}
-
-	if (py_column_name != NULL && py_column_name != Py_None) {
-		if (PyString_Check(py_column_name) || PyUnicode_Check(py_table_name)){
-			py_column_name = PyUnicode_FromObject(py_column_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "column_name must be a string");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			return NULL;
-		}
+	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return NULL;
 	}
-
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
-		}
-
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-			return NULL;
-		}
-
-		stmt_res = _ibm_db_new_stmt_struct(conn_res);
-
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		if (rc == SQL_ERROR) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-
-			Py_RETURN_FALSE;
-		}
-
-		if (py_qualifier && py_qualifier != Py_None )
-			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
-		if (py_owner &&  py_owner != Py_None )
-			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_table_name && py_table_name != Py_None )
-			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
-		if (py_column_name && py_column_name != Py_None )
-			column_name = getUnicodeDataAsSQLWCHAR(py_column_name, &isNewBuffer);
-
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLColumnsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
-			owner,SQL_NTS, table_name, SQL_NTS, column_name, SQL_NTS);
-		Py_END_ALLOW_THREADS;
-
-		if (isNewBuffer) {
-		    if(qualifier) PyMem_Del(qualifier);
-		    if(owner) PyMem_Del(owner);
-		    if(table_name) PyMem_Del(table_name);
-		    if(column_name) PyMem_Del(column_name);
-		}	
-				
-		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
-				SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_column_name);
-
-			Py_RETURN_FALSE;
-		}
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_column_name);
-
-		return (PyObject *)stmt_res;				  
+	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 0);
+	if ( rc == 0 ) {
+		Py_RETURN_TRUE;
 	} else {
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_column_name);
-
-		Py_RETURN_FALSE;
-	}
+		return NULL;
+	}	
 }
 
-/*!# ibm_db.foreign_keys
+/*!# ibm_db.dropdb
  *
  * ===Description
- * resource ibm_db.foreign_keys ( resource connection, string pk_qualifier,
- * string pk_schema, string pk_table-name, string fk_qualifier
- * string fk_schema, string fk_table-name )
+ *  True/None ibm_db.dropdb ( IBM_DBConnection connection, string dbName )
  *
- * Returns a result set listing the foreign keys for a table.
+ * Drops the specified database
  *
  * ===Parameters
  *
  * ====connection
- *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
+ *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
  *
- * ====pk_qualifier
- *		A qualifier for the pk_table-name argument for the DB2 databases 
- * running on OS/390 or z/OS servers. For other databases, pass NULL or an empty 
- * string. 
+ * ====dbName
+ *      Name of the database that is to be dropped.
  *
- * ====pk_schema
- *		The schema for the pk_table-name argument which contains the tables. If 
- * schema is NULL, ibm_db.foreign_keys() matches the schema for the current 
- * connection. 
+ * ===Return Value
+ *  Returns True if specified database dropped sucessfully else None
+ */
+PyObject *ibm_db_dropdb(PyObject *self, PyObject *args)
+{
+	PyObject *py_conn_res = NULL;
+	PyObject *dbNameObj = NULL;
+	int rc = -1;
+
+	if ( !PyArg_ParseTuple( args, "OO", &py_conn_res, &dbNameObj ) ) {
+		return NULL;
+	}
+	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return NULL;
+	}
+	rc = _python_ibm_db_dropdb( (conn_handle *)py_conn_res, dbNameObj, 0 );
+	if ( rc == 0 ) {
+		Py_RETURN_TRUE;
+	} else {
+		return NULL;
+	}
+}
+
+/*ibm_db.recreatedb
  *
- * ====pk_table-name
- *		The name of the table which contains the primary key.
+ * ===Description
+ *  True/None ibm_db.recreatedb ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
  *
- * ====fk_qualifier
- *		A qualifier for the fk_table-name argument for the DB2 databases
- * running on OS/390 or z/OS servers. For other databases, pass NULL or an empty
- * string.
+ * Drop and then recreates a database by using the specified database name, code set, and mode
  *
- * ====fk_schema
- *		The schema for the fk_table-name argument which contains the tables. If
- * schema is NULL, ibm_db.foreign_keys() matches the schema for the current
- * connection.
+ * ===Parameters
  *
- * ====fk_table-name
- *		The name of the table which contains the foreign key.
+ * ====connection
+ *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
  *
- * ===Return Values
+ * ====dbName
+ *      Name of the database that is to be created.
  *
- * Returns a statement resource with a result set containing rows describing the
- * foreign keys for the specified table. The result set is composed of the
- * following columns:
+ * ====codeSet
+ *      Database code set information.
+ *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
  *
- * Column name::	Description
- * PKTABLE_CAT:: Name of the catalog for the table containing the primary key.
- * The value is NULL if this table does not have catalogs.
- * PKTABLE_SCHEM:: Name of the schema for the table containing the primary key.
- * PKTABLE_NAME:: Name of the table containing the primary key.
- * PKCOLUMN_NAME:: Name of the column containing the primary key.
- * FKTABLE_CAT:: Name of the catalog for the table containing the foreign key.
- * The value is NULL if this table does not have catalogs.
- * FKTABLE_SCHEM:: Name of the schema for the table containing the foreign key.
- * FKTABLE_NAME:: Name of the table containing the foreign key.
- * FKCOLUMN_NAME:: Name of the column containing the foreign key.
- * KEY_SEQ:: 1-indexed position of the column in the key.
- * UPDATE_RULE:: Integer value representing the action applied to the foreign
- * key when the SQL operation is UPDATE.
- * DELETE_RULE:: Integer value representing the action applied to the foreign
- * key when the SQL operation is DELETE.
- * FK_NAME:: The name of the foreign key.
- * PK_NAME:: The name of the primary key.
- * DEFERRABILITY:: An integer value representing whether the foreign key
- * deferrability is SQL_INITIALLY_DEFERRED, SQL_INITIALLY_IMMEDIATE, or
- * SQL_NOT_DEFERRABLE.
+ * ====mode
+ *      Database logging mode.
+ *      Note: This value is applicable only to IDS data servers.
+ *
+ * ===Return Value
+ *  Returns True if specified database created successfully else return None
  */
-static PyObject *ibm_db_foreign_keys(PyObject *self, PyObject *args)
+PyObject *ibm_db_recreatedb(PyObject *self, PyObject *args)
 {
-	SQLWCHAR *pk_qualifier = NULL;
-	SQLWCHAR *pk_owner = NULL;
-	SQLWCHAR *pk_table_name = NULL;
-	SQLWCHAR *fk_qualifier = NULL;
-	SQLWCHAR *fk_owner = NULL;
-	SQLWCHAR *fk_table_name = NULL;
-	int rc;
-	conn_handle *conn_res = NULL;
-	stmt_handle *stmt_res;
 	PyObject *py_conn_res = NULL;
-	PyObject *py_pk_qualifier = NULL;
-	PyObject *py_pk_owner = NULL;
-	PyObject *py_pk_table_name = NULL;
-	PyObject *py_fk_qualifier = NULL;
-	PyObject *py_fk_owner = NULL;
-	PyObject *py_fk_table_name = NULL;
-	int isNewBuffer = 0;
+	PyObject *dbNameObj = NULL;
+	PyObject *codesetObj = NULL;
+	PyObject *modeObj = NULL;
+	int rc = -1;
 
-	if (!PyArg_ParseTuple(args, "OOOO|OOO", &py_conn_res, &py_pk_qualifier, 
-		&py_pk_owner, &py_pk_table_name, &py_fk_qualifier,
-		&py_fk_owner, &py_fk_table_name))
+	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
 		return NULL;
-
-	if (py_pk_qualifier != NULL && py_pk_qualifier != Py_None) {
-		if (PyString_Check(py_pk_qualifier) || PyUnicode_Check(py_pk_qualifier)){
-			py_pk_qualifier = PyUnicode_FromObject(py_pk_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, 
-				"qualifier for table containing primary key must be a string or unicode");
-			return NULL;
-		}
 	}
-
-	if (py_pk_owner != NULL && py_pk_owner != Py_None) {
-		if (PyString_Check(py_pk_owner) || PyUnicode_Check(py_pk_owner)){
-			py_pk_owner = PyUnicode_FromObject(py_pk_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception,  
-				"owner of table containing primary key must be a string or unicode");
-			Py_XDECREF(py_pk_qualifier);
-			return NULL;
-		}
+	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return NULL;
 	}
+	rc = _python_ibm_db_dropdb((conn_handle *)py_conn_res, dbNameObj, 1 );
+	if ( rc != 0 ) {
+		return NULL; 
+	} 
 
-	if (py_pk_table_name != NULL && py_pk_table_name != Py_None) {
-		if (PyString_Check(py_pk_table_name) || PyUnicode_Check(py_pk_table_name)){
-			py_pk_table_name = PyUnicode_FromObject(py_pk_table_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, 
-				"name of the table that contains primary key must be a string or unicode");
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			return NULL;
-		}
+	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 0);
+	if ( rc == 0 ) {
+		Py_RETURN_TRUE;
+	} else {
+		return NULL;
 	}
+}
 
-	if (py_fk_qualifier != NULL && py_fk_qualifier != Py_None) {
-		if (PyString_Check(py_fk_qualifier) || PyUnicode_Check(py_fk_qualifier)){
-			py_fk_qualifier = PyUnicode_FromObject(py_fk_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, 
-				"qualifier for table containing the foreign key must be a string or unicode");
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			return NULL;
-		}
+/*!# ibm_db.createdbNX 
+ *
+ * ===Description
+ *  True/None ibm_db.createdbNX ( IBM_DBConnection connection, string dbName [, codeSet, mode] )
+ *
+ * Creates the database if not exist by using the specified database name, code set, and mode
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *      A valid database server instance connection resource variable as returned from ibm_db.connect() by specifying the ATTACH keyword.
+ *
+ * ====dbName
+ *      Name of the database that is to be created.
+ *
+ * ====codeSet
+ *      Database code set information.
+ *      Note: If the value of the codeSet argument not specified, the database is created in the Unicode code page for DB2 data servers and in the UTF-8 code page for IDS data servers.
+ *
+ * ====mode
+ *      Database logging mode.
+ *      Note: This value is applicable only to IDS data servers.
+ *
+ * ===Return Value
+ *  Returns True if database already exists or created sucessfully else return None
+ */
+PyObject *ibm_db_createdbNX(PyObject *self, PyObject *args)
+{
+	PyObject *py_conn_res = NULL;
+	PyObject *dbNameObj = NULL;
+	PyObject *codesetObj = NULL;
+	PyObject *modeObj = NULL;
+	int rc = -1;
+	
+	if ( !PyArg_ParseTuple( args, "OO|OO", &py_conn_res, &dbNameObj, &codesetObj, &modeObj ) ) {
+		return NULL;
 	}
-
-	if (py_fk_owner != NULL && py_fk_owner != Py_None) {
-		if (PyString_Check(py_fk_owner) || PyUnicode_Check(py_fk_owner)){
-			py_fk_owner = PyUnicode_FromObject(py_fk_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, 
-				"owner of table containing the foreign key must be a string or unicode");
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			Py_XDECREF(py_fk_qualifier);
-			return NULL;
-		}
+	if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+		return NULL;
+	}	
+	rc = _python_ibm_db_createdb((conn_handle *)py_conn_res, dbNameObj, codesetObj, modeObj, 1);
+	if ( rc == 0 ) {
+		Py_RETURN_TRUE;
+	} else {
+		return NULL;
 	}
+}
 
-	if (py_fk_table_name != NULL && py_fk_table_name != Py_None) {
-		if (PyString_Check(py_fk_table_name) || PyUnicode_Check(py_fk_table_name)){
-			py_fk_table_name = PyUnicode_FromObject(py_fk_table_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, 
-				"name of the table that contains foreign key must be a string or unicode");
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			Py_XDECREF(py_fk_qualifier);
-			Py_XDECREF(py_fk_owner);
-			return NULL;
-		}
+/*!# ibm_db.autocommit
+ *
+ * ===Description
+ *
+ * mixed ibm_db.autocommit ( resource connection [, bool value] )
+ *
+ * Returns or sets the AUTOCOMMIT behavior of the specified connection resource.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *	A valid database connection resource variable as returned from connect()
+ * or pconnect().
+ *
+ * ====value
+ *	One of the following constants:
+ *	SQL_AUTOCOMMIT_OFF
+ *		  Turns AUTOCOMMIT off.
+ *	SQL_AUTOCOMMIT_ON
+ *		  Turns AUTOCOMMIT on.
+ *
+ * ===Return Values
+ *
+ * When ibm_db.autocommit() receives only the connection parameter, it returns
+ * the current state of AUTOCOMMIT for the requested connection as an integer
+ * value. A value of 0 indicates that AUTOCOMMIT is off, while a value of 1
+ * indicates that AUTOCOMMIT is on.
+ *
+ * When ibm_db.autocommit() receives both the connection parameter and
+ * autocommit parameter, it attempts to set the AUTOCOMMIT state of the
+ * requested connection to the corresponding state.
+ *
+ * Returns TRUE on success or FALSE on failure.
+ */ 
+static PyObject *ibm_db_autocommit(PyObject *self, PyObject *args)			
+{
+	PyObject *py_autocommit = NULL;
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res = NULL;
+	int rc;
+	SQLINTEGER autocommit = -1;
+
+	if (!PyArg_ParseTuple(args, "O|O", &py_conn_res, &py_autocommit)){
+		return NULL;
 	}
 
 	if (!NIL_P(py_conn_res)) {
@@ -3199,397 +4158,421 @@ static PyObject *ibm_db_foreign_keys(PyObject *self, PyObject *args)
 		} else {
 			conn_res = (conn_handle *)py_conn_res;
 		}
-
+		if (!NIL_P(py_autocommit)) {
+			if (PyInt_Check(py_autocommit)) { 
+				autocommit = (SQLINTEGER)PyInt_AsLong(py_autocommit);
+			} else {
+				PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+				return NULL;
+			}
+		}
 		if (!conn_res->handle_active) {
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			Py_XDECREF(py_fk_qualifier);
-			Py_XDECREF(py_fk_owner);
-			Py_XDECREF(py_fk_table_name);
 			return NULL;
 		}
 
-		stmt_res = _ibm_db_new_stmt_struct(conn_res);
+	  /* If value in handle is different from value passed in */
+		if (PyTuple_Size(args) == 2) {
+			if(autocommit != (conn_res->auto_commit)) {
+				_python_ibm_db_clear_handle_error(conn_res, NULL);
+				Py_BEGIN_ALLOW_THREADS;
+#ifndef PASE
+				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, (SQLPOINTER) (autocommit == 0 ? SQL_AUTOCOMMIT_OFF : SQL_AUTOCOMMIT_ON), SQL_IS_INTEGER);
+#else
+				rc = SQLSetConnectAttr((SQLHDBC)conn_res->hdbc, SQL_ATTR_AUTOCOMMIT, (SQLPOINTER)&autocommit, SQL_IS_INTEGER);
+#endif
+				Py_END_ALLOW_THREADS;
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, 
+												rc, 1, NULL, -1, 1);
+				}
+				conn_res->auto_commit = autocommit;
+			}
+			Py_INCREF(Py_True);
+			return Py_True;
+		} else {
+			return PyInt_FromLong(conn_res->auto_commit);
+		}
+	}
+	return NULL;
+}
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		Py_END_ALLOW_THREADS;
-
-		if (rc == SQL_ERROR) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			Py_XDECREF(py_fk_qualifier);
-			Py_XDECREF(py_fk_owner);
-			Py_XDECREF(py_fk_table_name);
+/*	static void _python_ibm_db_add_param_cache( stmt_handle *stmt_res, int param_no, PyObject *var_pyvalue, char *varname, int varname_len, int param_type, int size, SQLSMALLINT data_type, SQLSMALLINT precision, SQLSMALLINT scale, SQLSMALLINT nullable )
+*/
+static void _python_ibm_db_add_param_cache( stmt_handle *stmt_res, int param_no, PyObject *var_pyvalue, int param_type, int size, SQLSMALLINT data_type, SQLUINTEGER precision, SQLSMALLINT scale, SQLSMALLINT nullable )
+{
+	param_node *tmp_curr = NULL, *prev = stmt_res->head_cache_list, *curr = stmt_res->head_cache_list;
 
-			Py_RETURN_FALSE;
-		}
+	while ( (curr != NULL) && (curr->param_num < param_no) ) {
+		prev = curr;
+		curr = curr->next;
+	}
 
-		if(py_pk_qualifier && py_pk_qualifier != Py_None)
-			pk_qualifier = getUnicodeDataAsSQLWCHAR(py_pk_qualifier, &isNewBuffer);
-		if(py_pk_owner && py_pk_owner != Py_None)
-			pk_owner = getUnicodeDataAsSQLWCHAR(py_pk_owner, &isNewBuffer);
-		if(py_pk_table_name && py_pk_table_name != Py_None)
-			pk_table_name = getUnicodeDataAsSQLWCHAR(py_pk_table_name, &isNewBuffer);
-		if(py_fk_qualifier && py_fk_qualifier != Py_None)
-			fk_qualifier = getUnicodeDataAsSQLWCHAR(py_fk_qualifier, &isNewBuffer);
-		if(py_fk_owner && py_fk_owner != Py_None)
-			fk_owner = getUnicodeDataAsSQLWCHAR(py_fk_owner, &isNewBuffer);
-		if(py_fk_table_name && py_fk_table_name != Py_None)
-			fk_table_name = getUnicodeDataAsSQLWCHAR(py_fk_table_name, &isNewBuffer);
+	if ( curr == NULL || curr->param_num != param_no ) {
+		/* Allocate memory and make new node to be added */
+		tmp_curr = ALLOC(param_node);
+		memset(tmp_curr, 0, sizeof(param_node));
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLForeignKeysW((SQLHSTMT)stmt_res->hstmt, pk_qualifier, SQL_NTS,
-						pk_owner, SQL_NTS, pk_table_name, SQL_NTS, fk_qualifier, SQL_NTS,
-						fk_owner, SQL_NTS, fk_table_name, SQL_NTS);
-		Py_END_ALLOW_THREADS;
+		/* assign values */
+		tmp_curr->data_type = data_type;
+		tmp_curr->param_size = precision;
+		tmp_curr->nullable = nullable;
+		tmp_curr->scale = scale;
+		tmp_curr->param_num = param_no;
+		tmp_curr->file_options = SQL_FILE_READ;
+		tmp_curr->param_type = param_type;
+		tmp_curr->size = size;
 
-		if (isNewBuffer) {
-		    if(pk_qualifier) PyMem_Del(pk_qualifier);
-		    if(pk_owner) PyMem_Del(pk_owner);
-		    if(pk_table_name) PyMem_Del(pk_table_name);
-		    if(fk_qualifier) PyMem_Del(fk_qualifier);
-		    if(fk_owner) PyMem_Del(fk_owner);
-		    if(fk_table_name) PyMem_Del(fk_table_name);
-		}	
-		
-		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-											1, NULL, -1, 1);
-			Py_XDECREF(py_pk_qualifier);
-			Py_XDECREF(py_pk_owner);
-			Py_XDECREF(py_pk_table_name);
-			Py_XDECREF(py_fk_qualifier);
-			Py_XDECREF(py_fk_owner);
-			Py_XDECREF(py_fk_table_name);
-			PyErr_Clear( );
-			Py_RETURN_FALSE;
+		/* Set this flag in stmt_res if a FILE INPUT is present */
+		if ( param_type == PARAM_FILE) {
+			stmt_res->file_param = 1;
 		}
-		Py_XDECREF(py_pk_qualifier);
-		Py_XDECREF(py_pk_owner);
-		Py_XDECREF(py_pk_table_name);
-		Py_XDECREF(py_fk_qualifier);
-		Py_XDECREF(py_fk_owner);
-		Py_XDECREF(py_fk_table_name);
-		return (PyObject *)stmt_res;				  
 
-	} else {
-		Py_XDECREF(py_pk_qualifier);
-		Py_XDECREF(py_pk_owner);
-		Py_XDECREF(py_pk_table_name);
-		Py_XDECREF(py_fk_qualifier);
-		Py_XDECREF(py_fk_owner);
-		Py_XDECREF(py_fk_table_name);
-		Py_RETURN_FALSE;
-	}
-}
+		if ( var_pyvalue != NULL) {
+			tmp_curr->var_pyvalue = var_pyvalue;
+		}
 
-/*!# ibm_db.primary_keys
- *
- * ===Description
- * resource ibm_db.primary_keys ( resource connection, string qualifier,
- * string schema, string table-name )
- *
- * Returns a result set listing the primary keys for a table.
- *
- * ===Parameters
- *
- * ====connection
- *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
- *
- * ====qualifier
- *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
- * other databases, pass NULL or an empty string.
- *
- * ====schema
- *		The schema which contains the tables. If schema is NULL,
- * ibm_db.primary_keys() matches the schema for the current connection.
- *
- * ====table-name
- *		The name of the table.
- *
- * ===Return Values
- *
- * Returns a statement resource with a result set containing rows describing the
- * primary keys for the specified table.
- * The result set is composed of the following columns:
- *
- * Column name:: Description
- * TABLE_CAT:: Name of the catalog for the table containing the primary key.
- * The value is NULL if this table does not have catalogs.
- * TABLE_SCHEM:: Name of the schema for the table containing the primary key.
- * TABLE_NAME:: Name of the table containing the primary key.
- * COLUMN_NAME:: Name of the column containing the primary key.
- * KEY_SEQ:: 1-indexed position of the column in the key.
- * PK_NAME:: The name of the primary key.
- */
-static PyObject *ibm_db_primary_keys(PyObject *self, PyObject *args)
-{
-	SQLWCHAR *qualifier = NULL;
-	SQLWCHAR *owner = NULL;
-	SQLWCHAR *table_name = NULL;
-	int rc;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	PyObject *py_conn_res = NULL;
-	PyObject *py_qualifier = NULL;
-	PyObject *py_owner = NULL;
-	PyObject *py_table_name = NULL;
-	int isNewBuffer;
+		/* link pointers for the list */
+		if ( prev == NULL ) {
+			stmt_res->head_cache_list = tmp_curr;
+		} else {
+			prev->next = tmp_curr;
+		}
+		tmp_curr->next = curr;
 
-	if (!PyArg_ParseTuple(args, "OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name))
-		return NULL;
+		/* Increment num params added */
+		stmt_res->num_params++;
+	} else {
+		/* Both the nodes are for the same param no */
+		/* Replace Information */
+		curr->data_type = data_type;
+		curr->param_size = precision;
+		curr->nullable = nullable;
+		curr->scale = scale;
+		curr->param_num = param_no;
+		curr->file_options = SQL_FILE_READ;
+		curr->param_type = param_type;
+		curr->size = size;
 
-	if (py_qualifier != NULL && py_qualifier != Py_None) {
-		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
-			py_qualifier = PyUnicode_FromObject(py_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
-			return NULL;
+		/* Set this flag in stmt_res if a FILE INPUT is present */
+		if ( param_type == PARAM_FILE) {
+			stmt_res->file_param = 1;
 		}
-	}
 
-	if (py_owner != NULL && py_owner != Py_None) {
-		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
-			py_owner = PyUnicode_FromObject(py_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			return NULL;
+		if ( var_pyvalue != NULL) {
+			curr->var_pyvalue = var_pyvalue;
 		}
-	}
 
-	if (py_table_name != NULL && py_table_name != Py_None) {
-		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
-			py_table_name = PyUnicode_FromObject(py_table_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			return NULL;
-		}
 	}
+}
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
-		}
+/*
+ * static PyObject *_python_ibm_db_bind_param_helper(int argc, stmt_handle *stmt_res, SQLUSMALLINT param_no, PyObject *var_pyvalue, long param_type,
+ * 					 long data_type, long precision, long scale, long size)
+ */
+static PyObject *_python_ibm_db_bind_param_helper(int argc, stmt_handle *stmt_res, SQLUSMALLINT param_no, PyObject *var_pyvalue, long param_type, long data_type, long precision, long scale, long size)
+{
+	SQLSMALLINT sql_data_type = 0;
+	SQLUINTEGER sql_precision = 0;
+	SQLSMALLINT sql_scale = 0;
+	SQLSMALLINT sql_nullable = SQL_NO_NULLS;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	int rc = 0;
+	
+	/* Check for Param options */
+	switch (argc) {
+		/* if argc == 3, then the default value for param_type will be used */
+		case 3:
+			param_type = SQL_PARAM_INPUT;
 
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			return NULL;
-		}
+			_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, (SQLUSMALLINT)param_no, &sql_data_type, &sql_precision, &sql_scale, &sql_nullable);
+			Py_END_ALLOW_THREADS;
 
-		stmt_res = _ibm_db_new_stmt_struct(conn_res);
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+				sprintf(error, "Describe Param Failed: %s", 
+				IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+			/* Add to cache */
+			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue, 
+										param_type, size, 
+										sql_data_type, sql_precision, 
+										sql_scale, sql_nullable );
+			break;
 
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		if (rc == SQL_ERROR) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-
-			Py_RETURN_FALSE;
-		}
-		if (py_qualifier && py_qualifier != Py_None )
-			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
-		if (py_owner &&  py_owner != Py_None )
-			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_table_name && py_table_name != Py_None )
-			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
+		case 4:
+			_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
+								(SQLUSMALLINT)param_no, &sql_data_type, 
+								&sql_precision, &sql_scale, &sql_nullable);
+			Py_END_ALLOW_THREADS;
 
-		Py_BEGIN_ALLOW_THREADS;	
-		rc = SQLPrimaryKeysW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
-			owner, SQL_NTS, table_name, SQL_NTS);
-		Py_END_ALLOW_THREADS;
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
+												rc, 1, NULL, -1, 1);
+				sprintf(error, "Describe Param Failed: %s", 
+						IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+			/* Add to cache */
+			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
+											param_type, size, 
+											sql_data_type, sql_precision, 
+											sql_scale, sql_nullable );
+			break;
 
-		if (isNewBuffer) {
-		    if(qualifier) PyMem_Del(qualifier);
-		    if(owner) PyMem_Del(owner);
-		    if(table_name) PyMem_Del(table_name);
-		}
-		
-		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-				1, NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
+		case 5:
+			_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
+								(SQLUSMALLINT)param_no, &sql_data_type, 
+								&sql_precision, &sql_scale, &sql_nullable);
+			Py_END_ALLOW_THREADS;
 
-			Py_RETURN_FALSE;
-		}
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+								rc, 1, NULL, -1, 1);
+				sprintf(error, "Describe Param Failed: %s", 
+								IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+			sql_data_type = (SQLSMALLINT)data_type;
+			/* Add to cache */
+			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
+											param_type, size, 
+											sql_data_type, sql_precision, 
+											sql_scale, sql_nullable );
+			break;
 
-		return (PyObject *)stmt_res;			 
+		case 6:
+			_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, 
+								(SQLUSMALLINT)param_no, &sql_data_type, 
+							&sql_precision, &sql_scale, &sql_nullable);
+			Py_END_ALLOW_THREADS;
 
-	} else {
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
+												rc, 1, NULL, -1, 1);
+				sprintf(error, "Describe Param Failed: %s", 
+						IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+			sql_data_type = (SQLSMALLINT)data_type;
+			sql_precision = (SQLUINTEGER)precision;
+			/* Add to cache */
+			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
+											param_type, size, 
+											sql_data_type, sql_precision, 
+											sql_scale, sql_nullable );
+			break;
 
-		Py_RETURN_FALSE;
+		case 7:
+		case 8:
+			/* Cache param data passed 
+			* I am using a linked list of nodes here because I don't know 
+			* before hand how many params are being passed in/bound. 
+			* To determine this, a call to SQLNumParams is necessary. 
+			* This is take away any advantages an array would have over 
+			* linked list access 
+			* Data is being copied over to the correct types for subsequent 
+			* CLI call because this might cause problems on other platforms 
+			* such as AIX 
+			*/
+			sql_data_type = (SQLSMALLINT)data_type;
+			sql_precision = (SQLUINTEGER)precision;
+			sql_scale = (SQLSMALLINT)scale;
+			_python_ibm_db_add_param_cache(stmt_res, param_no, var_pyvalue,
+											param_type, size, 
+											sql_data_type, sql_precision, 
+											sql_scale, sql_nullable );
+			break;
+	
+		default:
+			/* WRONG_PARAM_COUNT; */
+			return NULL;
 	}
+	/* end Switch */
+
+	/* We bind data with DB2 CLI in ibm_db.execute() */
+	/* This will save network flow if we need to override params in it */
+
+	Py_INCREF(Py_True);
+	return Py_True;
 }
 
-/*!# ibm_db.procedure_columns
+/*!# ibm_db.bind_param
  *
  * ===Description
- * resource ibm_db.procedure_columns ( resource connection, string qualifier,
- * string schema, string procedure, string parameter )
+ * Py_True/Py_None ibm_db.bind_param (resource stmt, int parameter-number,
+ *									string variable [, int parameter-type
+ *									[, int data-type [, int precision
+ *									[, int scale [, int size[]]]]]] )
  *
- * Returns a result set listing the parameters for one or more stored procedures
+ * Binds a Python variable to an SQL statement parameter in a IBM_DBStatement
+ * resource returned by ibm_db.prepare().
+ * This function gives you more control over the parameter type, data type,
+ * precision, and scale for the parameter than simply passing the variable as
+ * part of the optional input array to ibm_db.execute().
  *
  * ===Parameters
  *
- * ====connection
- *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
+ * ====stmt
  *
- * ====qualifier
- *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
- * other databases, pass NULL or an empty string.
+ *	A prepared statement returned from ibm_db.prepare().
  *
- * ====schema
- *		The schema which contains the procedures. This parameter accepts a
- * search pattern containing _ and % as wildcards.
+ * ====parameter-number
  *
- * ====procedure
- *		The name of the procedure. This parameter accepts a search pattern
- * containing _ and % as wildcards.
+ *	Specifies the 1-indexed position of the parameter in the prepared
+ * statement.
  *
- * ====parameter
- *		The name of the parameter. This parameter accepts a search pattern
- * containing _ and % as wildcards.
- *		If this parameter is NULL, all parameters for the specified stored
- * procedures are returned.
+ * ====variable
  *
- * ===Return Values
+ *	A Python variable to bind to the parameter specified by parameter-number.
  *
- * Returns a statement resource with a result set containing rows describing the
- * parameters for the stored procedures matching the specified parameters. The
- * rows are composed of the following columns:
+ * ====parameter-type
  *
- * Column name::	Description
- * PROCEDURE_CAT:: The catalog that contains the procedure. The value is NULL
- * if this table does not have catalogs.
- * PROCEDURE_SCHEM:: Name of the schema that contains the stored procedure.
- * PROCEDURE_NAME:: Name of the procedure.
- * COLUMN_NAME:: Name of the parameter.
- * COLUMN_TYPE:: An integer value representing the type of the parameter:
- *					  Return value:: Parameter type
- *					  1:: (SQL_PARAM_INPUT)	Input (IN) parameter.
- *					  2:: (SQL_PARAM_INPUT_OUTPUT) Input/output (INOUT)
- *						  parameter.
- *					  3:: (SQL_PARAM_OUTPUT) Output (OUT) parameter.
- * DATA_TYPE:: The SQL data type for the parameter represented as an integer
- * value.
- * TYPE_NAME:: A string representing the data type for the parameter.
- * COLUMN_SIZE:: An integer value representing the size of the parameter.
- * BUFFER_LENGTH:: Maximum number of bytes necessary to store data for this
- * parameter.
- * DECIMAL_DIGITS:: The scale of the parameter, or NULL where scale is not
- * applicable.
- * NUM_PREC_RADIX:: An integer value of either 10 (representing an exact numeric
- * data type), 2 (representing anapproximate numeric data type), or NULL
- * (representing a data type for which radix is not applicable).
- * NULLABLE:: An integer value representing whether the parameter is nullable or
- * not.
- * REMARKS:: Description of the parameter.
- * COLUMN_DEF:: Default value for the parameter.
- * SQL_DATA_TYPE:: An integer value representing the size of the parameter.
- * SQL_DATETIME_SUB:: Returns an integer value representing a datetime subtype
- * code, or NULL for SQL data types to which this does not apply.
- * CHAR_OCTET_LENGTH:: Maximum length in octets for a character data type
- * parameter, which matches COLUMN_SIZE for single-byte character set data, or
- * NULL for non-character data types.
- * ORDINAL_POSITION:: The 1-indexed position of the parameter in the CALL
- * statement.
- * IS_NULLABLE:: A string value where 'YES' means that the parameter accepts or
- * returns NULL values and 'NO' means that the parameter does not accept or
- * return NULL values.
+ *	A constant specifying whether the Python variable should be bound to the
+ * SQL parameter as an input parameter (SQL_PARAM_INPUT), an output parameter
+ * (SQL_PARAM_OUTPUT), or as a parameter that accepts input and returns output
+ * (SQL_PARAM_INPUT_OUTPUT). To avoid memory overhead, you can also specify
+ * PARAM_FILE to bind the Python variable to the name of a file that contains
+ * large object (BLOB, CLOB, or DBCLOB) data.
+ *
+ * ====data-type
+ *
+ *	A constant specifying the SQL data type that the Python variable should be
+ * bound as: one of SQL_BINARY, DB2_CHAR, DB2_DOUBLE, or DB2_LONG .
+ *
+ * ====precision
+ *
+ *	Specifies the precision that the variable should be bound to the database. *
+ * ====scale
+ *
+ *	  Specifies the scale that the variable should be bound to the database.
+ *
+ * ====size
+ *
+ *	  Specifies the size that should be retreived from an INOUT/OUT parameter.
+ *
+ * ===Return Values
+ *
+ *	Returns Py_True on success or NULL on failure.
  */
-static PyObject *ibm_db_procedure_columns(PyObject *self, PyObject *args)
+static PyObject *ibm_db_bind_param(PyObject *self, PyObject *args)			
 {
-	SQLWCHAR *qualifier = NULL;
-	SQLWCHAR *owner = NULL;
-	SQLWCHAR *proc_name = NULL;
-	SQLWCHAR *column_name = NULL;
-	PyObject *py_qualifier = NULL;
-	PyObject *py_owner = NULL;
-	PyObject *py_proc_name = NULL;
-	PyObject *py_column_name = NULL;
-	PyObject *py_conn_res = NULL;
-	int rc = 0;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	int isNewBuffer;
+	PyObject *var_pyvalue = NULL;
+	PyObject *py_param_type = NULL;
+	PyObject *py_data_type = NULL;
+	PyObject *py_precision = NULL;
+	PyObject *py_scale = NULL;
+	PyObject *py_size = NULL;
+	PyObject *py_param_no = NULL;
+	PyObject *py_stmt_res = NULL;
 
-	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_proc_name, &py_column_name))
+	long param_type = SQL_PARAM_INPUT;
+	/* LONG types used for data being passed in */
+	SQLUSMALLINT param_no = 0;
+	long data_type = 0;
+	long precision = 0;
+	long scale = 0;
+	long size = 0;
+	stmt_handle *stmt_res;
+	
+	if (!PyArg_ParseTuple(args, "OOO|OOOOO", &py_stmt_res, &py_param_no, 
+						&var_pyvalue, &py_param_type, 
+						&py_data_type, &py_precision, 
+						&py_scale, &py_size)) {
+	
 		return NULL;
+	}
 
-	if (py_qualifier != NULL && py_qualifier != Py_None) {
-		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
-			py_qualifier = PyUnicode_FromObject(py_qualifier);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+	if (!NIL_P(py_param_no)) {
+		if (PyInt_Check(py_param_no)) {
+			param_no = (SQLUSMALLINT) PyInt_AsLong(py_param_no);
+		} else {
+			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
 			return NULL;
 		}
 	}
+	if (py_param_type != NULL && py_param_type != Py_None && 
+		TYPE(py_param_type) == PYTHON_FIXNUM) {
+		param_type = PyInt_AS_LONG(py_param_type);
+	}
 
-	if (py_owner != NULL && py_owner != Py_None) {
-		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
-			py_owner = PyUnicode_FromObject(py_owner);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			return NULL;
-		}
+	if (py_data_type != NULL && py_data_type != Py_None && 
+		TYPE(py_data_type) == PYTHON_FIXNUM) {
+		data_type = PyInt_AS_LONG(py_data_type);
 	}
 
-	if (py_proc_name != NULL && py_proc_name != Py_None) {
-		if (PyString_Check(py_proc_name) || PyUnicode_Check(py_proc_name)){
-			py_proc_name = PyUnicode_FromObject(py_proc_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			return NULL;
-		}
+	if (py_precision != NULL && py_precision != Py_None && 
+		TYPE(py_precision) == PYTHON_FIXNUM) {
+		precision = PyInt_AS_LONG(py_precision);
 	}
 
-	if (py_column_name != NULL && py_column_name != Py_None) {
-		if (PyString_Check(py_column_name) || PyUnicode_Check(py_column_name)){
-			py_column_name = PyUnicode_FromObject(py_column_name);
-		}
-		else {
-			PyErr_SetString(PyExc_Exception, "column_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
+	if (py_scale != NULL && py_scale != Py_None && 
+		TYPE(py_scale) == PYTHON_FIXNUM) {
+		scale = PyInt_AS_LONG(py_scale);
+	}
+
+	if (py_size != NULL && py_size != Py_None && 
+		TYPE(py_size) == PYTHON_FIXNUM) {
+		size = PyInt_AS_LONG(py_size);
+	}
+
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
 			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
 		}
+		return _python_ibm_db_bind_param_helper(PyTuple_Size(args), stmt_res, param_no, var_pyvalue, param_type, data_type, precision, scale, size);
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
 	}
+}
+
+
+/*!# ibm_db.close
+ *
+ * ===Description
+ *
+ * bool ibm_db.close ( resource connection )
+ *
+ * This function closes a DB2 client connection created with ibm_db.connect()
+ * and returns the corresponding resources to the database server.
+ *
+ * If you attempt to close a persistent DB2 client connection created with
+ * ibm_db.pconnect(), the close request returns TRUE and the persistent IBM Data
+ * Server client connection remains available for the next caller.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *	Specifies an active DB2 client connection.
+ *
+ * ===Return Values
+ * Returns TRUE on success or FALSE on failure.
+ */
+static PyObject *ibm_db_close(PyObject *self, PyObject *args)			
+{
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res = NULL;
+	int rc;
+
+	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+		return NULL;
 
 	if (!NIL_P(py_conn_res)) {
 		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
@@ -3599,83 +4582,92 @@ static PyObject *ibm_db_procedure_columns(PyObject *self, PyObject *args)
 			conn_res = (conn_handle *)py_conn_res;
 		}
 
+		/* A pooled connection goes back to its pool */
+		if ( conn_res->pool != NULL ) {
+			return _python_ibm_db_pool_checkin((ibm_db_pool *)conn_res->pool, conn_res);
+		}
+
+		/* Check to see if it's a persistent connection; 
+		 * if so, just return true 
+		*/
+
 		if (!conn_res->handle_active) {
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
-			Py_XDECREF(py_column_name);
 			return NULL;
 		}
 
-		stmt_res = _ibm_db_new_stmt_struct(conn_res);
+		if ( conn_res->owner_pid != IBM_DB_GETPID() ) {
+			_python_ibm_db_abandon_conn(conn_res);
+			Py_RETURN_TRUE;
+		}
 
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		if (rc == SQL_ERROR) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
-			Py_XDECREF(py_column_name);
+		if ( conn_res->handle_active && !conn_res->flag_pconnect ) {
+			_python_ibm_db_stmt_cache_invalidate(conn_res);
+			/* Disconnect from DB. If stmt is allocated, 
+			* it is freed automatically 
+			*/
+			if (conn_res->auto_commit == 0) {
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLEndTran(SQL_HANDLE_DBC, (SQLHDBC)conn_res->hdbc, 
+								SQL_ROLLBACK);
+				Py_END_ALLOW_THREADS;
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, 
+													rc, 1, NULL, -1, 1);
+					return NULL;
+				}
+			}
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLDisconnect((SQLHDBC)conn_res->hdbc);
+			Py_END_ALLOW_THREADS;
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
+												1, NULL, -1, 1);
+				return NULL;
+			}
 
-			Py_RETURN_FALSE;
-		}
-		if (py_qualifier && py_qualifier != Py_None )
-			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
-		if (py_owner &&  py_owner != Py_None )
-			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_proc_name && py_proc_name != Py_None )
-			proc_name = getUnicodeDataAsSQLWCHAR(py_proc_name, &isNewBuffer);
-		if (py_column_name && py_column_name != Py_None )
-			column_name = getUnicodeDataAsSQLWCHAR(py_column_name, &isNewBuffer);
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLFreeHandle(SQL_HANDLE_DBC, conn_res->hdbc);
+			Py_END_ALLOW_THREADS;
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLProcedureColumnsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, 
-			owner, SQL_NTS, proc_name, SQL_NTS, column_name, 
-			SQL_NTS);
-		Py_END_ALLOW_THREADS;
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 
+												1, NULL, -1, 1);
 
-		if (isNewBuffer) {
-		    if(qualifier) PyMem_Del(qualifier);
-		    if(owner) PyMem_Del(owner);
-		    if(proc_name) PyMem_Del(proc_name);
-			if(column_name) PyMem_Del(column_name);
-		}
-		
-		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-				1, NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
-			Py_XDECREF(py_column_name);
+				rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
+				return NULL;
+			}
 
-			Py_RETURN_FALSE;
-		}
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_proc_name);
-		Py_XDECREF(py_column_name);
+			rc = SQLFreeHandle(SQL_HANDLE_ENV, conn_res->henv);
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(conn_res->henv, SQL_HANDLE_ENV, rc, 
+												1, NULL, -1, 1);
+				return NULL;
+			}
 
-		return (PyObject *)stmt_res;			
+			conn_res->handle_active = 0;
+			Py_INCREF(Py_True);
+			return Py_True;
+		} else if ( conn_res->flag_pconnect ) {
+			/* Do we need to call FreeStmt or something to close cursors? */
+			Py_INCREF(Py_True);
+			return Py_True;
+		} else {
+			return NULL;
+		}
 	} else {
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_proc_name);
-		Py_XDECREF(py_column_name);
-
-		Py_RETURN_FALSE;
+		return NULL;
 	}
 }
 
-/*!# ibm_db.procedures
+/*!# ibm_db.column_privileges
  *
  * ===Description
- * resource ibm_db.procedures ( resource connection, string qualifier,
- * string schema, string procedure )
+ * resource ibm_db.column_privileges ( resource connection [, string qualifier
+ * [, string schema [, string table-name [, string column-name]]]] )
  *
- * Returns a result set listing the stored procedures registered in a database.
+ * Returns a result set listing the columns and associated privileges for a
+ * table.
  *
  * ===Parameters
  *
@@ -3687,50 +4679,53 @@ static PyObject *ibm_db_procedure_columns(PyObject *self, PyObject *args)
  * other databases, pass NULL or an empty string.
  *
  * ====schema
- *		The schema which contains the procedures. This parameter accepts a
- * search pattern containing _ and % as wildcards.
+ *		The schema which contains the tables. To match all schemas, pass NULL
+ * or an empty string.
  *
- * ====procedure
- *		The name of the procedure. This parameter accepts a search pattern
- * containing _ and % as wildcards.
+ * ====table-name
+ *		The name of the table or view. To match all tables in the database,
+ * pass NULL or an empty string.
  *
- * ===Return Values
+ * ====column-name
+ *		The name of the column. To match all columns in the table, pass NULL
+ * or an empty string.
  *
- * Returns a statement resource with a result set containing rows describing the
- * stored procedures matching the specified parameters. The rows are composed of
- * the following columns:
+ * ===Return Values
+ * Returns a statement resource with a result set containing rows describing
+ * the column privileges for columns matching the specified parameters. The rows
+ * are composed of the following columns:
  *
- * Column name:: Description
- * PROCEDURE_CAT:: The catalog that contains the procedure. The value is NULL if
- * this table does not have catalogs.
- * PROCEDURE_SCHEM:: Name of the schema that contains the stored procedure.
- * PROCEDURE_NAME:: Name of the procedure.
- * NUM_INPUT_PARAMS:: Number of input (IN) parameters for the stored procedure.
- * NUM_OUTPUT_PARAMS:: Number of output (OUT) parameters for the stored
- * procedure.
- * NUM_RESULT_SETS:: Number of result sets returned by the stored procedure.
- * REMARKS:: Any comments about the stored procedure.
- * PROCEDURE_TYPE:: Always returns 1, indicating that the stored procedure does
- * not return a return value.
+ * TABLE_CAT:: Name of the catalog. The value is NULL if this table does not
+ * have catalogs.
+ * TABLE_SCHEM:: Name of the schema.
+ * TABLE_NAME:: Name of the table or view.
+ * COLUMN_NAME:: Name of the column.
+ * GRANTOR:: Authorization ID of the user who granted the privilege.
+ * GRANTEE:: Authorization ID of the user to whom the privilege was granted.
+ * PRIVILEGE:: The privilege for the column.
+ * IS_GRANTABLE:: Whether the GRANTEE is permitted to grant this privilege to
+ * other users.
  */
-static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_column_privileges(PyObject *self, PyObject *args)
 {
 	SQLWCHAR *qualifier = NULL;
 	SQLWCHAR *owner = NULL;
-	SQLWCHAR *proc_name = NULL;
-	int rc = 0;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	PyObject *py_conn_res = NULL;
+	SQLWCHAR *table_name = NULL;
+	SQLWCHAR *column_name = NULL;
 	PyObject *py_qualifier = NULL;
 	PyObject *py_owner = NULL;
-	PyObject *py_proc_name = NULL;
+	PyObject *py_table_name = NULL;
+	PyObject *py_column_name = NULL;
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res;
+	stmt_handle *stmt_res;
+	int rc;
 	int isNewBuffer;
 
-	if (!PyArg_ParseTuple(args, "OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_proc_name))
+	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name, &py_column_name))
 		return NULL;
-
+	
 	if (py_qualifier != NULL && py_qualifier != Py_None) {
 		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
 			py_qualifier = PyUnicode_FromObject(py_qualifier);
@@ -3752,9 +4747,9 @@ static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)
 		}
 	}
 
-	if (py_proc_name != NULL && py_proc_name != Py_None) {
-		if (PyString_Check(py_proc_name) || PyUnicode_Check(py_proc_name)){
-			py_proc_name = PyUnicode_FromObject(py_proc_name);
+	if (py_table_name != NULL && py_table_name != Py_None) {
+		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
+			py_table_name = PyUnicode_FromObject(py_table_name);
 		}
 		else {
 			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
@@ -3764,6 +4759,18 @@ static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)
 		}
 	}
 
+	if (py_column_name != NULL && py_column_name != Py_None) {
+		if (PyString_Check(py_column_name) || PyUnicode_Check(py_table_name)){
+			py_column_name = PyUnicode_FromObject(py_column_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "column_name must be a string");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			return NULL;
+		}
+	}
 
 	if (!NIL_P(py_conn_res)) {
 		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
@@ -3777,19 +4784,21 @@ static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 			return NULL;
 		}
 
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
-
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
 		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 
 			Py_RETURN_FALSE;
 		}
@@ -3797,52 +4806,55 @@ static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)
 			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
 		if (py_owner &&  py_owner != Py_None )
 			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_proc_name && py_proc_name != Py_None )
-			proc_name = getUnicodeDataAsSQLWCHAR(py_proc_name, &isNewBuffer);
+		if (py_table_name && py_table_name != Py_None )
+			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLProceduresW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
-			SQL_NTS, proc_name, SQL_NTS);
+		rc = SQLColumnPrivilegesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
+							owner, SQL_NTS, table_name, SQL_NTS, column_name,
+							SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
 		if (isNewBuffer) {
-		    if(qualifier) PyMem_Del(qualifier);
-		    if(owner) PyMem_Del(owner);
-		    if(proc_name) PyMem_Del(proc_name);
+			if(qualifier) PyMem_Del(qualifier);
+			if(owner) PyMem_Del(owner);
+			if(table_name) PyMem_Del(table_name);
 		}
 		
 		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-				1, NULL, -1, 1);
+			_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
+							SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 
 			Py_RETURN_FALSE;
 		}
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
-		Py_XDECREF(py_proc_name);
-		return (PyObject *)stmt_res;				
+		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_column_name);
+
+		return (PyObject *)stmt_res;
 	} else {
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
-		Py_XDECREF(py_proc_name);
+		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_column_name);
 
 		Py_RETURN_FALSE;
 	}
 }
 
-/*!# ibm_db.special_columns
- *
+/*!# ibm_db.columns
  * ===Description
- * resource ibm_db.special_columns ( resource connection, string qualifier,
- * string schema, string table_name, int scope )
+ * resource ibm_db.columns ( resource connection [, string qualifier
+ * [, string schema [, string table-name [, string column-name]]]] )
  *
- * Returns a result set listing the unique row identifier columns for a table.
+ * Returns a result set listing the columns and associated metadata for a table.
  *
  * ===Parameters
- *
  * ====connection
  *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
  *
@@ -3851,91 +4863,70 @@ static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)
  * other databases, pass NULL or an empty string.
  *
  * ====schema
- *		The schema which contains the tables.
- *
- * ====table_name
- *		The name of the table.
+ *		The schema which contains the tables. To match all schemas, pass '%'.
  *
- * ====scope
- *		Integer value representing the minimum duration for which the unique
- * row identifier is valid. This can be one of the following values:
+ * ====table-name
+ *		The name of the table or view. To match all tables in the database,
+ * pass NULL or an empty string.
  *
- *		0: Row identifier is valid only while the cursor is positioned on the
- * row. (SQL_SCOPE_CURROW)
- *		1: Row identifier is valid for the duration of the transaction.
- * (SQL_SCOPE_TRANSACTION)
- *		2: Row identifier is valid for the duration of the connection.
- * (SQL_SCOPE_SESSION)
+ * ====column-name
+ *		The name of the column. To match all columns in the table, pass NULL or
+ * an empty string.
  *
  * ===Return Values
- *
- * Returns a statement resource with a result set containing rows with unique
- * row identifier information for a table.
+ * Returns a statement resource with a result set containing rows describing the
+ * columns matching the specified parameters.
  * The rows are composed of the following columns:
  *
- * Column name:: Description
- *
- * SCOPE:: Integer value representing the minimum duration for which the unique
- * row identifier is valid.
- *
- *			 0: Row identifier is valid only while the cursor is positioned on
- * the row. (SQL_SCOPE_CURROW)
- *
- *			 1: Row identifier is valid for the duration of the transaction.
- * (SQL_SCOPE_TRANSACTION)
- *
- *			 2: Row identifier is valid for the duration of the connection.
- * (SQL_SCOPE_SESSION)
- *
- * COLUMN_NAME:: Name of the unique column.
- *
- * DATA_TYPE:: SQL data type for the column.
- *
- * TYPE_NAME:: Character string representation of the SQL data type for the
- * column.
- *
+ * TABLE_CAT:: Name of the catalog. The value is NULL if this table does not
+ * have catalogs.
+ * TABLE_SCHEM:: Name of the schema.
+ * TABLE_NAME:: Name of the table or view.
+ * COLUMN_NAME:: Name of the column.
+ * DATA_TYPE:: The SQL data type for the column represented as an integer value.
+ * TYPE_NAME:: A string representing the data type for the column.
  * COLUMN_SIZE:: An integer value representing the size of the column.
- *
  * BUFFER_LENGTH:: Maximum number of bytes necessary to store data from this
  * column.
- *
  * DECIMAL_DIGITS:: The scale of the column, or NULL where scale is not
  * applicable.
- *
  * NUM_PREC_RADIX:: An integer value of either 10 (representing an exact numeric
  * data type), 2 (representing an approximate numeric data type), or NULL
  * (representing a data type for which radix is not applicable).
- *
- * PSEUDO_COLUMN:: Always returns 1.
+ * NULLABLE:: An integer value representing whether the column is nullable or
+ * not.
+ * REMARKS:: Description of the column.
+ * COLUMN_DEF:: Default value for the column.
+ * SQL_DATA_TYPE:: An integer value representing the size of the column.
+ * SQL_DATETIME_SUB:: Returns an integer value representing a datetime subtype
+ * code, or NULL for SQL data types to which this does not apply.
+ * CHAR_OCTET_LENGTH::	Maximum length in octets for a character data type
+ * column, which matches COLUMN_SIZE for single-byte character set data, or
+ * NULL for non-character data types.
+ * ORDINAL_POSITION:: The 1-indexed position of the column in the table.
+ * IS_NULLABLE:: A string value where 'YES' means that the column is nullable
+ * and 'NO' means that the column is not nullable.
  */
-static PyObject *ibm_db_special_columns(PyObject *self, PyObject *args)
+static PyObject *ibm_db_columns(PyObject *self, PyObject *args)			
 {
 	SQLWCHAR *qualifier = NULL;
 	SQLWCHAR *owner = NULL;
 	SQLWCHAR *table_name = NULL;
-	int scope = 0;
-	conn_handle *conn_res;
-	stmt_handle *stmt_res;
-	int rc;
-	PyObject *py_conn_res = NULL;
-	PyObject *py_scope = NULL;
+	SQLWCHAR *column_name = NULL;
 	PyObject *py_qualifier = NULL;
 	PyObject *py_owner = NULL;
 	PyObject *py_table_name = NULL;
+	PyObject *py_column_name = NULL;
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res;
+	stmt_handle *stmt_res;
+	int rc;
 	int isNewBuffer;
 
-	if (!PyArg_ParseTuple(args, "OOOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name, &py_scope))
+	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name, &py_column_name))
 		return NULL;
 
-	if (!NIL_P(py_scope)) {
-		if (PyInt_Check(py_scope)) {
-			scope = (int) PyInt_AsLong(py_scope);
-		} else {
-			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-			return NULL;
-		}
-	}
 	if (py_qualifier != NULL && py_qualifier != Py_None) {
 		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
 			py_qualifier = PyUnicode_FromObject(py_qualifier);
@@ -3969,6 +4960,19 @@ static PyObject *ibm_db_special_columns(PyObject *self, PyObject *args)
 		}
 	}
 
+	if (py_column_name != NULL && py_column_name != Py_None) {
+		if (PyString_Check(py_column_name) || PyUnicode_Check(py_table_name)){
+			py_column_name = PyUnicode_FromObject(py_column_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "column_name must be a string");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			return NULL;
+		}
+	}
+
 	if (!NIL_P(py_conn_res)) {
 		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
 			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
@@ -3982,211 +4986,242 @@ static PyObject *ibm_db_special_columns(PyObject *self, PyObject *args)
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
 			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 			return NULL;
 		}
 
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
 		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
 			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 
 			Py_RETURN_FALSE;
 		}
+
 		if (py_qualifier && py_qualifier != Py_None )
 			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
 		if (py_owner &&  py_owner != Py_None )
 			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
 		if (py_table_name && py_table_name != Py_None )
 			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
+		if (py_column_name && py_column_name != Py_None )
+			column_name = getUnicodeDataAsSQLWCHAR(py_column_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLSpecialColumnsW((SQLHSTMT)stmt_res->hstmt, SQL_BEST_ROWID, 
-			qualifier, SQL_NTS, owner, SQL_NTS, table_name,
-			SQL_NTS, scope, SQL_NULLABLE);
+		rc = SQLColumnsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
+			owner,SQL_NTS, table_name, SQL_NTS, column_name, SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
 		if (isNewBuffer) {
 		    if(qualifier) PyMem_Del(qualifier);
 		    if(owner) PyMem_Del(owner);
-		    if(table_name) PyMem_Del(table_name);	
-		}
-		
+		    if(table_name) PyMem_Del(table_name);
+		    if(column_name) PyMem_Del(column_name);
+		}	
+				
 		if (rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-				1, NULL, -1, 1);
+			_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, 
+				SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
 			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_column_name);
 
 			Py_RETURN_FALSE;
 		}
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
 		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_column_name);
 
-		return (PyObject *)stmt_res;
+		return (PyObject *)stmt_res;				  
 	} else {
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
 		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_column_name);
 
 		Py_RETURN_FALSE;
-
 	}
 }
 
-/*!# ibm_db.statistics
+/*!# ibm_db.foreign_keys
  *
  * ===Description
- * resource ibm_db.statistics ( resource connection, string qualifier,
- * string schema, string table-name, bool unique )
+ * resource ibm_db.foreign_keys ( resource connection, string pk_qualifier,
+ * string pk_schema, string pk_table-name, string fk_qualifier
+ * string fk_schema, string fk_table-name )
  *
- * Returns a result set listing the index and statistics for a table.
+ * Returns a result set listing the foreign keys for a table.
  *
  * ===Parameters
  *
  * ====connection
  *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
  *
- * ====qualifier
- *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
- * other databases, pass NULL or an empty string.
+ * ====pk_qualifier
+ *		A qualifier for the pk_table-name argument for the DB2 databases 
+ * running on OS/390 or z/OS servers. For other databases, pass NULL or an empty 
+ * string. 
  *
- * ====schema
- *		The schema that contains the targeted table. If this parameter is NULL,
- * the statistics and indexes are returned for the schema of the current user.
+ * ====pk_schema
+ *		The schema for the pk_table-name argument which contains the tables. If 
+ * schema is NULL, ibm_db.foreign_keys() matches the schema for the current 
+ * connection. 
  *
- * ====table_name
- *		The name of the table.
+ * ====pk_table-name
+ *		The name of the table which contains the primary key.
  *
- * ====unique
- *		A boolean value representing the type of index information to return.
+ * ====fk_qualifier
+ *		A qualifier for the fk_table-name argument for the DB2 databases
+ * running on OS/390 or z/OS servers. For other databases, pass NULL or an empty
+ * string.
  *
- *		False	 Return only the information for unique indexes on the table.
+ * ====fk_schema
+ *		The schema for the fk_table-name argument which contains the tables. If
+ * schema is NULL, ibm_db.foreign_keys() matches the schema for the current
+ * connection.
  *
- *		True	  Return the information for all indexes on the table.
+ * ====fk_table-name
+ *		The name of the table which contains the foreign key.
  *
  * ===Return Values
  *
  * Returns a statement resource with a result set containing rows describing the
- * statistics and indexes for the base tables matching the specified parameters.
- * The rows are composed of the following columns:
- *
- * Column name:: Description
- * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
- * table does not have catalogs.
- * TABLE_SCHEM:: Name of the schema that contains the table.
- * TABLE_NAME:: Name of the table.
- * NON_UNIQUE:: An integer value representing whether the index prohibits unique
- * values, or whether the row represents statistics on the table itself:
- *
- *					 Return value:: Parameter type
- *					 0 (SQL_FALSE):: The index allows duplicate values.
- *					 1 (SQL_TRUE):: The index values must be unique.
- *					 NULL:: This row is statistics information for the table
- *					 itself.
- *
- * INDEX_QUALIFIER:: A string value representing the qualifier that would have
- * to be prepended to INDEX_NAME to fully qualify the index.
- * INDEX_NAME:: A string representing the name of the index.
- * TYPE:: An integer value representing the type of information contained in
- * this row of the result set:
- *
- *			Return value:: Parameter type
- *			0 (SQL_TABLE_STAT):: The row contains statistics about the table
- *								 itself.
- *			1 (SQL_INDEX_CLUSTERED):: The row contains information about a
- *									  clustered index.
- *			2 (SQL_INDEX_HASH):: The row contains information about a hashed
- *								 index.
- *			3 (SQL_INDEX_OTHER):: The row contains information about a type of
- * index that is neither clustered nor hashed.
+ * foreign keys for the specified table. The result set is composed of the
+ * following columns:
  *
- * ORDINAL_POSITION:: The 1-indexed position of the column in the index. NULL if
- * the row contains statistics information about the table itself.
- * COLUMN_NAME:: The name of the column in the index. NULL if the row contains
- * statistics information about the table itself.
- * ASC_OR_DESC:: A if the column is sorted in ascending order, D if the column
- * is sorted in descending order, NULL if the row contains statistics
- * information about the table itself.
- * CARDINALITY:: If the row contains information about an index, this column
- * contains an integer value representing the number of unique values in the
- * index. If the row contains information about the table itself, this column
- * contains an integer value representing the number of rows in the table.
- * PAGES:: If the row contains information about an index, this column contains
- * an integer value representing the number of pages used to store the index. If
- * the row contains information about the table itself, this column contains an
- * integer value representing the number of pages used to store the table.
- * FILTER_CONDITION:: Always returns NULL.
- */ 
-static PyObject *ibm_db_statistics(PyObject *self, PyObject *args)
+ * Column name::	Description
+ * PKTABLE_CAT:: Name of the catalog for the table containing the primary key.
+ * The value is NULL if this table does not have catalogs.
+ * PKTABLE_SCHEM:: Name of the schema for the table containing the primary key.
+ * PKTABLE_NAME:: Name of the table containing the primary key.
+ * PKCOLUMN_NAME:: Name of the column containing the primary key.
+ * FKTABLE_CAT:: Name of the catalog for the table containing the foreign key.
+ * The value is NULL if this table does not have catalogs.
+ * FKTABLE_SCHEM:: Name of the schema for the table containing the foreign key.
+ * FKTABLE_NAME:: Name of the table containing the foreign key.
+ * FKCOLUMN_NAME:: Name of the column containing the foreign key.
+ * KEY_SEQ:: 1-indexed position of the column in the key.
+ * UPDATE_RULE:: Integer value representing the action applied to the foreign
+ * key when the SQL operation is UPDATE.
+ * DELETE_RULE:: Integer value representing the action applied to the foreign
+ * key when the SQL operation is DELETE.
+ * FK_NAME:: The name of the foreign key.
+ * PK_NAME:: The name of the primary key.
+ * DEFERRABILITY:: An integer value representing whether the foreign key
+ * deferrability is SQL_INITIALLY_DEFERRED, SQL_INITIALLY_IMMEDIATE, or
+ * SQL_NOT_DEFERRABLE.
+ */
+static PyObject *ibm_db_foreign_keys(PyObject *self, PyObject *args)
 {
-	SQLWCHAR *qualifier = NULL;
-	SQLWCHAR *owner = NULL;
-	SQLWCHAR *table_name = NULL;
-	int unique = 0;
-	int rc = 0;
-	SQLUSMALLINT sql_unique;
-	conn_handle *conn_res;
+	SQLWCHAR *pk_qualifier = NULL;
+	SQLWCHAR *pk_owner = NULL;
+	SQLWCHAR *pk_table_name = NULL;
+	SQLWCHAR *fk_qualifier = NULL;
+	SQLWCHAR *fk_owner = NULL;
+	SQLWCHAR *fk_table_name = NULL;
+	int rc;
+	conn_handle *conn_res = NULL;
 	stmt_handle *stmt_res;
 	PyObject *py_conn_res = NULL;
-	PyObject *py_qualifier = NULL;
-	PyObject *py_owner = NULL;
-	PyObject *py_table_name = NULL;
-	PyObject *py_unique = NULL;
-	int isNewBuffer;
+	PyObject *py_pk_qualifier = NULL;
+	PyObject *py_pk_owner = NULL;
+	PyObject *py_pk_table_name = NULL;
+	PyObject *py_fk_qualifier = NULL;
+	PyObject *py_fk_owner = NULL;
+	PyObject *py_fk_table_name = NULL;
+	int isNewBuffer = 0;
 
-	if (!PyArg_ParseTuple(args, "OOOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name, &py_unique))
+	if (!PyArg_ParseTuple(args, "OOOO|OOO", &py_conn_res, &py_pk_qualifier, 
+		&py_pk_owner, &py_pk_table_name, &py_fk_qualifier,
+		&py_fk_owner, &py_fk_table_name))
 		return NULL;
 
-	if (py_qualifier != NULL && py_qualifier != Py_None) {
-		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
-			py_qualifier = PyUnicode_FromObject(py_qualifier);
+	if (py_pk_qualifier != NULL && py_pk_qualifier != Py_None) {
+		if (PyString_Check(py_pk_qualifier) || PyUnicode_Check(py_pk_qualifier)){
+			py_pk_qualifier = PyUnicode_FromObject(py_pk_qualifier);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+			PyErr_SetString(PyExc_Exception, 
+				"qualifier for table containing primary key must be a string or unicode");
 			return NULL;
 		}
 	}
 
-	if (py_owner != NULL && py_owner != Py_None) {
-		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
-			py_owner = PyUnicode_FromObject(py_owner);
+	if (py_pk_owner != NULL && py_pk_owner != Py_None) {
+		if (PyString_Check(py_pk_owner) || PyUnicode_Check(py_pk_owner)){
+			py_pk_owner = PyUnicode_FromObject(py_pk_owner);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
-			Py_XDECREF(py_qualifier);
+			PyErr_SetString(PyExc_Exception,  
+				"owner of table containing primary key must be a string or unicode");
+			Py_XDECREF(py_pk_qualifier);
 			return NULL;
 		}
 	}
 
-	if (py_table_name != NULL && py_table_name != Py_None) {
-		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
-			py_table_name = PyUnicode_FromObject(py_table_name);
+	if (py_pk_table_name != NULL && py_pk_table_name != Py_None) {
+		if (PyString_Check(py_pk_table_name) || PyUnicode_Check(py_pk_table_name)){
+			py_pk_table_name = PyUnicode_FromObject(py_pk_table_name);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
+			PyErr_SetString(PyExc_Exception, 
+				"name of the table that contains primary key must be a string or unicode");
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
 			return NULL;
 		}
 	}
 
-	if (py_unique != NULL && py_unique != Py_None) {
-		if (PyBool_Check(py_unique)) {
-			if (py_unique == Py_True)
-				unique = 1;
-			else
-				unique = 0;
+	if (py_fk_qualifier != NULL && py_fk_qualifier != Py_None) {
+		if (PyString_Check(py_fk_qualifier) || PyUnicode_Check(py_fk_qualifier)){
+			py_fk_qualifier = PyUnicode_FromObject(py_fk_qualifier);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "unique must be a boolean");
+			PyErr_SetString(PyExc_Exception, 
+				"qualifier for table containing the foreign key must be a string or unicode");
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			return NULL;
+		}
+	}
+
+	if (py_fk_owner != NULL && py_fk_owner != Py_None) {
+		if (PyString_Check(py_fk_owner) || PyUnicode_Check(py_fk_owner)){
+			py_fk_owner = PyUnicode_FromObject(py_fk_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, 
+				"owner of table containing the foreign key must be a string or unicode");
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			Py_XDECREF(py_fk_qualifier);
+			return NULL;
+		}
+	}
+
+	if (py_fk_table_name != NULL && py_fk_table_name != Py_None) {
+		if (PyString_Check(py_fk_table_name) || PyUnicode_Check(py_fk_table_name)){
+			py_fk_table_name = PyUnicode_FromObject(py_fk_table_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, 
+				"name of the table that contains foreign key must be a string or unicode");
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			Py_XDECREF(py_fk_qualifier);
+			Py_XDECREF(py_fk_owner);
 			return NULL;
 		}
 	}
@@ -4201,74 +5236,101 @@ static PyObject *ibm_db_statistics(PyObject *self, PyObject *args)
 
 		if (!conn_res->handle_active) {
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			Py_XDECREF(py_fk_qualifier);
+			Py_XDECREF(py_fk_owner);
+			Py_XDECREF(py_fk_table_name);
 			return NULL;
 		}
 
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
-		sql_unique = unique;
 
+		Py_BEGIN_ALLOW_THREADS;
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+
 		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			Py_XDECREF(py_fk_qualifier);
+			Py_XDECREF(py_fk_owner);
+			Py_XDECREF(py_fk_table_name);
 
 			Py_RETURN_FALSE;
 		}
-		if (py_qualifier && py_qualifier != Py_None )
-			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
-		if (py_owner &&  py_owner != Py_None )
-			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_table_name && py_table_name != Py_None )
-			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
+
+		if(py_pk_qualifier && py_pk_qualifier != Py_None)
+			pk_qualifier = getUnicodeDataAsSQLWCHAR(py_pk_qualifier, &isNewBuffer);
+		if(py_pk_owner && py_pk_owner != Py_None)
+			pk_owner = getUnicodeDataAsSQLWCHAR(py_pk_owner, &isNewBuffer);
+		if(py_pk_table_name && py_pk_table_name != Py_None)
+			pk_table_name = getUnicodeDataAsSQLWCHAR(py_pk_table_name, &isNewBuffer);
+		if(py_fk_qualifier && py_fk_qualifier != Py_None)
+			fk_qualifier = getUnicodeDataAsSQLWCHAR(py_fk_qualifier, &isNewBuffer);
+		if(py_fk_owner && py_fk_owner != Py_None)
+			fk_owner = getUnicodeDataAsSQLWCHAR(py_fk_owner, &isNewBuffer);
+		if(py_fk_table_name && py_fk_table_name != Py_None)
+			fk_table_name = getUnicodeDataAsSQLWCHAR(py_fk_table_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLStatisticsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
-			SQL_NTS, table_name, SQL_NTS, sql_unique, SQL_QUICK);
+		rc = SQLForeignKeysW((SQLHSTMT)stmt_res->hstmt, pk_qualifier, SQL_NTS,
+						pk_owner, SQL_NTS, pk_table_name, SQL_NTS, fk_qualifier, SQL_NTS,
+						fk_owner, SQL_NTS, fk_table_name, SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
 		if (isNewBuffer) {
-		    if(qualifier) PyMem_Del(qualifier);
-		    if(owner) PyMem_Del(owner);
-		    if(table_name) PyMem_Del(table_name);
-		}
+		    if(pk_qualifier) PyMem_Del(pk_qualifier);
+		    if(pk_owner) PyMem_Del(pk_owner);
+		    if(pk_table_name) PyMem_Del(pk_table_name);
+		    if(fk_qualifier) PyMem_Del(fk_qualifier);
+		    if(fk_owner) PyMem_Del(fk_owner);
+		    if(fk_table_name) PyMem_Del(fk_table_name);
+		}	
 		
 		if (rc == SQL_ERROR ) {
 			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-				1, NULL, -1, 1);
-			Py_XDECREF(py_qualifier);
-			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-
+											1, NULL, -1, 1);
+			Py_XDECREF(py_pk_qualifier);
+			Py_XDECREF(py_pk_owner);
+			Py_XDECREF(py_pk_table_name);
+			Py_XDECREF(py_fk_qualifier);
+			Py_XDECREF(py_fk_owner);
+			Py_XDECREF(py_fk_table_name);
+			PyErr_Clear( );
 			Py_RETURN_FALSE;
 		}
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_pk_qualifier);
+		Py_XDECREF(py_pk_owner);
+		Py_XDECREF(py_pk_table_name);
+		Py_XDECREF(py_fk_qualifier);
+		Py_XDECREF(py_fk_owner);
+		Py_XDECREF(py_fk_table_name);
+		return (PyObject *)stmt_res;				  
 
-		return (PyObject *)stmt_res;
 	} else {
-		Py_XDECREF(py_qualifier);
-		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-
+		Py_XDECREF(py_pk_qualifier);
+		Py_XDECREF(py_pk_owner);
+		Py_XDECREF(py_pk_table_name);
+		Py_XDECREF(py_fk_qualifier);
+		Py_XDECREF(py_fk_owner);
+		Py_XDECREF(py_fk_table_name);
 		Py_RETURN_FALSE;
 	}
 }
 
-/*!# ibm_db.table_privileges
+/*!# ibm_db.primary_keys
  *
  * ===Description
- * resource ibm_db.table_privileges ( resource connection [, string qualifier
- * [, string schema [, string table_name]]] )
+ * resource ibm_db.primary_keys ( resource connection, string qualifier,
+ * string schema, string table-name )
  *
- * Returns a result set listing the tables and associated privileges in a
- * database.
+ * Returns a result set listing the primary keys for a table.
  *
  * ===Parameters
  *
@@ -4280,46 +5342,42 @@ static PyObject *ibm_db_statistics(PyObject *self, PyObject *args)
  * other databases, pass NULL or an empty string.
  *
  * ====schema
- *		The schema which contains the tables. This parameter accepts a search
- * pattern containing _ and % as wildcards.
+ *		The schema which contains the tables. If schema is NULL,
+ * ibm_db.primary_keys() matches the schema for the current connection.
  *
- * ====table_name
- *		The name of the table. This parameter accepts a search pattern
- * containing _ and % as wildcards.
+ * ====table-name
+ *		The name of the table.
  *
  * ===Return Values
  *
- * Returns a statement resource with a result set containing rows describing
- * the privileges for the tables that match the specified parameters. The rows
- * are composed of the following columns:
+ * Returns a statement resource with a result set containing rows describing the
+ * primary keys for the specified table.
+ * The result set is composed of the following columns:
  *
  * Column name:: Description
- * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
- * table does not have catalogs.
- * TABLE_SCHEM:: Name of the schema that contains the table.
- * TABLE_NAME:: Name of the table.
- * GRANTOR:: Authorization ID of the user who granted the privilege.
- * GRANTEE:: Authorization ID of the user to whom the privilege was granted.
- * PRIVILEGE:: The privilege that has been granted. This can be one of ALTER,
- * CONTROL, DELETE, INDEX, INSERT, REFERENCES, SELECT, or UPDATE.
- * IS_GRANTABLE:: A string value of "YES" or "NO" indicating whether the grantee
- * can grant the privilege to other users.
+ * TABLE_CAT:: Name of the catalog for the table containing the primary key.
+ * The value is NULL if this table does not have catalogs.
+ * TABLE_SCHEM:: Name of the schema for the table containing the primary key.
+ * TABLE_NAME:: Name of the table containing the primary key.
+ * COLUMN_NAME:: Name of the column containing the primary key.
+ * KEY_SEQ:: 1-indexed position of the column in the key.
+ * PK_NAME:: The name of the primary key.
  */
-static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
+static PyObject *ibm_db_primary_keys(PyObject *self, PyObject *args)
 {
 	SQLWCHAR *qualifier = NULL;
 	SQLWCHAR *owner = NULL;
 	SQLWCHAR *table_name = NULL;
+	int rc;
 	conn_handle *conn_res;
 	stmt_handle *stmt_res;
-	int rc;
 	PyObject *py_conn_res = NULL;
 	PyObject *py_qualifier = NULL;
 	PyObject *py_owner = NULL;
 	PyObject *py_table_name = NULL;
 	int isNewBuffer;
 
-	if (!PyArg_ParseTuple(args, "O|OOO", &py_conn_res, &py_qualifier, &py_owner,
+	if (!PyArg_ParseTuple(args, "OOOO", &py_conn_res, &py_qualifier, &py_owner,
 		&py_table_name))
 		return NULL;
 
@@ -4372,14 +5430,10 @@ static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
 			return NULL;
 		}
 
-		if (!conn_res) {
-			PyErr_SetString(PyExc_Exception,"Connection Resource cannot be found");
-			Py_RETURN_FALSE;
-		}
-
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
 		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
@@ -4396,8 +5450,8 @@ static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
 		if (py_table_name && py_table_name != Py_None )
 			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLTablePrivilegesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, 
+		Py_BEGIN_ALLOW_THREADS;	
+		rc = SQLPrimaryKeysW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS,
 			owner, SQL_NTS, table_name, SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
@@ -4420,7 +5474,8 @@ static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
 		Py_XDECREF(py_owner);
 		Py_XDECREF(py_table_name);
 
-		return (PyObject *)stmt_res;
+		return (PyObject *)stmt_res;			 
+
 	} else {
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
@@ -4430,13 +5485,13 @@ static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
 	}
 }
 
-/*!# ibm_db.tables
+/*!# ibm_db.procedure_columns
  *
  * ===Description
- * resource ibm_db.tables ( resource connection [, string qualifier [, string
- * schema [, string table-name [, string table-type]]]] )
+ * resource ibm_db.procedure_columns ( resource connection, string qualifier,
+ * string schema, string procedure, string parameter )
  *
- * Returns a result set listing the tables and associated metadata in a database
+ * Returns a result set listing the parameters for one or more stored procedures
  *
  * ===Parameters
  *
@@ -4448,52 +5503,82 @@ static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
  * other databases, pass NULL or an empty string.
  *
  * ====schema
- *		The schema which contains the tables. This parameter accepts a search
- * pattern containing _ and % as wildcards.
+ *		The schema which contains the procedures. This parameter accepts a
+ * search pattern containing _ and % as wildcards.
  *
- * ====table-name
- *		The name of the table. This parameter accepts a search pattern
+ * ====procedure
+ *		The name of the procedure. This parameter accepts a search pattern
  * containing _ and % as wildcards.
  *
- * ====table-type
- *		A list of comma-delimited table type identifiers. To match all table
- * types, pass NULL or an empty string.
- *		Valid table type identifiers include: ALIAS, HIERARCHY TABLE,
- * INOPERATIVE VIEW, NICKNAME, MATERIALIZED QUERY TABLE, SYSTEM TABLE, TABLE,
- * TYPED TABLE, TYPED VIEW, and VIEW.
+ * ====parameter
+ *		The name of the parameter. This parameter accepts a search pattern
+ * containing _ and % as wildcards.
+ *		If this parameter is NULL, all parameters for the specified stored
+ * procedures are returned.
  *
  * ===Return Values
  *
- * Returns a statement resource with a result set containing rows describing
- * the tables that match the specified parameters.
- * The rows are composed of the following columns:
+ * Returns a statement resource with a result set containing rows describing the
+ * parameters for the stored procedures matching the specified parameters. The
+ * rows are composed of the following columns:
  *
- * Column name:: Description
- * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
- * table does not have catalogs.
- * TABLE_SCHEMA:: Name of the schema that contains the table.
- * TABLE_NAME:: Name of the table.
- * TABLE_TYPE:: Table type identifier for the table.
- * REMARKS:: Description of the table.
+ * Column name::	Description
+ * PROCEDURE_CAT:: The catalog that contains the procedure. The value is NULL
+ * if this table does not have catalogs.
+ * PROCEDURE_SCHEM:: Name of the schema that contains the stored procedure.
+ * PROCEDURE_NAME:: Name of the procedure.
+ * COLUMN_NAME:: Name of the parameter.
+ * COLUMN_TYPE:: An integer value representing the type of the parameter:
+ *					  Return value:: Parameter type
+ *					  1:: (SQL_PARAM_INPUT)	Input (IN) parameter.
+ *					  2:: (SQL_PARAM_INPUT_OUTPUT) Input/output (INOUT)
+ *						  parameter.
+ *					  3:: (SQL_PARAM_OUTPUT) Output (OUT) parameter.
+ * DATA_TYPE:: The SQL data type for the parameter represented as an integer
+ * value.
+ * TYPE_NAME:: A string representing the data type for the parameter.
+ * COLUMN_SIZE:: An integer value representing the size of the parameter.
+ * BUFFER_LENGTH:: Maximum number of bytes necessary to store data for this
+ * parameter.
+ * DECIMAL_DIGITS:: The scale of the parameter, or NULL where scale is not
+ * applicable.
+ * NUM_PREC_RADIX:: An integer value of either 10 (representing an exact numeric
+ * data type), 2 (representing anapproximate numeric data type), or NULL
+ * (representing a data type for which radix is not applicable).
+ * NULLABLE:: An integer value representing whether the parameter is nullable or
+ * not.
+ * REMARKS:: Description of the parameter.
+ * COLUMN_DEF:: Default value for the parameter.
+ * SQL_DATA_TYPE:: An integer value representing the size of the parameter.
+ * SQL_DATETIME_SUB:: Returns an integer value representing a datetime subtype
+ * code, or NULL for SQL data types to which this does not apply.
+ * CHAR_OCTET_LENGTH:: Maximum length in octets for a character data type
+ * parameter, which matches COLUMN_SIZE for single-byte character set data, or
+ * NULL for non-character data types.
+ * ORDINAL_POSITION:: The 1-indexed position of the parameter in the CALL
+ * statement.
+ * IS_NULLABLE:: A string value where 'YES' means that the parameter accepts or
+ * returns NULL values and 'NO' means that the parameter does not accept or
+ * return NULL values.
  */
-static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
+static PyObject *ibm_db_procedure_columns(PyObject *self, PyObject *args)
 {
 	SQLWCHAR *qualifier = NULL;
 	SQLWCHAR *owner = NULL;
-	SQLWCHAR *table_name = NULL;
-	SQLWCHAR *table_type = NULL;
+	SQLWCHAR *proc_name = NULL;
+	SQLWCHAR *column_name = NULL;
 	PyObject *py_qualifier = NULL;
 	PyObject *py_owner = NULL;
-	PyObject *py_table_name = NULL;
-	PyObject *py_table_type = NULL;
-	PyObject *py_conn_res;
+	PyObject *py_proc_name = NULL;
+	PyObject *py_column_name = NULL;
+	PyObject *py_conn_res = NULL;
+	int rc = 0;
 	conn_handle *conn_res;
 	stmt_handle *stmt_res;
-	int rc;
 	int isNewBuffer;
 
 	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
-		&py_table_name, &py_table_type))
+		&py_proc_name, &py_column_name))
 		return NULL;
 
 	if (py_qualifier != NULL && py_qualifier != Py_None) {
@@ -4517,9 +5602,9 @@ static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
 		}
 	}
 
-	if (py_table_name != NULL && py_table_name != Py_None) {
-		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
-			py_table_name = PyUnicode_FromObject(py_table_name);
+	if (py_proc_name != NULL && py_proc_name != Py_None) {
+		if (PyString_Check(py_proc_name) || PyUnicode_Check(py_proc_name)){
+			py_proc_name = PyUnicode_FromObject(py_proc_name);
 		}
 		else {
 			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
@@ -4529,15 +5614,15 @@ static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
 		}
 	}
 
-	if (py_table_type != NULL && py_table_type != Py_None) {
-		if (PyString_Check(py_table_type) || PyUnicode_Check(py_table_type)){
-			py_table_type = PyUnicode_FromObject(py_table_type);
+	if (py_column_name != NULL && py_column_name != Py_None) {
+		if (PyString_Check(py_column_name) || PyUnicode_Check(py_column_name)){
+			py_column_name = PyUnicode_FromObject(py_column_name);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "table type must be a string or unicode");
+			PyErr_SetString(PyExc_Exception, "column_name must be a string or unicode");
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_proc_name);
 			return NULL;
 		}
 	}
@@ -4554,43 +5639,45 @@ static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_table_type);
+			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_column_name);
 			return NULL;
 		}
 
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
 		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_table_type);
-			
+			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_column_name);
+
 			Py_RETURN_FALSE;
 		}
 		if (py_qualifier && py_qualifier != Py_None )
 			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
 		if (py_owner &&  py_owner != Py_None )
 			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
-		if (py_table_name && py_table_name != Py_None )
-			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
-		if(py_table_type && py_table_type != Py_None)
-			table_type = getUnicodeDataAsSQLWCHAR(py_table_type, &isNewBuffer);
+		if (py_proc_name && py_proc_name != Py_None )
+			proc_name = getUnicodeDataAsSQLWCHAR(py_proc_name, &isNewBuffer);
+		if (py_column_name && py_column_name != Py_None )
+			column_name = getUnicodeDataAsSQLWCHAR(py_column_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLTablesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
-			SQL_NTS, table_name, SQL_NTS, table_type, SQL_NTS);
+		rc = SQLProcedureColumnsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, 
+			owner, SQL_NTS, proc_name, SQL_NTS, column_name, 
+			SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
 		if (isNewBuffer) {
 		    if(qualifier) PyMem_Del(qualifier);
 		    if(owner) PyMem_Del(owner);
-		    if(table_name) PyMem_Del(table_name);
-			if(table_type) PyMem_Del(table_type);
+		    if(proc_name) PyMem_Del(proc_name);
+			if(column_name) PyMem_Del(column_name);
 		}
 		
 		if (rc == SQL_ERROR ) {
@@ -4598,61 +5685,123 @@ static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
 				1, NULL, -1, 1);
 			Py_XDECREF(py_qualifier);
 			Py_XDECREF(py_owner);
-			Py_XDECREF(py_table_name);
-			Py_XDECREF(py_table_type);
+			Py_XDECREF(py_proc_name);
+			Py_XDECREF(py_column_name);
 
 			Py_RETURN_FALSE;
 		}
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_table_type);
-		
-		return (PyObject *)stmt_res;
+		Py_XDECREF(py_proc_name);
+		Py_XDECREF(py_column_name);
+
+		return (PyObject *)stmt_res;			
 	} else {
 		Py_XDECREF(py_qualifier);
 		Py_XDECREF(py_owner);
-		Py_XDECREF(py_table_name);
-		Py_XDECREF(py_table_type);
+		Py_XDECREF(py_proc_name);
+		Py_XDECREF(py_column_name);
 
 		Py_RETURN_FALSE;
 	}
 }
 
-/*!# ibm_db.commit
- * ===Description
- * bool ibm_db.commit ( resource connection )
+/*!# ibm_db.procedures
  *
- * Commits an in-progress transaction on the specified connection resource and
- * begins a new transaction.
- * Python applications normally default to AUTOCOMMIT mode, so ibm_db.commit()
- * is not necessary unless AUTOCOMMIT has been turned off for the connection
- * resource.
+ * ===Description
+ * resource ibm_db.procedures ( resource connection, string qualifier,
+ * string schema, string procedure )
  *
- * Note: If the specified connection resource is a persistent connection, all
- * transactions in progress for all applications using that persistent
- * connection will be committed. For this reason, persistent connections are
- * not recommended for use in applications that require transactions.
+ * Returns a result set listing the stored procedures registered in a database.
  *
  * ===Parameters
  *
  * ====connection
- *		A valid database connection resource variable as returned from
- * ibm_db.connect() or ibm_db.pconnect().
+ *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
+ *
+ * ====qualifier
+ *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
+ * other databases, pass NULL or an empty string.
+ *
+ * ====schema
+ *		The schema which contains the procedures. This parameter accepts a
+ * search pattern containing _ and % as wildcards.
+ *
+ * ====procedure
+ *		The name of the procedure. This parameter accepts a search pattern
+ * containing _ and % as wildcards.
  *
  * ===Return Values
  *
- * Returns TRUE on success or FALSE on failure.
+ * Returns a statement resource with a result set containing rows describing the
+ * stored procedures matching the specified parameters. The rows are composed of
+ * the following columns:
+ *
+ * Column name:: Description
+ * PROCEDURE_CAT:: The catalog that contains the procedure. The value is NULL if
+ * this table does not have catalogs.
+ * PROCEDURE_SCHEM:: Name of the schema that contains the stored procedure.
+ * PROCEDURE_NAME:: Name of the procedure.
+ * NUM_INPUT_PARAMS:: Number of input (IN) parameters for the stored procedure.
+ * NUM_OUTPUT_PARAMS:: Number of output (OUT) parameters for the stored
+ * procedure.
+ * NUM_RESULT_SETS:: Number of result sets returned by the stored procedure.
+ * REMARKS:: Any comments about the stored procedure.
+ * PROCEDURE_TYPE:: Always returns 1, indicating that the stored procedure does
+ * not return a return value.
  */
-static PyObject *ibm_db_commit(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_procedures(PyObject *self, PyObject *args)			
 {
-	PyObject *py_conn_res = NULL;
+	SQLWCHAR *qualifier = NULL;
+	SQLWCHAR *owner = NULL;
+	SQLWCHAR *proc_name = NULL;
+	int rc = 0;
 	conn_handle *conn_res;
-	int rc;
+	stmt_handle *stmt_res;
+	PyObject *py_conn_res = NULL;
+	PyObject *py_qualifier = NULL;
+	PyObject *py_owner = NULL;
+	PyObject *py_proc_name = NULL;
+	int isNewBuffer;
 
-	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+	if (!PyArg_ParseTuple(args, "OOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_proc_name))
 		return NULL;
 
+	if (py_qualifier != NULL && py_qualifier != Py_None) {
+		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
+			py_qualifier = PyUnicode_FromObject(py_qualifier);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+			return NULL;
+		}
+	}
+
+	if (py_owner != NULL && py_owner != Py_None) {
+		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
+			py_owner = PyUnicode_FromObject(py_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			return NULL;
+		}
+	}
+
+	if (py_proc_name != NULL && py_proc_name != Py_None) {
+		if (PyString_Check(py_proc_name) || PyUnicode_Check(py_proc_name)){
+			py_proc_name = PyUnicode_FromObject(py_proc_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			return NULL;
+		}
+	}
+
+
 	if (!NIL_P(py_conn_res)) {
 		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
 			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
@@ -4663,154 +5812,197 @@ static PyObject *ibm_db_commit(PyObject *self, PyObject *args)
 
 		if (!conn_res->handle_active) {
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_proc_name);
 			return NULL;
 		}
 
-		rc = SQLEndTran(SQL_HANDLE_DBC, conn_res->hdbc, SQL_COMMIT);
+		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
-		if ( rc == SQL_ERROR ) {
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if (rc == SQL_ERROR) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-											 NULL, -1, 1);
-			Py_INCREF(Py_False);
-			return Py_False;
-		} else {
-			Py_INCREF(Py_True);
-			return Py_True;
-		}
-	}
-	Py_INCREF(Py_False);
-	return Py_False;
-}
-
-/* static int _python_ibm_db_do_prepare(SQLHANDLE hdbc, char *stmt_string, stmt_handle *stmt_res, PyObject *options)
-*/
-static int _python_ibm_db_do_prepare(SQLHANDLE hdbc, SQLWCHAR *stmt, int stmt_size, stmt_handle *stmt_res, PyObject *options)
-{
-	int rc;
-
-	/* alloc handle and return only if it errors */
-	rc = SQLAllocHandle(SQL_HANDLE_STMT, hdbc, &(stmt_res->hstmt));
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-										1, NULL, -1, 1);
-		return rc;
-	}
+				NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_proc_name);
 
-	/* get the string and its length */
-	if (NIL_P(stmt)) {
-		PyErr_SetString(PyExc_Exception, 
-			"Supplied statement parameter is invalid");
-		return rc;
-	}
+			Py_RETURN_FALSE;
+		}
+		if (py_qualifier && py_qualifier != Py_None )
+			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
+		if (py_owner &&  py_owner != Py_None )
+			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
+		if (py_proc_name && py_proc_name != Py_None )
+			proc_name = getUnicodeDataAsSQLWCHAR(py_proc_name, &isNewBuffer);
 
-	if ( rc < SQL_SUCCESS ) {
-		_python_ibm_db_check_sql_errors(hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1);
-		PyErr_SetString(PyExc_Exception, "Statement prepare Failed: ");
-		return rc;
-	}
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLProceduresW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
+			SQL_NTS, proc_name, SQL_NTS);
+		Py_END_ALLOW_THREADS;
 
-	if (!NIL_P(options)) {
-		rc = _python_ibm_db_parse_options( options, SQL_HANDLE_STMT, stmt_res );
-		if ( rc == SQL_ERROR ) {
-			return rc;
+		if (isNewBuffer) {
+		    if(qualifier) PyMem_Del(qualifier);
+		    if(owner) PyMem_Del(owner);
+		    if(proc_name) PyMem_Del(proc_name);
 		}
-	}
-
-	/* Prepare the stmt. The cursor type requested has already been set in 
-	* _python_ibm_db_assign_options 
-	*/
+		
+		if (rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+				1, NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_proc_name);
 
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLPrepareW((SQLHSTMT)stmt_res->hstmt, stmt, 
-				stmt_size);
-	Py_END_ALLOW_THREADS;
+			Py_RETURN_FALSE;
+		}
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_proc_name);
+		return (PyObject *)stmt_res;				
+	} else {
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_proc_name);
 
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-										1, NULL, -1, 1);
+		Py_RETURN_FALSE;
 	}
-	return rc;
 }
 
-/*!# ibm_db.exec
+/*!# ibm_db.special_columns
  *
  * ===Description
- * stmt_handle ibm_db.exec ( IBM_DBConnection connection, string statement
- *								[, array options] )
- *
- * Prepares and executes an SQL statement.
- *
- * If you plan to interpolate Python variables into the SQL statement,
- * understand that this is one of the more common security exposures. Consider
- * calling ibm_db.prepare() to prepare an SQL statement with parameter markers	* for input values. Then you can call ibm_db.execute() to pass in the input
- * values and avoid SQL injection attacks.
+ * resource ibm_db.special_columns ( resource connection, string qualifier,
+ * string schema, string table_name, int scope )
  *
- * If you plan to repeatedly issue the same SQL statement with different
- * parameters, consider calling ibm_db.:prepare() and ibm_db.execute() to
- * enable the database server to reuse its access plan and increase the
- * efficiency of your database access.
+ * Returns a result set listing the unique row identifier columns for a table.
  *
  * ===Parameters
  *
  * ====connection
+ *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
  *
- *		A valid database connection resource variable as returned from
- * ibm_db.connect() or ibm_db.pconnect().
- *
- * ====statement
+ * ====qualifier
+ *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
+ * other databases, pass NULL or an empty string.
  *
- *		An SQL statement. The statement cannot contain any parameter markers.
+ * ====schema
+ *		The schema which contains the tables.
  *
- * ====options
+ * ====table_name
+ *		The name of the table.
  *
- *		An dictionary containing statement options. You can use this parameter  * to request a scrollable cursor on database servers that support this
- * functionality.
+ * ====scope
+ *		Integer value representing the minimum duration for which the unique
+ * row identifier is valid. This can be one of the following values:
  *
- *		SQL_ATTR_CURSOR_TYPE
- *			 Passing the SQL_SCROLL_FORWARD_ONLY value requests a forward-only
- *			 cursor for this SQL statement. This is the default type of
- *			 cursor, and it is supported by all database servers. It is also
- *			 much faster than a scrollable cursor.
- *
- *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value requests a scrollable  *			 cursor for this SQL statement. This type of cursor enables you to
- *			 fetch rows non-sequentially from the database server. However, it
- *			 is only supported by DB2 servers, and is much slower than
- *			 forward-only cursors.
+ *		0: Row identifier is valid only while the cursor is positioned on the
+ * row. (SQL_SCOPE_CURROW)
+ *		1: Row identifier is valid for the duration of the transaction.
+ * (SQL_SCOPE_TRANSACTION)
+ *		2: Row identifier is valid for the duration of the connection.
+ * (SQL_SCOPE_SESSION)
  *
  * ===Return Values
  *
- * Returns a stmt_handle resource if the SQL statement was issued
- * successfully, or FALSE if the database failed to execute the SQL statement.
+ * Returns a statement resource with a result set containing rows with unique
+ * row identifier information for a table.
+ * The rows are composed of the following columns:
+ *
+ * Column name:: Description
+ *
+ * SCOPE:: Integer value representing the minimum duration for which the unique
+ * row identifier is valid.
+ *
+ *			 0: Row identifier is valid only while the cursor is positioned on
+ * the row. (SQL_SCOPE_CURROW)
+ *
+ *			 1: Row identifier is valid for the duration of the transaction.
+ * (SQL_SCOPE_TRANSACTION)
+ *
+ *			 2: Row identifier is valid for the duration of the connection.
+ * (SQL_SCOPE_SESSION)
+ *
+ * COLUMN_NAME:: Name of the unique column.
+ *
+ * DATA_TYPE:: SQL data type for the column.
+ *
+ * TYPE_NAME:: Character string representation of the SQL data type for the
+ * column.
+ *
+ * COLUMN_SIZE:: An integer value representing the size of the column.
+ *
+ * BUFFER_LENGTH:: Maximum number of bytes necessary to store data from this
+ * column.
+ *
+ * DECIMAL_DIGITS:: The scale of the column, or NULL where scale is not
+ * applicable.
+ *
+ * NUM_PREC_RADIX:: An integer value of either 10 (representing an exact numeric
+ * data type), 2 (representing an approximate numeric data type), or NULL
+ * (representing a data type for which radix is not applicable).
+ *
+ * PSEUDO_COLUMN:: Always returns 1.
  */
-static PyObject *ibm_db_exec(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_special_columns(PyObject *self, PyObject *args)
 {
-	PyObject *options = NULL;
-	PyObject *py_conn_res = NULL;
-	stmt_handle *stmt_res;
+	SQLWCHAR *qualifier = NULL;
+	SQLWCHAR *owner = NULL;
+	SQLWCHAR *table_name = NULL;
+	int scope = 0;
 	conn_handle *conn_res;
+	stmt_handle *stmt_res;
 	int rc;
+	PyObject *py_conn_res = NULL;
+	PyObject *py_scope = NULL;
+	PyObject *py_qualifier = NULL;
+	PyObject *py_owner = NULL;
+	PyObject *py_table_name = NULL;
 	int isNewBuffer;
-	char* return_str = NULL; /* This variable is used by 
-							 * _python_ibm_db_check_sql_errors to return err 
-							 * strings 
-							 */
-	SQLWCHAR *stmt = NULL;
-	PyObject *py_stmt = NULL;
-
-	/* This function basically is a wrap of the _python_ibm_db_do_prepare and 
-	* _python_ibm_db_Execute_stmt 
-	* After completing statement execution, it returns the statement resource 
-	*/
 
-	if (!PyArg_ParseTuple(args, "OO|O", &py_conn_res, &py_stmt,  &options))
+	if (!PyArg_ParseTuple(args, "OOOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name, &py_scope))
 		return NULL;
 
-	if (py_stmt != NULL && py_stmt != Py_None) {
-		if (PyString_Check(py_stmt) || PyUnicode_Check(py_stmt)){
-			py_stmt = PyUnicode_FromObject(py_stmt);
+	if (!NIL_P(py_scope)) {
+		if (PyInt_Check(py_scope)) {
+			scope = (int) PyInt_AsLong(py_scope);
+		} else {
+			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+			return NULL;
+		}
+	}
+	if (py_qualifier != NULL && py_qualifier != Py_None) {
+		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
+			py_qualifier = PyUnicode_FromObject(py_qualifier);
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "statement must be a string or unicode");
+			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+			return NULL;
+		}
+	}
+
+	if (py_owner != NULL && py_owner != Py_None) {
+		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
+			py_owner = PyUnicode_FromObject(py_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			return NULL;
+		}
+	}
+
+	if (py_table_name != NULL && py_table_name != Py_None) {
+		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
+			py_table_name = PyUnicode_FromObject(py_table_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
 			return NULL;
 		}
 	}
@@ -4825,268 +6017,385 @@ static PyObject *ibm_db_exec(PyObject *self, PyObject *args)
 
 		if (!conn_res->handle_active) {
 			PyErr_SetString(PyExc_Exception, "Connection is not active");
-			Py_XDECREF(py_stmt);
-			return NULL;
-		}
-
-		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
-		if ( return_str == NULL ) {
-			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
-			Py_XDECREF(py_stmt);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
 			return NULL;
 		}
 
-		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
-
-		_python_ibm_db_clear_stmt_err_cache();
-
 		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
-		/* Allocates the stmt handle */
-		/* returns the stat_handle back to the calling function */
 		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1,
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if (rc == SQL_ERROR) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
 				NULL, -1, 1);
-			PyMem_Del(return_str);
-			Py_XDECREF(py_stmt);
-			return NULL;
-		}
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
 
-		if (!NIL_P(options)) {
-			rc = _python_ibm_db_parse_options(options, SQL_HANDLE_STMT, stmt_res);
-			if ( rc == SQL_ERROR ) {
-				Py_XDECREF(py_stmt);
-				return NULL;
-			}
+			Py_RETURN_FALSE;
 		}
-		if (py_stmt != NULL && py_stmt != Py_None){
-			stmt = getUnicodeDataAsSQLWCHAR(py_stmt, &isNewBuffer);
-     		}
+		if (py_qualifier && py_qualifier != Py_None )
+			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
+		if (py_owner &&  py_owner != Py_None )
+			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
+		if (py_table_name && py_table_name != Py_None )
+			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLExecDirectW((SQLHSTMT)stmt_res->hstmt, stmt, SQL_NTS);
+		rc = SQLSpecialColumnsW((SQLHSTMT)stmt_res->hstmt, SQL_BEST_ROWID, 
+			qualifier, SQL_NTS, owner, SQL_NTS, table_name,
+			SQL_NTS, scope, SQL_NULLABLE);
 		Py_END_ALLOW_THREADS;
 
-		if ( rc < SQL_SUCCESS ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 
-				1, return_str, DB2_ERRMSG, 
-				stmt_res->errormsg_recno_tracker);
-			SQLFreeHandle( SQL_HANDLE_STMT, stmt_res->hstmt );
-			/* TODO: Object freeing */
-			/* free(stmt_res); */
-			if (isNewBuffer) {
-				if(stmt) PyMem_Del(stmt);
-			}
-			Py_XDECREF(py_stmt);
-			PyMem_Del(return_str);
-			return NULL;
-		}
 		if (isNewBuffer) {
-			if(stmt) PyMem_Del(stmt);
-		}	
-		PyMem_Del(return_str);
-		Py_XDECREF(py_stmt);
-		return (PyObject *)stmt_res;				 
+		    if(qualifier) PyMem_Del(qualifier);
+		    if(owner) PyMem_Del(owner);
+		    if(table_name) PyMem_Del(table_name);	
+		}
+		
+		if (rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+				1, NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+
+			Py_RETURN_FALSE;
+		}
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+
+		return (PyObject *)stmt_res;
+	} else {
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+
+		Py_RETURN_FALSE;
+
 	}
-	Py_XDECREF(py_stmt);
-	return NULL;
 }
 
-/*!# ibm_db.free_result
+/*!# ibm_db.statistics
  *
  * ===Description
- * bool ibm_db.free_result ( resource stmt )
+ * resource ibm_db.statistics ( resource connection, string qualifier,
+ * string schema, string table-name, bool unique )
  *
- * Frees the system and database resources that are associated with a result
- * set. These resources are freed implicitly when a script finishes, but you
- * can call ibm_db.free_result() to explicitly free the result set resources
- * before the end of the script.
+ * Returns a result set listing the index and statistics for a table.
  *
  * ===Parameters
  *
- * ====stmt
- *		A valid statement resource.
+ * ====connection
+ *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
+ *
+ * ====qualifier
+ *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
+ * other databases, pass NULL or an empty string.
+ *
+ * ====schema
+ *		The schema that contains the targeted table. If this parameter is NULL,
+ * the statistics and indexes are returned for the schema of the current user.
+ *
+ * ====table_name
+ *		The name of the table.
+ *
+ * ====unique
+ *		A boolean value representing the type of index information to return.
+ *
+ *		False	 Return only the information for unique indexes on the table.
+ *
+ *		True	  Return the information for all indexes on the table.
  *
  * ===Return Values
  *
- * Returns TRUE on success or FALSE on failure.
- */
-static PyObject *ibm_db_free_result(PyObject *self, PyObject *args)
-{
-	PyObject *py_stmt_res = NULL;
-	stmt_handle *stmt_res;
+ * Returns a statement resource with a result set containing rows describing the
+ * statistics and indexes for the base tables matching the specified parameters.
+ * The rows are composed of the following columns:
+ *
+ * Column name:: Description
+ * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
+ * table does not have catalogs.
+ * TABLE_SCHEM:: Name of the schema that contains the table.
+ * TABLE_NAME:: Name of the table.
+ * NON_UNIQUE:: An integer value representing whether the index prohibits unique
+ * values, or whether the row represents statistics on the table itself:
+ *
+ *					 Return value:: Parameter type
+ *					 0 (SQL_FALSE):: The index allows duplicate values.
+ *					 1 (SQL_TRUE):: The index values must be unique.
+ *					 NULL:: This row is statistics information for the table
+ *					 itself.
+ *
+ * INDEX_QUALIFIER:: A string value representing the qualifier that would have
+ * to be prepended to INDEX_NAME to fully qualify the index.
+ * INDEX_NAME:: A string representing the name of the index.
+ * TYPE:: An integer value representing the type of information contained in
+ * this row of the result set:
+ *
+ *			Return value:: Parameter type
+ *			0 (SQL_TABLE_STAT):: The row contains statistics about the table
+ *								 itself.
+ *			1 (SQL_INDEX_CLUSTERED):: The row contains information about a
+ *									  clustered index.
+ *			2 (SQL_INDEX_HASH):: The row contains information about a hashed
+ *								 index.
+ *			3 (SQL_INDEX_OTHER):: The row contains information about a type of
+ * index that is neither clustered nor hashed.
+ *
+ * ORDINAL_POSITION:: The 1-indexed position of the column in the index. NULL if
+ * the row contains statistics information about the table itself.
+ * COLUMN_NAME:: The name of the column in the index. NULL if the row contains
+ * statistics information about the table itself.
+ * ASC_OR_DESC:: A if the column is sorted in ascending order, D if the column
+ * is sorted in descending order, NULL if the row contains statistics
+ * information about the table itself.
+ * CARDINALITY:: If the row contains information about an index, this column
+ * contains an integer value representing the number of unique values in the
+ * index. If the row contains information about the table itself, this column
+ * contains an integer value representing the number of rows in the table.
+ * PAGES:: If the row contains information about an index, this column contains
+ * an integer value representing the number of pages used to store the index. If
+ * the row contains information about the table itself, this column contains an
+ * integer value representing the number of pages used to store the table.
+ * FILTER_CONDITION:: Always returns NULL.
+ */ 
+static PyObject *ibm_db_statistics(PyObject *self, PyObject *args)
+{
+	SQLWCHAR *qualifier = NULL;
+	SQLWCHAR *owner = NULL;
+	SQLWCHAR *table_name = NULL;
+	int unique = 0;
 	int rc = 0;
+	SQLUSMALLINT sql_unique;
+	conn_handle *conn_res;
+	stmt_handle *stmt_res;
+	PyObject *py_conn_res = NULL;
+	PyObject *py_qualifier = NULL;
+	PyObject *py_owner = NULL;
+	PyObject *py_table_name = NULL;
+	PyObject *py_unique = NULL;
+	int isNewBuffer;
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OOOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name, &py_unique))
 		return NULL;
-	
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+
+	if (py_qualifier != NULL && py_qualifier != Py_None) {
+		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
+			py_qualifier = PyUnicode_FromObject(py_qualifier);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
 			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
 		}
-		if ( stmt_res->hstmt ) {
-			/* Free any cursors that might have been allocated in a previous call 
-			* to SQLExecute 
-			*/
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
-			Py_END_ALLOW_THREADS;
+	}
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-				PyErr_Clear( );	
-				Py_RETURN_FALSE;
-			}
+	if (py_owner != NULL && py_owner != Py_None) {
+		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
+			py_owner = PyUnicode_FromObject(py_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			return NULL;
 		}
-		_python_ibm_db_free_result_struct(stmt_res);
-	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-		return NULL;
 	}
-	Py_INCREF(Py_True);
-	return Py_True;
-}
 
-/*
- * static PyObject *_python_ibm_db_prepare_helper(conn_handle *conn_res, PyObject *py_stmt, PyObject *options)
- *
- */
-static PyObject *_python_ibm_db_prepare_helper(conn_handle *conn_res, PyObject *py_stmt, PyObject *options)
-{
-	stmt_handle *stmt_res;
-	int rc;
-	char error[DB2_MAX_ERR_MSG_LEN];
-	SQLWCHAR *stmt = NULL;
-	int stmt_size = 0;
-	int isNewBuffer;
-
-	if (!conn_res->handle_active) {
-		PyErr_SetString(PyExc_Exception, "Connection is not active");
-		return NULL;
+	if (py_table_name != NULL && py_table_name != Py_None) {
+		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
+			py_table_name = PyUnicode_FromObject(py_table_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			return NULL;
+		}
 	}
 
-	if (py_stmt != NULL && py_stmt != Py_None) {
-		if (PyString_Check(py_stmt) || PyUnicode_Check(py_stmt)) {
-			py_stmt = PyUnicode_FromObject(py_stmt);
-			if (py_stmt != NULL &&  py_stmt != Py_None) {
-				stmt_size = PyUnicode_GetSize(py_stmt);
-			} else {
-				PyErr_SetString(PyExc_Exception, "Error occure during processing of statement");
-				return NULL;	
-			}
+	if (py_unique != NULL && py_unique != Py_None) {
+		if (PyBool_Check(py_unique)) {
+			if (py_unique == Py_True)
+				unique = 1;
+			else
+				unique = 0;
 		}
 		else {
-			PyErr_SetString(PyExc_Exception, "statement must be a string or unicode");
+			PyErr_SetString(PyExc_Exception, "unique must be a boolean");
 			return NULL;
 		}
 	}
 
-	_python_ibm_db_clear_stmt_err_cache();
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
 
-	/* Initialize stmt resource members with default values. */
-	/* Parsing will update options if needed */
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			return NULL;
+		}
 
-	stmt_res = _ibm_db_new_stmt_struct(conn_res);
+		stmt_res = _ibm_db_new_stmt_struct(conn_res);
+		sql_unique = unique;
 
-	/* Allocates the stmt handle */
-	/* Prepares the statement */
-	/* returns the stat_handle back to the calling function */
-	if( py_stmt && py_stmt != Py_None)
-		stmt = getUnicodeDataAsSQLWCHAR(py_stmt, &isNewBuffer);
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if (rc == SQL_ERROR) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+				NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+
+			Py_RETURN_FALSE;
+		}
+		if (py_qualifier && py_qualifier != Py_None )
+			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
+		if (py_owner &&  py_owner != Py_None )
+			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
+		if (py_table_name && py_table_name != Py_None )
+			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
+
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLStatisticsW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
+			SQL_NTS, table_name, SQL_NTS, sql_unique, SQL_QUICK);
+		Py_END_ALLOW_THREADS;
+
+		if (isNewBuffer) {
+		    if(qualifier) PyMem_Del(qualifier);
+		    if(owner) PyMem_Del(owner);
+		    if(table_name) PyMem_Del(table_name);
+		}
 		
-	rc = _python_ibm_db_do_prepare(conn_res->hdbc, stmt, stmt_size, stmt_res, options);
-	if (isNewBuffer) {
-		if(stmt) PyMem_Del(stmt);
-	}
-	
-	if ( rc < SQL_SUCCESS ) {
-		sprintf(error, "Statement Prepare Failed: %s", IBM_DB_G(__python_stmt_err_msg));
-		Py_XDECREF(py_stmt);
-		return NULL;
+		if (rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+				1, NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+
+			Py_RETURN_FALSE;
+		}
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+
+		return (PyObject *)stmt_res;
+	} else {
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+
+		Py_RETURN_FALSE;
 	}
-	Py_XDECREF(py_stmt);
-	return (PyObject *)stmt_res;		
 }
 
-/*!# ibm_db.prepare
+/*!# ibm_db.table_privileges
  *
  * ===Description
- * IBMDB_Statement ibm_db.prepare ( IBM_DBConnection connection,
- *								  string statement [, array options] )
+ * resource ibm_db.table_privileges ( resource connection [, string qualifier
+ * [, string schema [, string table_name]]] )
  *
- * ibm_db.prepare() creates a prepared SQL statement which can include 0 or
- * more parameter markers (? characters) representing parameters for input,
- * output, or input/output. You can pass parameters to the prepared statement
- * using ibm_db.bind_param(), or for input values only, as an array passed to
- * ibm_db.execute().
- *
- * There are three main advantages to using prepared statements in your
- * application:
- *		* Performance: when you prepare a statement, the database server
- *		 creates an optimized access plan for retrieving data with that
- *		 statement. Subsequently issuing the prepared statement with
- *		 ibm_db.execute() enables the statements to reuse that access plan
- *		 and avoids the overhead of dynamically creating a new access plan
- *		 for every statement you issue.
- *		* Security: when you prepare a statement, you can include parameter
- *		 markers for input values. When you execute a prepared statement
- *		 with input values for placeholders, the database server checks each
- *		 input value to ensure that the type matches the column definition or
- *		 parameter definition.
- *		* Advanced functionality: Parameter markers not only enable you to
- *		 pass input values to prepared SQL statements, they also enable you
- *		 to retrieve OUT and INOUT parameters from stored procedures using
- *		 ibm_db.bind_param().
+ * Returns a result set listing the tables and associated privileges in a
+ * database.
  *
  * ===Parameters
- * ====connection
  *
- *		A valid database connection resource variable as returned from
- *		ibm_db.connect() or ibm_db.pconnect().
+ * ====connection
+ *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
  *
- * ====statement
+ * ====qualifier
+ *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
+ * other databases, pass NULL or an empty string.
  *
- *		An SQL statement, optionally containing one or more parameter markers.
+ * ====schema
+ *		The schema which contains the tables. This parameter accepts a search
+ * pattern containing _ and % as wildcards.
  *
- * ====options
+ * ====table_name
+ *		The name of the table. This parameter accepts a search pattern
+ * containing _ and % as wildcards.
  *
- *		An dictionary containing statement options. You can use this parameter
- *		to request a scrollable cursor on database servers that support this
- *		functionality.
+ * ===Return Values
  *
- *		SQL_ATTR_CURSOR_TYPE
- *			 Passing the SQL_SCROLL_FORWARD_ONLY value requests a forward-only
- *			 cursor for this SQL statement. This is the default type of
- *			 cursor, and it is supported by all database servers. It is also
- *			 much faster than a scrollable cursor.
- *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value requests a scrollable  
- *			 cursor for this SQL statement. This type of cursor enables you
- *			 to fetch rows non-sequentially from the database server. However, 
- *			 it is only supported by DB2 servers, and is much slower than
- *			 forward-only cursors.
+ * Returns a statement resource with a result set containing rows describing
+ * the privileges for the tables that match the specified parameters. The rows
+ * are composed of the following columns:
  *
- * ===Return Values
- * Returns a IBM_DBStatement object if the SQL statement was successfully
- * parsed and prepared by the database server. Returns FALSE if the database
- * server returned an error. You can determine which error was returned by
- * calling ibm_db.stmt_error() or ibm_db.stmt_errormsg().
- */					 
-static PyObject *ibm_db_prepare(PyObject *self, PyObject *args)			
+ * Column name:: Description
+ * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
+ * table does not have catalogs.
+ * TABLE_SCHEM:: Name of the schema that contains the table.
+ * TABLE_NAME:: Name of the table.
+ * GRANTOR:: Authorization ID of the user who granted the privilege.
+ * GRANTEE:: Authorization ID of the user to whom the privilege was granted.
+ * PRIVILEGE:: The privilege that has been granted. This can be one of ALTER,
+ * CONTROL, DELETE, INDEX, INSERT, REFERENCES, SELECT, or UPDATE.
+ * IS_GRANTABLE:: A string value of "YES" or "NO" indicating whether the grantee
+ * can grant the privilege to other users.
+ */
+static PyObject *ibm_db_table_privileges(PyObject *self, PyObject *args)
 {
-	PyObject *py_conn_res = NULL;
-	PyObject *options = NULL;
+	SQLWCHAR *qualifier = NULL;
+	SQLWCHAR *owner = NULL;
+	SQLWCHAR *table_name = NULL;
 	conn_handle *conn_res;
-	
-	PyObject *py_stmt = NULL;
-	
-	if (!PyArg_ParseTuple(args, "OO|O", &py_conn_res, &py_stmt, &options))
+	stmt_handle *stmt_res;
+	int rc;
+	PyObject *py_conn_res = NULL;
+	PyObject *py_qualifier = NULL;
+	PyObject *py_owner = NULL;
+	PyObject *py_table_name = NULL;
+	int isNewBuffer;
+
+	if (!PyArg_ParseTuple(args, "O|OOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name))
 		return NULL;
 
+	if (py_qualifier != NULL && py_qualifier != Py_None) {
+		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
+			py_qualifier = PyUnicode_FromObject(py_qualifier);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+			return NULL;
+		}
+	}
+
+	if (py_owner != NULL && py_owner != Py_None) {
+		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
+			py_owner = PyUnicode_FromObject(py_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			return NULL;
+		}
+	}
+
+	if (py_table_name != NULL && py_table_name != Py_None) {
+		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
+			py_table_name = PyUnicode_FromObject(py_table_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			return NULL;
+		}
+	}
+
 	if (!NIL_P(py_conn_res)) {
 		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
 			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
@@ -5094,250 +6403,1285 @@ static PyObject *ibm_db_prepare(PyObject *self, PyObject *args)
 		} else {
 			conn_res = (conn_handle *)py_conn_res;
 		}
-		return _python_ibm_db_prepare_helper(conn_res, py_stmt, options);	 
-	}
-
-	return NULL;
-}
-
-/*	static param_node* build_list( stmt_res, param_no, data_type, precision, scale, nullable )
-*/
-static param_node* build_list( stmt_handle *stmt_res, int param_no, SQLSMALLINT data_type, SQLUINTEGER precision, SQLSMALLINT scale, SQLSMALLINT nullable )
-{
-	param_node *tmp_curr = NULL, *curr = stmt_res->head_cache_list, *prev = NULL;
-
-	/* Allocate memory and make new node to be added */
-	tmp_curr = ALLOC(param_node);
-	memset(tmp_curr, 0, sizeof(param_node));
-	/* assign values */
-	tmp_curr->data_type = data_type;
-	tmp_curr->param_size = precision;
-	tmp_curr->nullable = nullable;
-	tmp_curr->scale = scale;
-	tmp_curr->param_num = param_no;
-	tmp_curr->file_options = SQL_FILE_READ;
-	tmp_curr->param_type = SQL_PARAM_INPUT;
 
-	while ( curr != NULL ) {
-		prev = curr;
-		curr = curr->next;
-	}
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			return NULL;
+		}
 
-	if (stmt_res->head_cache_list == NULL) {
-		stmt_res->head_cache_list = tmp_curr;
-	} else {
-		prev->next = tmp_curr;
-	}
+		if (!conn_res) {
+			PyErr_SetString(PyExc_Exception,"Connection Resource cannot be found");
+			Py_RETURN_FALSE;
+		}
 
-	tmp_curr->next = curr;
+		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
-	return tmp_curr;
-}
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if (rc == SQL_ERROR) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+				NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
 
-/*	static int _python_ibm_db_bind_data( stmt_handle *stmt_res, param_node *curr, PyObject *bind_data )
-*/
-static int _python_ibm_db_bind_data( stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
-{
-	int rc;
-	SQLSMALLINT valueType = 0;
-	SQLPOINTER	paramValuePtr;
-#if  PY_MAJOR_VERSION < 3
-	Py_ssize_t buffer_len = 0;
-#endif
-	int param_length;
-	
-	/* Have to use SQLBindFileToParam if PARAM is type PARAM_FILE */
-	/*** Need to fix this***/
-	if ( curr->param_type == PARAM_FILE) {
-		PyObject *FileNameObj = NULL;
-		/* Only string types can be bound */
-		if (PyString_Check(bind_data)) {
-			if (PyUnicode_Check(bind_data)) {
-				FileNameObj = PyUnicode_AsASCIIString(bind_data);
-				if (FileNameObj == NULL) {
-					return SQL_ERROR;
-				}
-			}
-		} else {
-			return SQL_ERROR;
-		}
-		curr->bind_indicator = 0;
-		if(curr->svalue != NULL) {
-			PyMem_Del(curr->svalue);
-			curr->svalue = NULL;
-		}
-		if (FileNameObj != NULL) {
-			curr->svalue = PyBytes_AsString(FileNameObj);
-		} else {
-			curr->svalue = PyBytes_AsString(bind_data);
+			Py_RETURN_FALSE;
 		}
-		curr->ivalue = strlen(curr->svalue);
-		curr->svalue = memcpy(PyMem_Malloc((sizeof(char))*(curr->ivalue+1)), curr->svalue, curr->ivalue);
-		curr->svalue[curr->ivalue] = '\0';
-		Py_XDECREF(FileNameObj);
-		valueType = (SQLSMALLINT) curr->ivalue;
-		/* Bind file name string */
+		if (py_qualifier && py_qualifier != Py_None )
+			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
+		if (py_owner &&  py_owner != Py_None )
+			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
+		if (py_table_name && py_table_name != Py_None )
+			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
 
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLBindFileToParam((SQLHSTMT)stmt_res->hstmt, curr->param_num,
-					curr->data_type, (SQLCHAR*)curr->svalue,
-					(SQLSMALLINT*)&(curr->ivalue), &(curr->file_options), 
-					(SQLSMALLINT) curr->ivalue, &(curr->bind_indicator));
+		rc = SQLTablePrivilegesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, 
+			owner, SQL_NTS, table_name, SQL_NTS);
 		Py_END_ALLOW_THREADS;
 
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-											 rc, 1, NULL, -1, 1);
+		if (isNewBuffer) {
+		    if(qualifier) PyMem_Del(qualifier);
+		    if(owner) PyMem_Del(owner);
+		    if(table_name) PyMem_Del(table_name);
 		}
-		return rc;
-	}
-	
-	switch(TYPE(bind_data)) {
-		case PYTHON_FIXNUM:
-			if(curr->data_type == SQL_BIGINT || curr->data_type == SQL_DECIMAL ){
-				PyObject *tempobj = NULL;
-#if  PY_MAJOR_VERSION >= 3
-			       	PyObject *tempobj2 = NULL;
-#endif
-				tempobj = PyObject_Str(bind_data);
-#if  PY_MAJOR_VERSION >= 3
-				tempobj2 = PyUnicode_AsASCIIString(tempobj);
-				Py_XDECREF(tempobj);
-				tempobj = tempobj2;
-#endif	
-				curr->svalue = PyBytes_AsString(tempobj);
-				curr->ivalue = strlen(curr->svalue);
-				curr->svalue = memcpy(PyMem_Malloc((sizeof(char))*(curr->ivalue+1)), curr->svalue, curr->ivalue);
-				curr->svalue[curr->ivalue] = '\0'; 
-				curr->bind_indicator = curr->ivalue;
-
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-					curr->param_type, SQL_C_CHAR, curr->data_type,
-					curr->param_size, curr->scale, curr->svalue, curr->param_size, NULL);
-				Py_END_ALLOW_THREADS;
+		
+		if (rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+				1, NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
 
-				if ( rc == SQL_ERROR ){
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-				}
-				Py_XDECREF(tempobj);
-			}
-			else{
-				curr->ivalue = (SQLINTEGER) PyLong_AsLong(bind_data);
+			Py_RETURN_FALSE;
+		}
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
 
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-							curr->param_type, SQL_C_LONG, curr->data_type,
-							curr->param_size, curr->scale, &curr->ivalue, 0, NULL);
-				Py_END_ALLOW_THREADS;
+		return (PyObject *)stmt_res;
+	} else {
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
 
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-				}
-				curr->data_type = SQL_C_LONG;
-			}
-			break;
+		Py_RETURN_FALSE;
+	}
+}
 
-		/* Convert BOOLEAN types to LONG for DB2 / Cloudscape */
-		case PYTHON_FALSE:
-			curr->ivalue = 0;
+/*!# ibm_db.tables
+ *
+ * ===Description
+ * resource ibm_db.tables ( resource connection [, string qualifier [, string
+ * schema [, string table-name [, string table-type]]]] )
+ *
+ * Returns a result set listing the tables and associated metadata in a database
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *		A valid connection to an IBM DB2, Cloudscape, or Apache Derby database.
+ *
+ * ====qualifier
+ *		A qualifier for DB2 databases running on OS/390 or z/OS servers. For
+ * other databases, pass NULL or an empty string.
+ *
+ * ====schema
+ *		The schema which contains the tables. This parameter accepts a search
+ * pattern containing _ and % as wildcards.
+ *
+ * ====table-name
+ *		The name of the table. This parameter accepts a search pattern
+ * containing _ and % as wildcards.
+ *
+ * ====table-type
+ *		A list of comma-delimited table type identifiers. To match all table
+ * types, pass NULL or an empty string.
+ *		Valid table type identifiers include: ALIAS, HIERARCHY TABLE,
+ * INOPERATIVE VIEW, NICKNAME, MATERIALIZED QUERY TABLE, SYSTEM TABLE, TABLE,
+ * TYPED TABLE, TYPED VIEW, and VIEW.
+ *
+ * ===Return Values
+ *
+ * Returns a statement resource with a result set containing rows describing
+ * the tables that match the specified parameters.
+ * The rows are composed of the following columns:
+ *
+ * Column name:: Description
+ * TABLE_CAT:: The catalog that contains the table. The value is NULL if this
+ * table does not have catalogs.
+ * TABLE_SCHEMA:: Name of the schema that contains the table.
+ * TABLE_NAME:: Name of the table.
+ * TABLE_TYPE:: Table type identifier for the table.
+ * REMARKS:: Description of the table.
+ */
+static PyObject *ibm_db_tables(PyObject *self, PyObject *args)
+{
+	SQLWCHAR *qualifier = NULL;
+	SQLWCHAR *owner = NULL;
+	SQLWCHAR *table_name = NULL;
+	SQLWCHAR *table_type = NULL;
+	PyObject *py_qualifier = NULL;
+	PyObject *py_owner = NULL;
+	PyObject *py_table_name = NULL;
+	PyObject *py_table_type = NULL;
+	PyObject *py_conn_res;
+	conn_handle *conn_res;
+	stmt_handle *stmt_res;
+	int rc;
+	int isNewBuffer;
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-						curr->param_type, SQL_C_LONG, curr->data_type, curr->param_size,
-						curr->scale, &curr->ivalue, 0, NULL);
-			Py_END_ALLOW_THREADS;
+	if (!PyArg_ParseTuple(args, "O|OOOO", &py_conn_res, &py_qualifier, &py_owner,
+		&py_table_name, &py_table_type))
+		return NULL;
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-													rc, 1, NULL, -1, 1);
-			}
-			curr->data_type = SQL_C_LONG;
-			break;
+	if (py_qualifier != NULL && py_qualifier != Py_None) {
+		if (PyString_Check(py_qualifier) || PyUnicode_Check(py_qualifier)){
+			py_qualifier = PyUnicode_FromObject(py_qualifier);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "qualifier must be a string or unicode");
+			return NULL;
+		}
+	}
 
-		case PYTHON_TRUE:
-			curr->ivalue = 1;
+	if (py_owner != NULL && py_owner != Py_None) {
+		if (PyString_Check(py_owner) || PyUnicode_Check(py_owner)){
+			py_owner = PyUnicode_FromObject(py_owner);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "owner must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			return NULL;
+		}
+	}
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-			curr->param_type, SQL_C_LONG, curr->data_type, curr->param_size,
-						curr->scale, &curr->ivalue, 0, NULL);
-			Py_END_ALLOW_THREADS;
+	if (py_table_name != NULL && py_table_name != Py_None) {
+		if (PyString_Check(py_table_name) || PyUnicode_Check(py_table_name)){
+			py_table_name = PyUnicode_FromObject(py_table_name);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table_name must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			return NULL;
+		}
+	}
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-			}
-			curr->data_type = SQL_C_LONG;
-			break;
+	if (py_table_type != NULL && py_table_type != Py_None) {
+		if (PyString_Check(py_table_type) || PyUnicode_Check(py_table_type)){
+			py_table_type = PyUnicode_FromObject(py_table_type);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "table type must be a string or unicode");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			return NULL;
+		}
+	}
 
-		case PYTHON_FLOAT:
-			curr->fvalue = PyFloat_AsDouble(bind_data);
-			
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-					curr->param_type, SQL_C_DOUBLE, curr->data_type, curr->param_size,
-					curr->scale, &curr->fvalue, 0, NULL);
-			Py_END_ALLOW_THREADS;
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-			}
-			curr->data_type = SQL_C_DOUBLE;
-			break;
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_table_type);
+			return NULL;
+		}
 
-		case PYTHON_UNICODE:
-			{
-				int isNewBuffer;
-				if(PyObject_CheckBuffer(bind_data) && (curr->data_type == SQL_BLOB || curr->data_type == SQL_BINARY || curr->data_type == SQL_VARBINARY)) {
-#if  PY_MAJOR_VERSION >= 3
-					Py_buffer tmp_buffer;
-					PyObject_GetBuffer(bind_data, &tmp_buffer, PyBUF_SIMPLE);
-					curr->uvalue = tmp_buffer.buf;
-					curr->ivalue = tmp_buffer.len;
-#else					
-					PyObject_AsReadBuffer(bind_data, (const void **) &(curr->uvalue), &buffer_len);
-					curr->ivalue = buffer_len;
-#endif
-				} else {
-					if(curr->uvalue != NULL) {
-						PyMem_Del(curr->uvalue);
-						curr->uvalue = NULL;
-					}
-					curr->uvalue = getUnicodeDataAsSQLWCHAR(bind_data, &isNewBuffer);
-					curr->ivalue = PyUnicode_GetSize(bind_data);
-					curr->ivalue = curr->ivalue * sizeof(SQLWCHAR);
-				}
-				param_length = curr->ivalue;
-				if (curr->size != 0) {
-					curr->ivalue = (curr->size + 1) * sizeof(SQLWCHAR);
-				}
+		stmt_res = _ibm_db_new_stmt_struct(conn_res);
 
-				if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-					if (curr->size == 0) {
-						if ((curr->data_type == SQL_BLOB) || (curr->data_type == SQL_CLOB) || (curr->data_type == SQL_BINARY)
-#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
-								|| (curr->data_type == SQL_LONGVARBINARY)
-#endif /* PASE */
-								|| (curr->data_type == SQL_VARBINARY) || (curr->data_type == SQL_XML)) {
-							if (curr->ivalue <= curr->param_size) {
-								curr->ivalue = curr->param_size + sizeof(SQLWCHAR);
-							}
-						} else {
-							if (curr->ivalue <= (curr->param_size * sizeof(SQLWCHAR))) {
-								curr->ivalue = (curr->param_size + 1) * sizeof(SQLWCHAR);
-							}
-						}
-					}
-				}
-				
-				if (isNewBuffer == 0 ){
-					/* actually make a copy, since this will uvalue will be freed explicitly */
-					SQLWCHAR* tmp = (SQLWCHAR*)ALLOC_N(SQLWCHAR, curr->ivalue + 1);
-					memcpy(tmp, curr->uvalue, (param_length + sizeof(SQLWCHAR)));
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if (rc == SQL_ERROR) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+				NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_table_type);
+			
+			Py_RETURN_FALSE;
+		}
+		if (py_qualifier && py_qualifier != Py_None )
+			qualifier = getUnicodeDataAsSQLWCHAR(py_qualifier, &isNewBuffer);
+		if (py_owner &&  py_owner != Py_None )
+			owner = getUnicodeDataAsSQLWCHAR(py_owner, &isNewBuffer);
+		if (py_table_name && py_table_name != Py_None )
+			table_name = getUnicodeDataAsSQLWCHAR(py_table_name, &isNewBuffer);
+		if(py_table_type && py_table_type != Py_None)
+			table_type = getUnicodeDataAsSQLWCHAR(py_table_type, &isNewBuffer);
+
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLTablesW((SQLHSTMT)stmt_res->hstmt, qualifier, SQL_NTS, owner,
+			SQL_NTS, table_name, SQL_NTS, table_type, SQL_NTS);
+		Py_END_ALLOW_THREADS;
+
+		if (isNewBuffer) {
+		    if(qualifier) PyMem_Del(qualifier);
+		    if(owner) PyMem_Del(owner);
+		    if(table_name) PyMem_Del(table_name);
+			if(table_type) PyMem_Del(table_type);
+		}
+		
+		if (rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+				1, NULL, -1, 1);
+			Py_XDECREF(py_qualifier);
+			Py_XDECREF(py_owner);
+			Py_XDECREF(py_table_name);
+			Py_XDECREF(py_table_type);
+
+			Py_RETURN_FALSE;
+		}
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_table_type);
+		
+		return (PyObject *)stmt_res;
+	} else {
+		Py_XDECREF(py_qualifier);
+		Py_XDECREF(py_owner);
+		Py_XDECREF(py_table_name);
+		Py_XDECREF(py_table_type);
+
+		Py_RETURN_FALSE;
+	}
+}
+
+/*!# ibm_db.commit
+ * ===Description
+ * bool ibm_db.commit ( resource connection )
+ *
+ * Commits an in-progress transaction on the specified connection resource and
+ * begins a new transaction.
+ * Python applications normally default to AUTOCOMMIT mode, so ibm_db.commit()
+ * is not necessary unless AUTOCOMMIT has been turned off for the connection
+ * resource.
+ *
+ * Note: If the specified connection resource is a persistent connection, all
+ * transactions in progress for all applications using that persistent
+ * connection will be committed. For this reason, persistent connections are
+ * not recommended for use in applications that require transactions.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *		A valid database connection resource variable as returned from
+ * ibm_db.connect() or ibm_db.pconnect().
+ *
+ * ===Return Values
+ *
+ * Returns TRUE on success or FALSE on failure.
+ */
+static PyObject *ibm_db_commit(PyObject *self, PyObject *args)			
+{
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res;
+	int rc;
+
+	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+		return NULL;
+
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			return NULL;
+		}
+
+		_python_ibm_db_clear_handle_error(conn_res, NULL);
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLEndTran(SQL_HANDLE_DBC, conn_res->hdbc, SQL_COMMIT);
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+											 NULL, -1, 1);
+			Py_INCREF(Py_False);
+			return Py_False;
+		} else {
+			Py_INCREF(Py_True);
+			return Py_True;
+		}
+	}
+	Py_INCREF(Py_False);
+	return Py_False;
+}
+
+/* static int _python_ibm_db_do_prepare(SQLHANDLE hdbc, char *stmt_string, stmt_handle *stmt_res, PyObject *options)
+*/
+/*	static void _python_ibm_db_apply_query_timeout(conn_handle *conn_res, stmt_handle *stmt_res, PyObject *options)
+	gives a statement the SQL_ATTR_QUERY_TIMEOUT of its connection, unless
+	its own options set one
+*/
+static void _python_ibm_db_apply_query_timeout(conn_handle *conn_res, stmt_handle *stmt_res, PyObject *options)
+{
+	PyObject *key = NULL;
+	int rc;
+
+	if ( stmt_res->query_timeout == conn_res->query_timeout ) {
+		return;
+	}
+	if ( !NIL_P(options) ) {
+		key = PyInt_FromLong(SQL_ATTR_QUERY_TIMEOUT);
+		if ( key != NULL && PyDict_GetItem(options, key) != NULL ) {
+			Py_DECREF(key);
+			return;
+		}
+		Py_XDECREF(key);
+	}
+	rc = SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_QUERY_TIMEOUT, 
+		(SQLPOINTER)conn_res->query_timeout, SQL_IS_INTEGER);
+	if ( rc != SQL_ERROR ) {
+		stmt_res->query_timeout = conn_res->query_timeout;
+	}
+}
+
+static int _python_ibm_db_do_prepare(SQLHANDLE hdbc, SQLWCHAR *stmt, int stmt_size, stmt_handle *stmt_res, PyObject *options)
+{
+	double start;
+	int rc;
+
+	/* alloc handle and return only if it errors */
+	rc = SQLAllocHandle(SQL_HANDLE_STMT, hdbc, &(stmt_res->hstmt));
+	_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+										1, NULL, -1, 1);
+		return rc;
+	}
+
+	/* get the string and its length */
+	if (NIL_P(stmt)) {
+		PyErr_SetString(PyExc_Exception, 
+			"Supplied statement parameter is invalid");
+		return rc;
+	}
+
+	if ( rc < SQL_SUCCESS ) {
+		_python_ibm_db_check_sql_errors(hdbc, SQL_HANDLE_DBC, rc, 1, NULL, -1, 1);
+		PyErr_SetString(PyExc_Exception, "Statement prepare Failed: ");
+		return rc;
+	}
+
+	if (!NIL_P(options)) {
+		rc = _python_ibm_db_parse_options( options, SQL_HANDLE_STMT, stmt_res );
+		if ( rc == SQL_ERROR ) {
+			return rc;
+		}
+	}
+
+	/* Prepare the stmt. The cursor type requested has already been set in 
+	* _python_ibm_db_assign_options 
+	*/
+
+	start = _python_ibm_db_clock();
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLPrepareW((SQLHSTMT)stmt_res->hstmt, stmt, 
+				stmt_size);
+	Py_END_ALLOW_THREADS;
+	_python_ibm_db_stats_gil(stmt_res, start);
+	_python_ibm_db_stats_call(stmt_res, ST_PREPARE, start, 0);
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+										1, NULL, -1, 1);
+	} else {
+		_python_ibm_db_count_request(stmt_res, RT_PREPARE);
+	}
+	return rc;
+}
+
+/*!# ibm_db.exec
+ *
+ * ===Description
+ * stmt_handle ibm_db.exec ( IBM_DBConnection connection, string statement
+ *								[, array options] )
+ *
+ * Prepares and executes an SQL statement.
+ *
+ * If you plan to interpolate Python variables into the SQL statement,
+ * understand that this is one of the more common security exposures. Consider
+ * calling ibm_db.prepare() to prepare an SQL statement with parameter markers	* for input values. Then you can call ibm_db.execute() to pass in the input
+ * values and avoid SQL injection attacks.
+ *
+ * If you plan to repeatedly issue the same SQL statement with different
+ * parameters, consider calling ibm_db.:prepare() and ibm_db.execute() to
+ * enable the database server to reuse its access plan and increase the
+ * efficiency of your database access.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *
+ *		A valid database connection resource variable as returned from
+ * ibm_db.connect() or ibm_db.pconnect().
+ *
+ * ====statement
+ *
+ *		An SQL statement. The statement cannot contain any parameter markers.
+ *
+ * ====options
+ *
+ *		An dictionary containing statement options. You can use this parameter  * to request a scrollable cursor on database servers that support this
+ * functionality.
+ *
+ *		SQL_ATTR_CURSOR_TYPE
+ *			 Passing the SQL_SCROLL_FORWARD_ONLY value requests a forward-only
+ *			 cursor for this SQL statement. This is the default type of
+ *			 cursor, and it is supported by all database servers. It is also
+ *			 much faster than a scrollable cursor.
+ *
+ *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value requests a scrollable  *			 cursor for this SQL statement. This type of cursor enables you to
+ *			 fetch rows non-sequentially from the database server. However, it
+ *			 is only supported by DB2 servers, and is much slower than
+ *			 forward-only cursors.
+ *
+ * ===Return Values
+ *
+ * Returns a stmt_handle resource if the SQL statement was issued
+ * successfully, or FALSE if the database failed to execute the SQL statement.
+ */
+static PyObject *ibm_db_exec(PyObject *self, PyObject *args)			
+{
+	PyObject *options = NULL;
+	PyObject *py_conn_res = NULL;
+	stmt_handle *stmt_res;
+	conn_handle *conn_res;
+	int rc;
+	int isNewBuffer;
+	char* return_str = NULL; /* This variable is used by 
+							 * _python_ibm_db_check_sql_errors to return err 
+							 * strings 
+							 */
+	SQLWCHAR *stmt = NULL;
+	PyObject *py_stmt = NULL;
+	double start;
+
+	/* This function basically is a wrap of the _python_ibm_db_do_prepare and 
+	* _python_ibm_db_Execute_stmt 
+	* After completing statement execution, it returns the statement resource 
+	*/
+
+	if (!PyArg_ParseTuple(args, "OO|O", &py_conn_res, &py_stmt,  &options))
+		return NULL;
+
+	if (py_stmt != NULL && py_stmt != Py_None) {
+		if (PyString_Check(py_stmt) || PyUnicode_Check(py_stmt)){
+			py_stmt = PyUnicode_FromObject(py_stmt);
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "statement must be a string or unicode");
+			return NULL;
+		}
+	}
+
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+			Py_XDECREF(py_stmt);
+			return NULL;
+		}
+
+		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
+		if ( return_str == NULL ) {
+			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+			Py_XDECREF(py_stmt);
+			return NULL;
+		}
+
+		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
+
+		_python_ibm_db_clear_stmt_err_cache();
+		_python_ibm_db_clear_handle_error(conn_res, NULL);
+
+		stmt_res = _ibm_db_new_stmt_struct(conn_res);
+
+		/* Allocates the stmt handle */
+		/* returns the stat_handle back to the calling function */
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, conn_res->hdbc, &(stmt_res->hstmt));
+		_python_ibm_db_register_handle(stmt_res->hstmt, (PyObject *)stmt_res);
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1,
+				NULL, -1, 1);
+			PyMem_Del(return_str);
+			Py_XDECREF(py_stmt);
+			return NULL;
+		}
+		_python_ibm_db_apply_query_timeout(conn_res, stmt_res, NULL);
+
+		if (!NIL_P(options)) {
+			rc = _python_ibm_db_parse_options(options, SQL_HANDLE_STMT, stmt_res);
+			if ( rc == SQL_ERROR ) {
+				Py_XDECREF(py_stmt);
+				return NULL;
+			}
+		}
+		if (py_stmt != NULL && py_stmt != Py_None){
+			stmt = getUnicodeDataAsSQLWCHAR(py_stmt, &isNewBuffer);
+     		}
+
+		if ( conn_res->stmt_cache_size > 0 && _python_ibm_db_is_ddl(py_stmt) ) {
+			_python_ibm_db_stmt_cache_invalidate(conn_res);
+		}
+
+		_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+		start = _python_ibm_db_clock();
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLExecDirectW((SQLHSTMT)stmt_res->hstmt, stmt, SQL_NTS);
+		if ( rc == SQL_SUCCESS || rc == SQL_SUCCESS_WITH_INFO ) {
+			_python_ibm_db_exec_row_count(stmt_res);
+		}
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_stats_gil(stmt_res, start);
+		_python_ibm_db_stats_result(stmt_res, ST_EXECUTE, start, rc < SQL_SUCCESS ? NULL : Py_True);
+
+		if ( rc < SQL_SUCCESS ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 
+				1, return_str, DB2_ERRMSG, 
+				stmt_res->errormsg_recno_tracker);
+			SQLFreeHandle( SQL_HANDLE_STMT, stmt_res->hstmt );
+			/* TODO: Object freeing */
+			/* free(stmt_res); */
+			if (isNewBuffer) {
+				if(stmt) PyMem_Del(stmt);
+			}
+			Py_XDECREF(py_stmt);
+			PyMem_Del(return_str);
+			return NULL;
+		}
+		if (isNewBuffer) {
+			if(stmt) PyMem_Del(stmt);
+		}	
+		PyMem_Del(return_str);
+		Py_XDECREF(py_stmt);
+		return (PyObject *)stmt_res;				 
+	}
+	Py_XDECREF(py_stmt);
+	return NULL;
+}
+
+/*!# ibm_db.cancel
+ *
+ * ===Description
+ * bool ibm_db.cancel ( resource stmt )
+ *
+ * Cancels the SQL statement executing or fetching on a statement resource.
+ *
+ * ibm_db releases the GIL while a statement executes, so ibm_db.cancel() can
+ * be called from another thread. The call running on the statement then
+ * fails with SQLSTATE HY008 (or 57014 when the server interrupts it). A
+ * statement that runs longer than its SQL_ATTR_QUERY_TIMEOUT, set on the
+ * statement or on its connection, fails with SQLSTATE HYT00.
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns TRUE on success, FALSE if the statement is already freed.
+ */
+static PyObject *ibm_db_cancel(PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	SQLHANDLE hstmt;
+	int rc;
+
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+		return NULL;
+
+	if (NIL_P(py_stmt_res) || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	}
+	stmt_res = (stmt_handle *)py_stmt_res;
+	hstmt = stmt_res->hstmt;
+	if ( hstmt == -1 || stmt_res->owner_pid != IBM_DB_GETPID() ) {
+		Py_RETURN_FALSE;
+	}
+
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLCancel((SQLHSTMT)hstmt);
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+		sprintf(error, "Statement cancel Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+		PyErr_SetString(PyExc_Exception, error);
+		return NULL;
+	}
+	Py_RETURN_TRUE;
+}
+
+/*!# ibm_db.free_result
+ *
+ * ===Description
+ * bool ibm_db.free_result ( resource stmt )
+ *
+ * Frees the system and database resources that are associated with a result
+ * set. These resources are freed implicitly when a script finishes, but you
+ * can call ibm_db.free_result() to explicitly free the result set resources
+ * before the end of the script.
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns TRUE on success or FALSE on failure.
+ */
+static PyObject *ibm_db_free_result(PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res;
+	int rc = 0;
+
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+		return NULL;
+	
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
+		}
+		if ( stmt_res->hstmt ) {
+			/* Free any cursors that might have been allocated in a previous call 
+			* to SQLExecute 
+			*/
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+				PyErr_Clear( );	
+				Py_RETURN_FALSE;
+			}
+			if ( stmt_res->rowset != NULL ) {
+				_python_ibm_db_unbind_columns(stmt_res);
+			}
+		}
+		_python_ibm_db_free_result_struct(stmt_res);
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
+	}
+	Py_INCREF(Py_True);
+	return Py_True;
+}
+
+/*
+ * static PyObject *_python_ibm_db_prepare_helper(conn_handle *conn_res, PyObject *py_stmt, PyObject *options)
+ *
+ */
+static PyObject *_python_ibm_db_prepare_helper(conn_handle *conn_res, PyObject *py_stmt, PyObject *options)
+{
+	stmt_handle *stmt_res;
+	int rc;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	SQLWCHAR *stmt = NULL;
+	int stmt_size = 0;
+	int isNewBuffer;
+	int cacheable = 0;
+
+	if (!conn_res->handle_active) {
+		PyErr_SetString(PyExc_Exception, "Connection is not active");
+		return NULL;
+	}
+
+	if (py_stmt != NULL && py_stmt != Py_None) {
+		if (PyString_Check(py_stmt) || PyUnicode_Check(py_stmt)) {
+			py_stmt = PyUnicode_FromObject(py_stmt);
+			if (py_stmt != NULL &&  py_stmt != Py_None) {
+				stmt_size = PyUnicode_GetSize(py_stmt);
+			} else {
+				PyErr_SetString(PyExc_Exception, "Error occure during processing of statement");
+				return NULL;	
+			}
+		}
+		else {
+			PyErr_SetString(PyExc_Exception, "statement must be a string or unicode");
+			return NULL;
+		}
+	}
+
+	_python_ibm_db_clear_stmt_err_cache();
+	_python_ibm_db_clear_handle_error(conn_res, NULL);
+
+	/* Reuse a statement prepared earlier on this connection */
+	if ( conn_res->stmt_cache_size > 0 && py_stmt != NULL && py_stmt != Py_None ) {
+		if ( _python_ibm_db_is_ddl(py_stmt) ) {
+			_python_ibm_db_stmt_cache_invalidate(conn_res);
+		} else if ( NIL_P(options) ) {
+			stmt_res = _python_ibm_db_stmt_cache_get(conn_res, py_stmt);
+			if ( stmt_res != NULL ) {
+				_python_ibm_db_clear_handle_error(conn_res, stmt_res);
+				_python_ibm_db_apply_query_timeout(conn_res, stmt_res, NULL);
+				stmt_res->fetch_buffer_size = conn_res->fetch_buffer_size;
+				conn_res->stmt_cache_hits++;
+				_python_ibm_db_stats_cache_hit(stmt_res);
+				Py_XDECREF(py_stmt);
+				return (PyObject *)stmt_res;
+			}
+			conn_res->stmt_cache_misses++;
+			cacheable = 1;
+		}
+	}
+
+	/* Initialize stmt resource members with default values. */
+	/* Parsing will update options if needed */
+
+	stmt_res = _ibm_db_new_stmt_struct(conn_res);
+
+	/* Allocates the stmt handle */
+	/* Prepares the statement */
+	/* returns the stat_handle back to the calling function */
+	if( py_stmt && py_stmt != Py_None)
+		stmt = getUnicodeDataAsSQLWCHAR(py_stmt, &isNewBuffer);
+		
+	rc = _python_ibm_db_do_prepare(conn_res->hdbc, stmt, stmt_size, stmt_res, options);
+	if (isNewBuffer) {
+		if(stmt) PyMem_Del(stmt);
+	}
+	
+	if ( rc < SQL_SUCCESS ) {
+		sprintf(error, "Statement Prepare Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+		Py_XDECREF(py_stmt);
+		return NULL;
+	}
+	_python_ibm_db_apply_query_timeout(conn_res, stmt_res, options);
+	if ( cacheable ) {
+		/* ibm_db.free_stmt() returns the handle to the cache */
+		stmt_res->cache_key = py_stmt;
+		stmt_res->cache_gen = conn_res->stmt_cache_gen;
+		stmt_res->cache_tick = ++conn_res->stmt_cache_tick;
+		Py_INCREF(conn_res);
+		stmt_res->cache_conn = conn_res;
+		return (PyObject *)stmt_res;
+	}
+	Py_XDECREF(py_stmt);
+	return (PyObject *)stmt_res;		
+}
+
+/*!# ibm_db.prepare
+ *
+ * ===Description
+ * IBMDB_Statement ibm_db.prepare ( IBM_DBConnection connection,
+ *								  string statement [, array options] )
+ *
+ * ibm_db.prepare() creates a prepared SQL statement which can include 0 or
+ * more parameter markers (? characters) representing parameters for input,
+ * output, or input/output. You can pass parameters to the prepared statement
+ * using ibm_db.bind_param(), or for input values only, as an array passed to
+ * ibm_db.execute().
+ *
+ * There are three main advantages to using prepared statements in your
+ * application:
+ *		* Performance: when you prepare a statement, the database server
+ *		 creates an optimized access plan for retrieving data with that
+ *		 statement. Subsequently issuing the prepared statement with
+ *		 ibm_db.execute() enables the statements to reuse that access plan
+ *		 and avoids the overhead of dynamically creating a new access plan
+ *		 for every statement you issue.
+ *		* Security: when you prepare a statement, you can include parameter
+ *		 markers for input values. When you execute a prepared statement
+ *		 with input values for placeholders, the database server checks each
+ *		 input value to ensure that the type matches the column definition or
+ *		 parameter definition.
+ *		* Advanced functionality: Parameter markers not only enable you to
+ *		 pass input values to prepared SQL statements, they also enable you
+ *		 to retrieve OUT and INOUT parameters from stored procedures using
+ *		 ibm_db.bind_param().
+ *
+ * ===Parameters
+ * ====connection
+ *
+ *		A valid database connection resource variable as returned from
+ *		ibm_db.connect() or ibm_db.pconnect().
+ *
+ * ====statement
+ *
+ *		An SQL statement, optionally containing one or more parameter markers.
+ *
+ * ====options
+ *
+ *		An dictionary containing statement options. You can use this parameter
+ *		to request a scrollable cursor on database servers that support this
+ *		functionality.
+ *
+ *		SQL_ATTR_CURSOR_TYPE
+ *			 Passing the SQL_SCROLL_FORWARD_ONLY value requests a forward-only
+ *			 cursor for this SQL statement. This is the default type of
+ *			 cursor, and it is supported by all database servers. It is also
+ *			 much faster than a scrollable cursor.
+ *			 Passing the SQL_CURSOR_KEYSET_DRIVEN value requests a scrollable  
+ *			 cursor for this SQL statement. This type of cursor enables you
+ *			 to fetch rows non-sequentially from the database server. However, 
+ *			 it is only supported by DB2 servers, and is much slower than
+ *			 forward-only cursors.
+ *
+ *		Statements prepared without options are taken from the statement
+ *		cache of the connection when ATTR_STMT_CACHE_SIZE is set on it.
+ *
+ * ===Return Values
+ * Returns a IBM_DBStatement object if the SQL statement was successfully
+ * parsed and prepared by the database server. Returns FALSE if the database
+ * server returned an error. You can determine which error was returned by
+ * calling ibm_db.stmt_error() or ibm_db.stmt_errormsg().
+ */					 
+static PyObject *ibm_db_prepare(PyObject *self, PyObject *args)			
+{
+	PyObject *py_conn_res = NULL;
+	PyObject *options = NULL;
+	conn_handle *conn_res;
+	
+	PyObject *py_stmt = NULL;
+	
+	if (!PyArg_ParseTuple(args, "OO|O", &py_conn_res, &py_stmt, &options))
+		return NULL;
+
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+		return _python_ibm_db_prepare_helper(conn_res, py_stmt, options);	 
+	}
+
+	return NULL;
+}
+
+/*	static param_node* build_list( stmt_res, param_no, data_type, precision, scale, nullable )
+*/
+static param_node* build_list( stmt_handle *stmt_res, int param_no, SQLSMALLINT data_type, SQLUINTEGER precision, SQLSMALLINT scale, SQLSMALLINT nullable )
+{
+	param_node *tmp_curr = NULL, *curr = stmt_res->head_cache_list, *prev = NULL;
+
+	/* Allocate memory and make new node to be added */
+	tmp_curr = ALLOC(param_node);
+	memset(tmp_curr, 0, sizeof(param_node));
+	/* assign values */
+	tmp_curr->data_type = data_type;
+	tmp_curr->param_size = precision;
+	tmp_curr->nullable = nullable;
+	tmp_curr->scale = scale;
+	tmp_curr->param_num = param_no;
+	tmp_curr->file_options = SQL_FILE_READ;
+	tmp_curr->param_type = SQL_PARAM_INPUT;
+
+	while ( curr != NULL ) {
+		prev = curr;
+		curr = curr->next;
+	}
+
+	if (stmt_res->head_cache_list == NULL) {
+		stmt_res->head_cache_list = tmp_curr;
+	} else {
+		prev->next = tmp_curr;
+	}
+
+	tmp_curr->next = curr;
+
+	return tmp_curr;
+}
+
+/*	static PyObject *_python_ibm_db_stream_read(PyObject *stream)
+	Returns the next chunk of a file-like object or iterator bound as a
+	parameter, or NULL once it is exhausted or failed (check PyErr_Occurred)
+*/
+static PyObject *_python_ibm_db_stream_read(PyObject *stream)
+{
+	PyObject *chunk = NULL;
+
+	if ( PyObject_HasAttrString(stream, "read") ) {
+		chunk = PyObject_CallMethod(stream, "read", "i", LOB_BUFSIZ);
+		if ( chunk != NULL && PyObject_Length(chunk) <= 0 ) {
+			Py_DECREF(chunk);
+			chunk = NULL;
+		}
+	} else {
+		chunk = PyIter_Next(stream);
+	}
+	return chunk;
+}
+
+/*	static int _python_ibm_db_bind_buffer(stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
+	Binds an input parameter straight from the memory of a bytes-like object.
+	The buffer is held by the param node until the execute returns
+*/
+static int _python_ibm_db_bind_buffer(stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
+{
+	int rc;
+#if  PY_MAJOR_VERSION < 3
+	const void *buf = NULL;
+	Py_ssize_t buffer_len = 0;
+#endif
+
+	if ( PyObject_CheckBuffer(bind_data) ) {
+		rc = PyObject_GetBuffer(bind_data, &(curr->buffer_view), PyBUF_SIMPLE);
+	} else {
+#if  PY_MAJOR_VERSION < 3
+		/* buffer objects only implement the old buffer interface */
+		rc = PyObject_AsReadBuffer(bind_data, &buf, &buffer_len);
+		if ( rc == 0 ) {
+			rc = PyBuffer_FillInfo(&(curr->buffer_view), bind_data, (void *)buf, buffer_len, 1, PyBUF_SIMPLE);
+		}
+#else
+		rc = -1;
+#endif
+	}
+	if ( rc != 0 ) {
+		PyErr_Clear();
+		strcpy(IBM_DB_G(__python_stmt_err_msg), "Failed to get the buffer of a binary parameter");
+		return SQL_ERROR;
+	}
+	curr->bind_indicator = (SQLINTEGER)curr->buffer_view.len;
+
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+		curr->param_type, SQL_C_BINARY, curr->data_type, curr->param_size,
+		curr->scale, curr->buffer_view.buf, curr->buffer_view.len, &(curr->bind_indicator));
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+										rc, 1, NULL, -1, 1);
+	}
+	return rc;
+}
+
+/*	static int _python_ibm_db_bind_utf8(stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
+	Binds a string input parameter encoded as UTF-8, for the CHAR_UTF8 and
+	CHAR_BYTES modes. The encoded value is held by the param node like the
+	buffer of _python_ibm_db_bind_buffer
+*/
+static int _python_ibm_db_bind_utf8(stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
+{
+	PyObject *encoded;
+	int rc;
+
+	encoded = PyUnicode_AsUTF8String(bind_data);
+	if ( encoded == NULL ) {
+		PyErr_Clear();
+		strcpy(IBM_DB_G(__python_stmt_err_msg), "Failed to encode a string parameter as UTF-8");
+		return SQL_ERROR;
+	}
+	rc = PyObject_GetBuffer(encoded, &(curr->buffer_view), PyBUF_SIMPLE);
+	Py_DECREF(encoded);
+	if ( rc != 0 ) {
+		PyErr_Clear();
+		strcpy(IBM_DB_G(__python_stmt_err_msg), "Failed to get the buffer of a string parameter");
+		return SQL_ERROR;
+	}
+	curr->bind_indicator = (SQLINTEGER)curr->buffer_view.len;
+
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+		curr->param_type, SQL_C_CHAR, curr->data_type, curr->param_size,
+		curr->scale, curr->buffer_view.buf, curr->buffer_view.len, &(curr->bind_indicator));
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+										rc, 1, NULL, -1, 1);
+	}
+	return rc;
+}
+
+/*	static void _python_ibm_db_release_param_buffers(stmt_handle *stmt_res)
+	releases the buffers bound by _python_ibm_db_bind_buffer and
+	_python_ibm_db_bind_utf8 once the execute returned, so that the caller
+	may resize its objects again. Each execute binds its parameters again
+*/
+static void _python_ibm_db_release_param_buffers(stmt_handle *stmt_res)
+{
+	param_node *curr;
+
+	for ( curr = stmt_res->head_cache_list; curr != NULL; curr = curr->next ) {
+		if ( curr->buffer_view.obj != NULL ) {
+			PyBuffer_Release(&(curr->buffer_view));
+		}
+	}
+}
+
+/*	static int _python_ibm_db_bind_data( stmt_handle *stmt_res, param_node *curr, PyObject *bind_data )
+*/
+static int _python_ibm_db_bind_data( stmt_handle *stmt_res, param_node *curr, PyObject *bind_data)
+{
+	int rc;
+	SQLSMALLINT valueType = 0;
+	SQLPOINTER	paramValuePtr;
+#if  PY_MAJOR_VERSION < 3
+	Py_ssize_t buffer_len = 0;
+#endif
+	int param_length;
+
+	Py_CLEAR(curr->stream);
+	Py_CLEAR(curr->stream_chunk);
+	if ( curr->buffer_view.obj != NULL ) {
+		PyBuffer_Release(&(curr->buffer_view));
+	}
+	
+	/* Have to use SQLBindFileToParam if PARAM is type PARAM_FILE */
+	/*** Need to fix this***/
+	if ( curr->param_type == PARAM_FILE) {
+		PyObject *FileNameObj = NULL;
+		/* Only string types can be bound */
+		if (PyString_Check(bind_data)) {
+			if (PyUnicode_Check(bind_data)) {
+				FileNameObj = PyUnicode_AsASCIIString(bind_data);
+				if (FileNameObj == NULL) {
+					return SQL_ERROR;
+				}
+			}
+		} else {
+			return SQL_ERROR;
+		}
+		curr->bind_indicator = 0;
+		if(curr->svalue != NULL) {
+			PyMem_Del(curr->svalue);
+			curr->svalue = NULL;
+		}
+		if (FileNameObj != NULL) {
+			curr->svalue = PyBytes_AsString(FileNameObj);
+		} else {
+			curr->svalue = PyBytes_AsString(bind_data);
+		}
+		curr->ivalue = strlen(curr->svalue);
+		curr->svalue = memcpy(PyMem_Malloc((sizeof(char))*(curr->ivalue+1)), curr->svalue, curr->ivalue);
+		curr->svalue[curr->ivalue] = '\0';
+		Py_XDECREF(FileNameObj);
+		valueType = (SQLSMALLINT) curr->ivalue;
+		/* Bind file name string */
+
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLBindFileToParam((SQLHSTMT)stmt_res->hstmt, curr->param_num,
+					curr->data_type, (SQLCHAR*)curr->svalue,
+					(SQLSMALLINT*)&(curr->ivalue), &(curr->file_options), 
+					(SQLSMALLINT) curr->ivalue, &(curr->bind_indicator));
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+											 rc, 1, NULL, -1, 1);
+		}
+		return rc;
+	}
+	
+	switch(TYPE(bind_data)) {
+		case PYTHON_FIXNUM:
+			if(curr->data_type == SQL_BIGINT) {
+				curr->bivalue = (SQLBIGINT) PyLong_AsLongLong(bind_data);
+				if ( curr->bivalue == -1 && PyErr_Occurred() ) {
+					return SQL_ERROR;
+				}
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+							curr->param_type, SQL_C_SBIGINT, curr->data_type,
+							curr->param_size, curr->scale, &curr->bivalue, 0, NULL);
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+				}
+			}
+			else if(curr->data_type == SQL_DECIMAL){
+				PyObject *tempobj = NULL;
+#if  PY_MAJOR_VERSION >= 3
+			       	PyObject *tempobj2 = NULL;
+#endif
+				tempobj = PyObject_Str(bind_data);
+#if  PY_MAJOR_VERSION >= 3
+				tempobj2 = PyUnicode_AsASCIIString(tempobj);
+				Py_XDECREF(tempobj);
+				tempobj = tempobj2;
+#endif	
+				curr->svalue = PyBytes_AsString(tempobj);
+				curr->ivalue = strlen(curr->svalue);
+				curr->svalue = memcpy(PyMem_Malloc((sizeof(char))*(curr->ivalue+1)), curr->svalue, curr->ivalue);
+				curr->svalue[curr->ivalue] = '\0'; 
+				curr->bind_indicator = curr->ivalue;
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+					curr->param_type, SQL_C_CHAR, curr->data_type,
+					curr->param_size, curr->scale, curr->svalue, curr->param_size, NULL);
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ){
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+				}
+				Py_XDECREF(tempobj);
+			}
+			else{
+				curr->ivalue = (SQLINTEGER) PyLong_AsLong(bind_data);
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+							curr->param_type, SQL_C_LONG, curr->data_type,
+							curr->param_size, curr->scale, &curr->ivalue, 0, NULL);
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+				}
+				curr->data_type = SQL_C_LONG;
+			}
+			break;
+
+		/* Convert BOOLEAN types to LONG for DB2 / Cloudscape */
+		case PYTHON_FALSE:
+			curr->ivalue = 0;
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+						curr->param_type, SQL_C_LONG, curr->data_type, curr->param_size,
+						curr->scale, &curr->ivalue, 0, NULL);
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+													rc, 1, NULL, -1, 1);
+			}
+			curr->data_type = SQL_C_LONG;
+			break;
+
+		case PYTHON_TRUE:
+			curr->ivalue = 1;
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+			curr->param_type, SQL_C_LONG, curr->data_type, curr->param_size,
+						curr->scale, &curr->ivalue, 0, NULL);
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+			}
+			curr->data_type = SQL_C_LONG;
+			break;
+
+		case PYTHON_FLOAT:
+			curr->fvalue = PyFloat_AsDouble(bind_data);
+			
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+					curr->param_type, SQL_C_DOUBLE, curr->data_type, curr->param_size,
+					curr->scale, &curr->fvalue, 0, NULL);
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+			}
+			curr->data_type = SQL_C_DOUBLE;
+			break;
+
+		case PYTHON_UNICODE:
+			if ( stmt_res->s_char_mode != CHAR_WCHAR && curr->param_type == SQL_PARAM_INPUT ) {
+				switch ( curr->data_type ) {
+					case SQL_CHAR:
+					case SQL_VARCHAR:
+					case SQL_LONGVARCHAR:
+					case SQL_WCHAR:
+					case SQL_WVARCHAR:
+					case SQL_WLONGVARCHAR:
+					case SQL_GRAPHIC:
+					case SQL_VARGRAPHIC:
+					case SQL_LONGVARGRAPHIC:
+						return _python_ibm_db_bind_utf8(stmt_res, curr, bind_data);
+				}
+			}
+			{
+				int isNewBuffer;
+				if(PyObject_CheckBuffer(bind_data) && (curr->data_type == SQL_BLOB || curr->data_type == SQL_BINARY || curr->data_type == SQL_VARBINARY)) {
+#if  PY_MAJOR_VERSION >= 3
+					Py_buffer tmp_buffer;
+					PyObject_GetBuffer(bind_data, &tmp_buffer, PyBUF_SIMPLE);
+					curr->uvalue = tmp_buffer.buf;
+					curr->ivalue = tmp_buffer.len;
+#else					
+					PyObject_AsReadBuffer(bind_data, (const void **) &(curr->uvalue), &buffer_len);
+					curr->ivalue = buffer_len;
+#endif
+				} else {
+					if(curr->uvalue != NULL) {
+						PyMem_Del(curr->uvalue);
+						curr->uvalue = NULL;
+					}
+					curr->uvalue = getUnicodeDataAsSQLWCHAR(bind_data, &isNewBuffer);
+					curr->ivalue = PyUnicode_GetSize(bind_data);
+					curr->ivalue = curr->ivalue * sizeof(SQLWCHAR);
+				}
+				param_length = curr->ivalue;
+				if (curr->size != 0) {
+					curr->ivalue = (curr->size + 1) * sizeof(SQLWCHAR);
+				}
+
+				if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+					if (curr->size == 0) {
+						if ((curr->data_type == SQL_BLOB) || (curr->data_type == SQL_CLOB) || (curr->data_type == SQL_BINARY)
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+								|| (curr->data_type == SQL_LONGVARBINARY)
+#endif /* PASE */
+								|| (curr->data_type == SQL_VARBINARY) || (curr->data_type == SQL_XML)) {
+							if (curr->ivalue <= curr->param_size) {
+								curr->ivalue = curr->param_size + sizeof(SQLWCHAR);
+							}
+						} else {
+							if (curr->ivalue <= (curr->param_size * sizeof(SQLWCHAR))) {
+								curr->ivalue = (curr->param_size + 1) * sizeof(SQLWCHAR);
+							}
+						}
+					}
+				}
+				
+				if (isNewBuffer == 0 ){
+					/* actually make a copy, since this will uvalue will be freed explicitly */
+					SQLWCHAR* tmp = (SQLWCHAR*)ALLOC_N(SQLWCHAR, curr->ivalue + 1);
+					memcpy(tmp, curr->uvalue, (param_length + sizeof(SQLWCHAR)));
 					curr->uvalue = tmp;
 				} else if (param_length <= curr->param_size) {
 					SQLWCHAR* tmp = (SQLWCHAR*)ALLOC_N(SQLWCHAR, curr->ivalue + 1);
@@ -5345,654 +7689,1507 @@ static int _python_ibm_db_bind_data( stmt_handle *stmt_res, param_node *curr, Py
 					PyMem_Del(curr->uvalue);
 					curr->uvalue = tmp;
 				}
-				
-				switch( curr->data_type){
-					case SQL_CLOB:
-					case SQL_DBCLOB:
-						if(curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT){
-							curr->bind_indicator =  param_length;
-							paramValuePtr = (SQLPOINTER)curr->uvalue;
-						} else {
-							curr->bind_indicator = SQL_DATA_AT_EXEC;	
-#ifndef PASE
-							paramValuePtr = (SQLPOINTER)(curr);
-#else
-							paramValuePtr = (SQLPOINTER)&(curr);
-#endif
-						}
-						valueType = SQL_C_WCHAR;
-						break;
-					
-					case SQL_BLOB:
-						if (curr->param_type == SQL_PARAM_OUTPUT ||curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->bind_indicator = param_length;
-							paramValuePtr = (SQLPOINTER)curr;
-						} else {
-							curr->bind_indicator = SQL_DATA_AT_EXEC;
-#ifndef PASE
-							paramValuePtr = (SQLPOINTER)(curr);
-#else
-							paramValuePtr = (SQLPOINTER)&(curr);
-#endif
-						}
-						valueType = SQL_C_BINARY;
-						break;
-					
-					case SQL_BINARY:
-#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
-					case SQL_LONGVARBINARY:
-#endif /* PASE */
-					case SQL_VARBINARY:
-						/* account for bin_mode settings as well */
-						curr->bind_indicator = param_length;
-						valueType = SQL_C_BINARY;
-						paramValuePtr = (SQLPOINTER)curr->uvalue;
-						break;
+				
+				switch( curr->data_type){
+					case SQL_CLOB:
+					case SQL_DBCLOB:
+						if(curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT){
+							curr->bind_indicator =  param_length;
+							paramValuePtr = (SQLPOINTER)curr->uvalue;
+						} else {
+							curr->bind_indicator = SQL_DATA_AT_EXEC;	
+#ifndef PASE
+							paramValuePtr = (SQLPOINTER)(curr);
+#else
+							paramValuePtr = (SQLPOINTER)&(curr);
+#endif
+						}
+						valueType = SQL_C_WCHAR;
+						break;
+					
+					case SQL_BLOB:
+						if (curr->param_type == SQL_PARAM_OUTPUT ||curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->bind_indicator = param_length;
+							paramValuePtr = (SQLPOINTER)curr;
+						} else {
+							curr->bind_indicator = SQL_DATA_AT_EXEC;
+#ifndef PASE
+							paramValuePtr = (SQLPOINTER)(curr);
+#else
+							paramValuePtr = (SQLPOINTER)&(curr);
+#endif
+						}
+						valueType = SQL_C_BINARY;
+						break;
+					
+					case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+					case SQL_LONGVARBINARY:
+#endif /* PASE */
+					case SQL_VARBINARY:
+						/* account for bin_mode settings as well */
+						curr->bind_indicator = param_length;
+						valueType = SQL_C_BINARY;
+						paramValuePtr = (SQLPOINTER)curr->uvalue;
+						break;
+
+					case SQL_XML:
+						curr->bind_indicator = param_length;
+						paramValuePtr = (SQLPOINTER)curr->uvalue;
+						valueType = SQL_C_WCHAR;
+						break;
+					case SQL_TYPE_TIMESTAMP:
+						valueType = SQL_C_WCHAR;
+						curr->bind_indicator = SQL_NTS;
+						if(curr->uvalue[10] == 'T'){
+							curr->uvalue[10] = ' ';
+						}
+						paramValuePtr = (SQLPOINTER)(curr->uvalue);
+						break;
+					default:
+						valueType = SQL_C_WCHAR;
+						curr->bind_indicator = param_length;
+						paramValuePtr = (SQLPOINTER)(curr->uvalue);
+				}
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num, curr->param_type, valueType, curr->data_type, curr->param_size, curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+				}
+				curr->data_type = valueType;
+			}
+			break;
+		
+		case PYTHON_STRING:
+			if ( curr->param_type == SQL_PARAM_INPUT && (curr->data_type == SQL_BLOB || 
+					curr->data_type == SQL_BINARY || curr->data_type == SQL_VARBINARY
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+					|| curr->data_type == SQL_LONGVARBINARY
+#endif /* PASE */
+					) ) {
+				rc = _python_ibm_db_bind_buffer(stmt_res, curr, bind_data);
+				break;
+			}
+			{
+				char* tmp;
+				if (PyObject_CheckBuffer(bind_data) && (curr->data_type == SQL_BLOB || curr->data_type == SQL_BINARY
+										 || curr->data_type == SQL_VARBINARY) ) {
+#if  PY_MAJOR_VERSION >= 3
+					Py_buffer tmp_buffer;
+					PyObject_GetBuffer(bind_data, &tmp_buffer, PyBUF_SIMPLE);
+					curr->svalue = tmp_buffer.buf;
+					curr->ivalue = tmp_buffer.len;
+#else
+					PyObject_AsReadBuffer(bind_data, (const void **) &(curr->svalue), &buffer_len);
+					curr->ivalue = buffer_len;
+#endif
+				} else {
+					if(curr->svalue != NULL) {
+						PyMem_Del(curr->svalue);
+						curr->svalue = NULL;
+					}
+					curr->svalue = PyBytes_AsString(bind_data);   /** It is PyString_AsString() in PY_MAJOR_VERSION<3, and code execution will not come here in PY_MAJOR_VERSION>=3 **/
+					curr->ivalue = strlen(curr->svalue);
+				}
+				param_length = curr->ivalue;
+				/*
+				* An extra parameter is given by the client to pick the size of the 
+				* string returned. The string is then truncate past that size.	
+				* If no size is given then use BUFSIZ to return the string.
+				*/
+				if (curr->size != 0) {
+					curr->ivalue = curr->size;
+				}
+	            
+				if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+					if (curr->size == 0) {
+						if (curr->ivalue <= curr->param_size) {
+							curr->ivalue = curr->param_size + 1;
+						}
+					}
+				}
+				tmp = ALLOC_N(char, curr->ivalue+1);
+				curr->svalue = memcpy(tmp, curr->svalue, param_length);
+				curr->svalue[param_length] = '\0';
+	
+				switch ( curr->data_type ) {
+					case SQL_CLOB:
+					case SQL_DBCLOB:
+						if (curr->param_type == SQL_PARAM_OUTPUT || 
+							curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->bind_indicator = param_length;
+							paramValuePtr = (SQLPOINTER)curr->svalue;
+						} else {
+							curr->bind_indicator = SQL_DATA_AT_EXEC;
+							/* The correct dataPtr will be set during SQLPutData with 
+							* the len from this struct 
+							*/
+#ifndef PASE
+							paramValuePtr = (SQLPOINTER)(curr);
+#else
+							paramValuePtr = (SQLPOINTER)&(curr);
+#endif
+						}
+						valueType = SQL_C_CHAR;
+						break;
+
+					case SQL_BLOB:
+						if (curr->param_type == SQL_PARAM_OUTPUT || 
+							curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->ivalue = curr->ivalue -1;
+							curr->bind_indicator = param_length;
+							paramValuePtr = (SQLPOINTER)curr;
+						} else {
+							curr->bind_indicator = SQL_DATA_AT_EXEC;
+#ifndef PASE
+							paramValuePtr = (SQLPOINTER)(curr);
+#else
+							paramValuePtr = (SQLPOINTER)&(curr);
+#endif
+						}
+						valueType = SQL_C_BINARY;
+						break;
+	
+					case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+					case SQL_LONGVARBINARY:
+#endif /* PASE */
+					case SQL_VARBINARY:
+					case SQL_XML:
+						/* account for bin_mode settings as well */
+						curr->bind_indicator = curr->ivalue;
+						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->ivalue = curr->ivalue - 1;
+							curr->bind_indicator = param_length;
+						}
+						
+						valueType = SQL_C_BINARY;
+						paramValuePtr = (SQLPOINTER)curr->svalue;
+						break;
+
+						/* This option should handle most other types such as DATE, 
+						* VARCHAR etc 
+						*/
+					case SQL_TYPE_TIMESTAMP:
+						valueType = SQL_C_CHAR;
+						curr->bind_indicator = curr->ivalue;
+						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->bind_indicator = SQL_NTS;
+						}
+						if(curr->svalue[10] == 'T'){
+							curr->svalue[10] = ' ';
+						}
+						paramValuePtr = (SQLPOINTER)(curr->svalue);
+						break;
+					default:
+						valueType = SQL_C_CHAR;
+						curr->bind_indicator = curr->ivalue;
+						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
+							curr->bind_indicator = SQL_NTS;
+						}
+						paramValuePtr = (SQLPOINTER)(curr->svalue);
+				}
+
+				Py_BEGIN_ALLOW_THREADS;
+				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+					curr->param_type, valueType, curr->data_type, curr->param_size,
+					curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
+				Py_END_ALLOW_THREADS;
+
+				if ( rc == SQL_ERROR ) {
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+				}
+				curr->data_type = valueType;
+			}
+			break;
+
+		case PYTHON_DECIMAL:
+			/* decimal.Decimal is passed in its character form, converted in C */
+			if(curr->svalue != NULL) {
+				PyMem_Del(curr->svalue);
+				curr->svalue = NULL;
+			}
+			curr->svalue = _python_ibm_db_decimal_to_chars(bind_data);
+			if ( curr->svalue == NULL ) {
+				return SQL_ERROR;
+			}
+			curr->ivalue = strlen(curr->svalue);
+			valueType = SQL_C_CHAR;
+			paramValuePtr = (SQLPOINTER)(curr->svalue);
+			curr->bind_indicator = curr->ivalue;
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num, curr->param_type, valueType, curr->data_type, curr->param_size, curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,rc, 1, NULL, -1, 1);
+			}
+			curr->data_type = valueType;
+			break;
+
+		case PYTHON_DATE:
+			curr->date_value = ALLOC(DATE_STRUCT);
+			curr->date_value->year = PyDateTime_GET_YEAR(bind_data);
+			curr->date_value->month = PyDateTime_GET_MONTH(bind_data);
+			curr->date_value->day = PyDateTime_GET_DAY(bind_data);
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+				curr->param_type, SQL_C_TYPE_DATE, curr->data_type, curr->param_size,
+				curr->scale, curr->date_value, curr->ivalue, &(curr->bind_indicator));
+			Py_END_ALLOW_THREADS;
+			break;
+
+		case PYTHON_TIME:
+			curr->time_value = ALLOC(TIME_STRUCT);
+			curr->time_value->hour = PyDateTime_TIME_GET_HOUR(bind_data);
+			curr->time_value->minute = PyDateTime_TIME_GET_MINUTE(bind_data);
+			curr->time_value->second = PyDateTime_TIME_GET_SECOND(bind_data);
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+				curr->param_type, SQL_C_TYPE_TIME, curr->data_type, curr->param_size,
+				curr->scale, curr->time_value, curr->ivalue, &(curr->bind_indicator));
+			Py_END_ALLOW_THREADS;
+			break;
+
+		case PYTHON_TIMESTAMP:
+			curr->ts_value = ALLOC(TIMESTAMP_STRUCT);
+			curr->ts_value->year = PyDateTime_GET_YEAR(bind_data);
+			curr->ts_value->month = PyDateTime_GET_MONTH(bind_data);
+			curr->ts_value->day = PyDateTime_GET_DAY(bind_data);
+			curr->ts_value->hour = PyDateTime_DATE_GET_HOUR(bind_data);
+			curr->ts_value->minute = PyDateTime_DATE_GET_MINUTE(bind_data);
+			curr->ts_value->second = PyDateTime_DATE_GET_SECOND(bind_data);
+			curr->ts_value->fraction = PyDateTime_DATE_GET_MICROSECOND(bind_data) * 1000;
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+				curr->param_type, SQL_C_TYPE_TIMESTAMP, curr->data_type, curr->param_size,
+				curr->scale, curr->ts_value, curr->ivalue, &(curr->bind_indicator));
+			Py_END_ALLOW_THREADS;
+			break;
+
+		case PYTHON_NIL:
+			curr->ivalue = SQL_NULL_DATA;
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+				curr->param_type, SQL_C_DEFAULT, curr->data_type, curr->param_size,
+				curr->scale, &curr->ivalue, 0, (SQLLEN *)&(curr->ivalue));
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+											rc, 1, NULL, -1, 1);
+			}
+			break;
+			
+		case PYTHON_BUFFER:
+			if ( curr->param_type == SQL_PARAM_INPUT ) {
+				rc = _python_ibm_db_bind_buffer(stmt_res, curr, bind_data);
+			} else {
+				/* Output values are written back, so bind a private copy */
+				PyObject *tmp_data = NULL;
+#if  PY_MAJOR_VERSION < 3
+				const void *buf = NULL;
+				Py_ssize_t buffer_len = 0;
+
+				if ( PyObject_AsReadBuffer(bind_data, &buf, &buffer_len) == 0 ) {
+					tmp_data = PyBytes_FromStringAndSize((const char *)buf, buffer_len);
+				}
+#else
+				Py_buffer tmp_view;
+
+				if ( PyObject_GetBuffer(bind_data, &tmp_view, PyBUF_SIMPLE) == 0 ) {
+					tmp_data = PyBytes_FromStringAndSize((const char *)tmp_view.buf, tmp_view.len);
+					PyBuffer_Release(&tmp_view);
+				}
+#endif
+				if ( tmp_data == NULL ) {
+					return SQL_ERROR;
+				}
+				rc = _python_ibm_db_bind_data(stmt_res, curr, tmp_data);
+				Py_DECREF(tmp_data);
+			}
+			break;
+
+		case PYTHON_STREAM:
+			/* The stream is read in chunks and sent with SQLPutData at execute */
+			if ( curr->param_type != SQL_PARAM_INPUT ) {
+				strcpy(IBM_DB_G(__python_stmt_err_msg), "File-like objects and iterators can only be bound as input parameters");
+				return SQL_ERROR;
+			}
+			curr->stream_chunk = _python_ibm_db_stream_read(bind_data);
+			if ( curr->stream_chunk == NULL && PyErr_Occurred() ) {
+				strcpy(IBM_DB_G(__python_stmt_err_msg), "Failed to read from the parameter stream");
+				return SQL_ERROR;
+			}
+			Py_INCREF(bind_data);
+			curr->stream = bind_data;
+
+			if ( curr->stream_chunk != NULL && PyUnicode_Check(curr->stream_chunk) ) {
+				valueType = SQL_C_WCHAR;
+			} else {
+				switch( curr->data_type ) {
+					case SQL_BLOB:
+					case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+					case SQL_LONGVARBINARY:
+#endif /* PASE */
+					case SQL_VARBINARY:
+						valueType = SQL_C_BINARY;
+						break;
+					default:
+						valueType = SQL_C_CHAR;
+				}
+			}
+			curr->bind_indicator = SQL_DATA_AT_EXEC;
+#ifndef PASE
+			paramValuePtr = (SQLPOINTER)(curr);
+#else
+			paramValuePtr = (SQLPOINTER)&(curr);
+#endif
+
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
+				curr->param_type, valueType, curr->data_type, curr->param_size,
+				curr->scale, paramValuePtr, 0, &(curr->bind_indicator));
+			Py_END_ALLOW_THREADS;
+
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+											rc, 1, NULL, -1, 1);
+			}
+			break;
+
+		default:
+			return SQL_ERROR;
+	}
+	return rc;
+}
+
+/*	static int _python_ibm_db_put_param_data(stmt_handle *stmt_res, param_node *node)
+	Sends the value of a data-at-execution parameter. Streams are sent one chunk
+	at a time; returns SQL_ERROR with a Python exception set if reading fails
+*/
+static int _python_ibm_db_put_param_data(stmt_handle *stmt_res, param_node *node)
+{
+	int rc = SQL_SUCCESS;
+	int sent = 0;
+	int is_unicode = 0;
+	PyObject *chunk = NULL;
+	SQLWCHAR *wvalue = NULL;
+	int isNewBuffer = 0;
+	Py_buffer view;
+	long bytes;
+	double start;
+
+	if ( node->stream == NULL ) {
+		start = _python_ibm_db_clock();
+		Py_BEGIN_ALLOW_THREADS;
+		if ( !NIL_P(node->svalue) ) {
+			rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)node->svalue, node->ivalue);
+		} else {
+			rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)node->uvalue, node->ivalue);
+		}
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_stats_gil(stmt_res, start);
+		if ( rc != SQL_ERROR && node->ivalue > 0 && _python_ibm_db_is_lob_type(node->data_type) ) {
+			_python_ibm_db_stats_lob(stmt_res, node->ivalue);
+		}
+		return rc;
+	}
+
+	chunk = node->stream_chunk;
+	node->stream_chunk = NULL;
+	if ( chunk != NULL ) {
+		is_unicode = PyUnicode_Check(chunk);
+	}
+
+	while ( chunk != NULL ) {
+		if ( PyUnicode_Check(chunk) != is_unicode ) {
+			PyErr_SetString(PyExc_Exception, "Parameter stream returned chunks of mixed text and binary data");
+			Py_DECREF(chunk);
+			rc = SQL_ERROR;
+			break;
+		}
+		if ( is_unicode ) {
+			wvalue = getUnicodeDataAsSQLWCHAR(chunk, &isNewBuffer);
+			bytes = PyUnicode_GET_SIZE(chunk) * sizeof(SQLWCHAR);
+			start = _python_ibm_db_clock();
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)wvalue, bytes);
+			Py_END_ALLOW_THREADS;
+			if ( isNewBuffer ) {
+				PyMem_Del(wvalue);
+			}
+		} else {
+			if ( PyObject_GetBuffer(chunk, &view, PyBUF_SIMPLE) != 0 ) {
+				Py_DECREF(chunk);
+				rc = SQL_ERROR;
+				break;
+			}
+			bytes = view.len;
+			start = _python_ibm_db_clock();
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)view.buf, view.len);
+			Py_END_ALLOW_THREADS;
+			PyBuffer_Release(&view);
+		}
+		Py_DECREF(chunk);
+		_python_ibm_db_stats_gil(stmt_res, start);
+		if ( rc == SQL_ERROR ) {
+			return rc;
+		}
+		if ( _python_ibm_db_is_lob_type(node->data_type) ) {
+			_python_ibm_db_stats_lob(stmt_res, bytes);
+		}
+		sent = 1;
+		chunk = _python_ibm_db_stream_read(node->stream);
+	}
+
+	if ( PyErr_Occurred() ) {
+		/* Abandon the execute so the statement does not stay in need data state */
+		Py_BEGIN_ALLOW_THREADS;
+		SQLCancel((SQLHSTMT)stmt_res->hstmt);
+		Py_END_ALLOW_THREADS;
+		return SQL_ERROR;
+	}
+
+	if ( !sent ) {
+		/* Empty stream, send a zero length value */
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)"", 0);
+		Py_END_ALLOW_THREADS;
+	}
+	return rc;
+}
+
+/*	static int _python_ibm_db_describe_param(stmt_handle *stmt_res, SQLUSMALLINT param_no, SQLSMALLINT *data_type, SQLUINTEGER *precision, SQLSMALLINT *scale, SQLSMALLINT *nullable)
+	describes a parameter from the type declared with ibm_db.set_input_sizes()
+	or found on an earlier execute of the statement, and with SQLDescribeParam
+	if there is none
+*/
+static int _python_ibm_db_describe_param(stmt_handle *stmt_res, SQLUSMALLINT param_no, SQLSMALLINT *data_type, SQLUINTEGER *precision, SQLSMALLINT *scale, SQLSMALLINT *nullable)
+{
+	ibm_db_param_desc *desc;
+	int rc;
+
+	if ( param_no <= stmt_res->num_param_desc &&
+			stmt_res->param_desc[param_no - 1].data_type != SQL_UNKNOWN_TYPE ) {
+		desc = &stmt_res->param_desc[param_no - 1];
+		*data_type = desc->data_type;
+		*precision = desc->precision;
+		*scale = desc->scale;
+		*nullable = desc->nullable;
+		return SQL_SUCCESS;
+	}
+
+	_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, param_no, data_type, 
+		precision, scale, nullable);
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
+									rc, 1, NULL, -1, 1);
+		return rc;
+	}
+	/* The kept descriptions start at the first parameter */
+	if ( param_no <= stmt_res->param_desc_alloc && param_no <= stmt_res->num_param_desc + 1 ) {
+		desc = &stmt_res->param_desc[param_no - 1];
+		desc->data_type = *data_type;
+		desc->precision = *precision;
+		desc->scale = *scale;
+		desc->nullable = *nullable;
+		if ( param_no > stmt_res->num_param_desc ) {
+			stmt_res->num_param_desc = param_no;
+		}
+	}
+	return rc;
+}
+
+/* static int _python_ibm_db_execute_helper2(stmt_res, data, int bind_cmp_list)
+	*/
+static int _python_ibm_db_execute_helper2(stmt_handle *stmt_res, PyObject *data, int bind_cmp_list, int bind_params)
+{
+	int rc = SQL_SUCCESS;
+	param_node *curr = NULL;	/* To traverse the list */
+	PyObject *bind_data;		 /* Data value from symbol table */
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	/* Used in call to SQLDescribeParam if needed */
+	SQLSMALLINT param_no;
+	SQLSMALLINT data_type;
+	SQLUINTEGER precision;
+	SQLSMALLINT scale;
+	SQLSMALLINT nullable;
+
+	/* This variable means that we bind the complete list of params cached */
+	/* The values used are fetched from the active symbol table */
+	/* TODO: Enhance this part to check for stmt_res->file_param */
+	/* If this flag is set, then use SQLBindParam, else use SQLExtendedBind */
+	if ( bind_cmp_list ) {
+		/* Bind the complete list sequentially */
+		/* Used when no parameters array is passed in */
+		curr = stmt_res->head_cache_list;
+
+		while (curr != NULL ) {
+			/* Fetch data from symbol table */
+			if (curr->param_type == PARAM_FILE)
+				bind_data = curr->var_pyvalue;
+			else {
+				bind_data = curr->var_pyvalue;
+			}
+			if (bind_data == NULL)
+				return -1;
+				
+			rc = _python_ibm_db_bind_data( stmt_res, curr, bind_data);
+			if ( rc == SQL_ERROR ) {
+				sprintf(error, "Binding Error 1: %s", 
+						IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return rc;
+			}
+			curr = curr->next;
+		}
+		return 0;
+	} else {
+		/* Bind only the data value passed in to the Current Node */
+		if ( data != NULL ) {
+			if ( bind_params ) {
+				/* This condition applies if the parameter has not been
+				* bound using ibm_db.bind_param. Need to describe the
+				* parameter and then bind it.
+				*/
+				param_no = ++stmt_res->num_params;
+
+				rc = _python_ibm_db_describe_param(stmt_res, param_no, &data_type, 
+						&precision, &scale, &nullable);
+				if ( rc == SQL_ERROR ) {
+					sprintf(error, "Describe Param Failed: %s", 
+							IBM_DB_G(__python_stmt_err_msg));
+					PyErr_SetString(PyExc_Exception, error);
+					return rc;
+				}
+
+				curr = build_list(stmt_res, param_no, data_type, precision, 
+							  scale, nullable);
+				rc = _python_ibm_db_bind_data( stmt_res, curr, data);
+				if ( rc == SQL_ERROR ) {
+					sprintf(error, "Binding Error 2: %s", 
+							IBM_DB_G(__python_stmt_err_msg));
+					PyErr_SetString(PyExc_Exception, error);
+					return rc;
+				}
+			} else {
+				/* This is always at least the head_cache_node -- assigned in
+				* ibm_db.execute(), if params have been bound.
+				*/
+				curr = stmt_res->current_node;
+				if ( curr != NULL ) {
+					rc = _python_ibm_db_bind_data( stmt_res, curr, data);
+					if ( rc == SQL_ERROR ) {
+						sprintf(error, "Binding Error 2: %s", 
+							IBM_DB_G(__python_stmt_err_msg));
+						PyErr_SetString(PyExc_Exception, error);
+						return rc;
+					}
+					stmt_res->current_node = curr->next;
+				}
+			}
+			return rc;
+		}
+	}
+	return rc;
+}
+
+/*
+ * static PyObject *_python_ibm_db_execute_helper1(stmt_handle *stmt_res, PyObject *parameters_tuple)
+ *
+ */ 
+static PyObject *_python_ibm_db_execute_helper1(stmt_handle *stmt_res, PyObject *parameters_tuple)
+{
+	double start;
+	int rc, numOpts, i, bind_params = 0;
+	SQLSMALLINT num;
+	SQLPOINTER valuePtr;
+	PyObject *data;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	/* This is used to loop over the param cache */
+	param_node *prev_ptr, *curr_ptr;
+	_python_ibm_db_clear_handle_error(NULL, stmt_res);
+	stmt_res->array_row_cnt = -1;
+
+	/* Free any cursors that might have been allocated in a previous call to 
+	* SQLExecute 
+	*/
+	Py_BEGIN_ALLOW_THREADS;
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
+	Py_END_ALLOW_THREADS;
+	stmt_res->row_gen++;
+
+	/* This ensures that each call to ibm_db.execute start from scratch */
+	stmt_res->current_node = stmt_res->head_cache_list;
+	
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLNumParams((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT*)&num);
+	Py_END_ALLOW_THREADS;
+	
+	if ( num != 0 ) {
+		/* Parameter Handling */
+		if ( !NIL_P(parameters_tuple) ) {
+			/* Make sure ibm_db.bind_param has been called */
+			/* If the param list is NULL -- ERROR */
+			if ( stmt_res->head_cache_list == NULL ) {
+				bind_params = 1;
+				if ( stmt_res->param_desc == NULL ) {
+					stmt_res->param_desc = ALLOC_N(ibm_db_param_desc, num);
+					stmt_res->param_desc_alloc = stmt_res->param_desc != NULL ? num : 0;
+					stmt_res->num_param_desc = 0;
+				}
+			}
+
+			if (!PyTuple_Check(parameters_tuple)) {
+				PyErr_SetString(PyExc_Exception, "Param is not a tuple");
+				return NULL;
+			}
+
+			numOpts = PyTuple_Size(parameters_tuple);
+	
+			if (numOpts > num) {
+				/* More are passed in -- Warning - Use the max number present */
+				sprintf(error, "%d params bound not matching %d required", 
+						numOpts, num);
+				PyErr_SetString(PyExc_Exception, error);
+				numOpts = stmt_res->num_params;
+			} else if (numOpts < num) {
+				/* If there are less params passed in, than are present 
+				* -- Error 
+				*/
+				sprintf(error, "%d params bound not matching %d required", 
+						numOpts, num);
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+
+			for ( i = 0; i < numOpts; i++) {
+				/* Bind values from the parameters_tuple to params */
+				data = PyTuple_GetItem(parameters_tuple, i);
+
+				/* The 0 denotes that you work only with the current node.
+				* The 4th argument specifies whether the data passed in
+				* has been described. So we need to call SQLDescribeParam
+				* before binding depending on this.
+				*/
+				rc = _python_ibm_db_execute_helper2(stmt_res, data, 0, bind_params);
+				if ( rc == SQL_ERROR) {
+					sprintf(error, "Binding Error: %s", IBM_DB_G(__python_stmt_err_msg));
+					PyErr_SetString(PyExc_Exception, error);
+					return NULL;
+				}
+			}
+		} else {
+			/* No additional params passed in. Use values already bound. */
+			if ( num > stmt_res->num_params ) {
+				/* More parameters than we expected */
+				sprintf(error, "%d params bound not matching %d required", 
+						stmt_res->num_params, num);
+				PyErr_SetString(PyExc_Exception, error);
+			} else if ( num < stmt_res->num_params ) {
+				/* Fewer parameters than we expected */
+				sprintf(error, "%d params bound not matching %d required", 
+						stmt_res->num_params, num);
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
+			
+			/* Param cache node list is empty -- No params bound */
+			if ( stmt_res->head_cache_list == NULL ) {
+				PyErr_SetString(PyExc_Exception, "Parameters not bound");
+				return NULL;
+			} else {
+				/* The 1 denotes that you work with the whole list 
+				 * And bind sequentially 				
+				 */
+				rc = _python_ibm_db_execute_helper2(stmt_res, NULL, 1, 0);
+				if ( rc == SQL_ERROR ) {
+					sprintf(error, "Binding Error 3: %s", IBM_DB_G(__python_stmt_err_msg));
+					PyErr_SetString(PyExc_Exception, error);
+					return NULL;
+				}
+			}
+		}
+	} else {
+		/* No Parameters 
+		 * We just execute the statement. No additional work needed. 
+		 */
+		_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+		start = _python_ibm_db_clock();
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
+		if ( rc != SQL_ERROR ) {
+			_python_ibm_db_exec_row_count(stmt_res);
+		}
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_stats_gil(stmt_res, start);
+		
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			sprintf(error, "Statement Execute Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return NULL;
+		}
+		Py_INCREF(Py_True);
+		return Py_True;
+	}
+		
+	/* Execute Stmt -- All parameters bound */
+	_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+	start = _python_ibm_db_clock();
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
+	if ( rc != SQL_ERROR && rc != SQL_NEED_DATA ) {
+		_python_ibm_db_exec_row_count(stmt_res);
+	}
+	Py_END_ALLOW_THREADS;
+	_python_ibm_db_stats_gil(stmt_res, start);
+	
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_release_param_buffers(stmt_res);
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+		sprintf(error, "Statement Execute Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+		PyErr_SetString(PyExc_Exception, error);
+		return NULL;
+	}
+		
+	if ( rc == SQL_NEED_DATA ) {
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
+		if ( rc != SQL_ERROR && rc != SQL_NEED_DATA ) {
+			_python_ibm_db_exec_row_count(stmt_res);
+		}
+		Py_END_ALLOW_THREADS;
+		while ( rc == SQL_NEED_DATA ) {
+			/* passing data value for a parameter */
+			rc = _python_ibm_db_put_param_data(stmt_res, (param_node*)valuePtr);
+			
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_release_param_buffers(stmt_res);
+				if ( PyErr_Occurred() ) {
+					return NULL;
+				}
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
+						rc, 1, NULL, -1, 1);
+				sprintf(error, "Sending data failed: %s", 
+						IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				return NULL;
+			}
 
-					case SQL_XML:
-						curr->bind_indicator = param_length;
-						paramValuePtr = (SQLPOINTER)curr->uvalue;
-						valueType = SQL_C_WCHAR;
-						break;
-					case SQL_TYPE_TIMESTAMP:
-						valueType = SQL_C_WCHAR;
-						curr->bind_indicator = SQL_NTS;
-						if(curr->uvalue[10] == 'T'){
-							curr->uvalue[10] = ' ';
-						}
-						paramValuePtr = (SQLPOINTER)(curr->uvalue);
-						break;
-					default:
-						valueType = SQL_C_WCHAR;
-						curr->bind_indicator = param_length;
-						paramValuePtr = (SQLPOINTER)(curr->uvalue);
-				}
+			Py_BEGIN_ALLOW_THREADS;
+			rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
+			if ( rc != SQL_ERROR && rc != SQL_NEED_DATA ) {
+				_python_ibm_db_exec_row_count(stmt_res);
+			}
+			Py_END_ALLOW_THREADS;
+		}
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_release_param_buffers(stmt_res);
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			sprintf(error, "Sending data failed: %s", IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return NULL;
+		}
+	}
+	_python_ibm_db_release_param_buffers(stmt_res);
+		
+	/* cleanup dynamic bindings if present */
+	if ( bind_params == 1 ) {
+		/* Free param cache list */
+		curr_ptr = stmt_res->head_cache_list;
+		prev_ptr = stmt_res->head_cache_list;
+			
+		while (curr_ptr != NULL) {
+			curr_ptr = curr_ptr->next;
+			
+			/* Free Values */
+			if ( prev_ptr->svalue) {
+				PyMem_Del(prev_ptr->svalue);
+			}
+			Py_XDECREF(prev_ptr->stream_chunk);
+			Py_XDECREF(prev_ptr->stream);
+			if ( prev_ptr->buffer_view.obj != NULL ) {
+				PyBuffer_Release(&(prev_ptr->buffer_view));
+			}
+			PyMem_Del(prev_ptr);
+			prev_ptr = curr_ptr;
+       		}
+		
+		stmt_res->head_cache_list = NULL;
+		stmt_res->num_params = 0;
+	}
+	
+	if ( rc != SQL_ERROR ) {
+		Py_INCREF(Py_True);
+		return Py_True;
+	}
+	return NULL;
+}
+
+/*!# ibm_db.execute
+ *
+ * ===Description
+ * Py_True/Py_False ibm_db.execute ( IBM_DBStatement stmt [, tuple parameters] )
+ *
+ * ibm_db.execute() executes an SQL statement that was prepared by
+ * ibm_db.prepare().
+ *
+ * If the SQL statement returns a result set, for example, a SELECT statement
+ * or a CALL to a stored procedure that returns one or more result sets, you
+ * can retrieve a row as an tuple/dictionary from the stmt resource using
+ * ibm_db.fetch_assoc(), ibm_db.fetch_both(), or ibm_db.fetch_tuple().
+ * Alternatively, you can use ibm_db.fetch_row() to move the result set pointer
+ * to the next row and fetch a column at a time from that row with
+ * ibm_db.result().
+ *
+ * Refer to ibm_db.prepare() for a brief discussion of the advantages of using
+ * ibm_db.prepare() and ibm_db.execute() rather than ibm_db.exec().
+ *
+ * ===Parameters
+ * ====stmt
+ *
+ *		A prepared statement returned from ibm_db.prepare().
+ *
+ * ====parameters
+ *
+ *		An tuple of input parameters matching any parameter markers contained
+ * in the prepared statement.
+ *
+ * ===Return Values
+ *
+ * Returns Py_True on success or Py_False on failure.
+ */
+static PyObject *ibm_db_execute(PyObject *self, PyObject *args)			
+{
+	PyObject *py_stmt_res = NULL;
+	PyObject *parameters_tuple = NULL;
+	stmt_handle *stmt_res;
+	double start;
+	if (!PyArg_ParseTuple(args, "O|O", &py_stmt_res, &parameters_tuple))
+		return NULL;
+
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
+		}
+		start = _python_ibm_db_clock();
+		return _python_ibm_db_stats_result(stmt_res, ST_EXECUTE, start,
+			_python_ibm_db_execute_helper1(stmt_res, parameters_tuple));
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
+	}
+	
+}
+
+
+/*!# ibm_db.conn_errormsg
+ *
+ * ===Description
+ * string ibm_db.conn_errormsg ( [resource connection] )
+ *
+ * ibm_db.conn_errormsg() returns an error message and SQLCODE value
+ * representing the reason the last database connection attempt failed.
+ * As ibm_db.connect() returns FALSE in the event of a failed connection
+ * attempt, do not pass any parameters to ibm_db.conn_errormsg() to retrieve
+ * the associated error message and SQLCODE value.
+ *
+ * If, however, the connection was successful but becomes invalid over time,
+ * you can pass the connection parameter to retrieve the associated error
+ * message and SQLCODE value for a specific connection.
+ * ===Parameters
+ *
+ * ====connection
+ *		A connection resource associated with a connection that initially
+ * succeeded, but which over time became invalid.
+ *
+ * ===Return Values
+ *
+ * Returns a string containing the error message and SQLCODE value resulting
+ * from a failed connection attempt. If there is no error associated with the
+ * last connection attempt, ibm_db.conn_errormsg() returns an empty string.
+ */
+static PyObject *ibm_db_conn_errormsg(PyObject *self, PyObject *args)
+{
+	conn_handle *conn_res = NULL;
+	PyObject *py_conn_res = NULL;
+	PyObject *retVal = NULL;
+	char* return_str = NULL;	/* This variable is used by 
+					* _python_ibm_db_check_sql_errors to return err 
+					* strings 
+					*/
+
+	if (!PyArg_ParseTuple(args, "|O", &py_conn_res))
+		return NULL;
+
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
+		}
+
+		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
+
+		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
+
+		_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, -1, 0, 
+										  return_str, DB2_ERRMSG, 
+										  conn_res->errormsg_recno_tracker);
+		if(conn_res->errormsg_recno_tracker - conn_res->error_recno_tracker >= 1)
+			 conn_res->error_recno_tracker = conn_res->errormsg_recno_tracker;
+		conn_res->errormsg_recno_tracker++;
+
+		retVal =  StringOBJ_FromASCII(return_str);
+		if(return_str != NULL) {
+			PyMem_Del(return_str);
+			return_str = NULL;
+		}
+		return retVal;
+	} else {
+		return StringOBJ_FromASCII(IBM_DB_G(__python_conn_err_msg));
+	}
+}
 
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num, curr->param_type, valueType, curr->data_type, curr->param_size, curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
-				Py_END_ALLOW_THREADS;
+/*!# ibm_db.stmt_errormsg
+ *
+ * ===Description
+ * string ibm_db.stmt_errormsg ( [resource stmt] )
+ *
+ * Returns a string containing the last SQL statement error message.
+ *
+ * If you do not pass a statement resource as an argument to
+ * ibm_db.stmt_errormsg(), the driver returns the error message associated with
+ * the last attempt to return a statement resource, for example, from
+ * ibm_db.prepare() or ibm_db.exec().
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns a string containing the error message and SQLCODE value for the last
+ * error that occurred issuing an SQL statement.
+ */
+static PyObject *ibm_db_stmt_errormsg(PyObject *self, PyObject *args)
+{
+	stmt_handle *stmt_res = NULL;
+	PyObject *py_stmt_res = NULL;
+	PyObject *retVal = NULL;
+	char* return_str = NULL;	/* This variable is used by 
+					* _python_ibm_db_check_sql_errors to return err 
+					* strings 
+					*/
 
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-				}
-				curr->data_type = valueType;
-			}
-			break;
-		
-		case PYTHON_STRING:
-			{
-				char* tmp;
-				if (PyObject_CheckBuffer(bind_data) && (curr->data_type == SQL_BLOB || curr->data_type == SQL_BINARY
-										 || curr->data_type == SQL_VARBINARY) ) {
-#if  PY_MAJOR_VERSION >= 3
-					Py_buffer tmp_buffer;
-					PyObject_GetBuffer(bind_data, &tmp_buffer, PyBUF_SIMPLE);
-					curr->svalue = tmp_buffer.buf;
-					curr->ivalue = tmp_buffer.len;
-#else
-					PyObject_AsReadBuffer(bind_data, (const void **) &(curr->svalue), &buffer_len);
-					curr->ivalue = buffer_len;
-#endif
-				} else {
-					if(curr->svalue != NULL) {
-						PyMem_Del(curr->svalue);
-						curr->svalue = NULL;
-					}
-					curr->svalue = PyBytes_AsString(bind_data);   /** It is PyString_AsString() in PY_MAJOR_VERSION<3, and code execution will not come here in PY_MAJOR_VERSION>=3 **/
-					curr->ivalue = strlen(curr->svalue);
-				}
-				param_length = curr->ivalue;
-				/*
-				* An extra parameter is given by the client to pick the size of the 
-				* string returned. The string is then truncate past that size.	
-				* If no size is given then use BUFSIZ to return the string.
-				*/
-				if (curr->size != 0) {
-					curr->ivalue = curr->size;
-				}
-	            
-				if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-					if (curr->size == 0) {
-						if (curr->ivalue <= curr->param_size) {
-							curr->ivalue = curr->param_size + 1;
-						}
-					}
-				}
-				tmp = ALLOC_N(char, curr->ivalue+1);
-				curr->svalue = memcpy(tmp, curr->svalue, param_length);
-				curr->svalue[param_length] = '\0';
-	
-				switch ( curr->data_type ) {
-					case SQL_CLOB:
-					case SQL_DBCLOB:
-						if (curr->param_type == SQL_PARAM_OUTPUT || 
-							curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->bind_indicator = param_length;
-							paramValuePtr = (SQLPOINTER)curr->svalue;
-						} else {
-							curr->bind_indicator = SQL_DATA_AT_EXEC;
-							/* The correct dataPtr will be set during SQLPutData with 
-							* the len from this struct 
-							*/
-#ifndef PASE
-							paramValuePtr = (SQLPOINTER)(curr);
-#else
-							paramValuePtr = (SQLPOINTER)&(curr);
-#endif
-						}
-						valueType = SQL_C_CHAR;
-						break;
+	if (!PyArg_ParseTuple(args, "|O", &py_stmt_res))
+		return NULL;
 
-					case SQL_BLOB:
-						if (curr->param_type == SQL_PARAM_OUTPUT || 
-							curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->ivalue = curr->ivalue -1;
-							curr->bind_indicator = param_length;
-							paramValuePtr = (SQLPOINTER)curr;
-						} else {
-							curr->bind_indicator = SQL_DATA_AT_EXEC;
-#ifndef PASE
-							paramValuePtr = (SQLPOINTER)(curr);
-#else
-							paramValuePtr = (SQLPOINTER)&(curr);
-#endif
-						}
-						valueType = SQL_C_BINARY;
-						break;
-	
-					case SQL_BINARY:
-#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
-					case SQL_LONGVARBINARY:
-#endif /* PASE */
-					case SQL_VARBINARY:
-					case SQL_XML:
-						/* account for bin_mode settings as well */
-						curr->bind_indicator = curr->ivalue;
-						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->ivalue = curr->ivalue - 1;
-							curr->bind_indicator = param_length;
-						}
-						
-						valueType = SQL_C_BINARY;
-						paramValuePtr = (SQLPOINTER)curr->svalue;
-						break;
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
+		}
+		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
 
-						/* This option should handle most other types such as DATE, 
-						* VARCHAR etc 
-						*/
-					case SQL_TYPE_TIMESTAMP:
-						valueType = SQL_C_CHAR;
-						curr->bind_indicator = curr->ivalue;
-						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->bind_indicator = SQL_NTS;
-						}
-						if(curr->svalue[10] == 'T'){
-							curr->svalue[10] = ' ';
-						}
-						paramValuePtr = (SQLPOINTER)(curr->svalue);
-						break;
-					default:
-						valueType = SQL_C_CHAR;
-						curr->bind_indicator = curr->ivalue;
-						if (curr->param_type == SQL_PARAM_OUTPUT || curr->param_type == SQL_PARAM_INPUT_OUTPUT) {
-							curr->bind_indicator = SQL_NTS;
-						}
-						paramValuePtr = (SQLPOINTER)(curr->svalue);
-				}
+		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
 
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-					curr->param_type, valueType, curr->data_type, curr->param_size,
-					curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
-				Py_END_ALLOW_THREADS;
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 0, 
+										return_str, DB2_ERRMSG, 
+										stmt_res->errormsg_recno_tracker);
+		if(stmt_res->errormsg_recno_tracker - stmt_res->error_recno_tracker >= 1)
+			stmt_res->error_recno_tracker = stmt_res->errormsg_recno_tracker;
+		stmt_res->errormsg_recno_tracker++;
 
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-				}
-				curr->data_type = valueType;
-			}
-			break;
+		retVal = StringOBJ_FromASCII(return_str);
+		if(return_str != NULL) {
+			PyMem_Del(return_str);
+			return_str = NULL;
+		}
+		return retVal;
+	} else {
+		return StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_msg));
+	}
+}
 
-		case PYTHON_DECIMAL:
-			if (curr->data_type == SQL_DECIMAL || curr->data_type == SQL_DECFLOAT) {
-				PyObject *tempobj = NULL;
-#if  PY_MAJOR_VERSION >= 3
-			        PyObject *tempobj2 = NULL;
-#endif
-				if(curr->svalue != NULL) {
-					PyMem_Del(curr->svalue);
-					curr->svalue = NULL;
-				}
-				tempobj = PyObject_Str(bind_data);
-#if PY_MAJOR_VERSION >= 3
-				tempobj2 = PyUnicode_AsASCIIString(tempobj);
-				Py_XDECREF(tempobj);
-				tempobj = tempobj2;
-#endif
-				curr->svalue = PyBytes_AsString(tempobj);
-				curr->ivalue = strlen(curr->svalue);
-				curr->svalue = estrdup(curr->svalue);
-				curr->svalue[curr->ivalue] = '\0'; 
-				valueType = SQL_C_CHAR;
-				paramValuePtr = (SQLPOINTER)(curr->svalue);
-				curr->bind_indicator = curr->ivalue;
+/*!# ibm_db.conn_error
+ * ===Description
+ * string ibm_db.conn_error ( [resource connection] )
+ *
+ * ibm_db.conn_error() returns an SQLSTATE value representing the reason the
+ * last attempt to connect to a database failed. As ibm_db.connect() returns
+ * FALSE in the event of a failed connection attempt, you do not pass any
+ * parameters to ibm_db.conn_error() to retrieve the SQLSTATE value.
+ *
+ * If, however, the connection was successful but becomes invalid over time, you
+ * can pass the connection parameter to retrieve the SQLSTATE value for a
+ * specific connection.
+ *
+ * To learn what the SQLSTATE value means, you can issue the following command
+ * at a DB2 Command Line Processor prompt: db2 '? sqlstate-value'. You can also
+ * call ibm_db.conn_errormsg() to retrieve an explicit error message and the
+ * associated SQLCODE value.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *		A connection resource associated with a connection that initially
+ * succeeded, but which over time became invalid.
+ *
+ * ===Return Values
+ *
+ * Returns the SQLSTATE value resulting from a failed connection attempt.
+ * Returns an empty string if there is no error associated with the last
+ * connection attempt.
+ */
+static PyObject *ibm_db_conn_error(PyObject *self, PyObject *args)			
+{
+	conn_handle *conn_res = NULL;
+	PyObject *py_conn_res = NULL;
+	PyObject *retVal = NULL;
+	char *return_str = NULL; /* This variable is used by 
+							 * _python_ibm_db_check_sql_errors to return err 
+							 * strings */
 
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLBindParameter(stmt_res->hstmt, curr->param_num, curr->param_type, valueType, curr->data_type, curr->param_size, curr->scale, paramValuePtr, curr->ivalue, &(curr->bind_indicator));
-				Py_END_ALLOW_THREADS;
+	if (!PyArg_ParseTuple(args, "|O", &py_conn_res))
+		return NULL;
 
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,rc, 1, NULL, -1, 1);
-				}
-				curr->data_type = valueType;
-				Py_XDECREF(tempobj);
-				break;
-			}
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+		return_str = ALLOC_N(char, SQL_SQLSTATE_SIZE + 1);
 
+		memset(return_str, 0, SQL_SQLSTATE_SIZE + 1);
 
-		case PYTHON_DATE:
-			curr->date_value = ALLOC(DATE_STRUCT);
-			curr->date_value->year = PyDateTime_GET_YEAR(bind_data);
-			curr->date_value->month = PyDateTime_GET_MONTH(bind_data);
-			curr->date_value->day = PyDateTime_GET_DAY(bind_data);
+		_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, -1, 0, 
+										return_str, DB2_ERR, 
+										conn_res->error_recno_tracker);
+		if (conn_res->error_recno_tracker-conn_res->errormsg_recno_tracker >= 1) {
+			conn_res->errormsg_recno_tracker = conn_res->error_recno_tracker;
+		}
+		conn_res->error_recno_tracker++;
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-				curr->param_type, SQL_C_TYPE_DATE, curr->data_type, curr->param_size,
-				curr->scale, curr->date_value, curr->ivalue, &(curr->bind_indicator));
-			Py_END_ALLOW_THREADS;
-			break;
+		retVal = StringOBJ_FromASCII(return_str);
+		if(return_str != NULL) {
+			PyMem_Del(return_str);
+			return_str = NULL;
+		}
+		return retVal;
+	} else {
+		return StringOBJ_FromASCII(IBM_DB_G(__python_conn_err_state));
+	}
+}
 
-		case PYTHON_TIME:
-			curr->time_value = ALLOC(TIME_STRUCT);
-			curr->time_value->hour = PyDateTime_TIME_GET_HOUR(bind_data);
-			curr->time_value->minute = PyDateTime_TIME_GET_MINUTE(bind_data);
-			curr->time_value->second = PyDateTime_TIME_GET_SECOND(bind_data);
+/*!# ibm_db.stmt_error
+ *
+ * ===Description
+ * string ibm_db.stmt_error ( [resource stmt] )
+ *
+ * Returns a string containing the SQLSTATE value returned by an SQL statement.
+ *
+ * If you do not pass a statement resource as an argument to
+ * ibm_db.stmt_error(), the driver returns the SQLSTATE value associated with
+ * the last attempt to return a statement resource, for example, from
+ * ibm_db.prepare() or ibm_db.exec().
+ *
+ * To learn what the SQLSTATE value means, you can issue the following command
+ * at a DB2 Command Line Processor prompt: db2 '? sqlstate-value'. You can also
+ * call ibm_db.stmt_errormsg() to retrieve an explicit error message and the
+ * associated SQLCODE value.
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns a string containing an SQLSTATE value.
+ */
+static PyObject *ibm_db_stmt_error(PyObject *self, PyObject *args)
+{
+	stmt_handle *stmt_res = NULL;
+	PyObject *py_stmt_res = NULL;
+	PyObject *retVal = NULL;
+	char* return_str = NULL; /* This variable is used by 
+							 * _python_ibm_db_check_sql_errors to return err 
+							 * strings 
+							 */
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-				curr->param_type, SQL_C_TYPE_TIME, curr->data_type, curr->param_size,
-				curr->scale, curr->time_value, curr->ivalue, &(curr->bind_indicator));
-			Py_END_ALLOW_THREADS;
-			break;
+	if (!PyArg_ParseTuple(args, "|O", &py_stmt_res))
+		return NULL;
 
-		case PYTHON_TIMESTAMP:
-			curr->ts_value = ALLOC(TIMESTAMP_STRUCT);
-			curr->ts_value->year = PyDateTime_GET_YEAR(bind_data);
-			curr->ts_value->month = PyDateTime_GET_MONTH(bind_data);
-			curr->ts_value->day = PyDateTime_GET_DAY(bind_data);
-			curr->ts_value->hour = PyDateTime_DATE_GET_HOUR(bind_data);
-			curr->ts_value->minute = PyDateTime_DATE_GET_MINUTE(bind_data);
-			curr->ts_value->second = PyDateTime_DATE_GET_SECOND(bind_data);
-			curr->ts_value->fraction = PyDateTime_DATE_GET_MICROSECOND(bind_data) * 1000;
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
+		}
+		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-				curr->param_type, SQL_C_TYPE_TIMESTAMP, curr->data_type, curr->param_size,
-				curr->scale, curr->ts_value, curr->ivalue, &(curr->bind_indicator));
-			Py_END_ALLOW_THREADS;
-			break;
+		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
 
-		case PYTHON_NIL:
-			curr->ivalue = SQL_NULL_DATA;
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 0, 
+										return_str, DB2_ERR, 
+										stmt_res->error_recno_tracker);
 
-			Py_BEGIN_ALLOW_THREADS;
-			rc = SQLBindParameter(stmt_res->hstmt, curr->param_num,
-				curr->param_type, SQL_C_DEFAULT, curr->data_type, curr->param_size,
-				curr->scale, &curr->ivalue, 0, (SQLLEN *)&(curr->ivalue));
-			Py_END_ALLOW_THREADS;
+		if (stmt_res->error_recno_tracker-stmt_res->errormsg_recno_tracker >= 1) {
+			stmt_res->errormsg_recno_tracker = stmt_res->error_recno_tracker;
+		}
+		stmt_res->error_recno_tracker++;
 
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-											rc, 1, NULL, -1, 1);
-			}
-			break;
-			
-		default:
-			return SQL_ERROR;
+		retVal = StringOBJ_FromASCII(return_str);
+		if(return_str != NULL) {
+			PyMem_Del(return_str);
+			return_str = NULL;
+		}
+		return retVal;
+	} else {
+		return StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_state));
 	}
-	return rc;
 }
 
-/* static int _python_ibm_db_execute_helper2(stmt_res, data, int bind_cmp_list)
-	*/
-static int _python_ibm_db_execute_helper2(stmt_handle *stmt_res, PyObject *data, int bind_cmp_list, int bind_params)
+/*	static PyObject *_python_ibm_db_last_error_helper(PyObject *args, int API)
+*/
+static PyObject *_python_ibm_db_last_error_helper(PyObject *args, int API)
 {
-	int rc = SQL_SUCCESS;
-	param_node *curr = NULL;	/* To traverse the list */
-	PyObject *bind_data;		 /* Data value from symbol table */
-	char error[DB2_MAX_ERR_MSG_LEN];
-
-	/* Used in call to SQLDescribeParam if needed */
-	SQLSMALLINT param_no;
-	SQLSMALLINT data_type;
-	SQLUINTEGER precision;
-	SQLSMALLINT scale;
-	SQLSMALLINT nullable;
-
-	/* This variable means that we bind the complete list of params cached */
-	/* The values used are fetched from the active symbol table */
-	/* TODO: Enhance this part to check for stmt_res->file_param */
-	/* If this flag is set, then use SQLBindParam, else use SQLExtendedBind */
-	if ( bind_cmp_list ) {
-		/* Bind the complete list sequentially */
-		/* Used when no parameters array is passed in */
-		curr = stmt_res->head_cache_list;
-
-		while (curr != NULL ) {
-			/* Fetch data from symbol table */
-			if (curr->param_type == PARAM_FILE)
-				bind_data = curr->var_pyvalue;
-			else {
-				bind_data = curr->var_pyvalue;
-			}
-			if (bind_data == NULL)
-				return -1;
-				
-			rc = _python_ibm_db_bind_data( stmt_res, curr, bind_data);
-			if ( rc == SQL_ERROR ) {
-				sprintf(error, "Binding Error 1: %s", 
-						IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return rc;
-			}
-			curr = curr->next;
-		}
-		return 0;
-	} else {
-		/* Bind only the data value passed in to the Current Node */
-		if ( data != NULL ) {
-			if ( bind_params ) {
-				/* This condition applies if the parameter has not been
-				* bound using ibm_db.bind_param. Need to describe the
-				* parameter and then bind it.
-				*/
-				param_no = ++stmt_res->num_params;
-
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, param_no,
-					(SQLSMALLINT*)&data_type, &precision, (SQLSMALLINT*)&scale,
-					(SQLSMALLINT*)&nullable);
-				Py_END_ALLOW_THREADS;
+	PyObject *py_handle = NULL;
+	conn_handle *conn_res = NULL;
+	stmt_handle *stmt_res = NULL;
 
-				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
-												rc, 1, NULL, -1, 1);
-					sprintf(error, "Describe Param Failed: %s", 
-							IBM_DB_G(__python_stmt_err_msg));
-					PyErr_SetString(PyExc_Exception, error);
-					return rc;
-				}
+	if (!PyArg_ParseTuple(args, "O", &py_handle))
+		return NULL;
 
-				curr = build_list(stmt_res, param_no, data_type, precision, 
-							  scale, nullable);
-				rc = _python_ibm_db_bind_data( stmt_res, curr, data);
-				if ( rc == SQL_ERROR ) {
-					sprintf(error, "Binding Error 2: %s", 
-							IBM_DB_G(__python_stmt_err_msg));
-					PyErr_SetString(PyExc_Exception, error);
-					return rc;
-				}
-			} else {
-				/* This is always at least the head_cache_node -- assigned in
-				* ibm_db.execute(), if params have been bound.
-				*/
-				curr = stmt_res->current_node;
-				if ( curr != NULL ) {
-					rc = _python_ibm_db_bind_data( stmt_res, curr, data);
-					if ( rc == SQL_ERROR ) {
-						sprintf(error, "Binding Error 2: %s", 
-							IBM_DB_G(__python_stmt_err_msg));
-						PyErr_SetString(PyExc_Exception, error);
-						return rc;
-					}
-					stmt_res->current_node = curr->next;
-				}
-			}
-			return rc;
-		}
+	if (PyObject_TypeCheck(py_handle, &conn_handleType)) {
+		conn_res = (conn_handle *)py_handle;
+		return StringOBJ_FromASCII(API == DB2_ERR ? conn_res->err_state : conn_res->err_msg);
+	} else if (PyObject_TypeCheck(py_handle, &stmt_handleType)) {
+		stmt_res = (stmt_handle *)py_handle;
+		return StringOBJ_FromASCII(API == DB2_ERR ? stmt_res->err_state : stmt_res->err_msg);
 	}
-	return rc;
+	PyErr_SetString(PyExc_Exception, "Connection or statement handle must be passed in.");
+	return NULL;
+}
+
+/*!# ibm_db.last_error
+ *
+ * ===Description
+ * string ibm_db.last_error ( resource handle )
+ *
+ * Returns the SQLSTATE of the last error raised on a connection or statement.
+ *
+ * Unlike ibm_db.conn_error() and ibm_db.stmt_error() called without a
+ * resource, the value is kept on the handle itself, so it is not affected by
+ * errors raised on other handles or in other threads.
+ *
+ * ===Parameters
+ *
+ * ====handle
+ *		A valid connection or statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns a string containing an SQLSTATE value, or an empty string if no
+ * error was raised on the handle.
+ */
+static PyObject *ibm_db_last_error(PyObject *self, PyObject *args)
+{
+	return _python_ibm_db_last_error_helper(args, DB2_ERR);
 }
 
-/*
- * static PyObject *_python_ibm_db_execute_helper1(stmt_handle *stmt_res, PyObject *parameters_tuple)
+/*!# ibm_db.last_errormsg
  *
- */ 
-static PyObject *_python_ibm_db_execute_helper1(stmt_handle *stmt_res, PyObject *parameters_tuple)
+ * ===Description
+ * string ibm_db.last_errormsg ( resource handle )
+ *
+ * Returns the error message and SQLCODE of the last error raised on a
+ * connection or statement. The message is kept on the handle itself, see
+ * ibm_db.last_error().
+ *
+ * ===Parameters
+ *
+ * ====handle
+ *		A valid connection or statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns a string containing the error message and SQLCODE value, or an
+ * empty string if no error was raised on the handle.
+ */
+static PyObject *ibm_db_last_errormsg(PyObject *self, PyObject *args)
 {
-	int rc, numOpts, i, bind_params = 0;
-	SQLSMALLINT num;
-	SQLPOINTER valuePtr;
-	PyObject *data;
-	char error[DB2_MAX_ERR_MSG_LEN];
-	/* This is used to loop over the param cache */
-	param_node *prev_ptr, *curr_ptr;
-	/* Free any cursors that might have been allocated in a previous call to 
-	* SQLExecute 
-	*/
-	Py_BEGIN_ALLOW_THREADS;
-	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
-	Py_END_ALLOW_THREADS;
-
-	/* This ensures that each call to ibm_db.execute start from scratch */
-	stmt_res->current_node = stmt_res->head_cache_list;
-	
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLNumParams((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT*)&num);
-	Py_END_ALLOW_THREADS;
-	
-	if ( num != 0 ) {
-		/* Parameter Handling */
-		if ( !NIL_P(parameters_tuple) ) {
-			/* Make sure ibm_db.bind_param has been called */
-			/* If the param list is NULL -- ERROR */
-			if ( stmt_res->head_cache_list == NULL ) {
-				bind_params = 1;
-			}
-
-			if (!PyTuple_Check(parameters_tuple)) {
-				PyErr_SetString(PyExc_Exception, "Param is not a tuple");
-				return NULL;
-			}
+	return _python_ibm_db_last_error_helper(args, DB2_ERRMSG);
+}
 
-			numOpts = PyTuple_Size(parameters_tuple);
-	
-			if (numOpts > num) {
-				/* More are passed in -- Warning - Use the max number present */
-				sprintf(error, "%d params bound not matching %d required", 
-						numOpts, num);
-				PyErr_SetString(PyExc_Exception, error);
-				numOpts = stmt_res->num_params;
-			} else if (numOpts < num) {
-				/* If there are less params passed in, than are present 
-				* -- Error 
-				*/
-				sprintf(error, "%d params bound not matching %d required", 
-						numOpts, num);
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
+/*!# ibm_db.next_result
+ *
+ * ===Description
+ * resource ibm_db.next_result ( resource stmt )
+ *
+ * Requests the next result set from a stored procedure.
+ *
+ * A stored procedure can return zero or more result sets. While you handle the
+ * first result set in exactly the same way you would handle the results
+ * returned by a simple SELECT statement, to fetch the second and subsequent
+ * result sets from a stored procedure you must call the ibm_db.next_result()
+ * function and return the result to a uniquely named Python variable.
+ *
+ * ===Parameters
+ * ====stmt
+ *		A prepared statement returned from ibm_db.exec() or ibm_db.execute().
+ *
+ * ===Return Values
+ *
+ * Returns a new statement resource containing the next result set if the stored
+ * procedure returned another result set. Returns FALSE if the stored procedure
+ * did not return another result set.
+ */
+static PyObject *ibm_db_next_result(PyObject *self, PyObject *args)			
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res, *new_stmt_res = NULL;
+	int rc = 0;
+	SQLHANDLE new_hstmt;
 
-			for ( i = 0; i < numOpts; i++) {
-				/* Bind values from the parameters_tuple to params */
-				data = PyTuple_GetItem(parameters_tuple, i);
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+		return NULL;
 
-				/* The 0 denotes that you work only with the current node.
-				* The 4th argument specifies whether the data passed in
-				* has been described. So we need to call SQLDescribeParam
-				* before binding depending on this.
-				*/
-				rc = _python_ibm_db_execute_helper2(stmt_res, data, 0, bind_params);
-				if ( rc == SQL_ERROR) {
-					sprintf(error, "Binding Error: %s", IBM_DB_G(__python_stmt_err_msg));
-					PyErr_SetString(PyExc_Exception, error);
-					return NULL;
-				}
-			}
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
 		} else {
-			/* No additional params passed in. Use values already bound. */
-			if ( num > stmt_res->num_params ) {
-				/* More parameters than we expected */
-				sprintf(error, "%d params bound not matching %d required", 
-						stmt_res->num_params, num);
-				PyErr_SetString(PyExc_Exception, error);
-			} else if ( num < stmt_res->num_params ) {
-				/* Fewer parameters than we expected */
-				sprintf(error, "%d params bound not matching %d required", 
-						stmt_res->num_params, num);
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
-			
-			/* Param cache node list is empty -- No params bound */
-			if ( stmt_res->head_cache_list == NULL ) {
-				PyErr_SetString(PyExc_Exception, "Parameters not bound");
-				return NULL;
-			} else {
-				/* The 1 denotes that you work with the whole list 
-				 * And bind sequentially 				
-				 */
-				rc = _python_ibm_db_execute_helper2(stmt_res, NULL, 1, 0);
-				if ( rc == SQL_ERROR ) {
-					sprintf(error, "Binding Error 3: %s", IBM_DB_G(__python_stmt_err_msg));
-					PyErr_SetString(PyExc_Exception, error);
-					return NULL;
-				}
-			}
+			stmt_res = (stmt_handle *)py_stmt_res;
 		}
-	} else {
-		/* No Parameters 
-		 * We just execute the statement. No additional work needed. 
-		 */
+		_python_ibm_db_clear_stmt_err_cache();
+		_python_ibm_db_clear_handle_error(NULL, stmt_res);
+
+		/* alloc handle and return only if it errors */
+		rc = SQLAllocHandle(SQL_HANDLE_STMT, stmt_res->hdbc, &new_hstmt);
+		if ( rc < SQL_SUCCESS ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+											NULL, -1, 1);
+			Py_INCREF(Py_False);
+			return Py_False;
+		}
+
 		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
+		rc = SQLNextResult((SQLHSTMT)stmt_res->hstmt, (SQLHSTMT)new_hstmt);
 		Py_END_ALLOW_THREADS;
 		
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-			sprintf(error, "Statement Execute Failed: %s", IBM_DB_G(__python_stmt_err_msg));
-			PyErr_SetString(PyExc_Exception, error);
-			return NULL;
+		if( rc != SQL_SUCCESS ) {
+			if(rc < SQL_SUCCESS) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
+												rc, 1, NULL, -1, 1);
+			}
+			SQLFreeHandle(SQL_HANDLE_STMT, new_hstmt);
+			Py_INCREF(Py_False);
+			return Py_False;
 		}
-		Py_INCREF(Py_True);
-		return Py_True;
-	}
-		
-	/* Execute Stmt -- All parameters bound */
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
-	Py_END_ALLOW_THREADS;
-	
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-		sprintf(error, "Statement Execute Failed: %s", IBM_DB_G(__python_stmt_err_msg));
-		PyErr_SetString(PyExc_Exception, error);
+
+		/* Initialize stmt resource members with default values. */
+		/* Parsing will update options if needed */
+		new_stmt_res = PyObject_NEW(stmt_handle, &stmt_handleType);
+		new_stmt_res->s_bin_mode = stmt_res->s_bin_mode;
+		new_stmt_res->cursor_type = stmt_res->cursor_type;
+		new_stmt_res->s_case_mode = stmt_res->s_case_mode;
+		new_stmt_res->s_char_mode = stmt_res->s_char_mode;
+		new_stmt_res->owner_pid = stmt_res->owner_pid;
+		new_stmt_res->query_timeout = 0;
+		new_stmt_res->fetch_buffer_size = stmt_res->fetch_buffer_size;
+		memset(new_stmt_res->round_trips, 0, sizeof(new_stmt_res->round_trips));
+		memset(&new_stmt_res->stats, 0, sizeof(new_stmt_res->stats));
+		new_stmt_res->prepare_pending = 0;
+		new_stmt_res->params_described = 0;
+		new_stmt_res->attrs_set = 0;
+		new_stmt_res->sizes_declared = 0;
+		new_stmt_res->exec_row_count = 0;
+		new_stmt_res->row_gen = 0;
+		Py_XINCREF(stmt_res->conn_res);
+		new_stmt_res->conn_res = stmt_res->conn_res;
+		new_stmt_res->head_cache_list = NULL;
+		new_stmt_res->current_node = NULL;
+		new_stmt_res->num_params = 0;
+		new_stmt_res->file_param = 0;
+		new_stmt_res->column_info = NULL;
+		new_stmt_res->num_columns = 0;
+		new_stmt_res->row_data = NULL;
+		new_stmt_res->rowset = NULL;
+		new_stmt_res->rowset_alloc = 0;
+		new_stmt_res->rowset_size = 1;
+		new_stmt_res->rows_fetched = 0;
+		new_stmt_res->array_row_cnt = -1;
+		new_stmt_res->row_names = NULL;
+		new_stmt_res->row_names_case = CASE_NATURAL;
+		new_stmt_res->cache_key = NULL;
+		new_stmt_res->cache_conn = NULL;
+		new_stmt_res->cache_tick = 0;
+		new_stmt_res->cache_gen = 0;
+		new_stmt_res->param_desc = NULL;
+		new_stmt_res->num_param_desc = 0;
+		new_stmt_res->param_desc_alloc = 0;
+		new_stmt_res->output_size = stmt_res->output_size;
+		Py_XINCREF(stmt_res->output_sizes);
+		new_stmt_res->output_sizes = stmt_res->output_sizes;
+		new_stmt_res->overflow = NULL;
+		new_stmt_res->overflow_size = 0;
+		new_stmt_res->hstmt = new_hstmt;
+		new_stmt_res->hdbc = stmt_res->hdbc;
+		new_stmt_res->err_state[0] = '\0';
+		new_stmt_res->err_msg[0] = '\0';
+		_python_ibm_db_register_handle(new_hstmt, (PyObject *)new_stmt_res);
+
+		return (PyObject *)new_stmt_res;		
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
 		return NULL;
 	}
-		
-	if ( rc == SQL_NEED_DATA ) {
-		rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
-		while ( rc == SQL_NEED_DATA ) {
-			/* passing data value for a parameter */
-			if ( !NIL_P(((param_node*)valuePtr)->svalue)) {
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)(((param_node*)valuePtr)->svalue), ((param_node*)valuePtr)->ivalue);
-				Py_END_ALLOW_THREADS;
-			} else {
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)(((param_node*)valuePtr)->uvalue), ((param_node*)valuePtr)->ivalue);
-				Py_END_ALLOW_THREADS;
-			}
-			
-			if ( rc == SQL_ERROR ) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
-						rc, 1, NULL, -1, 1);
-				sprintf(error, "Sending data failed: %s", 
-						IBM_DB_G(__python_stmt_err_msg));
-				PyErr_SetString(PyExc_Exception, error);
-				return NULL;
-			}
+}
+
+/*!# ibm_db.num_fields
+ *
+ * ===Description
+ * int ibm_db.num_fields ( resource stmt )
+ *
+ * Returns the number of fields contained in a result set. This is most useful
+ * for handling the result sets returned by dynamically generated queries, or
+ * for result sets returned by stored procedures, where your application cannot
+ * otherwise know how to retrieve and use the results.
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid statement resource containing a result set.
+ *
+ * ===Return Values
+ *
+ * Returns an integer value representing the number of fields in the result set
+ * associated with the specified statement resource. Returns FALSE if the
+ * statement resource is not a valid input value.
+ */
+static PyObject *ibm_db_num_fields(PyObject *self, PyObject *args)			
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res;
+	int rc = 0;
+	SQLSMALLINT indx = 0;
+	char error[DB2_MAX_ERR_MSG_LEN];
 
-			rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+		return NULL;
+
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+			return NULL;
+		} else {
+			stmt_res = (stmt_handle *)py_stmt_res;
 		}
 
+		/* Known once the result set has been described */
+		if ( stmt_res->column_info != NULL ) {
+			return PyInt_FromLong(stmt_res->num_columns);
+		}
+		_python_ibm_db_count_request(stmt_res, RT_DESCRIBE);
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLNumResultCols((SQLHSTMT)stmt_res->hstmt, &indx);
+		Py_END_ALLOW_THREADS;
+		
 		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-			sprintf(error, "Sending data failed: %s", IBM_DB_G(__python_stmt_err_msg));
-			PyErr_SetString(PyExc_Exception, error);
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+											1, NULL, -1, 1);
+			sprintf(error, "SQLNumResultCols failed: %s", 
+					IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);	
 			return NULL;
 		}
+		return PyInt_FromLong(indx);
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
 	}
-		
-	/* cleanup dynamic bindings if present */
-	if ( bind_params == 1 ) {
-		/* Free param cache list */
-		curr_ptr = stmt_res->head_cache_list;
-		prev_ptr = stmt_res->head_cache_list;
-			
-		while (curr_ptr != NULL) {
-			curr_ptr = curr_ptr->next;
-			
-			/* Free Values */
-			if ( prev_ptr->svalue) {
-				PyMem_Del(prev_ptr->svalue);
-			}
-			PyMem_Del(prev_ptr);
-			prev_ptr = curr_ptr;
-       		}
-		
-		stmt_res->head_cache_list = NULL;
-		stmt_res->num_params = 0;
-	}
-	
-	if ( rc != SQL_ERROR ) {
-		Py_INCREF(Py_True);
-		return Py_True;
-	}
-	return NULL;
+	Py_INCREF(Py_False);
+	return Py_False;
 }
 
-/*!# ibm_db.execute
+/*!# ibm_db.num_rows
  *
  * ===Description
- * Py_True/Py_False ibm_db.execute ( IBM_DBStatement stmt [, tuple parameters] )
+ * int ibm_db.num_rows ( resource stmt )
  *
- * ibm_db.execute() executes an SQL statement that was prepared by
- * ibm_db.prepare().
+ * Returns the number of rows deleted, inserted, or updated by an SQL statement.
  *
- * If the SQL statement returns a result set, for example, a SELECT statement
- * or a CALL to a stored procedure that returns one or more result sets, you
- * can retrieve a row as an tuple/dictionary from the stmt resource using
- * ibm_db.fetch_assoc(), ibm_db.fetch_both(), or ibm_db.fetch_tuple().
- * Alternatively, you can use ibm_db.fetch_row() to move the result set pointer
- * to the next row and fetch a column at a time from that row with
- * ibm_db.result().
+ * To determine the number of rows that will be returned by a SELECT statement,
+ * issue SELECT COUNT(*) with the same predicates as your intended SELECT
+ * statement and retrieve the value. If your application logic checks the number
+ * of rows returned by a SELECT statement and branches if the number of rows is
+ * 0, consider modifying your application to attempt to return the first row
+ * with one of ibm_db.fetch_assoc(), ibm_db.fetch_both(), ibm_db.fetch_array(),
+ * or ibm_db.fetch_row(), and branch if the fetch function returns FALSE.
  *
- * Refer to ibm_db.prepare() for a brief discussion of the advantages of using
- * ibm_db.prepare() and ibm_db.execute() rather than ibm_db.exec().
+ * Note: If you issue a SELECT statement using a scrollable cursor,
+ * ibm_db.num_rows() returns the number of rows returned by the SELECT
+ * statement. However, the overhead associated with scrollable cursors
+ * significantly degrades the performance of your application, so if this is the
+ * only reason you are considering using scrollable cursors, you should use a
+ * forward-only cursor and either call SELECT COUNT(*) or rely on the boolean
+ * return value of the fetch functions to achieve the equivalent functionality
+ * with much better performance.
  *
  * ===Parameters
- * ====stmt
- *
- *		A prepared statement returned from ibm_db.prepare().
- *
- * ====parameters
  *
- *		An tuple of input parameters matching any parameter markers contained
- * in the prepared statement.
+ * ====stmt
+ *		A valid stmt resource containing a result set.
  *
  * ===Return Values
  *
- * Returns Py_True on success or Py_False on failure.
+ * Returns the number of rows affected by the last SQL statement issued by the
+ * specified statement handle.
  */
-static PyObject *ibm_db_execute(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_num_rows(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	PyObject *parameters_tuple = NULL;
 	stmt_handle *stmt_res;
-	if (!PyArg_ParseTuple(args, "O|O", &py_stmt_res, &parameters_tuple))
+	int rc = 0;
+	SQLINTEGER count = 0;
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
 		return NULL;
 
 	if (!NIL_P(py_stmt_res)) {
@@ -6002,640 +9199,714 @@ static PyObject *ibm_db_execute(PyObject *self, PyObject *args)
 		} else {
 			stmt_res = (stmt_handle *)py_stmt_res;
 		}
-		return _python_ibm_db_execute_helper1(stmt_res, parameters_tuple);
+		if ( stmt_res->array_row_cnt >= 0 ) {
+			return PyInt_FromLong(stmt_res->array_row_cnt);
+		}
+
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLRowCount((SQLHSTMT)stmt_res->hstmt, &count);
+		Py_END_ALLOW_THREADS;
+		
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+											1, NULL, -1, 1);
+			sprintf(error, "SQLRowCount failed: %s", 
+					IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return NULL;
+		}
+		return PyInt_FromLong(count);
 	} else {
 		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
 		return NULL;
 	}
-	
+	Py_INCREF(Py_False);
+	return Py_False;
 }
 
-
-/*!# ibm_db.conn_errormsg
+/*!# ibm_db.get_num_result 
  *
  * ===Description
- * string ibm_db.conn_errormsg ( [resource connection] )
+ * int ibm_db.num_rows ( resource stmt )
  *
- * ibm_db.conn_errormsg() returns an error message and SQLCODE value
- * representing the reason the last database connection attempt failed.
- * As ibm_db.connect() returns FALSE in the event of a failed connection
- * attempt, do not pass any parameters to ibm_db.conn_errormsg() to retrieve
- * the associated error message and SQLCODE value.
+ * Returns the number of rows in a current open non-dynamic scrollable cursor.
  *
- * If, however, the connection was successful but becomes invalid over time,
- * you can pass the connection parameter to retrieve the associated error
- * message and SQLCODE value for a specific connection.
  * ===Parameters
  *
- * ====connection
- *		A connection resource associated with a connection that initially
- * succeeded, but which over time became invalid.
+ * ====stmt
+ *		A valid stmt resource containing a result set.
  *
  * ===Return Values
  *
- * Returns a string containing the error message and SQLCODE value resulting
- * from a failed connection attempt. If there is no error associated with the
- * last connection attempt, ibm_db.conn_errormsg() returns an empty string.
+ * True on success or False on failure.
  */
-static PyObject *ibm_db_conn_errormsg(PyObject *self, PyObject *args)
+static PyObject *ibm_db_get_num_result(PyObject *self, PyObject *args)
 {
-	conn_handle *conn_res = NULL;
-	PyObject *py_conn_res = NULL;
-	PyObject *retVal = NULL;
-	char* return_str = NULL;	/* This variable is used by 
-					* _python_ibm_db_check_sql_errors to return err 
-					* strings 
-					*/
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res;
+	int rc = 0;
+	SQLINTEGER count = 0;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	SQLSMALLINT strLenPtr;
 
-	if (!PyArg_ParseTuple(args, "|O", &py_conn_res))
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
 		return NULL;
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+	if (!NIL_P(py_stmt_res)) {
+		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
 			return NULL;
 		} else {
-			conn_res = (conn_handle *)py_conn_res;
+			stmt_res = (stmt_handle *)py_stmt_res;
 		}
 
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLGetDiagField(SQL_HANDLE_STMT, stmt_res->hstmt, 0,
+								SQL_DIAG_CURSOR_ROW_COUNT, &count, SQL_IS_INTEGER,
+								&strLenPtr);
+		Py_END_ALLOW_THREADS;
+		
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc,
+											1, NULL, -1, 1);
+			sprintf(error, "SQLGetDiagField failed: %s",
+					IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return NULL;
 		}
+		return PyInt_FromLong(count);
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
+	}
+	Py_INCREF(Py_False);
+	return Py_False;
+}
 
-		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
-
-		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
-
-		_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, -1, 0, 
-										  return_str, DB2_ERRMSG, 
-										  conn_res->errormsg_recno_tracker);
-		if(conn_res->errormsg_recno_tracker - conn_res->error_recno_tracker >= 1)
-			 conn_res->error_recno_tracker = conn_res->errormsg_recno_tracker;
-		conn_res->errormsg_recno_tracker++;
-
-		retVal =  StringOBJ_FromASCII(return_str);
-		if(return_str != NULL) {
-			PyMem_Del(return_str);
-			return_str = NULL;
+/* static int _python_ibm_db_get_column_by_name(stmt_handle *stmt_res, char *col_name, int col)
+ */
+static int _python_ibm_db_get_column_by_name(stmt_handle *stmt_res, char *col_name, int col)
+{
+	int i;
+	/* get column header info */
+	if ( stmt_res->column_info == NULL ) {
+		if (_python_ibm_db_get_result_set_info(stmt_res)<0) {
+			return -1;
 		}
-		return retVal;
-	} else {
-		return StringOBJ_FromASCII(IBM_DB_G(__python_conn_err_msg));
 	}
+	if ( col_name == NULL ) {
+		if ( col >= 0 && col < stmt_res->num_columns) {
+			return col;
+		} else {
+			return -1;
+		}
+	}
+	/* should start from 0 */
+	i = 0;
+	while (i < stmt_res->num_columns) {
+		if (strcmp((char*)stmt_res->column_info[i].name, col_name) == 0) {
+			return i;
+		}
+		i++;
+	}
+	return -1;
 }
 
-/*!# ibm_db.stmt_errormsg
+/*!# ibm_db.field_name
  *
  * ===Description
- * string ibm_db.stmt_errormsg ( [resource stmt] )
- *
- * Returns a string containing the last SQL statement error message.
+ * string ibm_db.field_name ( resource stmt, mixed column )
  *
- * If you do not pass a statement resource as an argument to
- * ibm_db.stmt_errormsg(), the driver returns the error message associated with
- * the last attempt to return a statement resource, for example, from
- * ibm_db.prepare() or ibm_db.exec().
+ * Returns the name of the specified column in the result set.
  *
  * ===Parameters
  *
  * ====stmt
- *		A valid statement resource.
+ *		Specifies a statement resource containing a result set.
+ *
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns a string containing the error message and SQLCODE value for the last
- * error that occurred issuing an SQL statement.
+ * Returns a string containing the name of the specified column. If the
+ * specified column does not exist in the result set, ibm_db.field_name()
+ * returns FALSE.
  */
-static PyObject *ibm_db_stmt_errormsg(PyObject *self, PyObject *args)
+static PyObject *ibm_db_field_name(PyObject *self, PyObject *args)			
 {
-	stmt_handle *stmt_res = NULL;
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
 	PyObject *py_stmt_res = NULL;
-	PyObject *retVal = NULL;
-	char* return_str = NULL;	/* This variable is used by 
-					* _python_ibm_db_check_sql_errors to return err 
-					* strings 
-					*/
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	int col = -1;
 
-	if (!PyArg_ParseTuple(args, "|O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
-		}
-		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
-
-		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
-
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 0, 
-										return_str, DB2_ERRMSG, 
-										stmt_res->errormsg_recno_tracker);
-		if(stmt_res->errormsg_recno_tracker - stmt_res->error_recno_tracker >= 1)
-			stmt_res->error_recno_tracker = stmt_res->errormsg_recno_tracker;
-		stmt_res->errormsg_recno_tracker++;
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
 
-		retVal = StringOBJ_FromASCII(return_str);
-		if(return_str != NULL) {
-			PyMem_Del(return_str);
-			return_str = NULL;
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
+			return NULL;
 		}
-		return retVal;
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
 	} else {
-		return StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_msg));
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
+	} 
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if (col_name_py3_tmp != NULL) {
+		Py_XDECREF(col_name_py3_tmp);
+	}
+#endif
+	if ( col < 0 ) {
+		Py_INCREF(Py_False);
+		return Py_False;
 	}
+	return StringOBJ_FromASCII((char*)stmt_res->column_info[col].name);
 }
 
-/*!# ibm_db.conn_error
- * ===Description
- * string ibm_db.conn_error ( [resource connection] )
- *
- * ibm_db.conn_error() returns an SQLSTATE value representing the reason the
- * last attempt to connect to a database failed. As ibm_db.connect() returns
- * FALSE in the event of a failed connection attempt, you do not pass any
- * parameters to ibm_db.conn_error() to retrieve the SQLSTATE value.
+/*!# ibm_db.field_display_size
  *
- * If, however, the connection was successful but becomes invalid over time, you
- * can pass the connection parameter to retrieve the SQLSTATE value for a
- * specific connection.
+ * ===Description
+ * int ibm_db.field_display_size ( resource stmt, mixed column )
  *
- * To learn what the SQLSTATE value means, you can issue the following command
- * at a DB2 Command Line Processor prompt: db2 '? sqlstate-value'. You can also
- * call ibm_db.conn_errormsg() to retrieve an explicit error message and the
- * associated SQLCODE value.
+ * Returns the maximum number of bytes required to display a column in a result
+ * set.
  *
  * ===Parameters
+ * ====stmt
+ *		Specifies a statement resource containing a result set.
  *
- * ====connection
- *		A connection resource associated with a connection that initially
- * succeeded, but which over time became invalid.
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns the SQLSTATE value resulting from a failed connection attempt.
- * Returns an empty string if there is no error associated with the last
- * connection attempt.
+ * Returns an integer value with the maximum number of bytes required to display
+ * the specified column.
+ * If the column does not exist in the result set, ibm_db.field_display_size()
+ * returns FALSE.
  */
-static PyObject *ibm_db_conn_error(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args) 
 {
-	conn_handle *conn_res = NULL;
-	PyObject *py_conn_res = NULL;
-	PyObject *retVal = NULL;
-	char *return_str = NULL; /* This variable is used by 
-							 * _python_ibm_db_check_sql_errors to return err 
-							 * strings */
+	PyObject *py_stmt_res = NULL;
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	int col = -1;
+	char *col_name = NULL;
+	stmt_handle *stmt_res = NULL;
+	int rc;
+	SQLINTEGER colDataDisplaySize;
 
-	if (!PyArg_ParseTuple(args, "|O", &py_conn_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
-		}
-		return_str = ALLOC_N(char, SQL_SQLSTATE_SIZE + 1);
-
-		memset(return_str, 0, SQL_SQLSTATE_SIZE + 1);
-
-		_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, -1, 0, 
-										return_str, DB2_ERR, 
-										conn_res->error_recno_tracker);
-		if (conn_res->error_recno_tracker-conn_res->errormsg_recno_tracker >= 1) {
-			conn_res->errormsg_recno_tracker = conn_res->error_recno_tracker;
-		}
-		conn_res->error_recno_tracker++;
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
 
-		retVal = StringOBJ_FromASCII(return_str);
-		if(return_str != NULL) {
-			PyMem_Del(return_str);
-			return_str = NULL;
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
+			return NULL;
 		}
-		return retVal;
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
 	} else {
-		return StringOBJ_FromASCII(IBM_DB_G(__python_conn_err_state));
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
+	}	
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
+	}
+#endif
+	if ( col < 0 ) {
+		Py_RETURN_FALSE;
 	}
-}
 
-/*!# ibm_db.stmt_error
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col+1,
+		 SQL_DESC_DISPLAY_SIZE, NULL, 0, NULL, &colDataDisplaySize);
+	Py_END_ALLOW_THREADS;
+	
+	if ( rc < SQL_SUCCESS ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
+									  NULL, -1, 1);
+		Py_INCREF(Py_False);
+		return Py_False;
+	}
+	return PyInt_FromLong(colDataDisplaySize);
+}
+/*!# ibm_db.field_nullable
  *
  * ===Description
- * string ibm_db.stmt_error ( [resource stmt] )
- *
- * Returns a string containing the SQLSTATE value returned by an SQL statement.
- *
- * If you do not pass a statement resource as an argument to
- * ibm_db.stmt_error(), the driver returns the SQLSTATE value associated with
- * the last attempt to return a statement resource, for example, from
- * ibm_db.prepare() or ibm_db.exec().
+ * bool ibm_db.field_nullable ( resource stmt, mixed column )
  *
- * To learn what the SQLSTATE value means, you can issue the following command
- * at a DB2 Command Line Processor prompt: db2 '? sqlstate-value'. You can also
- * call ibm_db.stmt_errormsg() to retrieve an explicit error message and the
- * associated SQLCODE value.
+ * Returns True/False based on indicated column in result set is nullable or not.
  *
  * ===Parameters
  *
  * ====stmt
- *		A valid statement resource.
+ *              Specifies a statement resource containing a result set. 
+ *
+ * ====column
+ *              Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns a string containing an SQLSTATE value.
+ * Returns TRUE if indicated column is nullable else returns FALSE.
+ * If the specified column does not exist in the result set, ibm_db.field_nullable() returns FALSE
  */
-static PyObject *ibm_db_stmt_error(PyObject *self, PyObject *args)
+static PyObject *ibm_db_field_nullable(PyObject *self, PyObject *args)
 {
-	stmt_handle *stmt_res = NULL;
 	PyObject *py_stmt_res = NULL;
-	PyObject *retVal = NULL;
-	char* return_str = NULL; /* This variable is used by 
-							 * _python_ibm_db_check_sql_errors to return err 
-							 * strings 
-							 */
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	int col = -1;
+	int rc;
+	SQLINTEGER nullableCol;
 
-	if (!PyArg_ParseTuple(args, "|O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+		return NULL;
+
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
 		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
 			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
 		}
-		return_str = ALLOC_N(char, DB2_MAX_ERR_MSG_LEN);
-
-		memset(return_str, 0, DB2_MAX_ERR_MSG_LEN);
-
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, -1, 0, 
-										return_str, DB2_ERR, 
-										stmt_res->error_recno_tracker);
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
+	} else {
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
+	}
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
+	}
+#endif
+	if ( col < 0 ) {
+		 Py_RETURN_FALSE;
+	}
 
-		if (stmt_res->error_recno_tracker-stmt_res->errormsg_recno_tracker >= 1) {
-			stmt_res->errormsg_recno_tracker = stmt_res->error_recno_tracker;
-		}
-		stmt_res->error_recno_tracker++;
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col+1,
+		SQL_DESC_NULLABLE, NULL, 0, NULL, &nullableCol);
+	Py_END_ALLOW_THREADS;
 
-		retVal = StringOBJ_FromASCII(return_str);
-		if(return_str != NULL) {
-			PyMem_Del(return_str);
-			return_str = NULL;
-		}
-		return retVal;
+	if ( rc < SQL_SUCCESS ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1,
+					NULL, -1, 1);
+		Py_RETURN_FALSE;
+	} else if ( nullableCol == SQL_NULLABLE ) {
+		Py_RETURN_TRUE;
 	} else {
-		return StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_state));
+		Py_RETURN_FALSE;
 	}
 }
-
-/*!# ibm_db.next_result
+/*!# ibm_db.field_num
  *
  * ===Description
- * resource ibm_db.next_result ( resource stmt )
- *
- * Requests the next result set from a stored procedure.
+ * int ibm_db.field_num ( resource stmt, mixed column )
  *
- * A stored procedure can return zero or more result sets. While you handle the
- * first result set in exactly the same way you would handle the results
- * returned by a simple SELECT statement, to fetch the second and subsequent
- * result sets from a stored procedure you must call the ibm_db.next_result()
- * function and return the result to a uniquely named Python variable.
+ * Returns the position of the named column in a result set.
  *
  * ===Parameters
+ *
  * ====stmt
- *		A prepared statement returned from ibm_db.exec() or ibm_db.execute().
+ *		Specifies a statement resource containing a result set.
+ *
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns a new statement resource containing the next result set if the stored
- * procedure returned another result set. Returns FALSE if the stored procedure
- * did not return another result set.
+ * Returns an integer containing the 0-indexed position of the named column in
+ * the result set. If the specified column does not exist in the result set,
+ * ibm_db.field_num() returns FALSE.
  */
-static PyObject *ibm_db_next_result(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_field_num(PyObject *self, PyObject *args)			
 {
 	PyObject *py_stmt_res = NULL;
-	stmt_handle *stmt_res, *new_stmt_res = NULL;
-	int rc = 0;
-	SQLHANDLE new_hstmt;
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	int col = -1;
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
-		}
-		_python_ibm_db_clear_stmt_err_cache();
-
-		/* alloc handle and return only if it errors */
-		rc = SQLAllocHandle(SQL_HANDLE_STMT, stmt_res->hdbc, &new_hstmt);
-		if ( rc < SQL_SUCCESS ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-											NULL, -1, 1);
-			Py_INCREF(Py_False);
-			return Py_False;
-		}
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLNextResult((SQLHSTMT)stmt_res->hstmt, (SQLHSTMT)new_hstmt);
-		Py_END_ALLOW_THREADS;
-		
-		if( rc != SQL_SUCCESS ) {
-			if(rc < SQL_SUCCESS) {
-				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, 
-												rc, 1, NULL, -1, 1);
-			}
-			SQLFreeHandle(SQL_HANDLE_STMT, new_hstmt);
-			Py_INCREF(Py_False);
-			return Py_False;
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
+			return NULL;
 		}
-
-		/* Initialize stmt resource members with default values. */
-		/* Parsing will update options if needed */
-		new_stmt_res = PyObject_NEW(stmt_handle, &stmt_handleType);
-		new_stmt_res->s_bin_mode = stmt_res->s_bin_mode;
-		new_stmt_res->cursor_type = stmt_res->cursor_type;
-		new_stmt_res->s_case_mode = stmt_res->s_case_mode;
-		new_stmt_res->head_cache_list = NULL;
-		new_stmt_res->current_node = NULL;
-		new_stmt_res->num_params = 0;
-		new_stmt_res->file_param = 0;
-		new_stmt_res->column_info = NULL;
-		new_stmt_res->num_columns = 0;
-		new_stmt_res->row_data = NULL;
-		new_stmt_res->hstmt = new_hstmt;
-		new_stmt_res->hdbc = stmt_res->hdbc;
-
-		return (PyObject *)new_stmt_res;		
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
 	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-		return NULL;
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
+	}
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
+	}
+#endif
+	if ( col < 0 ) {
+		Py_INCREF(Py_False);
+		return Py_False;
 	}
+	return PyInt_FromLong(col);
 }
 
-/*!# ibm_db.num_fields
+/*!# ibm_db.field_precision
  *
  * ===Description
- * int ibm_db.num_fields ( resource stmt )
+ * int ibm_db.field_precision ( resource stmt, mixed column )
  *
- * Returns the number of fields contained in a result set. This is most useful
- * for handling the result sets returned by dynamically generated queries, or
- * for result sets returned by stored procedures, where your application cannot
- * otherwise know how to retrieve and use the results.
+ * Returns the precision of the indicated column in a result set.
  *
  * ===Parameters
  *
  * ====stmt
- *		A valid statement resource containing a result set.
+ *		Specifies a statement resource containing a result set.
+ *
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns an integer value representing the number of fields in the result set
- * associated with the specified statement resource. Returns FALSE if the
- * statement resource is not a valid input value.
+ * Returns an integer containing the precision of the specified column. If the
+ * specified column does not exist in the result set, ibm_db.field_precision()
+ * returns FALSE.
  */
-static PyObject *ibm_db_num_fields(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_field_precision(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	stmt_handle *stmt_res;
-	int rc = 0;
-	SQLSMALLINT indx = 0;
-	char error[DB2_MAX_ERR_MSG_LEN];
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	int col = -1;
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
-		}
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
 
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLNumResultCols((SQLHSTMT)stmt_res->hstmt, &indx);
-		Py_END_ALLOW_THREADS;
-		
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-											1, NULL, -1, 1);
-			sprintf(error, "SQLNumResultCols failed: %s", 
-					IBM_DB_G(__python_stmt_err_msg));
-			PyErr_SetString(PyExc_Exception, error);	
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
 			return NULL;
 		}
-		return PyInt_FromLong(indx);
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
 	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-		return NULL;
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
+	} 
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
 	}
-	Py_INCREF(Py_False);
-	return Py_False;
+#endif
+	if ( col < 0 ) {
+		Py_RETURN_FALSE;
+	}
+	return PyInt_FromLong(stmt_res->column_info[col].size);
+
 }
 
-/*!# ibm_db.num_rows
+/*!# ibm_db.field_scale
  *
  * ===Description
- * int ibm_db.num_rows ( resource stmt )
- *
- * Returns the number of rows deleted, inserted, or updated by an SQL statement.
- *
- * To determine the number of rows that will be returned by a SELECT statement,
- * issue SELECT COUNT(*) with the same predicates as your intended SELECT
- * statement and retrieve the value. If your application logic checks the number
- * of rows returned by a SELECT statement and branches if the number of rows is
- * 0, consider modifying your application to attempt to return the first row
- * with one of ibm_db.fetch_assoc(), ibm_db.fetch_both(), ibm_db.fetch_array(),
- * or ibm_db.fetch_row(), and branch if the fetch function returns FALSE.
+ * int ibm_db.field_scale ( resource stmt, mixed column )
  *
- * Note: If you issue a SELECT statement using a scrollable cursor,
- * ibm_db.num_rows() returns the number of rows returned by the SELECT
- * statement. However, the overhead associated with scrollable cursors
- * significantly degrades the performance of your application, so if this is the
- * only reason you are considering using scrollable cursors, you should use a
- * forward-only cursor and either call SELECT COUNT(*) or rely on the boolean
- * return value of the fetch functions to achieve the equivalent functionality
- * with much better performance.
+ * Returns the scale of the indicated column in a result set.
  *
  * ===Parameters
- *
  * ====stmt
- *		A valid stmt resource containing a result set.
+ *		Specifies a statement resource containing a result set.
+ *
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
  * ===Return Values
  *
- * Returns the number of rows affected by the last SQL statement issued by the
- * specified statement handle.
+ * Returns an integer containing the scale of the specified column. If the
+ * specified column does not exist in the result set, ibm_db.field_scale()
+ * returns FALSE.
  */
-static PyObject *ibm_db_num_rows(PyObject *self, PyObject *args)
+static PyObject *ibm_db_field_scale(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	stmt_handle *stmt_res;
-	int rc = 0;
-	SQLINTEGER count = 0;
-	char error[DB2_MAX_ERR_MSG_LEN];
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	int col = -1;
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
-		}
-
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLRowCount((SQLHSTMT)stmt_res->hstmt, &count);
-		Py_END_ALLOW_THREADS;
-		
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
-											1, NULL, -1, 1);
-			sprintf(error, "SQLRowCount failed: %s", 
-					IBM_DB_G(__python_stmt_err_msg));
-			PyErr_SetString(PyExc_Exception, error);
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
 			return NULL;
 		}
-		return PyInt_FromLong(count);
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
 	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-		return NULL;
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
 	}
-	Py_INCREF(Py_False);
-	return Py_False;
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
+	}
+#endif
+	if ( col < 0 ) {
+		Py_RETURN_FALSE;
+	}
+	return PyInt_FromLong(stmt_res->column_info[col].scale);
 }
 
-/*!# ibm_db.get_num_result 
+/*	static char *_python_ibm_db_field_type_name(SQLSMALLINT type)
+	name of a column type as returned by ibm_db.field_type()
+*/
+static char *_python_ibm_db_field_type_name(SQLSMALLINT type)
+{
+	switch (type) {
+		case SQL_SMALLINT:
+		case SQL_INTEGER:
+			return "int";
+		case SQL_BIGINT:
+			return "bigint";
+		case SQL_REAL:
+		case SQL_FLOAT:
+		case SQL_DOUBLE:
+		case SQL_DECFLOAT:
+			return "real";
+		case SQL_DECIMAL:
+		case SQL_NUMERIC:
+			return "decimal";
+		case SQL_CLOB:
+			return "clob";
+		case SQL_DBCLOB:
+			return "dbclob";
+		case SQL_BLOB:
+			return "blob";
+		case SQL_XML:
+			return "xml";
+		case SQL_TYPE_DATE:
+			return "date";
+		case SQL_TYPE_TIME:
+			return "time";
+		case SQL_TYPE_TIMESTAMP:
+			return "timestamp";
+		default:
+			return "string";
+	}
+}
+
+/*!# ibm_db.field_type
  *
  * ===Description
- * int ibm_db.num_rows ( resource stmt )
+ * string ibm_db.field_type ( resource stmt, mixed column )
  *
- * Returns the number of rows in a current open non-dynamic scrollable cursor.
+ * Returns the data type of the indicated column in a result set.
  *
  * ===Parameters
- *
  * ====stmt
- *		A valid stmt resource containing a result set.
+ *		Specifies a statement resource containing a result set.
  *
- * ===Return Values
+ * ====column
+ *		Specifies the column in the result set. This can either be an integer
+ * representing the 0-indexed position of the column, or a string containing the
+ * name of the column.
  *
- * True on success or False on failure.
+ * ====Return Values
+ *
+ * Returns a string containing the defined data type of the specified column.
+ * If the specified column does not exist in the result set, ibm_db.field_type()
+ * returns FALSE.
  */
-static PyObject *ibm_db_get_num_result(PyObject *self, PyObject *args)
+static PyObject *ibm_db_field_type(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	stmt_handle *stmt_res;
-	int rc = 0;
-	SQLINTEGER count = 0;
-	char error[DB2_MAX_ERR_MSG_LEN];
-	SQLSMALLINT strLenPtr;
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
+	stmt_handle* stmt_res = NULL;
+	char *col_name = NULL;
+	char *str_val = NULL;
+	int col = -1;
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
 
-	if (!NIL_P(py_stmt_res)) {
-		if (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-			return NULL;
-		} else {
-			stmt_res = (stmt_handle *)py_stmt_res;
-		}
-
-		Py_BEGIN_ALLOW_THREADS;
-		rc = SQLGetDiagField(SQL_HANDLE_STMT, stmt_res->hstmt, 0,
-								SQL_DIAG_CURSOR_ROW_COUNT, &count, SQL_IS_INTEGER,
-								&strLenPtr);
-		Py_END_ALLOW_THREADS;
-		
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc,
-											1, NULL, -1, 1);
-			sprintf(error, "SQLGetDiagField failed: %s",
-					IBM_DB_G(__python_stmt_err_msg));
-			PyErr_SetString(PyExc_Exception, error);
-			return NULL;
-		}
-		return PyInt_FromLong(count);
-	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
 		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
 	}
-	Py_INCREF(Py_False);
-	return Py_False;
-}
-
-/* static int _python_ibm_db_get_column_by_name(stmt_handle *stmt_res, char *col_name, int col)
- */
-static int _python_ibm_db_get_column_by_name(stmt_handle *stmt_res, char *col_name, int col)
-{
-	int i;
-	/* get column header info */
-	if ( stmt_res->column_info == NULL ) {
-		if (_python_ibm_db_get_result_set_info(stmt_res)<0) {
-			return -1;
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col = PyInt_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
+			return NULL;
 		}
+		column = col_name_py3_tmp;
+#endif
+		col_name = PyBytes_AsString(column);
+	} else {
+		/* Column argument has to be either an integer or string */
+		Py_RETURN_FALSE;
 	}
-	if ( col_name == NULL ) {
-		if ( col >= 0 && col < stmt_res->num_columns) {
-			return col;
-		} else {
-			return -1;
-		}
+	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
+#if  PY_MAJOR_VERSION >= 3
+	if ( col_name_py3_tmp != NULL ) {
+		Py_XDECREF(col_name_py3_tmp);
 	}
-	/* should start from 0 */
-	i = 0;
-	while (i < stmt_res->num_columns) {
-		if (strcmp((char*)stmt_res->column_info[i].name, col_name) == 0) {
-			return i;
-		}
-		i++;
+#endif
+	if ( col < 0 ) {
+		Py_RETURN_FALSE;
 	}
-	return -1;
+	str_val = _python_ibm_db_field_type_name(stmt_res->column_info[col].type);
+	return StringOBJ_FromASCII(str_val);
 }
 
-/*!# ibm_db.field_name
+/*!# ibm_db.describe
  *
  * ===Description
- * string ibm_db.field_name ( resource stmt, mixed column )
+ * tuple ibm_db.describe ( resource stmt )
  *
- * Returns the name of the specified column in the result set.
+ * Returns the description of all columns of a result set in one call.
  *
  * ===Parameters
- *
  * ====stmt
  *		Specifies a statement resource containing a result set.
  *
- * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
- *
  * ===Return Values
  *
- * Returns a string containing the name of the specified column. If the
- * specified column does not exist in the result set, ibm_db.field_name()
- * returns FALSE.
+ * Returns a tuple with one tuple per column holding, in this order, the
+ * values of ibm_db.field_name(), ibm_db.field_type(),
+ * ibm_db.field_display_size(), ibm_db.field_precision(), ibm_db.field_scale()
+ * and ibm_db.field_nullable() for the column. Returns None if the statement
+ * did not produce a result set.
  */
-static PyObject *ibm_db_field_name(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_describe(PyObject *self, PyObject *args)
 {
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
 	PyObject *py_stmt_res = NULL;
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	int col = -1;
+	PyObject *return_value = NULL;
+	PyObject *column = NULL;
+	stmt_handle *stmt_res = NULL;
+	SQLINTEGER *display_size = NULL;
+	SQLSMALLINT nResultCols = 0;
+	char error[DB2_MAX_ERR_MSG_LEN];
+	int rc = SQL_SUCCESS, i;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
 		return NULL;
 
 	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
@@ -6645,43 +9916,82 @@ static PyObject *ibm_db_field_name(PyObject *self, PyObject *args)
 		stmt_res = (stmt_handle *)py_stmt_res;
 	}
 
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
+	if ( stmt_res->column_info == NULL ) {
+		_python_ibm_db_count_request(stmt_res, RT_DESCRIBE);
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLNumResultCols((SQLHSTMT)stmt_res->hstmt, &nResultCols);
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 
+											1, NULL, -1, 1);
+			sprintf(error, "SQLNumResultCols failed: %s", 
+					IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);	
+			return NULL;
+		}
+		if ( nResultCols == 0 ) {
+			Py_RETURN_NONE;
+		}
+		if ( _python_ibm_db_get_result_set_info(stmt_res) < 0 ) {
+			sprintf(error, "Column information cannot be retrieved: %s", 
+					IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
 			return NULL;
 		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
-	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
-	} 
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if (col_name_py3_tmp != NULL) {
-		Py_XDECREF(col_name_py3_tmp);
 	}
-#endif
-	if ( col < 0 ) {
-		Py_INCREF(Py_False);
-		return Py_False;
+
+	display_size = ALLOC_N(SQLINTEGER, stmt_res->num_columns);
+	if ( display_size == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return NULL;
 	}
-	return StringOBJ_FromASCII((char*)stmt_res->column_info[col].name);
+	Py_BEGIN_ALLOW_THREADS;
+	for (i = 0; i < stmt_res->num_columns && rc != SQL_ERROR; i++) {
+		rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)(i + 1),
+			SQL_DESC_DISPLAY_SIZE, NULL, 0, NULL, &display_size[i]);
+	}
+	Py_END_ALLOW_THREADS;
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
+										NULL, -1, 1);
+		sprintf(error, "Describe Column Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+		PyErr_SetString(PyExc_Exception, error);
+		PyMem_Del(display_size);
+		return NULL;
+	}
+
+	return_value = PyTuple_New(stmt_res->num_columns);
+	for (i = 0; return_value != NULL && i < stmt_res->num_columns; i++) {
+		column = Py_BuildValue("(NNlllN)",
+			StringOBJ_FromASCII((char*)stmt_res->column_info[i].name),
+			StringOBJ_FromASCII(_python_ibm_db_field_type_name(stmt_res->column_info[i].type)),
+			(long)display_size[i],
+			(long)stmt_res->column_info[i].size,
+			(long)stmt_res->column_info[i].scale,
+			PyBool_FromLong(stmt_res->column_info[i].nullable == SQL_NULLABLE));
+		if ( column == NULL ) {
+			Py_CLEAR(return_value);
+			break;
+		}
+		PyTuple_SET_ITEM(return_value, i, column);
+	}
+	PyMem_Del(display_size);
+	return return_value;
 }
 
-/*!# ibm_db.field_display_size
+/*!# ibm_db.field_width
  *
  * ===Description
- * int ibm_db.field_display_size ( resource stmt, mixed column )
+ * int ibm_db.field_width ( resource stmt, mixed column )
  *
- * Returns the maximum number of bytes required to display a column in a result
- * set.
+ * Returns the width of the current value of the indicated column in a result
+ * set. This is the maximum width of the column for a fixed-length data type, or
+ * the actual width of the column for a variable-length data type.
  *
  * ===Parameters
+ *
  * ====stmt
  *		Specifies a statement resource containing a result set.
  *
@@ -6692,12 +10002,11 @@ static PyObject *ibm_db_field_name(PyObject *self, PyObject *args)
  *
  * ===Return Values
  *
- * Returns an integer value with the maximum number of bytes required to display
- * the specified column.
- * If the column does not exist in the result set, ibm_db.field_display_size()
- * returns FALSE.
+ * Returns an integer containing the width of the specified character or binary
+ * data type column in a result set. If the specified column does not exist in
+ * the result set, ibm_db.field_width() returns FALSE.
  */
-static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args) 
+static PyObject *ibm_db_field_width(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
 	PyObject *column = NULL;
@@ -6708,7 +10017,7 @@ static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args)
 	char *col_name = NULL;
 	stmt_handle *stmt_res = NULL;
 	int rc;
-	SQLINTEGER colDataDisplaySize;
+	SQLINTEGER colDataSize;
 
 	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
 		return NULL;
@@ -6719,7 +10028,6 @@ static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args)
 	} else {
 		stmt_res = (stmt_handle *)py_stmt_res;
 	}
-
 	if ( TYPE(column) == PYTHON_FIXNUM ) {
 		col = PyInt_AsLong(column);
 	} else if (PyString_Check(column)) {
@@ -6734,7 +10042,7 @@ static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args)
 	} else {
 		/* Column argument has to be either an integer or string */
 		Py_RETURN_FALSE;
-	}	
+	}
 	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
 #if  PY_MAJOR_VERSION >= 3
 	if ( col_name_py3_tmp != NULL ) {
@@ -6744,56 +10052,45 @@ static PyObject *ibm_db_field_display_size(PyObject *self, PyObject *args)
 	if ( col < 0 ) {
 		Py_RETURN_FALSE;
 	}
-
+	
 	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col+1,
-		 SQL_DESC_DISPLAY_SIZE, NULL, 0, NULL, &colDataDisplaySize);
+	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col + 1,
+		SQL_DESC_LENGTH, NULL, 0, NULL, &colDataSize);
 	Py_END_ALLOW_THREADS;
 	
-	if ( rc < SQL_SUCCESS ) {
+	if ( rc != SQL_SUCCESS ) {
 		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
-									  NULL, -1, 1);
-		Py_INCREF(Py_False);
-		return Py_False;
+			NULL, -1, 1);
+		PyErr_Clear();
+		Py_RETURN_FALSE;
 	}
-	return PyInt_FromLong(colDataDisplaySize);
+	return PyInt_FromLong(colDataSize);
 }
-/*!# ibm_db.field_nullable
+
+/*!# ibm_db.cursor_type
  *
  * ===Description
- * bool ibm_db.field_nullable ( resource stmt, mixed column )
+ * int ibm_db.cursor_type ( resource stmt )
  *
- * Returns True/False based on indicated column in result set is nullable or not.
+ * Returns the cursor type used by a statement resource. Use this to determine
+ * if you are working with a forward-only cursor or scrollable cursor.
  *
  * ===Parameters
- *
  * ====stmt
- *              Specifies a statement resource containing a result set. 
- *
- * ====column
- *              Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ *		A valid statement resource.
  *
  * ===Return Values
  *
- * Returns TRUE if indicated column is nullable else returns FALSE.
- * If the specified column does not exist in the result set, ibm_db.field_nullable() returns FALSE
+ * Returns either SQL_SCROLL_FORWARD_ONLY if the statement resource uses a
+ * forward-only cursor or SQL_CURSOR_KEYSET_DRIVEN if the statement resource
+ * uses a scrollable cursor.
  */
-static PyObject *ibm_db_field_nullable(PyObject *self, PyObject *args)
+static PyObject *ibm_db_cursor_type(PyObject *self, PyObject *args)			
 {
 	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	int col = -1;
-	int rc;
-	SQLINTEGER nullableCol;
+	stmt_handle *stmt_res = NULL;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
 		return NULL;
 
 	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
@@ -6803,614 +10100,932 @@ static PyObject *ibm_db_field_nullable(PyObject *self, PyObject *args)
 		stmt_res = (stmt_handle *)py_stmt_res;
 	}
 
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
+	return PyInt_FromLong(stmt_res->cursor_type != SQL_SCROLL_FORWARD_ONLY);
+}
+
+/*!# ibm_db.rollback
+ *
+ * ===Description
+ * bool ibm_db.rollback ( resource connection )
+ *
+ * Rolls back an in-progress transaction on the specified connection resource
+ * and begins a new transaction. Python applications normally default to
+ * AUTOCOMMIT mode, so ibm_db.rollback() normally has no effect unless
+ * AUTOCOMMIT has been turned off for the connection resource.
+ *
+ * Note: If the specified connection resource is a persistent connection, all
+ * transactions in progress for all applications using that persistent
+ * connection will be rolled back. For this reason, persistent connections are
+ * not recommended for use in applications that require transactions.
+ *
+ * ===Parameters
+ *
+ * ====connection
+ *		A valid database connection resource variable as returned from
+ * ibm_db.connect() or ibm_db.pconnect().
+ *
+ * ===Return Values
+ *
+ * Returns TRUE on success or FALSE on failure.
+ */
+static PyObject *ibm_db_rollback(PyObject *self, PyObject *args)
+{
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res;
+	int rc;
+
+	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+		return NULL;
+
+	if (!NIL_P(py_conn_res)) {
+		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
+			return NULL;
+		} else {
+			conn_res = (conn_handle *)py_conn_res;
+		}
+		if (!conn_res->handle_active) {
+			PyErr_SetString(PyExc_Exception, "Connection is not active");
 			return NULL;
 		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
-	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
-	}
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
-	}
-#endif
-	if ( col < 0 ) {
-		 Py_RETURN_FALSE;
-	}
-
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col+1,
-		SQL_DESC_NULLABLE, NULL, 0, NULL, &nullableCol);
-	Py_END_ALLOW_THREADS;
-
-	if ( rc < SQL_SUCCESS ) {
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1,
-					NULL, -1, 1);
-		Py_RETURN_FALSE;
-	} else if ( nullableCol == SQL_NULLABLE ) {
-		Py_RETURN_TRUE;
-	} else {
-		Py_RETURN_FALSE;
+
+		_python_ibm_db_clear_handle_error(conn_res, NULL);
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLEndTran(SQL_HANDLE_DBC, conn_res->hdbc, SQL_ROLLBACK);
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
+				NULL, -1, 1);
+			PyErr_Clear();
+			Py_RETURN_FALSE;
+		} else {
+			Py_RETURN_TRUE;
+		}
+	}
+	Py_RETURN_FALSE;
+}
+
+/*!# ibm_db.free_stmt
+ *
+ * ===Description
+ * bool ibm_db.free_stmt ( resource stmt )
+ *
+ * Frees the system and database resources that are associated with a statement
+ * resource. These resources are freed implicitly when a script finishes, but
+ * you can call ibm_db.free_stmt() to explicitly free the statement resources
+ * before the end of the script.
+ *
+ * A statement from ibm_db.prepare() on a connection with a statement cache
+ * (see ATTR_STMT_CACHE_SIZE) is not freed: its cursor is closed and the
+ * prepared handle is kept for the next ibm_db.prepare() of the same SQL text.
+ * Statements with attributes set by ibm_db.set_option(), other than
+ * SQL_ATTR_QUERY_TIMEOUT, are freed.
+ *
+ * ===Parameters
+ * ====stmt
+ *		A valid statement resource.
+ *
+ * ===Return Values
+ *
+ * Returns TRUE on success or FALSE on failure.
+ *
+ * DEPRECATED
+ */
+static PyObject *ibm_db_free_stmt(PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *handle;
+	SQLRETURN rc;
+	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+		return NULL;
+	if (!NIL_P(py_stmt_res)) {
+		if (PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+			handle = (stmt_handle *)py_stmt_res;
+			if (handle->hstmt != -1) {
+				if ( handle->owner_pid == IBM_DB_GETPID() && 
+					_python_ibm_db_stmt_cache_put(handle) ) {
+					Py_RETURN_TRUE;
+				}
+				_python_ibm_db_unregister_handle(handle->hstmt, (PyObject *)handle);
+				rc = SQL_SUCCESS;
+				if ( handle->owner_pid == IBM_DB_GETPID() ) {
+					Py_BEGIN_ALLOW_THREADS;
+					rc = SQLFreeHandle( SQL_HANDLE_STMT, handle->hstmt);
+					Py_END_ALLOW_THREADS;
+				}
+				if ( rc == SQL_ERROR ){ 
+					_python_ibm_db_check_sql_errors(handle->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+					Py_RETURN_FALSE;
+				}
+				 _python_ibm_db_free_result_struct(handle);
+				handle->hstmt = -1;
+				Py_CLEAR(handle->cache_conn);
+				Py_RETURN_TRUE;
+			}
+		}
 	}
+	Py_RETURN_NONE;
 }
-/*!# ibm_db.field_num
+
+/*!# ibm_db.stmt_cache_info
  *
  * ===Description
- * int ibm_db.field_num ( resource stmt, mixed column )
+ * dict ibm_db.stmt_cache_info ( IBM_DBConnection connection )
  *
- * Returns the position of the named column in a result set.
+ * Returns the state of the prepared statement cache of a connection.
+ * ibm_db.prepare() looks a statement up by its SQL text and
+ * ibm_db.free_stmt() puts it back, so a statement prepared again after it
+ * was freed counts as a hit. DDL statements and a change of
+ * SQL_ATTR_CURRENT_SCHEMA empty the cache.
  *
  * ===Parameters
  *
- * ====stmt
- *		Specifies a statement resource containing a result set.
- *
- * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ * ====connection
+ *		A valid database connection resource variable as returned from
+ *		ibm_db.connect() or ibm_db.pconnect().
  *
  * ===Return Values
  *
- * Returns an integer containing the 0-indexed position of the named column in
- * the result set. If the specified column does not exist in the result set,
- * ibm_db.field_num() returns FALSE.
+ * A dictionary with the keys:
+ *		size		the ATTR_STMT_CACHE_SIZE of the connection
+ *		entries		number of statements cached
+ *		hits		prepares served from the cache
+ *		misses		prepares sent to the server while the cache was enabled
  */
-static PyObject *ibm_db_field_num(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_stmt_cache_info(PyObject *self, PyObject *args)
 {
-	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	int col = -1;
+	PyObject *py_conn_res = NULL;
+	conn_handle *conn_res;
+	Py_ssize_t entries = 0;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
 		return NULL;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+	if (NIL_P(py_conn_res) || !PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
+		PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
 		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
-	}
-
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
-			return NULL;
-		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
-	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
 	}
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
-	}
-#endif
-	if ( col < 0 ) {
-		Py_INCREF(Py_False);
-		return Py_False;
+	conn_res = (conn_handle *)py_conn_res;
+	if ( conn_res->stmt_cache != NULL ) {
+		entries = PyDict_Size(conn_res->stmt_cache);
 	}
-	return PyInt_FromLong(col);
+	return Py_BuildValue("{s:l,s:n,s:l,s:l}", "size", conn_res->stmt_cache_size,
+		"entries", entries, "hits", conn_res->stmt_cache_hits,
+		"misses", conn_res->stmt_cache_misses);
 }
 
-/*!# ibm_db.field_precision
+/*!# ibm_db.round_trips
  *
  * ===Description
- * int ibm_db.field_precision ( resource stmt, mixed column )
+ * dict ibm_db.round_trips ( resource handle [, bool reset] )
  *
- * Returns the precision of the indicated column in a result set.
+ * Returns the number of requests a statement, or the statements of a
+ * connection, sent to the database server to prepare, describe and execute
+ * SQL. With SQL_ATTR_DEFERRED_PREPARE turned on, a prepare is sent along
+ * with the execute that follows it, unless the result set or the parameters
+ * are described first. Fetches are not counted.
  *
  * ===Parameters
  *
- * ====stmt
- *		Specifies a statement resource containing a result set.
+ * ====handle
+ *		A valid connection or statement resource.
  *
- * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ * ====reset
+ *		If True, the counters are set back to 0 after being read.
  *
  * ===Return Values
  *
- * Returns an integer containing the precision of the specified column. If the
- * specified column does not exist in the result set, ibm_db.field_precision()
- * returns FALSE.
+ * A dictionary with the keys:
+ *		prepare		prepares sent on their own
+ *		describe	describes of a result set or of parameters
+ *		execute		executes, including those carrying a deferred prepare
  */
-static PyObject *ibm_db_field_precision(PyObject *self, PyObject *args)
+static PyObject *ibm_db_round_trips(PyObject *self, PyObject *args)
 {
-	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	int col = -1;
-
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
-		return NULL;
+	PyObject *py_handle = NULL;
+	PyObject *py_reset = NULL;
+	PyObject *retVal = NULL;
+	long *round_trips;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+	if (!PyArg_ParseTuple(args, "O|O", &py_handle, &py_reset))
 		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
-	}
 
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
-			return NULL;
-		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
+	if (!NIL_P(py_handle) && PyObject_TypeCheck(py_handle, &conn_handleType)) {
+		round_trips = ((conn_handle *)py_handle)->round_trips;
+	} else if (!NIL_P(py_handle) && PyObject_TypeCheck(py_handle, &stmt_handleType)) {
+		round_trips = ((stmt_handle *)py_handle)->round_trips;
 	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
-	} 
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
 	}
-#endif
-	if ( col < 0 ) {
-		Py_RETURN_FALSE;
+	retVal = Py_BuildValue("{s:l,s:l,s:l}", "prepare", round_trips[RT_PREPARE],
+		"describe", round_trips[RT_DESCRIBE], "execute", round_trips[RT_EXECUTE]);
+	if ( retVal != NULL && py_reset != NULL && PyObject_IsTrue(py_reset) ) {
+		memset(round_trips, 0, RT_COUNT * sizeof(long));
 	}
-	return PyInt_FromLong(stmt_res->column_info[col].size);
-
+	return retVal;
 }
 
-/*!# ibm_db.field_scale
+/*!# ibm_db.stats
  *
  * ===Description
- * int ibm_db.field_scale ( resource stmt, mixed column )
+ * dict ibm_db.stats ( [resource handle [, bool reset]] )
  *
- * Returns the scale of the indicated column in a result set.
+ * Returns counters and timings of the calls made on a statement, on the
+ * statements of a connection, or in the whole process when no handle is
+ * given. The time of a call is the wall time of the ibm_db function, from
+ * its start to its return. gil_released_time is the part of it spent in CLI
+ * calls with the GIL released, so the rest is mostly spent converting
+ * values between Python and the database types.
  *
  * ===Parameters
- * ====stmt
- *		Specifies a statement resource containing a result set.
  *
- * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ * ====handle
+ *		A valid connection or statement resource, or None for the counters
+ *		of the process.
+ *
+ * ====reset
+ *		If True, the counters are set back to 0 after being read.
  *
  * ===Return Values
  *
- * Returns an integer containing the scale of the specified column. If the
- * specified column does not exist in the result set, ibm_db.field_scale()
- * returns FALSE.
+ * A dictionary with the keys:
+ *		prepare, execute, fetch	number of calls
+ *		prepare_time, execute_time, fetch_time	seconds spent in those calls
+ *		rows_fetched		rows returned by the fetch functions
+ *		rows_affected		rows inserted, updated or deleted
+ *		lob_bytes		bytes of LOB and XML values fetched or sent
+ *		cache_hits		prepares served by the statement cache
+ *		gil_released_time	seconds spent in CLI calls without the GIL
  */
-static PyObject *ibm_db_field_scale(PyObject *self, PyObject *args)
+static PyObject *ibm_db_stats(PyObject *self, PyObject *args)
 {
-	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	int col = -1;
+	PyObject *py_handle = NULL;
+	PyObject *py_reset = NULL;
+	PyObject *retVal = NULL;
+	ibm_db_call_stats *stats;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "|OO", &py_handle, &py_reset))
 		return NULL;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
-		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
-	}
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
-			return NULL;
-		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
+	if (NIL_P(py_handle)) {
+		stats = &ibm_db_process_stats;
+	} else if (PyObject_TypeCheck(py_handle, &conn_handleType)) {
+		stats = &((conn_handle *)py_handle)->stats;
+	} else if (PyObject_TypeCheck(py_handle, &stmt_handleType)) {
+		stats = &((stmt_handle *)py_handle)->stats;
 	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
-	}
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
-	}
-#endif
-	if ( col < 0 ) {
-		Py_RETURN_FALSE;
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
 	}
-	return PyInt_FromLong(stmt_res->column_info[col].scale);
+	retVal = Py_BuildValue("{s:l,s:d,s:l,s:d,s:l,s:d,s:l,s:l,s:l,s:l,s:d}",
+		"prepare", stats->calls[ST_PREPARE], "prepare_time", stats->seconds[ST_PREPARE],
+		"execute", stats->calls[ST_EXECUTE], "execute_time", stats->seconds[ST_EXECUTE],
+		"fetch", stats->calls[ST_FETCH], "fetch_time", stats->seconds[ST_FETCH],
+		"rows_fetched", stats->rows_fetched, "rows_affected", stats->rows_affected,
+		"lob_bytes", stats->lob_bytes, "cache_hits", stats->cache_hits,
+		"gil_released_time", stats->gil_released);
+	if ( retVal != NULL && py_reset != NULL && PyObject_IsTrue(py_reset) ) {
+		memset(stats, 0, sizeof(ibm_db_call_stats));
+	}
+	return retVal;
 }
 
-/*!# ibm_db.field_type
+/*!# ibm_db.set_input_sizes
  *
  * ===Description
- * string ibm_db.field_type ( resource stmt, mixed column )
+ * bool ibm_db.set_input_sizes ( resource stmt, tuple sizes )
  *
- * Returns the data type of the indicated column in a result set.
+ * Declares the SQL type of the parameters of a prepared statement, which
+ * ibm_db.execute() and ibm_db.execute_many() then use instead of asking the
+ * database server with SQLDescribeParam. The declarations are kept for the
+ * following executes of the statement, but not for a later ibm_db.prepare()
+ * served from the statement cache.
  *
  * ===Parameters
+ *
  * ====stmt
- *		Specifies a statement resource containing a result set.
+ *		A prepared statement.
  *
- * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ * ====sizes
+ *		A tuple or list with an entry for each parameter, starting with the
+ *		first one. An entry is None for a parameter to describe, or a tuple
+ *		(sql_type, precision[, scale]) where sql_type is one of the
+ *		ibm_db.SQL_* type constants, such as ibm_db.SQL_VARCHAR.
  *
- * ====Return Values
+ * ===Return Values
  *
- * Returns a string containing the defined data type of the specified column.
- * If the specified column does not exist in the result set, ibm_db.field_type()
- * returns FALSE.
+ * Returns TRUE on success or FALSE on failure.
  */
-static PyObject *ibm_db_field_type(PyObject *self, PyObject *args)
+static PyObject *ibm_db_set_input_sizes(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	stmt_handle* stmt_res = NULL;
-	char *col_name = NULL;
-	char *str_val = NULL;
-	int col = -1;
+	PyObject *py_sizes = NULL;
+	PyObject *entry;
+	stmt_handle *stmt_res;
+	ibm_db_param_desc *param_desc;
+	int num_sizes, num_alloc, i, rc;
+	SQLSMALLINT num_params = 0;
+	long sql_type, precision, scale;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &py_sizes))
 		return NULL;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+	if (NIL_P(py_stmt_res) || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
 		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
 	}
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
-			return NULL;
-		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
-	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
+	stmt_res = (stmt_handle *)py_stmt_res;
+	if (!PyTuple_Check(py_sizes) && !PyList_Check(py_sizes)) {
+		PyErr_SetString(PyExc_Exception, "Sizes must be a tuple or a list");
+		return NULL;
+	}
+	num_sizes = PySequence_Size(py_sizes);
+
+	/* Room for the parameters described later as well */
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLNumParams((SQLHSTMT)stmt_res->hstmt, &num_params);
+	Py_END_ALLOW_THREADS;
+	if ( rc == SQL_ERROR ) {
+		num_params = 0;
 	}
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
+	num_alloc = num_sizes > num_params ? num_sizes : num_params;
+	if ( num_alloc == 0 ) {
+		Py_RETURN_TRUE;
 	}
-#endif
-	if ( col < 0 ) {
-		Py_RETURN_FALSE;
+	param_desc = ALLOC_N(ibm_db_param_desc, num_alloc);
+	if ( param_desc == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return NULL;
 	}
-	switch (stmt_res->column_info[col].type) {
-		case SQL_SMALLINT:
-		case SQL_INTEGER:
-			str_val = "int";
-			break;
-		case SQL_BIGINT:
-			str_val = "bigint";
-			break;
-		case SQL_REAL:
-		case SQL_FLOAT:
-		case SQL_DOUBLE:
-		case SQL_DECFLOAT:
-			str_val = "real";
-			break;
-		case SQL_DECIMAL:
-		case SQL_NUMERIC:
-			str_val = "decimal";
-			break;
-		case SQL_CLOB:
-			str_val = "clob";
-			break;
-		case SQL_DBCLOB:
-			str_val = "dbclob";
-			break;	
-		case SQL_BLOB:
-			str_val = "blob";
-			break;
-		case SQL_XML:
-			str_val = "xml";
-			break;
-		case SQL_TYPE_DATE:
-			str_val = "date";
-			break;
-		case SQL_TYPE_TIME:
-			str_val = "time";
-			break;
-		case SQL_TYPE_TIMESTAMP:
-			str_val = "timestamp";
-			break;
-		default:
-			str_val = "string";
-			break;
+
+	for ( i = 0; i < num_sizes; i++ ) {
+		entry = PySequence_Fast_GET_ITEM(py_sizes, i);
+		param_desc[i].data_type = SQL_UNKNOWN_TYPE;
+		param_desc[i].precision = 0;
+		param_desc[i].scale = 0;
+		param_desc[i].nullable = SQL_NULLABLE_UNKNOWN;
+		if ( entry == Py_None ) {
+			continue;
+		}
+		scale = 0;
+		if ( !PyTuple_Check(entry) ||
+				!PyArg_ParseTuple(entry, "ll|l", &sql_type, &precision, &scale) ) {
+			PyErr_Clear();
+			PyMem_Del(param_desc);
+			PyErr_SetString(PyExc_Exception, "Sizes must be None or (sql_type, precision[, scale])");
+			return NULL;
+		}
+		param_desc[i].data_type = (SQLSMALLINT)sql_type;
+		param_desc[i].precision = (SQLUINTEGER)precision;
+		param_desc[i].scale = (SQLSMALLINT)scale;
 	}
-	return StringOBJ_FromASCII(str_val);
+
+	if ( stmt_res->param_desc != NULL ) {
+		PyMem_Del(stmt_res->param_desc);
+	}
+	stmt_res->param_desc = param_desc;
+	stmt_res->param_desc_alloc = num_alloc;
+	stmt_res->num_param_desc = num_sizes;
+	stmt_res->sizes_declared = 1;
+	Py_RETURN_TRUE;
 }
 
-/*!# ibm_db.field_width
+/*!# ibm_db.set_output_size
  *
  * ===Description
- * int ibm_db.field_width ( resource stmt, mixed column )
+ * bool ibm_db.set_output_size ( resource stmt, int size [, int column] )
  *
- * Returns the width of the current value of the indicated column in a result
- * set. This is the maximum width of the column for a fixed-length data type, or
- * the actual width of the column for a variable-length data type.
+ * Sets the number of characters bound for the character columns of the
+ * result set when rows are fetched one at a time. By default a column is
+ * bound for its size, up to 512 characters. Longer values are read in full
+ * with SQLGetData into a buffer the statement keeps for the following rows,
+ * so a size fitting the usual values saves memory on wide columns without
+ * cutting any value.
  *
  * ===Parameters
  *
  * ====stmt
- *		Specifies a statement resource containing a result set.
+ *		A valid statement resource.
+ *
+ * ====size
+ *		The number of characters, 0 for the default.
  *
  * ====column
- *		Specifies the column in the result set. This can either be an integer
- * representing the 0-indexed position of the column, or a string containing the
- * name of the column.
+ *		The 0-indexed column the size is for. All character columns without
+ *		a size of their own if not given.
  *
  * ===Return Values
  *
- * Returns an integer containing the width of the specified character or binary
- * data type column in a result set. If the specified column does not exist in
- * the result set, ibm_db.field_width() returns FALSE.
+ * Returns TRUE on success or FALSE on failure.
  */
-static PyObject *ibm_db_field_width(PyObject *self, PyObject *args)
+static PyObject *ibm_db_set_output_size(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
-	PyObject *column = NULL;
-#if  PY_MAJOR_VERSION >= 3
-	PyObject *col_name_py3_tmp = NULL;
-#endif
-	int col = -1;
-	char *col_name = NULL;
-	stmt_handle *stmt_res = NULL;
+	PyObject *py_column = NULL;
+	PyObject *py_size = NULL;
+	stmt_handle *stmt_res;
+	long size = 0;
 	int rc;
-	SQLINTEGER colDataSize;
 
-	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
+	if (!PyArg_ParseTuple(args, "Ol|O", &py_stmt_res, &size, &py_column))
 		return NULL;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+	if (NIL_P(py_stmt_res) || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
+		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
 		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
 	}
-	if ( TYPE(column) == PYTHON_FIXNUM ) {
-		col = PyInt_AsLong(column);
-	} else if (PyString_Check(column)) {
-#if  PY_MAJOR_VERSION >= 3
-		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
-		if (col_name_py3_tmp == NULL) {
+	stmt_res = (stmt_handle *)py_stmt_res;
+	if ( size < 0 ) {
+		PyErr_SetString(PyExc_Exception, "Size must not be negative");
+		return NULL;
+	}
+
+	if ( NIL_P(py_column) ) {
+		stmt_res->output_size = size;
+	} else {
+		if ( !PyInt_Check(py_column) && !PyLong_Check(py_column) ) {
+			PyErr_SetString(PyExc_Exception, "Column must be an integer");
+			return NULL;
+		}
+		if ( stmt_res->output_sizes == NULL ) {
+			stmt_res->output_sizes = PyDict_New();
+			if ( stmt_res->output_sizes == NULL ) {
+				return NULL;
+			}
+		}
+		py_size = PyInt_FromLong(size);
+		if ( py_size == NULL ) {
+			return NULL;
+		}
+		rc = PyDict_SetItem(stmt_res->output_sizes, py_column, py_size);
+		Py_DECREF(py_size);
+		if ( rc < 0 ) {
 			return NULL;
 		}
-		column = col_name_py3_tmp;
-#endif
-		col_name = PyBytes_AsString(column);
-	} else {
-		/* Column argument has to be either an integer or string */
-		Py_RETURN_FALSE;
-	}
-	col = _python_ibm_db_get_column_by_name(stmt_res, col_name, col);
-#if  PY_MAJOR_VERSION >= 3
-	if ( col_name_py3_tmp != NULL ) {
-		Py_XDECREF(col_name_py3_tmp);
 	}
-#endif
-	if ( col < 0 ) {
-		Py_RETURN_FALSE;
+	/* Bind again with the new size on the next fetch */
+	if ( stmt_res->row_data != NULL ) {
+		_python_ibm_db_unbind_columns(stmt_res);
 	}
+	Py_RETURN_TRUE;
+}
+
+/*	static RETCODE _python_ibm_db_get_data(stmt_handle *stmt_res, int col_num, short ctype, void *buff, int in_length, SQLINTEGER *out_length) */
+static RETCODE _python_ibm_db_get_data(stmt_handle *stmt_res, int col_num, short ctype, void *buff, int in_length, SQLINTEGER *out_length)
+{
+	RETCODE rc = SQL_SUCCESS;
+	double start;
+	long bytes;
+	int term = 0;
 	
+	start = _python_ibm_db_clock();
 	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLColAttributes((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT)col + 1,
-		SQL_DESC_LENGTH, NULL, 0, NULL, &colDataSize);
+	rc = SQLGetData((SQLHSTMT)stmt_res->hstmt, col_num, ctype, buff, in_length, 
+		out_length);
 	Py_END_ALLOW_THREADS;
+	_python_ibm_db_stats_gil(stmt_res, start);
 	
-	if ( rc != SQL_SUCCESS ) {
+	if ( rc == SQL_ERROR ) {
 		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
 			NULL, -1, 1);
-		PyErr_Clear();
-		Py_RETURN_FALSE;
+	} else if ( stmt_res->column_info != NULL && rc != SQL_NO_DATA_FOUND ) {
+		switch (stmt_res->column_info[col_num - 1].type) {
+			case SQL_BLOB:
+			case SQL_CLOB:
+			case SQL_DBCLOB:
+			case SQL_XML:
+				/* count the bytes received, without the terminator */
+				if ( ctype == SQL_C_WCHAR ) {
+					term = sizeof(SQLWCHAR);
+				} else if ( ctype == SQL_C_CHAR ) {
+					term = 1;
+				}
+				bytes = *out_length;
+				if ( bytes == SQL_NO_TOTAL || bytes > in_length - term ) {
+					bytes = in_length - term;
+				}
+				if ( bytes > 0 ) {
+					_python_ibm_db_stats_lob(stmt_res, bytes);
+				}
+				break;
+		}
 	}
-	return PyInt_FromLong(colDataSize);
+	return rc;
+}
+
+/* Chunked reader of a LOB column of the current row, see ibm_db.lob_reader() */
+typedef struct _lob_reader_struct {
+	PyObject_HEAD
+	stmt_handle *stmt_res;		/* Statement positioned on the row */
+	int col_num;			/* 1-indexed column number */
+	SQLSMALLINT ctype;		/* SQL_C_BINARY or SQL_C_WCHAR */
+	SQLINTEGER chunk_size;		/* Bytes or characters per chunk */
+	unsigned long row_gen;		/* row_gen of the statement at creation */
+	SQLWCHAR pending;		/* High surrogate held for the next chunk */
+	int has_pending;
+	int eof;
+} lob_reader;
+
+static void _python_ibm_db_free_lob_reader(lob_reader *reader)
+{
+	Py_XDECREF(reader->stmt_res);
+	reader->stmt_res = NULL;
+	Py_TYPE(reader)->tp_free((PyObject*)reader);
+}
+
+/*	static int _python_ibm_db_lob_reader_check(lob_reader *reader)
+	returns 0 and raises if the statement has moved off the row of the reader
+*/
+static int _python_ibm_db_lob_reader_check(lob_reader *reader)
+{
+	if ( reader->stmt_res != NULL && reader->stmt_res->row_gen != reader->row_gen ) {
+		reader->eof = 1;
+		PyErr_SetString(PyExc_Exception, "LOB reader is no longer valid, the statement has moved to another row");
+		return 0;
+	}
+	return 1;
+}
+
+/*	static Py_ssize_t _python_ibm_db_lob_read_chunk(lob_reader *reader, char *buff, Py_ssize_t in_length)
+	reads the next piece of the LOB with SQLGetData, returns the number of 
+	bytes stored in buff, 0 at the end of the LOB and -1 on error
+*/
+static Py_ssize_t _python_ibm_db_lob_read_chunk(lob_reader *reader, char *buff, Py_ssize_t in_length)
+{
+	SQLINTEGER out_length = 0;
+	Py_ssize_t len_terChar = reader->ctype == SQL_C_WCHAR ? sizeof(SQLWCHAR) : 0;
+	RETCODE rc;
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	if ( reader->eof || reader->stmt_res == NULL ) {
+		return 0;
+	}
+
+	rc = _python_ibm_db_get_data(reader->stmt_res, reader->col_num, reader->ctype, 
+			buff, in_length, &out_length);
+	if ( rc == SQL_NO_DATA_FOUND ) {
+		reader->eof = 1;
+		return 0;
+	} else if ( rc == SQL_ERROR ) {
+		reader->eof = 1;
+		sprintf(error, "Failed to fetch LOB Data: %s", IBM_DB_G(__python_stmt_err_msg));
+		PyErr_SetString(PyExc_Exception, error);
+		return -1;
+	}
+	if ( out_length == SQL_NULL_DATA ) {
+		reader->eof = 1;
+		return 0;
+	}
+	if ( rc == SQL_SUCCESS_WITH_INFO && 
+		 (out_length == SQL_NO_TOTAL || out_length > in_length - len_terChar) ) {
+		/* the data was truncated, more pieces follow */
+		return in_length - len_terChar;
+	}
+	reader->eof = 1;
+	return out_length;
+}
+
+/*	static PyObject *_python_ibm_db_lob_read(lob_reader *reader, Py_ssize_t size)
+	returns the next size bytes (BLOB) or characters (CLOB) of the LOB
+*/
+static PyObject *_python_ibm_db_lob_read(lob_reader *reader, Py_ssize_t size)
+{
+	PyObject *chunk = NULL;
+	SQLWCHAR *wbuff = NULL;
+	Py_ssize_t len, num_chars;
+
+	if ( size <= 0 ) {
+		size = reader->chunk_size;
+	}
+
+	if ( reader->ctype == SQL_C_BINARY ) {
+		chunk = PyBytes_FromStringAndSize(NULL, size);
+		if ( chunk == NULL ) {
+			return NULL;
+		}
+		len = _python_ibm_db_lob_read_chunk(reader, PyBytes_AS_STRING(chunk), size);
+		if ( len < 0 ) {
+			Py_DECREF(chunk);
+			return NULL;
+		}
+		if ( len < size ) {
+			_PyBytes_Resize(&chunk, len);
+		}
+		return chunk;
+	}
+
+	/* Character LOBs are read as UTF-16, a surrogate pair is never split */
+	wbuff = ALLOC_N(SQLWCHAR, size + 2);
+	if ( wbuff == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory for LOB Data");
+		return NULL;
+	}
+	num_chars = 0;
+	if ( reader->has_pending ) {
+		wbuff[num_chars++] = reader->pending;
+		reader->has_pending = 0;
+	}
+	len = _python_ibm_db_lob_read_chunk(reader, (char *)(wbuff + num_chars), 
+			(size + 1) * sizeof(SQLWCHAR));
+	if ( len < 0 ) {
+		PyMem_Del(wbuff);
+		return NULL;
+	}
+	num_chars += len / sizeof(SQLWCHAR);
+	if ( !reader->eof && num_chars > 1 && 
+		 wbuff[num_chars - 1] >= 0xD800 && wbuff[num_chars - 1] <= 0xDBFF ) {
+		reader->pending = wbuff[--num_chars];
+		reader->has_pending = 1;
+	}
+	chunk = getSQLWCharAsPyUnicodeObject(wbuff, num_chars * sizeof(SQLWCHAR));
+	PyMem_Del(wbuff);
+	return chunk;
+}
+
+static PyObject *ibm_db_lob_reader_read(lob_reader *self, PyObject *args)
+{
+	PyObject *chunks = NULL;
+	PyObject *chunk = NULL;
+	PyObject *empty = NULL;
+	PyObject *value = NULL;
+	Py_ssize_t size = -1;
+	long py_size = -1;
+
+	if ( !PyArg_ParseTuple(args, "|l", &py_size) )
+		return NULL;
+	size = py_size;
+
+	if ( !_python_ibm_db_lob_reader_check(self) ) {
+		return NULL;
+	}
+
+	if ( size >= 0 ) {
+		if ( size == 0 || self->eof ) {
+			return self->ctype == SQL_C_BINARY ? PyBytes_FromStringAndSize("", 0) : 
+				PyUnicode_FromStringAndSize("", 0);
+		}
+		return _python_ibm_db_lob_read(self, size);
+	}
+
+	/* read the rest of the LOB */
+	chunks = PyList_New(0);
+	if ( chunks == NULL ) {
+		return NULL;
+	}
+	while ( !self->eof ) {
+		chunk = _python_ibm_db_lob_read(self, self->chunk_size);
+		if ( chunk == NULL ) {
+			Py_DECREF(chunks);
+			return NULL;
+		}
+		PyList_Append(chunks, chunk);
+		Py_DECREF(chunk);
+	}
+	if ( self->ctype == SQL_C_BINARY ) {
+		empty = PyBytes_FromStringAndSize("", 0);
+	} else {
+		empty = PyUnicode_FromStringAndSize("", 0);
+	}
+	if ( empty != NULL ) {
+		value = PyObject_CallMethod(empty, "join", "O", chunks);
+		Py_DECREF(empty);
+	}
+	Py_DECREF(chunks);
+	return value;
+}
+
+static PyObject *ibm_db_lob_reader_readinto(lob_reader *self, PyObject *args)
+{
+	PyObject *py_buffer = NULL;
+	Py_buffer view;
+	Py_ssize_t len;
+
+	if ( !PyArg_ParseTuple(args, "O", &py_buffer) )
+		return NULL;
+
+	if ( self->ctype != SQL_C_BINARY ) {
+		PyErr_SetString(PyExc_Exception, "readinto() is only supported for binary LOB columns");
+		return NULL;
+	}
+	if ( !_python_ibm_db_lob_reader_check(self) ) {
+		return NULL;
+	}
+	if ( PyObject_GetBuffer(py_buffer, &view, PyBUF_WRITABLE) < 0 ) {
+		return NULL;
+	}
+	len = 0;
+	if ( view.len > 0 ) {
+		len = _python_ibm_db_lob_read_chunk(self, (char *)view.buf, view.len);
+	}
+	PyBuffer_Release(&view);
+	if ( len < 0 ) {
+		return NULL;
+	}
+	return PyInt_FromLong(len);
+}
+
+static PyObject *ibm_db_lob_reader_close(lob_reader *self, PyObject *args)
+{
+	self->eof = 1;
+	Py_XDECREF(self->stmt_res);
+	self->stmt_res = NULL;
+	Py_RETURN_NONE;
+}
+
+static PyObject *ibm_db_lob_reader_iternext(lob_reader *self)
+{
+	PyObject *chunk = NULL;
+
+	if ( !_python_ibm_db_lob_reader_check(self) ) {
+		return NULL;
+	}
+	if ( self->eof ) {
+		return NULL;
+	}
+	chunk = _python_ibm_db_lob_read(self, self->chunk_size);
+	if ( chunk != NULL && PyObject_Length(chunk) == 0 && self->eof ) {
+		Py_DECREF(chunk);
+		return NULL;
+	}
+	return chunk;
 }
 
-/*!# ibm_db.cursor_type
+static PyMethodDef lob_reader_methods[] = {
+	{"read", (PyCFunction)ibm_db_lob_reader_read, METH_VARARGS, "Reads at most size bytes or characters, all the remaining data by default"},
+	{"readinto", (PyCFunction)ibm_db_lob_reader_readinto, METH_VARARGS, "Reads the next bytes of a binary LOB into a writable buffer"},
+	{"close", (PyCFunction)ibm_db_lob_reader_close, METH_NOARGS, "Releases the statement"},
+	{NULL} /* Sentinel */
+};
+
+static PyTypeObject lob_readerType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"ibm_db.IBM_DBLobReader", /*tp_name			 */
+	sizeof(lob_reader), /*tp_basicsize			 */
+	0,						 /*tp_itemsize		*/
+	(destructor)_python_ibm_db_free_lob_reader, /*tp_dealloc	*/
+	0,						 /*tp_print			*/
+	0,						 /*tp_getattr		 */
+	0,						 /*tp_setattr		 */
+	0,						 /*tp_compare		 */
+	0,						 /*tp_repr			*/
+	0,						 /*tp_as_number		*/
+	0,						 /*tp_as_sequence	 */
+	0,						 /*tp_as_mapping	  */
+	0,						 /*tp_hash			*/
+	0,						 /*tp_call			*/
+	0,						 /*tp_str			 */
+	0,						 /*tp_getattro		*/
+	0,						 /*tp_setattro		*/
+	0,						 /*tp_as_buffer		*/
+	Py_TPFLAGS_DEFAULT,		/*tp_flags			*/
+	"IBM DataServer LOB reader object", /* tp_doc		*/
+	0,						 /* tp_traverse		*/
+	0,						 /* tp_clear		  */
+	0,						 /* tp_richcompare	*/
+	0,						 /* tp_weaklistoffset */
+	PyObject_SelfIter,		 /* tp_iter			*/
+	(iternextfunc)ibm_db_lob_reader_iternext, /* tp_iternext		*/
+	lob_reader_methods,		 /* tp_methods		*/
+	0,						 /* tp_members		*/
+	0,						 /* tp_getset		 */
+	0,						 /* tp_base			*/
+	0,						 /* tp_dict			*/
+	0,						 /* tp_descr_get	  */
+	0,						 /* tp_descr_set	  */
+	0,						 /* tp_dictoffset	 */
+	0,						 /* tp_init			*/
+};
+
+/*!# ibm_db.lob_reader
  *
  * ===Description
- * int ibm_db.cursor_type ( resource stmt )
+ * IBM_DBLobReader ibm_db.lob_reader ( resource stmt, mixed column [, int chunk_size] )
  *
- * Returns the cursor type used by a statement resource. Use this to determine
- * if you are working with a forward-only cursor or scrollable cursor.
+ * Returns a reader streaming a LOB column of the current row in chunks.
+ *
+ * Use ibm_db.lob_reader() after ibm_db.fetch_row() to read a large BLOB, CLOB,
+ * DBCLOB or XML value piece by piece with repeated calls to SQLGetData,
+ * instead of materialising the whole value as ibm_db.result() does. The
+ * reader is an iterator yielding chunks of chunk_size, and provides read()
+ * and, for binary columns, readinto() like a file object. The reader only
+ * reads the row it was created on: once the statement is fetched from,
+ * executed again or freed, reading from it raises an exception.
  *
  * ===Parameters
+ *
  * ====stmt
- *		A valid statement resource.
+ *		A valid stmt resource positioned on a row by ibm_db.fetch_row().
+ *
+ * ====column
+ *		Either an integer mapping to the 0-indexed field in the result set, or
+ * a string matching the name of the column.
+ *
+ * ====chunk_size
+ *		Number of bytes (binary columns) or characters (character columns)
+ * returned per chunk. Defaults to LOB_BUFSIZ.
  *
  * ===Return Values
  *
- * Returns either SQL_SCROLL_FORWARD_ONLY if the statement resource uses a
- * forward-only cursor or SQL_CURSOR_KEYSET_DRIVEN if the statement resource
- * uses a scrollable cursor.
+ * Returns an IBM_DBLobReader object. Binary columns are returned as bytes and
+ * character columns as unicode chunks, a NULL value reads as empty.
  */
-static PyObject *ibm_db_cursor_type(PyObject *self, PyObject *args)			
+static PyObject *ibm_db_lob_reader(PyObject *self, PyObject *args)
 {
 	PyObject *py_stmt_res = NULL;
+	PyObject *column = NULL;
+#if  PY_MAJOR_VERSION >= 3
+	PyObject *col_name_py3_tmp = NULL;
+#endif
 	stmt_handle *stmt_res = NULL;
+	lob_reader *reader = NULL;
+	long col_num = -1;
+	long chunk_size = LOB_BUFSIZ;
+	SQLSMALLINT ctype;
+	char error[DB2_MAX_ERR_MSG_LEN];
 
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if (!PyArg_ParseTuple(args, "OO|l", &py_stmt_res, &column, &chunk_size))
 		return NULL;
 
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+	if (NIL_P(py_stmt_res) || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
 		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
 		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
 	}
+	stmt_res = (stmt_handle *)py_stmt_res;
 
-	return PyInt_FromLong(stmt_res->cursor_type != SQL_SCROLL_FORWARD_ONLY);
-}
-
-/*!# ibm_db.rollback
- *
- * ===Description
- * bool ibm_db.rollback ( resource connection )
- *
- * Rolls back an in-progress transaction on the specified connection resource
- * and begins a new transaction. Python applications normally default to
- * AUTOCOMMIT mode, so ibm_db.rollback() normally has no effect unless
- * AUTOCOMMIT has been turned off for the connection resource.
- *
- * Note: If the specified connection resource is a persistent connection, all
- * transactions in progress for all applications using that persistent
- * connection will be rolled back. For this reason, persistent connections are
- * not recommended for use in applications that require transactions.
- *
- * ===Parameters
- *
- * ====connection
- *		A valid database connection resource variable as returned from
- * ibm_db.connect() or ibm_db.pconnect().
- *
- * ===Return Values
- *
- * Returns TRUE on success or FALSE on failure.
- */
-static PyObject *ibm_db_rollback(PyObject *self, PyObject *args)
-{
-	PyObject *py_conn_res = NULL;
-	conn_handle *conn_res;
-	int rc;
-
-	if (!PyArg_ParseTuple(args, "O", &py_conn_res))
+	if ( chunk_size <= 0 ) {
+		PyErr_SetString(PyExc_Exception, "Chunk size must be a positive value");
 		return NULL;
+	}
 
-	if (!NIL_P(py_conn_res)) {
-		if (!PyObject_TypeCheck(py_conn_res, &conn_handleType)) {
-			PyErr_SetString( PyExc_Exception, "Supplied connection object Parameter is invalid" );
-			return NULL;
-		} else {
-			conn_res = (conn_handle *)py_conn_res;
-		}
-		if (!conn_res->handle_active) {
-			PyErr_SetString(PyExc_Exception, "Connection is not active");
+	/* get column header info */
+	if ( stmt_res->column_info == NULL ) {
+		if (_python_ibm_db_get_result_set_info(stmt_res)<0) {
+			sprintf(error, "Column information cannot be retrieved: %s", 
+				IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
 			return NULL;
 		}
+	}
 
-		rc = SQLEndTran(SQL_HANDLE_DBC, conn_res->hdbc, SQL_ROLLBACK);
-
-		if ( rc == SQL_ERROR ) {
-			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1, 
-				NULL, -1, 1);
-			PyErr_Clear();
-			Py_RETURN_FALSE;
-		} else {
-			Py_RETURN_TRUE;
+	if ( TYPE(column) == PYTHON_FIXNUM ) {
+		col_num = PyLong_AsLong(column);
+	} else if (PyString_Check(column)) {
+#if  PY_MAJOR_VERSION >= 3
+		col_name_py3_tmp = PyUnicode_AsASCIIString(column);
+		if (col_name_py3_tmp == NULL) {
+			return NULL;
 		}
+		column = col_name_py3_tmp;
+#endif
+		col_num = _python_ibm_db_get_column_by_name(stmt_res, PyBytes_AsString(column), -1);
+#if  PY_MAJOR_VERSION >= 3
+		Py_XDECREF(col_name_py3_tmp);
+#endif
 	}
-	Py_RETURN_FALSE;
-}
-
-/*!# ibm_db.free_stmt
- *
- * ===Description
- * bool ibm_db.free_stmt ( resource stmt )
- *
- * Frees the system and database resources that are associated with a statement
- * resource. These resources are freed implicitly when a script finishes, but
- * you can call ibm_db.free_stmt() to explicitly free the statement resources
- * before the end of the script.
- *
- * ===Parameters
- * ====stmt
- *		A valid statement resource.
- *
- * ===Return Values
- *
- * Returns TRUE on success or FALSE on failure.
- *
- * DEPRECATED
- */
-static PyObject *ibm_db_free_stmt(PyObject *self, PyObject *args)
-{
-	PyObject *py_stmt_res = NULL;
-	stmt_handle *handle;
-	SQLRETURN rc;
-	if (!PyArg_ParseTuple(args, "O", &py_stmt_res))
+	if ( col_num < 0 || col_num >= stmt_res->num_columns ) {
+		PyErr_SetString(PyExc_Exception, "Column ordinal out of range");
 		return NULL;
-	if (!NIL_P(py_stmt_res)) {
-		if (PyObject_TypeCheck(py_stmt_res, &stmt_handleType)) {
-			handle = (stmt_handle *)py_stmt_res;
-			if (handle->hstmt != -1) {
-				rc = SQLFreeHandle( SQL_HANDLE_STMT, handle->hstmt);
-				if ( rc == SQL_ERROR ){ 
-					_python_ibm_db_check_sql_errors(handle->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
-					Py_RETURN_FALSE;
-				}
-				 _python_ibm_db_free_result_struct(handle);
-				handle->hstmt = -1;
-				Py_RETURN_TRUE;
-			}
-		}
 	}
-	Py_RETURN_NONE;
-}
 
-/*	static RETCODE _python_ibm_db_get_data(stmt_handle *stmt_res, int col_num, short ctype, void *buff, int in_length, SQLINTEGER *out_length) */
-static RETCODE _python_ibm_db_get_data(stmt_handle *stmt_res, int col_num, short ctype, void *buff, int in_length, SQLINTEGER *out_length)
-{
-	RETCODE rc = SQL_SUCCESS;
-	
-	Py_BEGIN_ALLOW_THREADS;
-	rc = SQLGetData((SQLHSTMT)stmt_res->hstmt, col_num, ctype, buff, in_length, 
-		out_length);
-	Py_END_ALLOW_THREADS;
-	
-	if ( rc == SQL_ERROR ) {
-		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
-			NULL, -1, 1);
+	switch ( stmt_res->column_info[col_num].type ) {
+		case SQL_BLOB:
+		case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+		case SQL_LONGVARBINARY:
+#endif /* PASE */
+		case SQL_VARBINARY:
+			ctype = SQL_C_BINARY;
+			break;
+		case SQL_CLOB:
+		case SQL_DBCLOB:
+		case SQL_XML:
+#ifndef PASE /* i5/OS SQL_LONGVARCHAR is SQL_VARCHAR */
+		case SQL_LONGVARCHAR:
+		case SQL_WLONGVARCHAR:
+#endif /* PASE */
+			ctype = SQL_C_WCHAR;
+			break;
+		default:
+			PyErr_SetString(PyExc_Exception, "Column is not a LOB column");
+			return NULL;
 	}
-	return rc;
+
+	reader = PyObject_NEW(lob_reader, &lob_readerType);
+	if ( reader == NULL ) {
+		return NULL;
+	}
+	Py_INCREF(stmt_res);
+	reader->stmt_res = stmt_res;
+	reader->col_num = col_num + 1;
+	reader->ctype = ctype;
+	reader->chunk_size = chunk_size;
+	reader->row_gen = stmt_res->row_gen;
+	reader->pending = 0;
+	reader->has_pending = 0;
+	reader->eof = 0;
+	return (PyObject *)reader;
 }
 
 /*!# ibm_db.result
@@ -7458,6 +11073,7 @@ static PyObject *ibm_db_result(PyObject *self, PyObject *args)
 	SQLSMALLINT column_type, targetCType = SQL_C_CHAR, len_terChar = 0 ;
 	double double_val;
 	SQLINTEGER long_val;
+	SQLBIGINT bigint_val;
 	PyObject *return_value = NULL;
 
 	if (!PyArg_ParseTuple(args, "OO", &py_stmt_res, &column))
@@ -7523,7 +11139,6 @@ static PyObject *ibm_db_result(PyObject *self, PyObject *args)
 		case SQL_LONGVARCHAR:
 		case SQL_LONGVARGRAPHIC:
 #endif /* PASE */
-		case SQL_BIGINT:
 		case SQL_DECIMAL:
 		case SQL_NUMERIC:
 		case SQL_DECFLOAT:
@@ -7555,8 +11170,6 @@ static PyObject *ibm_db_result(PyObject *self, PyObject *args)
 			if (out_length == SQL_NULL_DATA) {
 				Py_INCREF(Py_None);
 				return_value = Py_None;
-			} else if (column_type == SQL_BIGINT){
-				return_value = PyLong_FromString(out_ptr, NULL, 0);
 			} else {
 				return_value = getSQLWCharAsPyUnicodeObject(out_ptr, out_length);
 			}
@@ -7672,6 +11285,21 @@ static PyObject *ibm_db_result(PyObject *self, PyObject *args)
 			}
 			break;
 
+		case SQL_BIGINT:
+			rc = _python_ibm_db_get_data(stmt_res, col_num+1, SQL_C_SBIGINT, 
+						 &bigint_val, sizeof(bigint_val), 
+						 &out_length);
+			if ( rc == SQL_ERROR ) {
+				PyErr_Clear();
+				Py_RETURN_FALSE;
+			}
+			if (out_length == SQL_NULL_DATA) {
+				Py_RETURN_NONE;
+			} else {
+				return PyLong_FromLongLong(bigint_val);
+			}
+			break;
+
 		case SQL_REAL:
 		case SQL_FLOAT:
 		case SQL_DOUBLE:
@@ -7771,54 +11399,149 @@ static PyObject *ibm_db_result(PyObject *self, PyObject *args)
 		default:
 			break;
 		}
-	} else {
-		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+	}
+	Py_RETURN_FALSE;
+}
+
+/*	static int _python_ibm_db_get_row_names(stmt_handle *stmt_res)
+	builds the tuple of interned column names used as the keys of every row
+	of the result set, applying the case mode of the statement to the names
+	once
+*/
+static int _python_ibm_db_get_row_names(stmt_handle *stmt_res)
+{
+	PyObject *names = NULL;
+	PyObject *key = NULL;
+	char *name;
+	int i;
+
+	if ( stmt_res->row_names != NULL && stmt_res->row_names_case == stmt_res->s_case_mode ) {
+		return 0;
+	}
+	Py_CLEAR(stmt_res->row_names);
+
+	names = PyTuple_New(stmt_res->num_columns);
+	if ( names == NULL ) {
+		return -1;
+	}
+	for (i = 0; i < stmt_res->num_columns; i++) {
+		name = (char*)stmt_res->column_info[i].name;
+		switch(stmt_res->s_case_mode) {
+			case CASE_LOWER:
+				strtolower(name, strlen(name));
+				break;
+			case CASE_UPPER:
+				strtoupper(name, strlen(name));
+				break;
+			case CASE_NATURAL:
+			default:
+				break;
+		}
+		key = StringOBJ_FromASCII(name);
+		if ( key == NULL ) {
+			Py_DECREF(names);
+			return -1;
+		}
+		StringOBJ_InternInPlace(&key);
+		PyTuple_SET_ITEM(names, i, key);
+	}
+	stmt_res->row_names = names;
+	stmt_res->row_names_case = stmt_res->s_case_mode;
+	return 0;
+}
+
+/*	static int _python_ibm_db_grow_overflow(stmt_handle *stmt_res, SQLINTEGER size, SQLINTEGER keep)
+	makes the overflow buffer of the statement hold size bytes, keeping its
+	first keep bytes
+*/
+static int _python_ibm_db_grow_overflow(stmt_handle *stmt_res, SQLINTEGER size, SQLINTEGER keep)
+{
+	char *overflow;
+
+	if ( size <= stmt_res->overflow_size ) {
+		return 0;
+	}
+	overflow = ALLOC_N(char, size);
+	if ( overflow == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return -1;
+	}
+	if ( stmt_res->overflow != NULL ) {
+		memcpy(overflow, stmt_res->overflow, keep);
+		PyMem_Del(stmt_res->overflow);
+	}
+	stmt_res->overflow = overflow;
+	stmt_res->overflow_size = size;
+	return 0;
+}
+
+/*	static PyObject *_python_ibm_db_get_overflow(stmt_handle *stmt_res, int col_num, SQLINTEGER length)
+	reads a character value of length bytes, SQL_NO_TOTAL if not known, into
+	the overflow buffer of the statement, which is kept for the following rows.
+	A value the buffer turns out too small for is read in parts
+*/
+static PyObject *_python_ibm_db_get_overflow(stmt_handle *stmt_res, int col_num, SQLINTEGER length)
+{
+	SQLINTEGER size, avail, read = 0, out_length = 0;
+	SQLINTEGER term = CHAR_TERM_SIZE(stmt_res);
+	int rc;
+
+	if ( length < 0 ) {
+		length = stmt_res->column_info[col_num - 1].size * CHAR_MAX_SIZE(stmt_res);
+	}
+	size = length + term;
+	for (;;) {
+		if ( _python_ibm_db_grow_overflow(stmt_res, size, read) < 0 ) {
+			return NULL;
+		}
+		avail = size - read - term;
+		rc = _python_ibm_db_get_data(stmt_res, col_num, CHAR_CTYPE(stmt_res), 
+			stmt_res->overflow + read, avail + term, &out_length);
+		if ( rc == SQL_ERROR ) {
+			PyErr_SetString(PyExc_Exception, IBM_DB_G(__python_stmt_err_msg));
+			return NULL;
+		}
+		if ( out_length == SQL_NULL_DATA ) {
+			Py_RETURN_NONE;
+		}
+		if ( rc != SQL_SUCCESS_WITH_INFO || 
+				(out_length != SQL_NO_TOTAL && out_length <= avail) ) {
+			break;
+		}
+		/* Truncated, the next call returns the rest of the value */
+		read += avail;
+		if ( out_length == SQL_NO_TOTAL ) {
+			size = 2 * size;
+		} else {
+			size = read + (out_length - avail) + term;
+		}
 	}
-	Py_RETURN_FALSE;
+	if ( out_length > 0 && out_length <= avail ) {
+		read += out_length;
+	}
+	return _python_ibm_db_char_value(stmt_res, stmt_res->overflow, read);
 }
 
-/* static void _python_ibm_db_bind_fetch_helper(INTERNAL_FUNCTION_PARAMETERS, 
-												int op)
+/* static PyObject *_python_ibm_db_bind_fetch_row(stmt_handle *stmt_res, 
+												SQLINTEGER row_number, int op)
 */
-static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
+static PyObject *_python_ibm_db_bind_fetch_row(stmt_handle *stmt_res, SQLINTEGER row_number, int op)
 {
 	int rc = -1;
 	int column_number;
-	SQLINTEGER row_number = -1;
-	stmt_handle *stmt_res = NULL;
 	SQLSMALLINT column_type ;
 	ibm_db_row_data_type *row_data;
-	SQLINTEGER out_length, tmp_length = 0;
+	SQLINTEGER out_length;
 	void *out_ptr = NULL;
-	SQLWCHAR *wout_ptr = NULL;
 	int len_terChar = 0;
 	SQLSMALLINT targetCType = SQL_C_CHAR;
-	PyObject *py_stmt_res = NULL;
 	PyObject *return_value = NULL;
-	PyObject *key = NULL;
 	PyObject *value = NULL;
-	PyObject *py_row_number = NULL;
+	PyObject *key = NULL;
+	double start;
 	char error[DB2_MAX_ERR_MSG_LEN];
-	
-	if (!PyArg_ParseTuple(args, "O|O", &py_stmt_res, &py_row_number))
-		return NULL;
-	
-	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
-		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
-		return NULL;
-	} else {
-		stmt_res = (stmt_handle *)py_stmt_res;
-	}
-
-	if (!NIL_P(py_row_number)) {
-		if (PyInt_Check(py_row_number)) {
-			row_number = (SQLINTEGER) PyInt_AsLong(py_row_number);
-		} else {
-			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
-			return NULL;
-		}
-	}
-	_python_ibm_db_init_error_info(stmt_res);
 
 	/* get column header info */
 	if ( stmt_res->column_info == NULL ) {
@@ -7829,6 +11552,10 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 			return NULL;
 		}
 	}
+	/* rows are fetched one at a time again after a block fetch */
+	if ( stmt_res->rowset != NULL ) {
+		_python_ibm_db_unbind_columns(stmt_res);
+	}
 	/* bind the data */
 	if ( stmt_res->row_data == NULL ) {
 		rc = _python_ibm_db_bind_column_helper(stmt_res);
@@ -7840,7 +11567,9 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 		}
 	}
 	/* check if row_number is present */
-	if (PyTuple_Size(args) == 2 && row_number > 0) {
+	stmt_res->row_gen++;
+	start = _python_ibm_db_clock();
+	if (row_number > 0) {
 #ifndef PASE /* i5/OS problem with SQL_FETCH_ABSOLUTE (temporary until fixed) */
 		if (is_systemi) {
 
@@ -7874,10 +11603,6 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 
 			Py_END_ALLOW_THREADS;
 #endif /* PASE */
-	} else if (PyTuple_Size(args) == 2 && row_number < 0) {
-		PyErr_SetString(PyExc_Exception, 
-			"Requested row number must be a positive value");
-		return NULL;
 	} else {
 		/* row_number is NULL or 0; just fetch next row */
 		Py_BEGIN_ALLOW_THREADS;
@@ -7886,6 +11611,7 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 
 		Py_END_ALLOW_THREADS;
 	}
+	_python_ibm_db_stats_gil(stmt_res, start);
 
 	if (rc == SQL_NO_DATA_FOUND) {
 		Py_INCREF(Py_False);
@@ -7899,31 +11625,22 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 	}
 	/* copy the data over return_value */
 	if ( op & FETCH_ASSOC ) {
+		if ( _python_ibm_db_get_row_names(stmt_res) < 0 ) {
+			return NULL;
+		}
 		return_value = PyDict_New();
 	} else if ( op == FETCH_INDEX ) {
 		return_value = PyTuple_New(stmt_res->num_columns);
 	}
+	if ( return_value == NULL ) {
+		return NULL;
+	}
 
 	for (column_number = 0; column_number < stmt_res->num_columns; column_number++) {
 		column_type = stmt_res->column_info[column_number].type;
 		row_data = &stmt_res->row_data[column_number].data;
 		out_length = stmt_res->row_data[column_number].out_length;
 
-		switch(stmt_res->s_case_mode) {
-			case CASE_LOWER:
-				stmt_res->column_info[column_number].name = 
-					(SQLCHAR*)strtolower((char*)stmt_res->column_info[column_number].name, 
-					strlen((char*)stmt_res->column_info[column_number].name));
-				break;
-			case CASE_UPPER:
-				stmt_res->column_info[column_number].name = 
-					(SQLCHAR*)strtoupper((char*)stmt_res->column_info[column_number].name, 
-					strlen((char*)stmt_res->column_info[column_number].name));
-				break;
-			case CASE_NATURAL:
-			default:
-					break;
-		}
 		if (out_length == SQL_NULL_DATA) {
 			Py_INCREF(Py_None);
 			value = Py_None;
@@ -7936,42 +11653,24 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 				case SQL_GRAPHIC:
 				case SQL_VARGRAPHIC:
 				case SQL_LONGVARGRAPHIC:
-					tmp_length = stmt_res->column_info[column_number].size;
-					value = getSQLWCharAsPyUnicodeObject(row_data->w_val, out_length);
-					break;
-
 #ifndef PASE /* i5/OS SQL_LONGVARCHAR is SQL_VARCHAR */
 				case SQL_LONGVARCHAR:
-				case SQL_WLONGVARCHAR:
-
 #endif /* PASE */
-					/* i5/OS will xlate from EBCIDIC to ASCII (via SQLGetData) */
-					tmp_length = stmt_res->column_info[column_number].size;
-
-					wout_ptr = (SQLWCHAR *)ALLOC_N(SQLWCHAR, tmp_length + 1);
-					if ( wout_ptr == NULL ) {
-						PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
-						return NULL;
-					}
-					
-					/*  _python_ibm_db_get_data null terminates all output. */
-					rc = _python_ibm_db_get_data(stmt_res, column_number + 1, SQL_C_WCHAR, wout_ptr,
-						(tmp_length * sizeof(SQLWCHAR) + 1), &out_length);
-					if ( rc == SQL_ERROR ) {
-						return NULL;
-					}
-					if (out_length == SQL_NULL_DATA) {
-						Py_INCREF(Py_None);
-						value = Py_None;
+					if ( out_length <= (SQLINTEGER)(stmt_res->row_data[column_number].buf_length - CHAR_TERM_SIZE(stmt_res)) ) {
+						value = _python_ibm_db_char_value(stmt_res, row_data->w_val, out_length);
 					} else {
-						value = getSQLWCharAsPyUnicodeObject(wout_ptr, out_length);
-					}
-					if (wout_ptr != NULL) {
-						PyMem_Del(wout_ptr);
-						wout_ptr = NULL;
+						/* Longer than the bound buffer, read the whole value */
+						value = _python_ibm_db_get_overflow(stmt_res, column_number + 1, out_length);
 					}
 					break;
-				
+
+#ifndef PASE
+				case SQL_WLONGVARCHAR:
+					/* Not bound, its length is not known before it is read */
+					value = _python_ibm_db_get_overflow(stmt_res, column_number + 1, SQL_NO_TOTAL);
+					break;
+#endif /* PASE */
+
 				case SQL_DECIMAL:
 				case SQL_NUMERIC:
 				case SQL_DECFLOAT:
@@ -7993,7 +11692,7 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 					break;
 
 				case SQL_BIGINT:
-					value = PyLong_FromString((char *)row_data->str_val, NULL, 10);
+					value = PyLong_FromLongLong(row_data->bi_val);
 					break;
 
 				case SQL_SMALLINT:
@@ -8119,21 +11818,230 @@ static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
 					break;
 				}
 		}
-		if (op & FETCH_ASSOC) {
-			key = StringOBJ_FromASCII((char*)stmt_res->column_info[column_number].name);
-			PyDict_SetItem(return_value, key, value);
-			Py_DECREF(key);
+		if ( value == NULL ) {
+			Py_DECREF(return_value);
+			return NULL;
 		}
 		if (op == FETCH_INDEX) {
 			/* No need to call Py_DECREF as PyTuple_SetItem steals the reference */
 			PyTuple_SetItem(return_value, column_number, value);
 		} else {
-			if (op == FETCH_BOTH) {
+			rc = PyDict_SetItem(return_value, 
+				PyTuple_GET_ITEM(stmt_res->row_names, column_number), value);
+			if ( rc == 0 && op == FETCH_BOTH ) {
 				key = PyInt_FromLong(column_number);
-				PyDict_SetItem(return_value, key, value);
-				Py_DECREF(key);
+				rc = key != NULL ? PyDict_SetItem(return_value, key, value) : -1;
+				Py_XDECREF(key);
 			}
 			Py_DECREF(value);
+			if ( rc < 0 ) {
+				Py_DECREF(return_value);
+				return NULL;
+			}
+		}
+	}
+	return return_value;
+}
+
+/* static void _python_ibm_db_bind_fetch_helper(INTERNAL_FUNCTION_PARAMETERS, 
+												int op)
+*/
+static PyObject *_python_ibm_db_bind_fetch_helper(PyObject *args, int op)
+{
+	SQLINTEGER row_number = -1;
+	stmt_handle *stmt_res = NULL;
+	PyObject *py_stmt_res = NULL;
+	PyObject *py_row_number = NULL;
+	double start;
+	
+	if (!PyArg_ParseTuple(args, "O|O", &py_stmt_res, &py_row_number))
+		return NULL;
+	
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
+
+	if (!NIL_P(py_row_number)) {
+		if (PyInt_Check(py_row_number)) {
+			row_number = (SQLINTEGER) PyInt_AsLong(py_row_number);
+		} else {
+			PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+			return NULL;
+		}
+		if (row_number < 0) {
+			PyErr_SetString(PyExc_Exception, 
+				"Requested row number must be a positive value");
+			return NULL;
+		}
+	}
+	_python_ibm_db_init_error_info(stmt_res);
+
+	start = _python_ibm_db_clock();
+	return _python_ibm_db_stats_result(stmt_res, ST_FETCH, start,
+		_python_ibm_db_bind_fetch_row(stmt_res, row_number, op));
+}
+
+/* static PyObject *_python_ibm_db_fetch_rowset_error(stmt_handle *stmt_res, PyObject *rows)
+	handles a fetch failure after the rows already collected. If the database 
+	server reported an error and rows were fetched before it, the rows are 
+	returned and the error is left for ibm_db.last_errormsg(); otherwise the 
+	exception is raised.
+*/
+static PyObject *_python_ibm_db_fetch_rowset_error(stmt_handle *stmt_res, PyObject *rows)
+{
+	if ( PyList_GET_SIZE(rows) > 0 && stmt_res->err_msg[0] != '\0' ) {
+		PyErr_Clear();
+		return rows;
+	}
+	Py_DECREF(rows);
+	return NULL;
+}
+
+/* static PyObject *_python_ibm_db_fetch_rowset(stmt_handle *stmt_res, long max_rows, int convert)
+	fetch up to max_rows rows (all remaining rows if max_rows is negative) 
+	as a list of tuples, using block fetch where the result set allows it.
+	If convert is set values are returned as the DB-API module expects them.
+*/
+static PyObject *_python_ibm_db_fetch_rowset(stmt_handle *stmt_res, long max_rows, int convert)
+{
+	int rc = -1;
+	int column_number;
+	double start;
+	long rowset_limit, num_rows = 0;
+	SQLUINTEGER block, row;
+	PyObject *return_value = NULL;
+	PyObject *row_tuple = NULL;
+	PyObject *value = NULL;
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	_python_ibm_db_clear_handle_error(NULL, stmt_res);
+	/* get column header info */
+	if ( stmt_res->column_info == NULL ) {
+		if (_python_ibm_db_get_result_set_info(stmt_res)<0) {
+			sprintf(error, "Column information cannot be retrieved: %s", 
+				IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return NULL;
+		}
+	}
+
+	return_value = PyList_New(0);
+	if ( return_value == NULL ) {
+		return NULL;
+	}
+
+	rowset_limit = _python_ibm_db_rowset_limit(stmt_res);
+	if ( rowset_limit < 0 ) {
+		/* LOB, XML and long columns are read with SQLGetData, one row at a time */
+		while ( max_rows < 0 || num_rows < max_rows ) {
+			row_tuple = _python_ibm_db_bind_fetch_row(stmt_res, 0, FETCH_INDEX);
+			if ( row_tuple == NULL ) {
+				return _python_ibm_db_fetch_rowset_error(stmt_res, return_value);
+			}
+			if ( row_tuple == Py_False ) {
+				Py_DECREF(row_tuple);
+				break;
+			}
+			for (column_number = 0; convert && column_number < stmt_res->num_columns; column_number++) {
+				value = PyTuple_GET_ITEM(row_tuple, column_number);
+				Py_INCREF(value);
+				value = _python_ibm_db_convert_value(stmt_res, column_number, value);
+				if ( value == NULL ) {
+					Py_DECREF(row_tuple);
+					Py_DECREF(return_value);
+					return NULL;
+				}
+				PyTuple_SetItem(row_tuple, column_number, value);
+			}
+			PyList_Append(return_value, row_tuple);
+			Py_DECREF(row_tuple);
+			num_rows++;
+		}
+		return return_value;
+	}
+
+	/* bind the data */
+	if ( max_rows > 0 && max_rows < rowset_limit ) {
+		rowset_limit = max_rows;
+	}
+	if ( stmt_res->rowset == NULL || stmt_res->rowset_alloc < (SQLUINTEGER)rowset_limit ) {
+		rc = _python_ibm_db_bind_rowset_helper(stmt_res, (SQLUINTEGER)rowset_limit);
+		if ( rc != SQL_SUCCESS && rc != SQL_SUCCESS_WITH_INFO ) {
+			_python_ibm_db_unbind_columns(stmt_res);
+			Py_DECREF(return_value);
+			if ( !PyErr_Occurred() ) {
+				sprintf(error, "Column binding cannot be done: %s", 
+					IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+			}
+			return NULL;
+		}
+	}
+
+	while ( max_rows < 0 || num_rows < max_rows ) {
+		block = stmt_res->rowset_alloc;
+		if ( max_rows > 0 && (SQLUINTEGER)(max_rows - num_rows) < block ) {
+			block = (SQLUINTEGER)(max_rows - num_rows);
+		}
+		if ( block != stmt_res->rowset_size ) {
+			rc = SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_ROW_ARRAY_SIZE, 
+				(SQLPOINTER)(long)block, SQL_IS_INTEGER);
+			if ( rc == SQL_ERROR ) {
+				_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
+					NULL, -1, 1);
+				sprintf(error, "Fetch Failure: %s", IBM_DB_G(__python_stmt_err_msg));
+				PyErr_SetString(PyExc_Exception, error);
+				Py_DECREF(return_value);
+				return NULL;
+			}
+			stmt_res->rowset_size = block;
+		}
+
+		stmt_res->rows_fetched = 0;
+		stmt_res->row_gen++;
+		start = _python_ibm_db_clock();
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLFetch((SQLHSTMT)stmt_res->hstmt);
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_stats_gil(stmt_res, start);
+
+		if (rc == SQL_NO_DATA_FOUND) {
+			break;
+		} else if ( rc != SQL_SUCCESS && rc != SQL_SUCCESS_WITH_INFO) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, 
+				NULL, -1, 1);
+			sprintf(error, "Fetch Failure: %s", IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			return _python_ibm_db_fetch_rowset_error(stmt_res, return_value);
+		}
+
+		for (row = 0; row < stmt_res->rows_fetched; row++) {
+			row_tuple = PyTuple_New(stmt_res->num_columns);
+			if ( row_tuple == NULL ) {
+				Py_DECREF(return_value);
+				return NULL;
+			}
+			for (column_number = 0; column_number < stmt_res->num_columns; column_number++) {
+				value = _python_ibm_db_rowset_value(stmt_res, column_number, row, convert);
+				if ( value == NULL ) {
+					Py_DECREF(row_tuple);
+					Py_DECREF(return_value);
+					return NULL;
+				}
+				/* No need to call Py_DECREF as PyTuple_SetItem steals the reference */
+				PyTuple_SetItem(row_tuple, column_number, value);
+			}
+			PyList_Append(return_value, row_tuple);
+			Py_DECREF(row_tuple);
+		}
+		num_rows += stmt_res->rows_fetched;
+
+		/* a partial rowset means the end of the result set was reached */
+		if ( stmt_res->rows_fetched < block ) {
+			break;
 		}
 	}
 	return return_value;
@@ -8174,6 +12082,7 @@ static PyObject *ibm_db_fetch_row(PyObject *self, PyObject *args)
 	PyObject *py_row_number = NULL;
 	SQLINTEGER row_number = -1;
 	stmt_handle* stmt_res = NULL;
+	double start;
 	int rc;
 	char error[DB2_MAX_ERR_MSG_LEN];
 
@@ -8195,6 +12104,7 @@ static PyObject *ibm_db_fetch_row(PyObject *self, PyObject *args)
 			return NULL;
 		}
 	}
+	_python_ibm_db_clear_handle_error(NULL, stmt_res);
 	/* get column header info */
 	if ( stmt_res->column_info == NULL ) {
 		if (_python_ibm_db_get_result_set_info(stmt_res)<0) {
@@ -8204,13 +12114,21 @@ static PyObject *ibm_db_fetch_row(PyObject *self, PyObject *args)
 			return NULL;	
 		}
 	}
+	/* rows are fetched one at a time again after a block fetch */
+	if ( stmt_res->rowset != NULL ) {
+		_python_ibm_db_unbind_columns(stmt_res);
+	}
 
 	/* check if row_number is present */
+	stmt_res->row_gen++;
+	start = _python_ibm_db_clock();
 	if (PyTuple_Size(args) == 2 && row_number > 0) { 
 #ifndef PASE /* i5/OS problem with SQL_FETCH_ABSOLUTE */
 
+		Py_BEGIN_ALLOW_THREADS;
 		rc = SQLFetchScroll((SQLHSTMT)stmt_res->hstmt, SQL_FETCH_ABSOLUTE, 
 						  row_number);
+		Py_END_ALLOW_THREADS;
 #else /* PASE */
 		Py_BEGIN_ALLOW_THREADS;
 		rc = SQLFetchScroll((SQLHSTMT)stmt_res->hstmt, SQL_FETCH_FIRST, 
@@ -8233,6 +12151,9 @@ static PyObject *ibm_db_fetch_row(PyObject *self, PyObject *args)
 		rc = SQLFetch((SQLHSTMT)stmt_res->hstmt);
 		Py_END_ALLOW_THREADS;
 	}
+	_python_ibm_db_stats_gil(stmt_res, start);
+	_python_ibm_db_stats_call(stmt_res, ST_FETCH, start, 
+		(rc == SQL_SUCCESS || rc == SQL_SUCCESS_WITH_INFO) ? 1 : 0);
 
 	if (rc == SQL_SUCCESS || rc == SQL_SUCCESS_WITH_INFO) {
 		Py_RETURN_TRUE;
@@ -8270,6 +12191,9 @@ static PyObject *ibm_db_fetch_row(PyObject *self, PyObject *args)
  * or requested row in the result set. Returns FALSE if there are no rows left
  * in the result set,
  * or if the row requested by row_number does not exist in the result set.
+ *
+ * The keys of the dictionary are column names shared with the other rows of
+ * the result set.
  */
 static PyObject *ibm_db_fetch_assoc(PyObject *self, PyObject *args)			
 {
@@ -8358,34 +12282,166 @@ static PyObject *ibm_db_fetch_array(PyObject *self, PyObject *args)
 	return _python_ibm_db_bind_fetch_helper(args, FETCH_INDEX);
 }
 
-/*!# ibm_db.fetch_both
+/*!# ibm_db.fetch_both
+ *
+ * ===Description
+ * dictionary ibm_db.fetch_both ( resource stmt [, int row_number] )
+ *
+ * Returns a dictionary, indexed by both column name and position, representing  * a row in a result set. Note that the row returned by ibm_db.fetch_both()
+ * requires more memory than the single-indexed dictionaries/arrays returned by  * ibm_db.fetch_assoc() or ibm_db.fetch_tuple().
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid stmt resource containing a result set.
+ *
+ * ====row_number
+ *		Requests a specific 1-indexed row from the result set. Passing this
+ * parameter results in a warning if the result set uses a forward-only cursor.
+ *
+ * ===Return Values
+ *
+ * Returns a dictionary with column values indexed by both the column name and
+ * 0-indexed column number.
+ * The dictionary represents the next or requested row in the result set.
+ * Returns FALSE if there are no rows left in the result set, or if the row
+ * requested by row_number does not exist in the result set.
+ */
+static PyObject *ibm_db_fetch_both(PyObject *self, PyObject *args)
+{
+	return _python_ibm_db_bind_fetch_helper(args, FETCH_BOTH);
+}
+
+/*!# ibm_db.fetch_many
+ *
+ * ===Description
+ * list ibm_db.fetch_many ( resource stmt, int num_rows [, bool convert] )
+ *
+ * Returns a list of tuples, indexed by column position, representing the next
+ * num_rows rows in a result set.
+ *
+ * The rows are retrieved in blocks (rowsets) with a single fetch per block,
+ * which avoids a call to the CLI for every row. Result sets containing LOB,
+ * XML or long character columns are fetched one row at a time.
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A valid stmt resource containing a result set.
+ *
+ * ====num_rows
+ *		The maximum number of rows to fetch.
+ *
+ * ====convert
+ *		If True, DECIMAL and NUMERIC values are returned as decimal.Decimal
+ * objects and BLOB values as buffer objects, as ibm_db_dbi returns them.
+ *
+ * ===Return Values
+ *
+ * Returns a list of 0-indexed tuples with column values indexed by the column
+ * position. The list holds fewer than num_rows tuples if the end of the result
+ * set was reached, and is empty if there are no rows left in the result set.
+ *
+ * If the database server reports an error after some rows were fetched, the
+ * call returns those rows and the error is available from
+ * ibm_db.last_errormsg(stmt).
+ */
+static PyObject *ibm_db_fetch_many(PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	PyObject *py_num_rows = NULL;
+	PyObject *py_convert = NULL;
+	stmt_handle *stmt_res = NULL;
+	long num_rows = 0;
+	int convert = 0;
+	double start;
+
+	if (!PyArg_ParseTuple(args, "OO|O", &py_stmt_res, &py_num_rows, &py_convert))
+		return NULL;
+
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
+
+	if (PyInt_Check(py_num_rows)) {
+		num_rows = PyInt_AsLong(py_num_rows);
+	} else {
+		PyErr_SetString(PyExc_Exception, "Supplied parameter is invalid");
+		return NULL;
+	}
+	if (num_rows <= 0) {
+		PyErr_SetString(PyExc_Exception, 
+			"Requested number of rows must be a positive value");
+		return NULL;
+	}
+	if (!NIL_P(py_convert)) {
+		convert = PyObject_IsTrue(py_convert);
+	}
+	_python_ibm_db_init_error_info(stmt_res);
+
+	start = _python_ibm_db_clock();
+	return _python_ibm_db_stats_result(stmt_res, ST_FETCH, start,
+		_python_ibm_db_fetch_rowset(stmt_res, num_rows, convert));
+}
+
+/*!# ibm_db.fetch_all
  *
  * ===Description
- * dictionary ibm_db.fetch_both ( resource stmt [, int row_number] )
+ * list ibm_db.fetch_all ( resource stmt [, bool convert] )
  *
- * Returns a dictionary, indexed by both column name and position, representing  * a row in a result set. Note that the row returned by ibm_db.fetch_both()
- * requires more memory than the single-indexed dictionaries/arrays returned by  * ibm_db.fetch_assoc() or ibm_db.fetch_tuple().
+ * Returns a list of tuples, indexed by column position, representing all the
+ * remaining rows in a result set.
+ *
+ * The whole list is built in a single call. Rows are retrieved in blocks as
+ * described for ibm_db.fetch_many() and the GIL is released while waiting for
+ * the database server.
  *
  * ===Parameters
  *
  * ====stmt
  *		A valid stmt resource containing a result set.
  *
- * ====row_number
- *		Requests a specific 1-indexed row from the result set. Passing this
- * parameter results in a warning if the result set uses a forward-only cursor.
+ * ====convert
+ *		If True, DECIMAL and NUMERIC values are returned as decimal.Decimal
+ * objects and BLOB values as buffer objects, as ibm_db_dbi returns them.
  *
  * ===Return Values
  *
- * Returns a dictionary with column values indexed by both the column name and
- * 0-indexed column number.
- * The dictionary represents the next or requested row in the result set.
- * Returns FALSE if there are no rows left in the result set, or if the row
- * requested by row_number does not exist in the result set.
+ * Returns a list of 0-indexed tuples with column values indexed by the column
+ * position. The list is empty if there are no rows left in the result set.
+ *
+ * As with ibm_db.fetch_many(), an error reported after some rows were fetched
+ * returns those rows and leaves the error for ibm_db.last_errormsg(stmt).
  */
-static PyObject *ibm_db_fetch_both(PyObject *self, PyObject *args)
+static PyObject *ibm_db_fetch_all(PyObject *self, PyObject *args)
 {
-	return _python_ibm_db_bind_fetch_helper(args, FETCH_BOTH);
+	PyObject *py_stmt_res = NULL;
+	PyObject *py_convert = NULL;
+	stmt_handle *stmt_res = NULL;
+	int convert = 0;
+	double start;
+
+	if (!PyArg_ParseTuple(args, "O|O", &py_stmt_res, &py_convert))
+		return NULL;
+
+	if (NIL_P(py_stmt_res) || (!PyObject_TypeCheck(py_stmt_res, &stmt_handleType))) {
+		PyErr_SetString(PyExc_Exception, "Supplied statement object parameter is invalid");
+		return NULL;
+	} else {
+		stmt_res = (stmt_handle *)py_stmt_res;
+	}
+
+	if (!NIL_P(py_convert)) {
+		convert = PyObject_IsTrue(py_convert);
+	}
+	_python_ibm_db_init_error_info(stmt_res);
+
+	start = _python_ibm_db_clock();
+	return _python_ibm_db_stats_result(stmt_res, ST_FETCH, start,
+		_python_ibm_db_fetch_rowset(stmt_res, -1, convert));
 }
 
 /*!# ibm_db.set_option
@@ -9450,8 +13506,10 @@ static PyObject *ibm_db_active(PyObject *self, PyObject *args)
 			conn_res = (conn_handle *)py_conn_res;
 		}
 #ifndef PASE
+		Py_BEGIN_ALLOW_THREADS;
 		rc = SQLGetConnectAttr(conn_res->hdbc, SQL_ATTR_PING_DB, 
 			(SQLPOINTER)&conn_alive, 0, NULL);
+		Py_END_ALLOW_THREADS;
 		if ( rc == SQL_ERROR ) {
 			_python_ibm_db_check_sql_errors(conn_res->hdbc, SQL_HANDLE_DBC, rc, 1,
 				NULL, -1, 1);
@@ -9582,10 +13640,10 @@ static PyObject *ibm_db_get_option(PyObject *self, PyObject *args)
 
 			/* Check that the option given is not null */
 			if (!NIL_P(py_op_integer)) {
-				/* Checking that the option to get is the cursor type because that 
-				* is what we support here 
+				/* Checking that the option to get is the cursor type or the
+				* query timeout because that is what we support here 
 				*/
-				if (op_integer == SQL_ATTR_CURSOR_TYPE) {
+				if (op_integer == SQL_ATTR_CURSOR_TYPE || op_integer == SQL_ATTR_QUERY_TIMEOUT) {
 					rc = SQLGetStmtAttr((SQLHSTMT)stmt_res->hstmt, op_integer, 
 						&value_int, SQL_IS_INTEGER, NULL);
 					if (rc == SQL_ERROR) {
@@ -9608,6 +13666,38 @@ static PyObject *ibm_db_get_option(PyObject *self, PyObject *args)
 	Py_RETURN_FALSE;
 }
 
+/*	static void _python_ibm_db_raise_error_list(stmt_handle *stmt_res, error_msg_node *error_list, int client_err_cnt, SQLINTEGER err_cnt)
+	raises the errors of a batch: the client_err_cnt messages of error_list 
+	followed by the first err_cnt diagnostic records of the statement
+*/
+static void _python_ibm_db_raise_error_list(stmt_handle *stmt_res, error_msg_node *error_list, int client_err_cnt, SQLINTEGER err_cnt) {
+	SQLINTEGER errNo = 0;
+	PyObject *errTuple = NULL;
+	PyObject *err_msg = NULL, *err_fmtObj = NULL;
+	char *err_fmt = NULL;
+
+	errTuple = PyTuple_New(err_cnt + client_err_cnt);
+	err_fmt = (char *)PyMem_Malloc(strlen("%s\nError %d :%s \n ") * (err_cnt + client_err_cnt));
+	err_fmt[0] = '\0';
+	errNo = 1;
+	while( error_list != NULL ) {
+		sprintf(err_fmt,"%s\nError %d: %s", err_fmt, (int)errNo, "%s \n");
+		PyTuple_SetItem(errTuple, errNo - 1, StringOBJ_FromASCII(error_list->err_msg));
+		error_list = error_list->next;
+		errNo++;
+	}
+	for ( errNo = client_err_cnt + 1; errNo <= (err_cnt + client_err_cnt); errNo++ ) {
+		sprintf(err_fmt,"%s\nError %d: %s", err_fmt, (int)errNo, "%s \n");
+		_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, SQL_HANDLE_STMT, SQL_ERROR, 1, NULL, -1, (errNo - client_err_cnt));
+		PyTuple_SetItem(errTuple, errNo - 1, StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_msg)));
+	}
+	err_fmtObj = StringOBJ_FromASCII(err_fmt);
+	err_msg = StringObj_Format(err_fmtObj, errTuple);
+	if ( err_fmtObj != NULL ) { Py_XDECREF(err_fmtObj); }
+	if ( err_fmt != NULL ) { PyMem_Free(err_fmt); }		
+	PyErr_SetObject(PyExc_Exception, err_msg);
+}
+
 static int _ibm_db_chaining_flag(stmt_handle *stmt_res, SQLINTEGER flag, error_msg_node *error_list, int client_err_cnt) {
 	int rc;
 	Py_BEGIN_ALLOW_THREADS;
@@ -9620,65 +13710,534 @@ static int _ibm_db_chaining_flag(stmt_handle *stmt_res, SQLINTEGER flag, error_m
 		}
 	} else {
 		if ( (rc != SQL_SUCCESS) || (client_err_cnt != 0) ) {
-			SQLINTEGER errNo = 0;
-			PyObject *errTuple = NULL;
 			SQLINTEGER err_cnt = 0;
-			PyObject *err_msg = NULL, *err_fmtObj = NULL;
-			char *err_fmt = NULL;
 			if ( rc != SQL_SUCCESS ) {
 				SQLGetDiagField(SQL_HANDLE_STMT, (SQLHSTMT)stmt_res->hstmt, 0, SQL_DIAG_NUMBER, (SQLPOINTER) &err_cnt, SQL_IS_POINTER, NULL);
 			}
-			errTuple = PyTuple_New(err_cnt + client_err_cnt);
-			err_fmt = (char *)PyMem_Malloc(strlen("%s\nError %d :%s \n ") * (err_cnt + client_err_cnt));
-			err_fmt[0] = '\0';
-			errNo = 1;
-			while( error_list != NULL ) {
-				sprintf(err_fmt,"%s\nError %d: %s", err_fmt, (int)errNo, "%s \n");
-				PyTuple_SetItem(errTuple, errNo - 1, StringOBJ_FromASCII(error_list->err_msg));
-				error_list = error_list->next;
-				errNo++;
+			_python_ibm_db_raise_error_list(stmt_res, error_list, client_err_cnt, err_cnt);
+		}
+	}
+	return rc;
+}
+
+static void _build_client_err_list(error_msg_node *head_error_list, char *err_msg) {
+	error_msg_node *tmp_err = NULL, *curr_err = head_error_list->next, *prv_err = NULL;
+	tmp_err = ALLOC(error_msg_node);
+	memset(tmp_err, 0, sizeof(error_msg_node));
+	strcpy(tmp_err->err_msg, err_msg);
+	tmp_err->next = NULL;
+	while( curr_err != NULL ) {
+		prv_err = curr_err;
+		curr_err = curr_err->next;
+	}
+
+	if ( head_error_list->next == NULL ) {
+		head_error_list->next = tmp_err;
+	} else {
+		prv_err->next = tmp_err;
+	}	
+} 
+
+/*	static int _python_ibm_db_param_array_size(param_node *curr, int py_type, PyObject *params, int col, ibm_db_rowset_col *array)
+	sets the C type of the array a parameter column is packed into and returns
+	its element size, -1 if the column cannot be bound as an array. Decimals
+	are converted to their character form here, once, to size the elements
+*/
+static int _python_ibm_db_param_array_size(param_node *curr, int py_type, PyObject *params, int col, ibm_db_rowset_col *array)
+{
+	PyObject *data = NULL;
+	Py_ssize_t i, len, max_len = 0;
+	int numOfRows = PyTuple_Size(params);
+	SQLSMALLINT *ctype = &array->ctype;
+
+	switch ( curr->data_type ) {
+		case SQL_BLOB:
+		case SQL_CLOB:
+		case SQL_DBCLOB:
+		case SQL_XML:
+			/* LOBs are sent at execution time */
+			return -1;
+		default:
+			break;
+	}
+
+	switch ( py_type ) {
+		case PYTHON_FIXNUM:
+			*ctype = SQL_C_SBIGINT;
+			return sizeof(SQLBIGINT);
+
+		case PYTHON_TRUE:
+		case PYTHON_FALSE:
+			*ctype = SQL_C_LONG;
+			return sizeof(SQLINTEGER);
+
+		case PYTHON_FLOAT:
+			*ctype = SQL_C_DOUBLE;
+			return sizeof(SQLDOUBLE);
+
+		case PYTHON_DECIMAL:
+			*ctype = SQL_C_CHAR;
+			array->chars = ALLOC_N(char *, numOfRows);
+			if ( array->chars == NULL ) {
+				return -1;
+			}
+			memset(array->chars, 0, sizeof(char *) * numOfRows);
+			for ( i = 0; i < numOfRows; i++ ) {
+				data = PyTuple_GET_ITEM(PyTuple_GET_ITEM(params, i), col);
+				if ( data == Py_None ) {
+					continue;
+				}
+				array->chars[i] = _python_ibm_db_decimal_to_chars(data);
+				if ( array->chars[i] == NULL ) {
+					/* The row by row execute reports it */
+					PyErr_Clear();
+					return -1;
+				}
+				len = strlen(array->chars[i]);
+				if ( len > max_len ) {
+					max_len = len;
+				}
+			}
+			if ( max_len + 1 > PARAMSET_BUFSIZ ) {
+				return -1;
+			}
+			return max_len + 1;
+
+		case PYTHON_DATE:
+			*ctype = SQL_C_TYPE_DATE;
+			return sizeof(DATE_STRUCT);
+
+		case PYTHON_TIME:
+			*ctype = SQL_C_TYPE_TIME;
+			return sizeof(TIME_STRUCT);
+
+		case PYTHON_TIMESTAMP:
+			*ctype = SQL_C_TYPE_TIMESTAMP;
+			return sizeof(TIMESTAMP_STRUCT);
+
+		case PYTHON_NIL:
+			*ctype = SQL_C_CHAR;
+			return 1;
+
+		case PYTHON_STRING:
+		case PYTHON_UNICODE:
+			for ( i = 0; i < numOfRows; i++ ) {
+				data = PyTuple_GET_ITEM(PyTuple_GET_ITEM(params, i), col);
+				if ( data == Py_None ) {
+					continue;
+				}
+				if ( py_type == PYTHON_UNICODE ) {
+					len = PyUnicode_GET_SIZE(data) * sizeof(SQLWCHAR);
+				} else {
+					len = PyBytes_GET_SIZE(data);
+				}
+				if ( len > max_len ) {
+					max_len = len;
+				}
+			}
+			switch ( curr->data_type ) {
+				case SQL_BINARY:
+#ifndef PASE /* i5/OS SQL_LONGVARBINARY is SQL_VARBINARY */
+				case SQL_LONGVARBINARY:
+#endif /* PASE */
+				case SQL_VARBINARY:
+					*ctype = SQL_C_BINARY;
+					break;
+				default:
+					*ctype = py_type == PYTHON_UNICODE ? SQL_C_WCHAR : SQL_C_CHAR;
+			}
+			if ( max_len + sizeof(SQLWCHAR) > PARAMSET_BUFSIZ ) {
+				return -1;
+			}
+			return max_len + sizeof(SQLWCHAR);
+
+		default:
+			return -1;
+	}
+}
+
+/*	static int _python_ibm_db_param_array_value(param_node *curr, ibm_db_rowset_col *array, SQLUINTEGER row, int index, PyObject *data)
+	copies the parameter value of row index of the batch into element row of
+	the parameter array
+*/
+static int _python_ibm_db_param_array_value(param_node *curr, ibm_db_rowset_col *array, SQLUINTEGER row, int index, PyObject *data)
+{
+	char *elem = (char *)array->buf + row * array->elem_size;
+	SQLWCHAR *wvalue = NULL;
+	char *svalue = NULL;
+	int isNewBuffer;
+	Py_ssize_t len;
+
+	if ( data == Py_None ) {
+		array->ind[row] = SQL_NULL_DATA;
+		return 0;
+	}
+
+	switch ( TYPE(data) ) {
+		case PYTHON_FIXNUM:
+			*(SQLBIGINT *)elem = (SQLBIGINT) PyLong_AsLongLong(data);
+			if ( *(SQLBIGINT *)elem == -1 && PyErr_Occurred() ) {
+				return -1;
+			}
+			array->ind[row] = 0;
+			break;
+
+		case PYTHON_TRUE:
+		case PYTHON_FALSE:
+			*(SQLINTEGER *)elem = (data == Py_True);
+			array->ind[row] = 0;
+			break;
+
+		case PYTHON_FLOAT:
+			*(SQLDOUBLE *)elem = PyFloat_AsDouble(data);
+			array->ind[row] = 0;
+			break;
+
+		case PYTHON_DECIMAL:
+			/* Converted by _python_ibm_db_param_array_size() */
+			svalue = array->chars[index];
+			len = strlen(svalue);
+			memcpy(elem, svalue, len + 1);
+			array->ind[row] = len;
+			break;
+
+		case PYTHON_STRING:
+			len = PyBytes_GET_SIZE(data);
+			memcpy(elem, PyBytes_AS_STRING(data), len);
+			elem[len] = '\0';
+			if ( curr->data_type == SQL_TYPE_TIMESTAMP && len > 10 && elem[10] == 'T' ) {
+				elem[10] = ' ';
+			}
+			array->ind[row] = len;
+			break;
+
+		case PYTHON_UNICODE:
+			wvalue = getUnicodeDataAsSQLWCHAR(data, &isNewBuffer);
+			len = PyUnicode_GET_SIZE(data) * sizeof(SQLWCHAR);
+			memcpy(elem, wvalue, len);
+			if ( isNewBuffer ) {
+				PyMem_Del(wvalue);
+			}
+			((SQLWCHAR *)elem)[len / sizeof(SQLWCHAR)] = 0;
+			if ( curr->data_type == SQL_TYPE_TIMESTAMP && len > 10 * sizeof(SQLWCHAR) && 
+				 ((SQLWCHAR *)elem)[10] == 'T' ) {
+				((SQLWCHAR *)elem)[10] = ' ';
+			}
+			array->ind[row] = len;
+			break;
+
+		case PYTHON_DATE:
+			((DATE_STRUCT *)elem)->year = PyDateTime_GET_YEAR(data);
+			((DATE_STRUCT *)elem)->month = PyDateTime_GET_MONTH(data);
+			((DATE_STRUCT *)elem)->day = PyDateTime_GET_DAY(data);
+			array->ind[row] = 0;
+			break;
+
+		case PYTHON_TIME:
+			((TIME_STRUCT *)elem)->hour = PyDateTime_TIME_GET_HOUR(data);
+			((TIME_STRUCT *)elem)->minute = PyDateTime_TIME_GET_MINUTE(data);
+			((TIME_STRUCT *)elem)->second = PyDateTime_TIME_GET_SECOND(data);
+			array->ind[row] = 0;
+			break;
+
+		case PYTHON_TIMESTAMP:
+			((TIMESTAMP_STRUCT *)elem)->year = PyDateTime_GET_YEAR(data);
+			((TIMESTAMP_STRUCT *)elem)->month = PyDateTime_GET_MONTH(data);
+			((TIMESTAMP_STRUCT *)elem)->day = PyDateTime_GET_DAY(data);
+			((TIMESTAMP_STRUCT *)elem)->hour = PyDateTime_DATE_GET_HOUR(data);
+			((TIMESTAMP_STRUCT *)elem)->minute = PyDateTime_DATE_GET_MINUTE(data);
+			((TIMESTAMP_STRUCT *)elem)->second = PyDateTime_DATE_GET_SECOND(data);
+			((TIMESTAMP_STRUCT *)elem)->fraction = PyDateTime_DATE_GET_MICROSECOND(data) * 1000;
+			array->ind[row] = 0;
+			break;
+
+		default:
+			PyErr_SetString(PyExc_Exception, "Unsupported parameter value type");
+			return -1;
+	}
+	return 0;
+}
+
+/*	static void _python_ibm_db_free_param_chars(ibm_db_rowset_col *arrays, int num_params, int num_rows)
+	releases the converted Decimal values of the parameter arrays
+*/
+static void _python_ibm_db_free_param_chars(ibm_db_rowset_col *arrays, int num_params, int num_rows)
+{
+	int i, j;
+
+	for (i = 0; i < num_params; i++) {
+		if ( arrays[i].chars == NULL ) {
+			continue;
+		}
+		for (j = 0; j < num_rows; j++) {
+			if ( arrays[i].chars[j] != NULL ) {
+				PyMem_Del(arrays[i].chars[j]);
+			}
+		}
+		PyMem_Del(arrays[i].chars);
+		arrays[i].chars = NULL;
+	}
+}
+
+/*	static void _python_ibm_db_free_param_arrays(stmt_handle *stmt_res, ibm_db_rowset_col *arrays, int num_params, int num_rows)
+	releases the parameter arrays and the bindings of an array execute
+*/
+static void _python_ibm_db_free_param_arrays(stmt_handle *stmt_res, ibm_db_rowset_col *arrays, int num_params, int num_rows)
+{
+	int i;
+
+	Py_BEGIN_ALLOW_THREADS;
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_RESET_PARAMS);
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMSET_SIZE, (SQLPOINTER)1, SQL_IS_INTEGER);
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAM_STATUS_PTR, NULL, 0);
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMS_PROCESSED_PTR, NULL, 0);
+	Py_END_ALLOW_THREADS;
+
+	_python_ibm_db_free_param_chars(arrays, num_params, num_rows);
+	for (i = 0; i < num_params; i++) {
+		if ( arrays[i].buf != NULL ) {
+			PyMem_Del(arrays[i].buf);
+		}
+		if ( arrays[i].ind != NULL ) {
+			PyMem_Del(arrays[i].ind);
+		}
+	}
+	PyMem_Del(arrays);
+}
+
+/*	static int _python_ibm_db_execute_array(stmt_handle *stmt_res, PyObject *params, int num_params, SQLINTEGER *row_cnt)
+	executes the statement for all the parameter tuples by binding each 
+	parameter column to an array (SQL_ATTR_PARAMSET_SIZE), in blocks of at most 
+	PARAMSET_BUFSIZ bytes. Returns 1 without executing anything when the 
+	parameters cannot be bound as arrays, -1 on error. The rows of a block are 
+	executed independently; when some of them fail the others are kept and 
+	the errors are raised together once all the blocks ran, as the chained 
+	execute of the per-row path does.
+*/
+static int _python_ibm_db_execute_array(stmt_handle *stmt_res, PyObject *params, int num_params, SQLINTEGER *row_cnt)
+{
+	ibm_db_rowset_col *arrays = NULL;
+	param_node *curr = NULL;
+	PyObject *param = NULL;
+	PyObject *data = NULL;
+	int *py_types = NULL;
+	int numOfRows = PyTuple_Size(params);
+	int i, j, py_type, rc = SQL_SUCCESS;
+	long row_width = 0;
+	double start;
+	SQLUINTEGER block, row, block_size = 0, paramset_size = 1;
+	SQLUINTEGER params_processed = 0;
+	SQLUSMALLINT *row_status = NULL;
+	SQLINTEGER block_cnt, diag_cnt, k;
+	error_msg_node *head_error_list = NULL;
+	int err_count = 0;
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	if ( num_params == 0 ) {
+		return 1;
+	}
+
+	/* Every row must be a tuple of homogeneous values */
+	py_types = ALLOC_N(int, num_params);
+	if ( py_types == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return -1;
+	}
+	for ( j = 0; j < num_params; j++ ) {
+		py_types[j] = PYTHON_NIL;
+	}
+	for ( i = 0; i < numOfRows; i++ ) {
+		param = PyTuple_GET_ITEM(params, i);
+		if ( !PyTuple_Check(param) || PyTuple_Size(param) != num_params ) {
+			PyMem_Del(py_types);
+			return 1;
+		}
+		for ( j = 0; j < num_params; j++ ) {
+			data = PyTuple_GET_ITEM(param, j);
+			if ( data == Py_None ) {
+				continue;
+			}
+			py_type = TYPE(data);
+			if ( py_type == PYTHON_FIXNUM ) {
+				/* Integers not fitting in 64 bits are sent as strings */
+				if ( PyLong_AsLongLong(data) == -1 && PyErr_Occurred() ) {
+					PyErr_Clear();
+					PyMem_Del(py_types);
+					return 1;
+				}
+			}
+			if ( py_types[j] == PYTHON_NIL ) {
+				py_types[j] = py_type;
+			} else if ( py_types[j] != py_type ) {
+				PyMem_Del(py_types);
+				return 1;
+			}
+		}
+	}
+
+	arrays = ALLOC_N(ibm_db_rowset_col, num_params);
+	if ( arrays == NULL ) {
+		PyMem_Del(py_types);
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return -1;
+	}
+	memset(arrays, 0, sizeof(ibm_db_rowset_col) * num_params);
+	for ( curr = stmt_res->head_cache_list, j = 0; curr != NULL && j < num_params; curr = curr->next, j++ ) {
+		arrays[j].elem_size = _python_ibm_db_param_array_size(curr, py_types[j], params, j, &arrays[j]);
+		if ( arrays[j].elem_size < 0 ) {
+			PyMem_Del(py_types);
+			_python_ibm_db_free_param_chars(arrays, num_params, numOfRows);
+			PyMem_Del(arrays);
+			return 1;
+		}
+		row_width += arrays[j].elem_size + sizeof(SQLINTEGER);
+	}
+	PyMem_Del(py_types);
+
+	block_size = (SQLUINTEGER)(PARAMSET_BUFSIZ / row_width);
+	if ( block_size == 0 ) {
+		block_size = 1;
+	} else if ( block_size > (SQLUINTEGER)numOfRows ) {
+		block_size = (SQLUINTEGER)numOfRows;
+	}
+
+	/* Bind the parameter columns to the arrays */
+	for ( curr = stmt_res->head_cache_list, j = 0; curr != NULL && j < num_params; curr = curr->next, j++ ) {
+		arrays[j].buf = (void *)ALLOC_N(char, arrays[j].elem_size * block_size);
+		arrays[j].ind = ALLOC_N(SQLINTEGER, block_size);
+		if ( arrays[j].buf == NULL || arrays[j].ind == NULL ) {
+			_python_ibm_db_free_param_arrays(stmt_res, arrays, num_params, numOfRows);
+			PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+			return -1;
+		}
+
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLBindParameter(stmt_res->hstmt, curr->param_num, SQL_PARAM_INPUT, 
+			arrays[j].ctype, curr->data_type, curr->param_size, curr->scale, 
+			arrays[j].buf, arrays[j].elem_size, (SQLINTEGER *)arrays[j].ind);
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			sprintf(error, "Binding Error 1: %s", IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			_python_ibm_db_free_param_arrays(stmt_res, arrays, num_params, numOfRows);
+			return -1;
+		}
+	}
+
+	row_status = ALLOC_N(SQLUSMALLINT, block_size);
+	head_error_list = ALLOC(error_msg_node);
+	if ( row_status == NULL || head_error_list == NULL ) {
+		_python_ibm_db_free_param_arrays(stmt_res, arrays, num_params, numOfRows);
+		if ( row_status != NULL ) PyMem_Del(row_status);
+		if ( head_error_list != NULL ) PyMem_Del(head_error_list);
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		return -1;
+	}
+	memset(head_error_list, 0, sizeof(error_msg_node));
+
+	/* A failing row must not stop the other rows of its block */
+	Py_BEGIN_ALLOW_THREADS;
+#ifdef SQL_ATTR_PARAMOPT_ATOMIC
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMOPT_ATOMIC, 
+		(SQLPOINTER)SQL_ATOMIC_NO, SQL_IS_INTEGER);
+#endif
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAM_STATUS_PTR, 
+		(SQLPOINTER)row_status, 0);
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMS_PROCESSED_PTR, 
+		(SQLPOINTER)&params_processed, 0);
+	Py_END_ALLOW_THREADS;
+
+	*row_cnt = 0;
+	for ( i = 0; i < numOfRows; i += block ) {
+		block = block_size;
+		if ( (SQLUINTEGER)(numOfRows - i) < block ) {
+			block = (SQLUINTEGER)(numOfRows - i);
+		}
+		for ( row = 0; row < block; row++ ) {
+			param = PyTuple_GET_ITEM(params, i + row);
+			for ( curr = stmt_res->head_cache_list, j = 0; curr != NULL && j < num_params; curr = curr->next, j++ ) {
+				if ( _python_ibm_db_param_array_value(curr, &arrays[j], row, i + row, PyTuple_GET_ITEM(param, j)) < 0 ) {
+					rc = -1;
+					goto cleanup;
+				}
+			}
+		}
+
+		rc = SQL_SUCCESS;
+		_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+		start = _python_ibm_db_clock();
+		Py_BEGIN_ALLOW_THREADS;
+		if ( block != paramset_size ) {
+			rc = SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMSET_SIZE, 
+				(SQLPOINTER)(long)block, SQL_IS_INTEGER);
+			paramset_size = block;
+		}
+		if ( rc != SQL_ERROR ) {
+			rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
+		}
+		Py_END_ALLOW_THREADS;
+		_python_ibm_db_stats_gil(stmt_res, start);
+
+		if ( rc == SQL_ERROR || rc == SQL_SUCCESS_WITH_INFO ) {
+			/* Keep the messages of the failed rows before the next block */
+			for ( row = 0; row < params_processed && row < block; row++ ) {
+				if ( row_status[row] == SQL_PARAM_ERROR ) {
+					break;
+				}
 			}
-			for ( errNo = client_err_cnt + 1; errNo <= (err_cnt + client_err_cnt); errNo++ ) {
-				sprintf(err_fmt,"%s\nError %d: %s", err_fmt, (int)errNo, "%s \n");
-				_python_ibm_db_check_sql_errors((SQLHSTMT)stmt_res->hstmt, SQL_HANDLE_STMT, SQL_ERROR, 1, NULL, -1, (errNo - client_err_cnt));
-				PyTuple_SetItem(errTuple, errNo - 1, StringOBJ_FromASCII(IBM_DB_G(__python_stmt_err_msg)));
+			if ( rc == SQL_ERROR || row < params_processed ) {
+				diag_cnt = 0;
+				SQLGetDiagField(SQL_HANDLE_STMT, (SQLHSTMT)stmt_res->hstmt, 0, SQL_DIAG_NUMBER, 
+					(SQLPOINTER)&diag_cnt, SQL_IS_INTEGER, NULL);
+				for ( k = 1; k <= diag_cnt; k++ ) {
+					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, SQL_ERROR, 1, NULL, -1, k);
+					_build_client_err_list(head_error_list, IBM_DB_G(__python_stmt_err_msg));
+					err_count++;
+				}
+				if ( diag_cnt == 0 ) {
+					sprintf(error, "Value parameters array %d failed", (int)(i + row + 1));
+					_build_client_err_list(head_error_list, error);
+					err_count++;
+				}
+				PyErr_Clear();
 			}
-			err_fmtObj = StringOBJ_FromASCII(err_fmt);
-			err_msg = StringObj_Format(err_fmtObj, errTuple);
-			if ( err_fmtObj != NULL ) { Py_XDECREF(err_fmtObj); }
-			if ( err_fmt != NULL ) { PyMem_Free(err_fmt); }		
-			PyErr_SetObject(PyExc_Exception, err_msg);
 		}
-	}
-	return rc;
-}
 
-static void _build_client_err_list(error_msg_node *head_error_list, char *err_msg) {
-	error_msg_node *tmp_err = NULL, *curr_err = head_error_list->next, *prv_err = NULL;
-	tmp_err = ALLOC(error_msg_node);
-	memset(tmp_err, 0, sizeof(error_msg_node));
-	strcpy(tmp_err->err_msg, err_msg);
-	tmp_err->next = NULL;
-	while( curr_err != NULL ) {
-		prv_err = curr_err;
-		curr_err = curr_err->next;
+		block_cnt = 0;
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLRowCount((SQLHSTMT)stmt_res->hstmt, &block_cnt);
+		Py_END_ALLOW_THREADS;
+		if ( rc != SQL_ERROR && block_cnt > 0 ) {
+			*row_cnt += block_cnt;
+		}
 	}
+	rc = 0;
 
-	if ( head_error_list->next == NULL ) {
-		head_error_list->next = tmp_err;
-	} else {
-		prv_err->next = tmp_err;
-	}	
-} 
+cleanup:
+	_python_ibm_db_free_param_arrays(stmt_res, arrays, num_params, numOfRows);
+	PyMem_Del(row_status);
+	if ( rc == 0 ) {
+		/* ibm_db.num_rows() reports the rows of all the blocks */
+		stmt_res->array_row_cnt = *row_cnt;
+		if ( err_count > 0 ) {
+			_python_ibm_db_raise_error_list(stmt_res, head_error_list->next, err_count, 0);
+			rc = -1;
+		}
+	}
+	while ( head_error_list != NULL ) {
+		error_msg_node *tmp_err = head_error_list;
+		head_error_list = head_error_list->next;
+		PyMem_Del(tmp_err);
+	}
+	return rc;
+}
 
-/*
- * ibm_db.execute_many -- can be used to execute an SQL with multiple values of parameter marker.
- * ===Description
- * int ibm_db.execute_many(IBM_DBStatement, Parameters[, Options])
- * Returns number of inserted/updated/deleted rows if batch executed successfully.
- * return NULL if batch fully or partialy fails  (All the rows executed except for which error occurs).
- */
-static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
+/*	static PyObject *_python_ibm_db_execute_many_helper(PyObject *args)
+	runs ibm_db.execute_many(), which adds its statistics.
+*/
+static PyObject *_python_ibm_db_execute_many_helper(PyObject *args) {
 	PyObject *options = NULL;
 	PyObject *params = NULL;
 	PyObject *py_stmt_res = NULL;
@@ -9695,12 +14254,15 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 	int numOfParam = 0;
 	SQLINTEGER row_cnt = 0;
 	int chaining_start = 0;
+	int stream_error = 0;
+	double start;
+	PyObject *err_type = NULL, *err_value = NULL, *err_tb = NULL;
 
-	SQLSMALLINT *data_type;
+	SQLSMALLINT *data_type = NULL;
 	SQLUINTEGER precision;
 	SQLSMALLINT scale;
 	SQLSMALLINT nullable;
-	SQLSMALLINT *ref_data_type;
+	SQLSMALLINT *ref_data_type = NULL;
 
 	/* Get the parameters 
 	 *  	1. statement handler Object
@@ -9720,8 +14282,11 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 		Py_BEGIN_ALLOW_THREADS;
 		SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
 		Py_END_ALLOW_THREADS;
+		stmt_res->row_gen++;
 		
 		_python_ibm_db_clear_stmt_err_cache();
+		_python_ibm_db_clear_handle_error(NULL, stmt_res);
+		stmt_res->array_row_cnt = -1;
 		stmt_res->head_cache_list = NULL;
 		stmt_res->current_node = NULL;
 
@@ -9737,17 +14302,11 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 		}
 		if ( numOpts != 0 ) {
 			for ( i = 0; i < numOpts; i++) {
-				Py_BEGIN_ALLOW_THREADS;
-				rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, i + 1,
-					(SQLSMALLINT*)(data_type + i), &precision, (SQLSMALLINT*)&scale,
-					(SQLSMALLINT*)&nullable);
-				Py_END_ALLOW_THREADS;
-
+				rc = _python_ibm_db_describe_param(stmt_res, i + 1, data_type + i, 
+						&precision, &scale, &nullable);
 				if ( rc == SQL_ERROR ) {
-					_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT,
-												rc, 1, NULL, -1, 1);
 					PyErr_SetString(PyExc_Exception, IBM_DB_G(__python_stmt_err_msg));
-					return NULL;
+					goto cleanup;
 				}
 
 				build_list(stmt_res, i + 1, data_type[i], precision, 
@@ -9757,6 +14316,20 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 
 		/* Execute SQL for all set of parameters */
 		numOfRows = PyTuple_Size(params);
+
+		/* Bind each parameter column to an array and execute in blocks */
+		if ( numOfRows > 0 ) {
+			rc = _python_ibm_db_execute_array(stmt_res, params, numOpts, &row_cnt);
+			if ( rc != 1 ) {
+				PyMem_Del(data_type);
+				PyMem_Del(ref_data_type);
+				if ( rc < 0 ) {
+					return NULL;
+				}
+				return PyInt_FromLong(row_cnt);
+			}
+		}
+
 		head_error_list = ALLOC(error_msg_node);
 		memset(head_error_list, 0, sizeof(error_msg_node));
 		head_error_list->next = NULL;
@@ -9844,7 +14417,9 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 						SQLSMALLINT valueType = 0;
 						switch( ref_data_type[curr->param_num -1] ) {
 							case PYTHON_FIXNUM:
-								if(curr->data_type == SQL_BIGINT || curr->data_type == SQL_DECIMAL ) {
+								if(curr->data_type == SQL_BIGINT) {
+									valueType = SQL_C_SBIGINT;
+								} else if(curr->data_type == SQL_DECIMAL) {
 									valueType = SQL_C_CHAR;
 								} else {
 									valueType = SQL_C_LONG;
@@ -9872,6 +14447,8 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 								}
 								break;
 							case PYTHON_STRING:
+							case PYTHON_BUFFER:
+							case PYTHON_STREAM:
 								switch( curr->data_type ) {
 									case SQL_BLOB:
 									case SQL_BINARY:
@@ -9926,28 +14503,29 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 					rc = _ibm_db_chaining_flag(stmt_res, SQL_ATTR_CHAINING_BEGIN, NULL, 0);
 					chaining_start = 1;
 					if ( rc != SQL_SUCCESS ) {
-						return NULL;
+						goto cleanup;
 					}
 				}
 
 				if ( error[0] == '\0' ) {
+					_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+					start = _python_ibm_db_clock();
 					Py_BEGIN_ALLOW_THREADS;
 					rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
 					Py_END_ALLOW_THREADS;
+					_python_ibm_db_stats_gil(stmt_res, start);
 
 					if ( rc == SQL_NEED_DATA ) {
 						SQLPOINTER valuePtr;
+						Py_BEGIN_ALLOW_THREADS;
 						rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
+						Py_END_ALLOW_THREADS;
 						while ( rc == SQL_NEED_DATA ) {
 							/* passing data value for a parameter */
-							if ( !NIL_P(((param_node*)valuePtr)->svalue)) {
-								Py_BEGIN_ALLOW_THREADS;
-								rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)(((param_node*)valuePtr)->svalue), ((param_node*)valuePtr)->ivalue);
-								Py_END_ALLOW_THREADS;
-							} else {
-								Py_BEGIN_ALLOW_THREADS;
-								rc = SQLPutData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER)(((param_node*)valuePtr)->uvalue), ((param_node*)valuePtr)->ivalue);
-								Py_END_ALLOW_THREADS;
+							rc = _python_ibm_db_put_param_data(stmt_res, (param_node*)valuePtr);
+							if ( rc == SQL_ERROR && PyErr_Occurred() ) {
+								stream_error = 1;
+								break;
 							}
 							if ( rc == SQL_ERROR ) {
 								_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
@@ -9956,18 +14534,36 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 								err_count++;
 								break;
 							}
+							Py_BEGIN_ALLOW_THREADS;
 							rc = SQLParamData((SQLHSTMT)stmt_res->hstmt, (SQLPOINTER *)&valuePtr);
+							Py_END_ALLOW_THREADS;
 						}
 					}
 				}
+				if ( stream_error ) {
+					break;
+				}
 			}
 		} else {
+			PyMem_Del(head_error_list);
+			PyMem_Del(data_type);
+			PyMem_Del(ref_data_type);
 			return PyInt_FromLong(0);
 			
 		}
 		
 		/* Set statement attribute SQL_ATTR_CHAINING_END */
-		rc = _ibm_db_chaining_flag(stmt_res, SQL_ATTR_CHAINING_END, head_error_list->next, err_count);
+		if ( stream_error ) {
+			/* The stream's exception is the one reported, not the aborted chain's */
+			PyErr_Fetch(&err_type, &err_value, &err_tb);
+			_ibm_db_chaining_flag(stmt_res, SQL_ATTR_CHAINING_END, NULL, 0);
+			PyErr_Clear();
+			PyErr_Restore(err_type, err_value, err_tb);
+		} else {
+			rc = _ibm_db_chaining_flag(stmt_res, SQL_ATTR_CHAINING_END, head_error_list->next, err_count);
+		}
+cleanup:
+		_python_ibm_db_release_param_buffers(stmt_res);
 		if ( head_error_list != NULL ) {
 			error_msg_node *tmp_err = NULL;
 			while ( head_error_list != NULL ) {
@@ -9976,7 +14572,9 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 				PyMem_Del(tmp_err);
 			}
 		}
-		if ( rc != SQL_SUCCESS || err_count != 0 ) {
+		PyMem_Del(data_type);
+		PyMem_Del(ref_data_type);
+		if ( PyErr_Occurred() || rc != SQL_SUCCESS || err_count != 0 ) {
 			return NULL;
 		}
 	} else {
@@ -9998,6 +14596,413 @@ static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args) {
 	return PyInt_FromLong(row_cnt);
 }
 
+/*
+ * ibm_db.execute_many -- can be used to execute an SQL with multiple values of parameter marker.
+ * ===Description
+ * int ibm_db.execute_many(IBM_DBStatement, Parameters[, Options])
+ * Returns number of inserted/updated/deleted rows if batch executed successfully.
+ * return NULL if batch fully or partialy fails  (All the rows executed except for which error occurs).
+ * When all the tuples hold values of the same types and no LOB parameter is
+ * present, the parameters are bound column-wise to arrays and the batch is
+ * executed with a single SQLExecute per block of rows.
+ */
+static PyObject* ibm_db_execute_many (PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res = NULL;
+	double start = _python_ibm_db_clock();
+
+	if ( PyTuple_Size(args) > 0 ) {
+		py_stmt_res = PyTuple_GET_ITEM(args, 0);
+	}
+	if ( py_stmt_res == NULL || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType) ) {
+		return _python_ibm_db_execute_many_helper(args);
+	}
+	stmt_res = (stmt_handle *)py_stmt_res;
+	return _python_ibm_db_stats_result(stmt_res, ST_EXECUTE, start, _python_ibm_db_execute_many_helper(args));
+}
+
+/*	static int _python_ibm_db_buffer_ctype(char *format, Py_ssize_t itemsize, SQLSMALLINT *ctype)
+	C type of the elements of a buffer given its struct module format, -1 if 
+	the elements cannot be bound
+*/
+static int _python_ibm_db_buffer_ctype(char *format, Py_ssize_t itemsize, SQLSMALLINT *ctype)
+{
+	if ( format == NULL ) {
+		format = "B";
+	}
+	/* only the native byte order can be bound */
+	if ( *format == '@' || *format == '=' || 
+		 (*format == '<' && !is_bigendian()) || 
+		 ((*format == '>' || *format == '!') && is_bigendian()) ) {
+		format++;
+	}
+	if ( *format != '\0' && format[strlen(format) - 1] == 's' ) {
+		/* fixed width byte strings, like NumPy 'S' arrays */
+		*ctype = SQL_C_CHAR;
+		return 0;
+	}
+	if ( strlen(format) != 1 ) {
+		return -1;
+	}
+
+	switch ( *format ) {
+		case 'c':
+			*ctype = SQL_C_CHAR;
+			return 0;
+		case '?':
+			*ctype = SQL_C_BIT;
+			return 0;
+		case 'b':
+			*ctype = SQL_C_STINYINT;
+			return 0;
+		case 'B':
+			*ctype = SQL_C_UTINYINT;
+			return 0;
+		case 'h':
+		case 'i':
+		case 'l':
+		case 'q':
+			switch ( itemsize ) {
+				case 2:
+					*ctype = SQL_C_SSHORT;
+					return 0;
+				case 4:
+					*ctype = SQL_C_SLONG;
+					return 0;
+				case 8:
+					*ctype = SQL_C_SBIGINT;
+					return 0;
+			}
+			return -1;
+		case 'H':
+		case 'I':
+		case 'L':
+		case 'Q':
+			switch ( itemsize ) {
+				case 2:
+					*ctype = SQL_C_USHORT;
+					return 0;
+				case 4:
+					*ctype = SQL_C_ULONG;
+					return 0;
+				case 8:
+					*ctype = SQL_C_UBIGINT;
+					return 0;
+			}
+			return -1;
+		case 'f':
+			*ctype = SQL_C_FLOAT;
+			return itemsize == sizeof(SQLREAL) ? 0 : -1;
+		case 'd':
+			*ctype = SQL_C_DOUBLE;
+			return itemsize == sizeof(SQLDOUBLE) ? 0 : -1;
+	}
+	return -1;
+}
+
+/*	static int _python_ibm_db_get_column_buffer(PyObject *obj, Py_buffer *view)
+	exports the memory of a buffer protocol object as a contiguous buffer
+*/
+static int _python_ibm_db_get_column_buffer(PyObject *obj, Py_buffer *view)
+{
+#if  PY_MAJOR_VERSION < 3
+	PyObject *typecode = NULL;
+	PyObject *itemsize = NULL;
+	const void *buf = NULL;
+	Py_ssize_t buffer_len = 0;
+	static char format[2];
+#endif
+
+	if ( PyObject_CheckBuffer(obj) ) {
+		return PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT);
+	}
+#if  PY_MAJOR_VERSION < 3
+	/* array.array only implements the old buffer interface */
+	typecode = PyObject_GetAttrString(obj, "typecode");
+	itemsize = PyObject_GetAttrString(obj, "itemsize");
+	if ( typecode != NULL && itemsize != NULL && PyString_Check(typecode) && 
+		 PyObject_AsReadBuffer(obj, &buf, &buffer_len) == 0 ) {
+		memset(view, 0, sizeof(Py_buffer));
+		view->buf = (void *)buf;
+		view->len = buffer_len;
+		view->itemsize = PyInt_AsLong(itemsize);
+		format[0] = PyString_AsString(typecode)[0];
+		format[1] = '\0';
+		view->format = format;
+		Py_DECREF(typecode);
+		Py_DECREF(itemsize);
+		return 0;
+	}
+	Py_XDECREF(typecode);
+	Py_XDECREF(itemsize);
+#endif
+	PyErr_Clear();
+	PyErr_SetString(PyExc_Exception, "Column values must support the buffer protocol");
+	return -1;
+}
+
+/*	static PyObject *_python_ibm_db_execute_columns_helper(PyObject *args)
+	runs ibm_db.execute_columns(), which adds its statistics.
+*/
+static PyObject *_python_ibm_db_execute_columns_helper(PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	PyObject *py_columns = NULL;
+	PyObject *py_masks = NULL;
+	PyObject *columns = NULL;
+	PyObject *masks = NULL;
+	PyObject *mask_obj = NULL;
+	stmt_handle *stmt_res = NULL;
+	Py_buffer *views = NULL;
+	Py_buffer mask_view;
+	SQLINTEGER **indicators = NULL;
+	SQLSMALLINT *ctypes = NULL;
+	SQLSMALLINT numOpts = 0;
+	SQLSMALLINT data_type, scale, nullable;
+	SQLUINTEGER precision;
+	SQLINTEGER row_cnt = 0;
+	Py_ssize_t num_rows = -1, row, len;
+	double start;
+	int rc, i, num_views = 0;
+	char *elem;
+	char error[DB2_MAX_ERR_MSG_LEN];
+
+	if ( !PyArg_ParseTuple(args, "OO|O", &py_stmt_res, &py_columns, &py_masks) )
+		return NULL;
+
+	if ( NIL_P(py_stmt_res) || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType) ) {
+		PyErr_SetString( PyExc_Exception, "Supplied statement object parameter is invalid" );
+		return NULL;
+	}
+	stmt_res = (stmt_handle *)py_stmt_res;
+
+	columns = PySequence_Fast(py_columns, "Columns must be a sequence");
+	if ( columns == NULL ) {
+		return NULL;
+	}
+	if ( !NIL_P(py_masks) ) {
+		masks = PySequence_Fast(py_masks, "Null masks must be a sequence");
+		if ( masks == NULL ) {
+			Py_DECREF(columns);
+			return NULL;
+		}
+	}
+
+	/* Free any cursors that might have been allocated in a previous call to SQLExecute */
+	Py_BEGIN_ALLOW_THREADS;
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_CLOSE);
+	rc = SQLNumParams((SQLHSTMT)stmt_res->hstmt, (SQLSMALLINT*)&numOpts);
+	Py_END_ALLOW_THREADS;
+	stmt_res->row_gen++;
+	_python_ibm_db_clear_stmt_err_cache();
+	_python_ibm_db_clear_handle_error(NULL, stmt_res);
+	stmt_res->array_row_cnt = -1;
+
+	if ( numOpts != PySequence_Fast_GET_SIZE(columns) || 
+		 (masks != NULL && numOpts != PySequence_Fast_GET_SIZE(masks)) ) {
+		sprintf(error, "Number of columns does not match the %d parameters of the statement", numOpts);
+		PyErr_SetString(PyExc_Exception, error);
+		goto cleanup;
+	}
+	if ( numOpts == 0 ) {
+		PyErr_SetString(PyExc_Exception, "Statement has no parameters");
+		goto cleanup;
+	}
+
+	views = ALLOC_N(Py_buffer, numOpts);
+	indicators = ALLOC_N(SQLINTEGER *, numOpts);
+	ctypes = ALLOC_N(SQLSMALLINT, numOpts);
+	if ( views == NULL || indicators == NULL || ctypes == NULL ) {
+		PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+		goto cleanup;
+	}
+	memset(indicators, 0, sizeof(SQLINTEGER *) * numOpts);
+
+	for ( i = 0; i < numOpts; i++ ) {
+		if ( _python_ibm_db_get_column_buffer(PySequence_Fast_GET_ITEM(columns, i), &views[i]) < 0 ) {
+			goto cleanup;
+		}
+		num_views++;
+		if ( views[i].itemsize <= 0 || 
+			 _python_ibm_db_buffer_ctype(views[i].format, views[i].itemsize, &ctypes[i]) < 0 ) {
+			sprintf(error, "Column %d has an unsupported element format", i + 1);
+			PyErr_SetString(PyExc_Exception, error);
+			goto cleanup;
+		}
+		len = views[i].len / views[i].itemsize;
+		if ( num_rows >= 0 && len != num_rows ) {
+			PyErr_SetString(PyExc_Exception, "All the columns must have the same number of rows");
+			goto cleanup;
+		}
+		num_rows = len;
+	}
+	if ( num_rows == 0 ) {
+		goto cleanup;
+	}
+
+	for ( i = 0; i < numOpts; i++ ) {
+		mask_obj = masks != NULL ? PySequence_Fast_GET_ITEM(masks, i) : Py_None;
+		if ( mask_obj != Py_None || ctypes[i] == SQL_C_CHAR ) {
+			indicators[i] = ALLOC_N(SQLINTEGER, num_rows);
+			if ( indicators[i] == NULL ) {
+				PyErr_SetString(PyExc_Exception, "Failed to Allocate Memory");
+				goto cleanup;
+			}
+			for ( row = 0; row < num_rows; row++ ) {
+				if ( ctypes[i] == SQL_C_CHAR ) {
+					/* byte strings are padded with NULs */
+					elem = (char *)views[i].buf + row * views[i].itemsize;
+					for ( len = 0; len < views[i].itemsize && elem[len] != '\0'; len++ );
+					indicators[i][row] = (SQLINTEGER)len;
+				} else {
+					indicators[i][row] = 0;
+				}
+			}
+		}
+		if ( mask_obj != Py_None ) {
+			if ( _python_ibm_db_get_column_buffer(mask_obj, &mask_view) < 0 ) {
+				goto cleanup;
+			}
+			if ( mask_view.len != num_rows ) {
+				PyBuffer_Release(&mask_view);
+				sprintf(error, "Null mask %d must have one byte per row", i + 1);
+				PyErr_SetString(PyExc_Exception, error);
+				goto cleanup;
+			}
+			for ( row = 0; row < num_rows; row++ ) {
+				if ( ((char *)mask_view.buf)[row] ) {
+					indicators[i][row] = SQL_NULL_DATA;
+				}
+			}
+			PyBuffer_Release(&mask_view);
+		}
+
+		_python_ibm_db_count_request(stmt_res, RT_DESCRIBE_PARAMS);
+		Py_BEGIN_ALLOW_THREADS;
+		rc = SQLDescribeParam((SQLHSTMT)stmt_res->hstmt, i + 1,
+			&data_type, &precision, &scale, &nullable);
+		if ( rc != SQL_ERROR ) {
+			rc = SQLBindParameter(stmt_res->hstmt, i + 1, SQL_PARAM_INPUT, ctypes[i], 
+				data_type, precision, scale, views[i].buf, views[i].itemsize, 
+				(SQLINTEGER *)indicators[i]);
+		}
+		Py_END_ALLOW_THREADS;
+
+		if ( rc == SQL_ERROR ) {
+			_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+			sprintf(error, "Binding Error 1: %s", IBM_DB_G(__python_stmt_err_msg));
+			PyErr_SetString(PyExc_Exception, error);
+			goto cleanup;
+		}
+	}
+
+	_python_ibm_db_count_request(stmt_res, RT_EXECUTE);
+	start = _python_ibm_db_clock();
+	Py_BEGIN_ALLOW_THREADS;
+	rc = SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMSET_SIZE, 
+		(SQLPOINTER)(long)num_rows, SQL_IS_INTEGER);
+	if ( rc != SQL_ERROR ) {
+		rc = SQLExecute((SQLHSTMT)stmt_res->hstmt);
+	}
+	if ( rc != SQL_ERROR ) {
+		rc = SQLRowCount((SQLHSTMT)stmt_res->hstmt, &row_cnt);
+	}
+	Py_END_ALLOW_THREADS;
+	_python_ibm_db_stats_gil(stmt_res, start);
+
+	if ( rc == SQL_ERROR ) {
+		_python_ibm_db_check_sql_errors(stmt_res->hstmt, SQL_HANDLE_STMT, rc, 1, NULL, -1, 1);
+		sprintf(error, "Statement Execute Failed: %s", IBM_DB_G(__python_stmt_err_msg));
+		PyErr_SetString(PyExc_Exception, error);
+	}
+
+cleanup:
+	/* The bindings point into the columns, drop them before releasing */
+	Py_BEGIN_ALLOW_THREADS;
+	SQLFreeStmt((SQLHSTMT)stmt_res->hstmt, SQL_RESET_PARAMS);
+	SQLSetStmtAttr((SQLHSTMT)stmt_res->hstmt, SQL_ATTR_PARAMSET_SIZE, (SQLPOINTER)1, SQL_IS_INTEGER);
+	Py_END_ALLOW_THREADS;
+
+	for ( i = 0; i < num_views; i++ ) {
+		if ( indicators[i] != NULL ) {
+			PyMem_Del(indicators[i]);
+		}
+#if  PY_MAJOR_VERSION < 3
+		if ( views[i].obj == NULL ) {
+			/* exported through the old buffer interface */
+			continue;
+		}
+#endif
+		PyBuffer_Release(&views[i]);
+	}
+	if ( views != NULL ) {
+		PyMem_Del(views);
+	}
+	if ( indicators != NULL ) {
+		PyMem_Del(indicators);
+	}
+	if ( ctypes != NULL ) {
+		PyMem_Del(ctypes);
+	}
+	Py_DECREF(columns);
+	Py_XDECREF(masks);
+
+	if ( PyErr_Occurred() ) {
+		return NULL;
+	}
+	return PyInt_FromLong(row_cnt);
+}
+
+/*!# ibm_db.execute_columns
+ *
+ * ===Description
+ * int ibm_db.execute_columns ( resource stmt, sequence columns [, sequence null_masks] )
+ *
+ * Executes a prepared statement for every row of the parameter columns.
+ *
+ * Each column is an object supporting the buffer protocol, like a NumPy array,
+ * an array.array or a memoryview, holding the values of one parameter for all
+ * the rows. The memory of the columns is bound directly as parameter arrays
+ * (SQL_ATTR_PARAMSET_SIZE) and the statement is executed with a single call,
+ * without creating a Python object for any value.
+ *
+ * Integer, floating point and boolean elements of native byte order are
+ * supported, as are fixed width byte strings (struct format 'Ns').
+ *
+ * ===Parameters
+ *
+ * ====stmt
+ *		A prepared statement returned from ibm_db.prepare().
+ *
+ * ====columns
+ *		A sequence with one contiguous buffer per parameter marker. All the
+ * buffers must hold the same number of elements.
+ *
+ * ====null_masks
+ *		An optional sequence with, for every column, None or a buffer of one
+ * byte per row. A non zero byte sets the parameter to NULL for that row.
+ *
+ * ===Return Values
+ *
+ * Returns the number of rows inserted, updated or deleted.
+ */
+static PyObject *ibm_db_execute_columns(PyObject *self, PyObject *args)
+{
+	PyObject *py_stmt_res = NULL;
+	stmt_handle *stmt_res = NULL;
+	double start = _python_ibm_db_clock();
+
+	if ( PyTuple_Size(args) > 0 ) {
+		py_stmt_res = PyTuple_GET_ITEM(args, 0);
+	}
+	if ( py_stmt_res == NULL || !PyObject_TypeCheck(py_stmt_res, &stmt_handleType) ) {
+		return _python_ibm_db_execute_columns_helper(args);
+	}
+	stmt_res = (stmt_handle *)py_stmt_res;
+	return _python_ibm_db_stats_result(stmt_res, ST_EXECUTE, start, _python_ibm_db_execute_columns_helper(args));
+}
+
 /*
  * ===Description
  *  ibm_db.callproc( conn_handle conn_res, char *procName, (In/INOUT/OUT parameters tuple) )
@@ -10030,6 +15035,7 @@ static PyObject* ibm_db_callproc(PyObject *self, PyObject *args){
 	stmt_handle *stmt_res = NULL;
 	param_node *tmp_curr = NULL;
 	int numOfParam = 0;
+	double start;
 
 	if (!PyArg_ParseTuple(args, "OO|O", &py_conn_res, &pyprocName, &parameters_tuple)) {
 		return NULL;
@@ -10113,7 +15119,9 @@ static PyObject* ibm_db_callproc(PyObject *self, PyObject *args){
 			}
 		}
 	
-		if (!NIL_P(_python_ibm_db_execute_helper1(stmt_res, NULL))) {
+		start = _python_ibm_db_clock();
+		if (!NIL_P(_python_ibm_db_stats_result(stmt_res, ST_EXECUTE, start,
+				_python_ibm_db_execute_helper1(stmt_res, NULL)))) {
 			tmp_curr = stmt_res->head_cache_list;
 			if(numOfParam != 0 && tmp_curr != NULL) {
 				int paramCount = 1;
@@ -10150,9 +15158,13 @@ static PyObject* ibm_db_callproc(PyObject *self, PyObject *args){
 								paramCount++;
 								break;
 							case SQL_BIGINT:
-								PyTuple_SetItem(outTuple, paramCount, PyLong_FromString(tmp_curr->svalue, NULL, 0));
-								paramCount++;
-								break;
+								if ( NIL_P(tmp_curr->svalue) && NIL_P(tmp_curr->uvalue) ) {
+									/* Bound from an integer as SQL_C_SBIGINT */
+									PyTuple_SetItem(outTuple, paramCount, PyLong_FromLongLong(tmp_curr->bivalue));
+									paramCount++;
+									break;
+								}
+								/* Bound from a string, fall through */
 							default:
 								if (!NIL_P(tmp_curr->svalue)) {
 									PyTuple_SetItem(outTuple, paramCount, StringOBJ_FromASCII(tmp_curr->svalue));
@@ -10347,6 +15359,16 @@ static int _python_get_variable_type(PyObject *variable_value)
 	else if (PyDate_Check(variable_value)){
 		return PYTHON_DATE;
 	}
+	else if (PyByteArray_Check(variable_value) || PyMemoryView_Check(variable_value)
+#if  PY_MAJOR_VERSION < 3
+			|| PyBuffer_Check(variable_value)
+#endif
+			){
+		return PYTHON_BUFFER;
+	}
+	else if (PyObject_HasAttrString(variable_value, "read") || PyIter_Check(variable_value)){
+		return PYTHON_STREAM;
+	}
 	else if (PyComplex_Check(variable_value)){
 		return PYTHON_COMPLEX;
 	}
@@ -10372,6 +15394,9 @@ static PyMethodDef ibm_db_Methods[] = {
 	{"fetch_assoc", (PyCFunction)ibm_db_fetch_assoc, METH_VARARGS, "Returns a dictionary, indexed by column name, representing a row in a result set"},
 	{"fetch_both", (PyCFunction)ibm_db_fetch_both, METH_VARARGS, "Returns a dictionary, indexed by both column name and position, representing a row in a result set"},
 	{"fetch_row", (PyCFunction)ibm_db_fetch_row, METH_VARARGS, "Sets the result set pointer to the next row or requested row"},
+	{"fetch_many", (PyCFunction)ibm_db_fetch_many, METH_VARARGS, "Returns a list of tuples representing the next rows in a result set"},
+	{"fetch_all", (PyCFunction)ibm_db_fetch_all, METH_VARARGS, "Returns a list of tuples representing all the remaining rows in a result set"},
+	{"lob_reader", (PyCFunction)ibm_db_lob_reader, METH_VARARGS, "Returns a reader streaming a LOB column of the current row in chunks"},
 	{"result", (PyCFunction)ibm_db_result, METH_VARARGS, "Returns a single column from a row in the result set"},
 	{"active", (PyCFunction)ibm_db_active, METH_VARARGS, "Checks if the specified connection resource is active"},
 	{"autocommit", (PyCFunction)ibm_db_autocommit, METH_VARARGS, "Returns or sets the AUTOCOMMIT state for a database connection"},
@@ -10389,6 +15414,7 @@ static PyMethodDef ibm_db_Methods[] = {
 	{"cursor_type", (PyCFunction)ibm_db_cursor_type, METH_VARARGS, "Returns the cursor type used by a statement resource"},
 	{"dropdb", (PyCFunction)ibm_db_dropdb, METH_VARARGS, "Drop db"},
 	{"execute_many", (PyCFunction)ibm_db_execute_many, METH_VARARGS, "Execute SQL with multiple rows."},
+	{"execute_columns", (PyCFunction)ibm_db_execute_columns, METH_VARARGS, "Execute SQL for the rows of buffer protocol parameter columns"},
 	{"field_display_size", (PyCFunction)ibm_db_field_display_size, METH_VARARGS, "Returns the maximum number of bytes required to display a column"},
 	{"field_name", (PyCFunction)ibm_db_field_name, METH_VARARGS, "Returns the name of the column in the result set"},
 	{"field_nullable", (PyCFunction)ibm_db_field_nullable, METH_VARARGS, "Returns indicated column can contain nulls or not"},
@@ -10396,10 +15422,18 @@ static PyMethodDef ibm_db_Methods[] = {
 	{"field_precision", (PyCFunction)ibm_db_field_precision, METH_VARARGS, "Returns the precision of the indicated column in a result set"},
 	{"field_scale", (PyCFunction)ibm_db_field_scale , METH_VARARGS, "Returns the scale of the indicated column in a result set"},
 	{"field_type", (PyCFunction)ibm_db_field_type, METH_VARARGS, "Returns the data type of the indicated column in a result set"},
+	{"describe", (PyCFunction)ibm_db_describe, METH_VARARGS, "Returns the name, type, display size, precision, scale and nullability of every column in a result set"},
 	{"field_width", (PyCFunction)ibm_db_field_width, METH_VARARGS, "Returns the width of the indicated column in a result set"},
 	{"foreign_keys", (PyCFunction)ibm_db_foreign_keys, METH_VARARGS, "Returns a result set listing the foreign keys for a table"},
 	{"free_result", (PyCFunction)ibm_db_free_result, METH_VARARGS, "Frees resources associated with a result set"},
 	{"free_stmt", (PyCFunction)ibm_db_free_stmt, METH_VARARGS, "Frees resources associated with the indicated statement resource"},
+	{"cancel", (PyCFunction)ibm_db_cancel, METH_VARARGS, "Cancels the SQL statement executing on a statement resource"},
+	{"after_fork", (PyCFunction)ibm_db_after_fork, METH_NOARGS, "Forgets the connections inherited from the parent process after fork()"},
+	{"stmt_cache_info", (PyCFunction)ibm_db_stmt_cache_info, METH_VARARGS, "Returns the size, entries, hits and misses of the prepared statement cache of a connection"},
+	{"round_trips", (PyCFunction)ibm_db_round_trips, METH_VARARGS, "Returns the number of prepare, describe and execute requests sent by a connection or statement"},
+	{"stats", (PyCFunction)ibm_db_stats, METH_VARARGS, "Returns call counts, timings and row counts of a connection, a statement or the process"},
+	{"set_input_sizes", (PyCFunction)ibm_db_set_input_sizes, METH_VARARGS, "Declares the SQL type of the parameters of a prepared statement"},
+	{"set_output_size", (PyCFunction)ibm_db_set_output_size, METH_VARARGS, "Sets the number of characters bound for character columns"},
 	{"get_option", (PyCFunction)ibm_db_get_option, METH_VARARGS, "Gets the specified option in the resource."},
 	{"next_result", (PyCFunction)ibm_db_next_result, METH_VARARGS, "Requests the next result set from a stored procedure"},
 	{"num_fields", (PyCFunction)ibm_db_num_fields, METH_VARARGS, "Returns the number of fields contained in a result set"},
@@ -10418,6 +15452,8 @@ static PyMethodDef ibm_db_Methods[] = {
 	{"statistics", (PyCFunction)ibm_db_statistics, METH_VARARGS, "Returns a result set listing the index and statistics for a table"},
 	{"stmt_error", (PyCFunction)ibm_db_stmt_error, METH_VARARGS, "Returns a string containing the SQLSTATE returned by an SQL statement"},
 	{"stmt_errormsg", (PyCFunction)ibm_db_stmt_errormsg, METH_VARARGS, "Returns a string containing the last SQL statement error message"},
+	{"last_error", (PyCFunction)ibm_db_last_error, METH_VARARGS, "Returns the SQLSTATE of the last error raised on a connection or statement"},
+	{"last_errormsg", (PyCFunction)ibm_db_last_errormsg, METH_VARARGS, "Returns the error message of the last error raised on a connection or statement"},
 	{"table_privileges", (PyCFunction)ibm_db_table_privileges, METH_VARARGS, "Returns a result set listing the tables and associated privileges in a database"},
 	{"tables", (PyCFunction)ibm_db_tables, METH_VARARGS, "Returns a result set listing the tables and associated metadata in a database"},	
 	/* An end-of-listing sentinel: */ 
@@ -10438,6 +15474,40 @@ static struct PyModuleDef moduledef = {
 	};
 #endif
 
+/*	static void _python_ibm_db_register_at_fork(PyObject *m)
+	runs ibm_db.after_fork() in the child of os.fork() where the os module
+	supports register_at_fork()
+*/
+static void _python_ibm_db_register_at_fork(PyObject *m)
+{
+	PyObject *os_module = NULL;
+	PyObject *register_at_fork = NULL;
+	PyObject *after_fork = NULL;
+	PyObject *args = NULL;
+	PyObject *kwargs = NULL;
+	PyObject *result = NULL;
+
+	os_module = PyImport_ImportModule("os");
+	if ( os_module != NULL ) {
+		register_at_fork = PyObject_GetAttrString(os_module, "register_at_fork");
+	}
+	if ( register_at_fork != NULL ) {
+		after_fork = PyObject_GetAttrString(m, "after_fork");
+		args = PyTuple_New(0);
+		kwargs = Py_BuildValue("{s:O}", "after_in_child", after_fork);
+		if ( after_fork != NULL && args != NULL && kwargs != NULL ) {
+			result = PyObject_Call(register_at_fork, args, kwargs);
+		}
+	}
+	Py_XDECREF(result);
+	Py_XDECREF(kwargs);
+	Py_XDECREF(args);
+	Py_XDECREF(after_fork);
+	Py_XDECREF(register_at_fork);
+	Py_XDECREF(os_module);
+	PyErr_Clear();
+}
+
 /* Module initialization function */
 PyMODINIT_FUNC
 INIT_ibm_db(void) {
@@ -10447,6 +15517,9 @@ INIT_ibm_db(void) {
 	ibm_db_globals = ALLOC(struct _ibm_db_globals);
 	memset(ibm_db_globals, 0, sizeof(struct _ibm_db_globals));
 	python_ibm_db_init_globals(ibm_db_globals);
+	ibm_db_globals_key = StringOBJ_FromASCII("ibm_db.globals");
+	ibm_db_conn_owners = PyDict_New();
+	ibm_db_stmt_owners = PyDict_New();
 
 	persistent_list = PyDict_New();
 
@@ -10466,6 +15539,13 @@ INIT_ibm_db(void) {
 	if (PyType_Ready(&server_infoType) < 0)
 		return MOD_RETURN_ERROR;
 
+	if (PyType_Ready(&lob_readerType) < 0)
+		return MOD_RETURN_ERROR;
+
+	poolType.tp_new = PyType_GenericNew;
+	if (PyType_Ready(&poolType) < 0)
+		return MOD_RETURN_ERROR;
+
 #if PY_MAJOR_VERSION < 3
 	m = Py_InitModule3("ibm_db", ibm_db_Methods,  "IBM DataServer Driver for Python.");
 #else
@@ -10479,6 +15559,12 @@ INIT_ibm_db(void) {
 	PyModule_AddIntConstant(m, "SQL_AUTOCOMMIT_OFF", SQL_AUTOCOMMIT_OFF);
 	PyModule_AddIntConstant(m, "SQL_ATTR_AUTOCOMMIT", SQL_ATTR_AUTOCOMMIT);
 	PyModule_AddIntConstant(m, "ATTR_CASE", ATTR_CASE);
+	PyModule_AddIntConstant(m, "ATTR_STMT_CACHE_SIZE", ATTR_STMT_CACHE_SIZE);
+	PyModule_AddIntConstant(m, "ATTR_FETCH_BUFFER_SIZE", ATTR_FETCH_BUFFER_SIZE);
+	PyModule_AddIntConstant(m, "ATTR_CHAR_MODE", ATTR_CHAR_MODE);
+	PyModule_AddIntConstant(m, "CHAR_WCHAR", CHAR_WCHAR);
+	PyModule_AddIntConstant(m, "CHAR_UTF8", CHAR_UTF8);
+	PyModule_AddIntConstant(m, "CHAR_BYTES", CHAR_BYTES);
 	PyModule_AddIntConstant(m, "CASE_NATURAL", CASE_NATURAL);
 	PyModule_AddIntConstant(m, "CASE_LOWER", CASE_LOWER);
 	PyModule_AddIntConstant(m, "CASE_UPPER", CASE_UPPER);
@@ -10533,6 +15619,10 @@ INIT_ibm_db(void) {
 	PyModule_AddIntConstant(m, "SQL_INDEX_CLUSTERED", SQL_INDEX_CLUSTERED);
 	PyModule_AddIntConstant(m, "SQL_INDEX_OTHER", SQL_INDEX_OTHER);
 	PyModule_AddIntConstant(m, "SQL_ATTR_CURRENT_SCHEMA", SQL_ATTR_CURRENT_SCHEMA);
+	PyModule_AddIntConstant(m, "SQL_ATTR_QUERY_TIMEOUT", SQL_ATTR_QUERY_TIMEOUT);
+	PyModule_AddIntConstant(m, "SQL_ATTR_DEFERRED_PREPARE", SQL_ATTR_DEFERRED_PREPARE);
+	PyModule_AddIntConstant(m, "SQL_DEFERRED_PREPARE_ON", SQL_DEFERRED_PREPARE_ON);
+	PyModule_AddIntConstant(m, "SQL_DEFERRED_PREPARE_OFF", SQL_DEFERRED_PREPARE_OFF);
 	PyModule_AddIntConstant(m, "SQL_ATTR_INFO_USERID", SQL_ATTR_INFO_USERID);
 	PyModule_AddIntConstant(m, "SQL_ATTR_INFO_WRKSTNNAME", SQL_ATTR_INFO_WRKSTNNAME);
 	PyModule_AddIntConstant(m, "SQL_ATTR_INFO_ACCTSTR", SQL_ATTR_INFO_ACCTSTR);
@@ -10545,6 +15635,12 @@ INIT_ibm_db(void) {
 	PyModule_AddIntConstant(m, "SQL_ATTR_ROWCOUNT_PREFETCH", SQL_ATTR_ROWCOUNT_PREFETCH);
 	PyModule_AddIntConstant(m, "SQL_ROWCOUNT_PREFETCH_ON", SQL_ROWCOUNT_PREFETCH_ON);
 	PyModule_AddIntConstant(m, "SQL_ROWCOUNT_PREFETCH_OFF", SQL_ROWCOUNT_PREFETCH_OFF);
+#ifdef SQL_ATTR_BLOCK_FOR_NROWS
+	PyModule_AddIntConstant(m, "SQL_ATTR_BLOCK_FOR_NROWS", SQL_ATTR_BLOCK_FOR_NROWS);
+#endif
+#ifdef SQL_ATTR_OPTIMIZE_FOR_NROWS
+	PyModule_AddIntConstant(m, "SQL_ATTR_OPTIMIZE_FOR_NROWS", SQL_ATTR_OPTIMIZE_FOR_NROWS);
+#endif
 	PyModule_AddIntConstant(m, "SQL_API_SQLROWCOUNT", SQL_API_SQLROWCOUNT);
 	PyModule_AddIntConstant(m, "QUOTED_LITERAL_REPLACEMENT_ON", SET_QUOTED_LITERAL_REPLACEMENT_ON);
 	PyModule_AddIntConstant(m, "QUOTED_LITERAL_REPLACEMENT_OFF", SET_QUOTED_LITERAL_REPLACEMENT_OFF);
@@ -10559,5 +15655,12 @@ INIT_ibm_db(void) {
 
 	Py_INCREF(&server_infoType);
 	PyModule_AddObject(m, "IBM_DBServerInfo", (PyObject *)&server_infoType);
+
+	Py_INCREF(&poolType);
+	PyModule_AddObject(m, "IBM_DBPool", (PyObject *)&poolType);
+	Py_INCREF(&poolType);
+	PyModule_AddObject(m, "Pool", (PyObject *)&poolType);
+
+	_python_ibm_db_register_at_fork(m);
 	return MOD_RETURN_VAL(m);
 }
@@ -28,6 +28,7 @@
 #define PyBytes_FromStringAndSize	PyString_FromStringAndSize
 #define StringObj_Format		PyString_Format
 #define StringObj_Size			PyString_Size
+#define StringOBJ_InternInPlace		PyString_InternInPlace
 #define PyObject_CheckBuffer		PyObject_CheckReadBuffer
 #define PyVarObject_HEAD_INIT(type, size) \
 					PyObject_HEAD_INIT(type) size,
@@ -44,6 +45,7 @@
 #define PyString_Check			PyUnicode_Check
 #define StringObj_Format		PyUnicode_Format
 #define StringObj_Size			PyUnicode_GET_SIZE
+#define StringOBJ_InternInPlace		PyUnicode_InternInPlace
 #define MOD_RETURN_ERROR		NULL
 #define MOD_RETURN_VAL(mod)		mod
 #define INIT_ibm_db PyInit_ibm_db
@@ -73,6 +75,8 @@
 #define PYTHON_DATE 10
 #define PYTHON_TIME 11
 #define PYTHON_TIMESTAMP 12
+#define PYTHON_STREAM 13
+#define PYTHON_BUFFER 14
 
 #define ENABLE_NUMERIC_LITERALS 1 /* Enable CLI numeric literals */
 
@@ -121,6 +125,22 @@
 
 /* Default initail LOB buffer size */
 #define INIT_BUFSIZ 10240
+
+/* Default chunk size of a LOB reader */
+#define LOB_BUFSIZ 65536
+
+/* Characters bound for a character column fetched one row at a time when
+ * it is wider, longer values are read into the overflow buffer */
+#define COLUMN_INLINE_SIZE 512
+
+/* Upper bound of the column buffers allocated for a block (rowset) fetch */
+#define ROWSET_BUFSIZ 1048576
+
+/* Character form of a DECIMAL value: sign, 31 digits, separator and exponent */
+#define DECIMAL_BUFSIZ 64
+
+/* Upper bound of the parameter arrays allocated for an array execute */
+#define PARAMSET_BUFSIZ 4194304
  
 /* Used in _python_parse_options */
 #define DB2_ERRMSG 1
@@ -157,6 +177,32 @@
 #define CASE_LOWER 1
 #define CASE_UPPER 2
 
+/* Number of prepared statements cached per connection */
+#define ATTR_STMT_CACHE_SIZE 3271983
+
+/* Bytes of column buffers a block (rowset) fetch may allocate */
+#define ATTR_FETCH_BUFFER_SIZE 3271984
+
+/* C type character data is transferred as */
+#define ATTR_CHAR_MODE 3271985
+#define CHAR_WCHAR 0
+#define CHAR_UTF8 1
+#define CHAR_BYTES 2
+
+/* Requests counted by ibm_db.round_trips() */
+#define RT_PREPARE 0
+#define RT_DESCRIBE 1
+#define RT_EXECUTE 2
+#define RT_COUNT 3
+
+/* Calls timed by ibm_db.stats() */
+#define ST_PREPARE 0
+#define ST_EXECUTE 1
+#define ST_FETCH 2
+#define ST_COUNT 3
+/* Counted as RT_DESCRIBE, once per prepare */
+#define RT_DESCRIBE_PARAMS 3
+
 /* maximum sizes */
 #define USERID_LEN 16
 #define ACCTSTR_LEN 200
@@ -349,10 +395,13 @@ static PyTypeObject server_infoType = {
 
 
 /*
-* TODO: make this threadsafe
+* Each thread keeps its own copy of the globals so errors raised in one
+* thread are never reported to another
 */
 
-#define IBM_DB_G(v) (ibm_db_globals->v)
+#define IBM_DB_G(v) (_python_ibm_db_get_globals()->v)
+
+static struct _ibm_db_globals *_python_ibm_db_get_globals(void);
 
 static void _python_ibm_db_clear_stmt_err_cache(void);
 static void _python_ibm_db_clear_conn_err_cache(void);
@@ -0,0 +1,393 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2007-2013                                  |
+# +--------------------------------------------------------------------------+
+# | This module complies with SQLAlchemy and is                              |
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+
+"""
+This module wraps ibm_db_dbi for asyncio.  It requires Python 3.5, and the
+ibm_db_dbi that setup.py installs there after converting it with 2to3.
+
+The Connection and Cursor classes mirror those of ibm_db_dbi with coroutine
+methods.  Each call that can wait on the database server runs on a thread of
+the module executor while the event loop serves other tasks; ibm_db releases
+the GIL around its network calls, so the queries of different connections
+run in parallel.  The calls made on one connection are serialized, since a
+CLI connection handle serves one request at a time.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+
+import ibm_db
+import ibm_db_dbi
+from ibm_db_dbi import Error, Warning, InterfaceError, DatabaseError, \
+     InternalError, OperationalError, ProgrammingError, IntegrityError, \
+     DataError, NotSupportedError
+
+__version__ = ibm_db.__version__
+
+apilevel = ibm_db_dbi.apilevel
+threadsafety = ibm_db_dbi.threadsafety
+paramstyle = ibm_db_dbi.paramstyle
+
+# Number of threads running blocking ibm_db calls, which bounds the number
+# of statements in flight at a time.  Read when the executor is created.
+max_workers = 32
+
+_executor = None
+
+# Single thread running the cancels of statements, so that a cancel does
+# not wait behind the calls of a busy executor.
+_cancel_executor = None
+
+def set_executor(executor):
+    """This method makes the module run its blocking calls on executor, a
+    concurrent.futures.Executor, instead of a thread pool of max_workers.
+    """
+    global _executor
+    _executor = executor
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+    return _executor
+
+def _get_cancel_executor():
+    global _cancel_executor
+    if _cancel_executor is None:
+        _cancel_executor = concurrent.futures.ThreadPoolExecutor(1)
+    return _cancel_executor
+
+def _submit(func, *args):
+    """Starts func(*args) on the executor and returns its future."""
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(_get_executor(),
+                                functools.partial(func, *args))
+
+async def _run(func, *args):
+    """Runs func(*args) on the executor and waits for its result."""
+    return await _submit(func, *args)
+
+async def _cancel(dbi_cursor):
+    """Runs dbi_cursor.cancel() on the cancel thread."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_get_cancel_executor(),
+                                      dbi_cursor.cancel)
+
+async def connect(dsn=None, user='', password='', host='', database='',
+                  conn_options=None, pool=None):
+    """This method creates a non persistent connection to the database as
+    ibm_db_dbi.connect() does.  It returns a ibm_db_aio.Connection object.
+    """
+    return Connection(await _run(ibm_db_dbi.connect, dsn, user, password,
+                                 host, database, conn_options, pool))
+
+
+class Connection(object):
+    """This class represents a connection to the database.  It wraps an
+    ibm_db_dbi.Connection and runs its methods on the executor.
+    """
+
+    def __init__(self, dbi_connection, on_close=None):
+        """Constructor for Connection object. It takes the
+        ibm_db_dbi.Connection to wrap, and a function called once the
+        connection is closed.
+        """
+        self.dbi_connection = dbi_connection
+        self._lock = asyncio.Lock()
+        self._on_close = on_close
+
+    async def _call(self, func, *args):
+        """Runs func(*args) on the executor once the previous call on this
+        connection finished.  If the awaiting task is cancelled the call
+        keeps the connection until its executor thread returns.
+        """
+        await self._lock.acquire()
+        try:
+            future = _submit(func, *args)
+        except:
+            self._lock.release()
+            raise
+        future.add_done_callback(lambda future: self._lock.release())
+        return await asyncio.shield(future)
+
+    # This attribute specifies the ibm_db connection handler.
+    # It is a read only attribute.
+    conn_handler = property(lambda self: self.dbi_connection.conn_handler)
+
+    def cursor(self):
+        """This method returns a Cursor object for the connection."""
+        return Cursor(self, self.dbi_connection.cursor())
+
+    async def close(self):
+        """This method closes the connection, or returns it to its pool."""
+        try:
+            return await self._call(self.dbi_connection.close)
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+    async def commit(self):
+        """This method commits the transaction of the connection."""
+        return await self._call(self.dbi_connection.commit)
+
+    async def rollback(self):
+        """This method rolls back the transaction of the connection."""
+        return await self._call(self.dbi_connection.rollback)
+
+    async def set_autocommit(self, is_on):
+        """This method sets the autocommit mode of the connection."""
+        return await self._call(self.dbi_connection.set_autocommit, is_on)
+
+    async def set_current_schema(self, schema_name):
+        """This method sets the current schema of the connection."""
+        return await self._call(self.dbi_connection.set_current_schema,
+                                schema_name)
+
+    async def get_current_schema(self):
+        """This method returns the current schema of the connection."""
+        return await self._call(self.dbi_connection.get_current_schema)
+
+    async def set_timeout(self, seconds):
+        """This method sets the number of seconds the statements of the
+        connection may run, 0 for no limit.
+        """
+        return await self._call(self.dbi_connection.set_timeout, seconds)
+
+    async def server_info(self):
+        """This method returns the (DBMS_NAME, DBMS_VER) of the server."""
+        return await self._call(self.dbi_connection.server_info)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.dbi_connection.conn_handler is not None:
+            await self.close()
+
+
+class Cursor(object):
+    """This class represents a cursor of the connection.  It wraps an
+    ibm_db_dbi.Cursor and runs its methods on the executor of the
+    connection.
+    """
+
+    def __init__(self, connection, dbi_cursor):
+        """Constructor for Cursor object. It takes the ibm_db_aio.Connection
+        and the ibm_db_dbi.Cursor to wrap.
+        """
+        self.connection = connection
+        self.dbi_cursor = dbi_cursor
+        self._rows = []
+
+    # These attributes are those of the ibm_db_dbi.Cursor.  description
+    # only looks at the metadata fetched by the execute.
+    description = property(lambda self: self.dbi_cursor.description)
+    rowcount = property(lambda self: self.dbi_cursor.rowcount)
+
+    def __get_arraysize(self):
+        return self.dbi_cursor.arraysize
+
+    def __set_arraysize(self, size):
+        self.dbi_cursor.arraysize = size
+
+    # Number of rows fetchmany() returns by default, and fetched at a
+    # time when iterating over the cursor.
+    arraysize = property(__get_arraysize, __set_arraysize)
+
+    def __get_timeout(self):
+        return self.dbi_cursor.timeout
+
+    def __set_timeout(self, seconds):
+        self.dbi_cursor.timeout = seconds
+
+    # Seconds the statements of the cursor may run, the connection
+    # setting if None.
+    timeout = property(__get_timeout, __set_timeout)
+
+    async def _call(self, func, *args):
+        try:
+            return await self.connection._call(func, *args)
+        except asyncio.CancelledError:
+            # The executor thread is still running the statement
+            _get_cancel_executor().submit(self.dbi_cursor.cancel)
+            raise
+
+    async def cancel(self):
+        """This method cancels the statement the cursor is running.  It
+        does not wait for the running call to finish.  Cancelling the task
+        awaiting a call of the cursor, as asyncio.wait_for() does on
+        timeout, cancels the statement as well.
+        """
+        return await _cancel(self.dbi_cursor)
+
+    async def close(self):
+        """This method closes the cursor."""
+        self._rows = []
+        return await self._call(self.dbi_cursor.close)
+
+    async def callproc(self, procname, parameters=None):
+        """This method calls a stored procedure like
+        ibm_db_dbi.Cursor.callproc().
+        """
+        self._rows = []
+        return await self._call(self.dbi_cursor.callproc, procname,
+                                parameters)
+
+    async def execute(self, operation, parameters=None):
+        """This method executes an SQL statement like
+        ibm_db_dbi.Cursor.execute().
+        """
+        self._rows = []
+        return await self._call(self.dbi_cursor.execute, operation,
+                                parameters)
+
+    async def executemany(self, operation, seq_parameters):
+        """This method executes an SQL statement once for each sequence of
+        parameters like ibm_db_dbi.Cursor.executemany().
+        """
+        self._rows = []
+        return await self._call(self.dbi_cursor.executemany, operation,
+                                seq_parameters)
+
+    async def fetchone(self):
+        """This method fetches the next row, None when there is none."""
+        if self._rows:
+            return self._rows.pop(0)
+        return await self._call(self.dbi_cursor.fetchone)
+
+    async def fetchmany(self, size=0):
+        """This method fetches size rows, arraysize rows by default."""
+        if size == 0:
+            size = self.dbi_cursor.arraysize
+        rows = self._rows[:size]
+        del self._rows[:size]
+        if len(rows) < size:
+            rows.extend(await self._call(self.dbi_cursor.fetchmany,
+                                         size - len(rows)))
+        return rows
+
+    async def fetchall(self):
+        """This method fetches all remaining rows."""
+        rows, self._rows = self._rows, []
+        rows.extend(await self._call(self.dbi_cursor.fetchall))
+        return rows
+
+    async def nextset(self):
+        """This method moves to the next result set of a stored procedure."""
+        self._rows = []
+        return await self._call(self.dbi_cursor.nextset)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # Rows are fetched arraysize at a time, not one executor call each
+        if not self._rows:
+            self._rows = await self._call(self.dbi_cursor.fetchmany,
+                                          max(self.dbi_cursor.arraysize, 1))
+            if not self._rows:
+                raise StopAsyncIteration
+        return self._rows.pop(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.dbi_cursor.conn_handler is not None:
+            await self.close()
+
+
+class _PoolAcquire(object):
+    """The result of Pool.acquire(), to be awaited or used in an async with
+    statement which releases the connection at its end.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+
+    def __await__(self):
+        return self._pool._acquire().__await__()
+
+    async def __aenter__(self):
+        self._connection = await self._pool._acquire()
+        return self._connection
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._pool.release(self._connection)
+
+
+class Pool(object):
+    """This class represents a pool of connections to one database, built
+    on ibm_db.Pool.  When all connections are checked out acquire() waits
+    for one to be released instead of failing.
+    """
+
+    def __init__(self, dsn=None, user='', password='', host='', database='',
+                 conn_options=None, min=0, max=10, max_idle=300, validate=30,
+                 pool=None):
+        """Constructor for Pool object. The connection arguments are those
+        of ibm_db_dbi.connect(), the other ones those of ibm_db.Pool.  pool
+        is an existing ibm_db.Pool to use instead.
+        """
+        if pool is None:
+            pool = {'min': min, 'max': max, 'max_idle': max_idle,
+                    'validate': validate}
+        else:
+            max = pool.info()['max']
+        self._connect_args = (dsn, user, password, host, database,
+                              conn_options, pool)
+        self._slots = asyncio.Semaphore(max)
+
+    def acquire(self):
+        """This method returns a connection of the pool.  Awaiting it gives
+        the Connection; "async with pool.acquire() as conn" also releases
+        it at the end of the block.
+        """
+        return _PoolAcquire(self)
+
+    async def _acquire(self):
+        await self._slots.acquire()
+        try:
+            dbi_connection = await _run(ibm_db_dbi.connect,
+                                        *self._connect_args)
+        except:
+            self._slots.release()
+            raise
+        return Connection(dbi_connection, on_close=self._slots.release)
+
+    async def release(self, connection):
+        """This method returns a connection to the pool."""
+        await connection.close()
+
+
+async def create_pool(dsn=None, user='', password='', host='', database='',
+                      conn_options=None, min=0, max=10, max_idle=300,
+                      validate=30, pool=None):
+    """This method creates a Pool and opens its first min connections."""
+    async_pool = Pool(dsn, user, password, host, database, conn_options,
+                      min, max, max_idle, validate, pool)
+    if min > 0 and pool is None:
+        connections = []
+        try:
+            for i in range(min):
+                connections.append(await async_pool.acquire())
+        finally:
+            for connection in connections:
+                await async_pool.release(connection)
+    return async_pool
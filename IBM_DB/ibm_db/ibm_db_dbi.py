@@ -37,9 +37,26 @@ __version__ = ibm_db.__version__
 # Constants for specifying database connection options.
 SQL_ATTR_AUTOCOMMIT = ibm_db.SQL_ATTR_AUTOCOMMIT
 SQL_ATTR_CURRENT_SCHEMA = ibm_db.SQL_ATTR_CURRENT_SCHEMA
+SQL_ATTR_QUERY_TIMEOUT = ibm_db.SQL_ATTR_QUERY_TIMEOUT
+SQL_ATTR_DEFERRED_PREPARE = ibm_db.SQL_ATTR_DEFERRED_PREPARE
+SQL_DEFERRED_PREPARE_ON = ibm_db.SQL_DEFERRED_PREPARE_ON
+SQL_DEFERRED_PREPARE_OFF = ibm_db.SQL_DEFERRED_PREPARE_OFF
 SQL_AUTOCOMMIT_OFF = ibm_db.SQL_AUTOCOMMIT_OFF
 SQL_AUTOCOMMIT_ON = ibm_db.SQL_AUTOCOMMIT_ON
 ATTR_CASE = ibm_db.ATTR_CASE
+ATTR_STMT_CACHE_SIZE = ibm_db.ATTR_STMT_CACHE_SIZE
+ATTR_FETCH_BUFFER_SIZE = ibm_db.ATTR_FETCH_BUFFER_SIZE
+ATTR_CHAR_MODE = ibm_db.ATTR_CHAR_MODE
+CHAR_WCHAR = ibm_db.CHAR_WCHAR
+CHAR_UTF8 = ibm_db.CHAR_UTF8
+CHAR_BYTES = ibm_db.CHAR_BYTES
+SQL_ATTR_ROWCOUNT_PREFETCH = ibm_db.SQL_ATTR_ROWCOUNT_PREFETCH
+SQL_ROWCOUNT_PREFETCH_ON = ibm_db.SQL_ROWCOUNT_PREFETCH_ON
+SQL_ROWCOUNT_PREFETCH_OFF = ibm_db.SQL_ROWCOUNT_PREFETCH_OFF
+# Only defined when the CLI headers ibm_db was built with have them.
+SQL_ATTR_BLOCK_FOR_NROWS = getattr(ibm_db, 'SQL_ATTR_BLOCK_FOR_NROWS', None)
+SQL_ATTR_OPTIMIZE_FOR_NROWS = getattr(ibm_db, 'SQL_ATTR_OPTIMIZE_FOR_NROWS',
+                                      None)
 CASE_NATURAL = ibm_db.CASE_NATURAL
 CASE_LOWER = ibm_db.CASE_LOWER
 CASE_UPPER = ibm_db.CASE_UPPER
@@ -53,9 +70,22 @@ SQL_DBMS_NAME = ibm_db.SQL_DBMS_NAME
 
 # Module globals
 apilevel = '2.0'
-threadsafety = 0
+threadsafety = 1
 paramstyle = 'qmark'
 
+# Number of prepared statements each connection keeps for reuse by its
+# cursors, unless ATTR_STMT_CACHE_SIZE is given in conn_options.
+stmt_cache_size = 20
+
+# SQLSTATE of the OperationalError raised by a statement that ran longer
+# than its SQL_ATTR_QUERY_TIMEOUT, and those of a cancelled statement.
+SQLSTATE_TIMEOUT = 'HYT00'
+SQLSTATE_CANCELLED = ('HY008', '57014')
+
+# Connection pools created by connect() for a pool argument given as a dict,
+# keyed by connection string, user, connection options and pool arguments.
+_pools = {}
+
 
 class Error(exception):
     """This is the base class of all other exception thrown by this
@@ -63,6 +93,10 @@ class Error(exception):
     statement.
     
     """
+    # Set to SQLSTATE_TIMEOUT or one of SQLSTATE_CANCELLED when a
+    # statement timed out or was cancelled.
+    sqlstate = None
+
     def __init__(self, message):
         """This is the constructor which take one string argument."""
         self._message = message
@@ -276,6 +310,43 @@ DATETIME = DBAPITypeObject(("TIMESTAMP",))
 
 ROWID = DBAPITypeObject(())
 
+# The parameter declaration ibm_db.set_input_sizes() takes for each type
+# object Cursor.setinputsizes() accepts.
+_INPUT_SIZES = ((NUMBER, (ibm_db.SQL_INTEGER, 10, 0)),
+                (BIGINT, (ibm_db.SQL_BIGINT, 19, 0)),
+                (FLOAT, (ibm_db.SQL_DOUBLE, 15, 0)),
+                (DATE, (ibm_db.SQL_TYPE_DATE, 10, 0)),
+                (TIME, (ibm_db.SQL_TYPE_TIME, 8, 0)),
+                (DATETIME, (ibm_db.SQL_TYPE_TIMESTAMP, 26, 6)))
+
+def _input_size(size):
+    """Returns the ibm_db.set_input_sizes() entry of a parameter given to
+    Cursor.setinputsizes().
+    """
+    if isinstance(size, tuple):
+        return size
+    if isinstance(size, (int, long)) and not isinstance(size, bool):
+        return (ibm_db.SQL_VARCHAR, size, 0)
+    for type_object, input_size in _INPUT_SIZES:
+        if size is type_object:
+            return input_size
+    return None
+
+# The type object matching each type name returned by ibm_db.field_type().
+# Where a name is in more than one type object the first one listed wins.
+_field_type_objects = {}
+for _type_object in (STRING, TEXT, XML, BINARY, NUMBER, BIGINT, FLOAT,
+                     DECIMAL, DATE, TIME, DATETIME, ROWID):
+    for _col_type in _type_object.col_types:
+        _field_type_objects.setdefault(_col_type, _type_object)
+del _type_object, _col_type
+
+def _decimal_from_string(value):
+    """Converts a DECIMAL value fetched as a string to a decimal.Decimal
+    object.  The decimal separator depends on the client locale.
+    """
+    return decimal.Decimal(str(value).replace(",", "."))
+
 def _get_exception(inst):
     """
     This method is used to determine the type of error that was generated.  
@@ -291,6 +362,15 @@ def _get_exception(inst):
         message = message[:len(message)-3]
 
     informix= 'IDS/' in message
+
+    # Timed out and cancelled statements, on all servers
+    index = message.find('SQLSTATE=')
+    if index != -1:
+        sqlstate = message[(index+9):(index+14)]
+        if sqlstate == SQLSTATE_TIMEOUT or sqlstate in SQLSTATE_CANCELLED:
+            error = OperationalError(message)
+            error.sqlstate = sqlstate
+            return error
     
     # These tuples are used to determine the type of exceptions that are
     # thrown by the database.  They store the SQLSTATE code and the
@@ -552,11 +632,50 @@ def createdbNX(database, dsn, user='', password='', host='', codeset='', mode=''
         
     return return_value
     
-def connect(dsn, user='', password='', host='', database='', conn_options=None):
+def connect(dsn=None, user='', password='', host='', database='',
+            conn_options=None, pool=None, fetch_buffer_size=None,
+            rowcount_prefetch=None, block_for_nrows=None,
+            optimize_for_nrows=None, deferred_prepare=None):
     """This method creates a non persistent connection to the database. It returns
         a ibm_db_dbi.Connection object.
+
+        pool is either an ibm_db.Pool to check the connection out from, in
+        which case no other argument may be given, or a dict of ibm_db.Pool
+        arguments (min, max, max_idle, validate) for a pool shared by the
+        connect() calls with the same connection string, user, conn_options
+        and pool arguments.  Closing the Connection returns it to the pool.
+
+        The tuning arguments are added to conn_options:
+        fetch_buffer_size   bytes of column buffers used to fetch a block of
+                            rows at a time (ATTR_FETCH_BUFFER_SIZE)
+        rowcount_prefetch   True to have rowcount known once a query is
+                            executed (SQL_ATTR_ROWCOUNT_PREFETCH)
+        block_for_nrows     rows the server sends per network block
+                            (SQL_ATTR_BLOCK_FOR_NROWS)
+        optimize_for_nrows  rows the server optimizes queries to return
+                            first (SQL_ATTR_OPTIMIZE_FOR_NROWS)
+        deferred_prepare    True to send the prepare of a statement with its
+                            first execute (SQL_ATTR_DEFERRED_PREPARE)
     """
-    
+
+    if isinstance(pool, ibm_db.IBM_DBPool):
+        if dsn is not None or user != '' or password != '' or host != '' or \
+           database != '' or conn_options is not None or \
+           fetch_buffer_size is not None or rowcount_prefetch is not None or \
+           block_for_nrows is not None or optimize_for_nrows is not None or \
+           deferred_prepare is not None:
+            raise InterfaceError("connect expects no other argument with an"
+                                 " ibm_db.Pool, the pool was created with"
+                                 " its own")
+        try:
+            conn = pool.checkout()
+        except Exception, inst:
+            raise _get_exception(inst)
+        return Connection(conn)
+    if pool is not None and not isinstance(pool, dict):
+        raise InterfaceError("connect expects pool to be an ibm_db.Pool"
+                             " or a dict")
+
     if dsn is None:
         raise InterfaceError("connect expects a not None dsn value") 
     
@@ -573,8 +692,13 @@ def connect(dsn, user='', password='', host='', database='', conn_options=None):
                                  " (conn_options) to be of type dict")
         if not SQL_ATTR_AUTOCOMMIT in conn_options:
             conn_options[SQL_ATTR_AUTOCOMMIT] = SQL_AUTOCOMMIT_OFF
+        if not ATTR_STMT_CACHE_SIZE in conn_options:
+            conn_options[ATTR_STMT_CACHE_SIZE] = stmt_cache_size
     else:
-        conn_options = {SQL_ATTR_AUTOCOMMIT : SQL_AUTOCOMMIT_OFF}
+        conn_options = {SQL_ATTR_AUTOCOMMIT : SQL_AUTOCOMMIT_OFF,
+                        ATTR_STMT_CACHE_SIZE : stmt_cache_size}
+    _add_tuning_options(conn_options, fetch_buffer_size, rowcount_prefetch,
+                        block_for_nrows, optimize_for_nrows, deferred_prepare)
 
     # If the dsn does not contain port and protocal adding database
     # and hostname is no good.  Add these when required, that is,
@@ -595,16 +719,81 @@ def connect(dsn, user='', password='', host='', database='', conn_options=None):
     if password != '' and dsn.find('PWD=') == -1:
         dsn = dsn + "PWD=" + password + ";"
     try:    
-        conn = ibm_db.connect(dsn, '', '', conn_options)
-        ibm_db.set_option(conn, {SQL_ATTR_CURRENT_SCHEMA : user}, 1)
+        if pool is not None:
+            conn = _get_pool(dsn, user, conn_options, pool).checkout()
+        else:
+            conn = ibm_db.connect(dsn, '', '', conn_options)
+            ibm_db.set_option(conn, {SQL_ATTR_CURRENT_SCHEMA : user}, 1)
     except Exception, inst:
         raise _get_exception(inst)
 
     return Connection(conn)
 
-def pconnect(dsn, user='', password='', host='', database='', conn_options=None):
+def _get_pool(dsn, user, conn_options, pool_args):
+    """Returns the pool shared by the connections to dsn with the same user,
+    conn_options and pool_args, creating it from the ibm_db.Pool arguments
+    in pool_args on first use.  The schema is set through the connection
+    options so that checkouts do not clear the statement cache.
+    """
+    key = (dsn, user, frozenset(conn_options.items()),
+           frozenset(pool_args.items()))
+    pool = _pools.get(key)
+    if pool is None:
+        pool_options = dict(conn_options)
+        if user != '':
+            pool_options[SQL_ATTR_CURRENT_SCHEMA] = user
+        pool = _pools.setdefault(key, ibm_db.Pool(dsn, options=pool_options,
+                                                  **pool_args))
+    return pool
+
+def _add_tuning_options(conn_options, fetch_buffer_size, rowcount_prefetch,
+                        block_for_nrows, optimize_for_nrows, deferred_prepare):
+    """Adds the tuning arguments of connect() that are not None to
+    conn_options, unless conn_options already sets the same attribute.
+    """
+    options = []
+    if fetch_buffer_size is not None:
+        options.append((ATTR_FETCH_BUFFER_SIZE, 'fetch_buffer_size',
+                        fetch_buffer_size))
+    if rowcount_prefetch is not None:
+        if rowcount_prefetch:
+            rowcount_prefetch = SQL_ROWCOUNT_PREFETCH_ON
+        else:
+            rowcount_prefetch = SQL_ROWCOUNT_PREFETCH_OFF
+        options.append((SQL_ATTR_ROWCOUNT_PREFETCH, 'rowcount_prefetch',
+                        rowcount_prefetch))
+    if deferred_prepare is not None:
+        if deferred_prepare:
+            deferred_prepare = SQL_DEFERRED_PREPARE_ON
+        else:
+            deferred_prepare = SQL_DEFERRED_PREPARE_OFF
+        options.append((SQL_ATTR_DEFERRED_PREPARE, 'deferred_prepare',
+                        deferred_prepare))
+    if block_for_nrows is not None:
+        options.append((SQL_ATTR_BLOCK_FOR_NROWS, 'block_for_nrows',
+                        block_for_nrows))
+    if optimize_for_nrows is not None:
+        options.append((SQL_ATTR_OPTIMIZE_FOR_NROWS, 'optimize_for_nrows',
+                        optimize_for_nrows))
+
+    for attr, name, value in options:
+        if attr is None:
+            raise NotSupportedError("%s is not supported by the CLI driver"
+                                    " ibm_db was built with" % name)
+        if isinstance(value, bool) or not isinstance(value, (int, long)) \
+           or value < 0:
+            raise InterfaceError("connect expects %s to be a non negative"
+                                 " integer" % name)
+        if not attr in conn_options:
+            conn_options[attr] = value
+
+def pconnect(dsn, user='', password='', host='', database='', conn_options=None,
+             fetch_buffer_size=None, rowcount_prefetch=None,
+             block_for_nrows=None, optimize_for_nrows=None,
+             deferred_prepare=None):
     """This method creates persistent connection to the database. It returns
-        a ibm_db_dbi.Connection object.
+        a ibm_db_dbi.Connection object.  The tuning arguments are those of
+        connect().
     """
     
     if dsn is None:
@@ -623,8 +812,13 @@ def pconnect(dsn, user='', password='', host='', database='', conn_options=None)
                                  " (conn_options) to be of type dict")
         if not SQL_ATTR_AUTOCOMMIT in conn_options:
             conn_options[SQL_ATTR_AUTOCOMMIT] = SQL_AUTOCOMMIT_OFF
+        if not ATTR_STMT_CACHE_SIZE in conn_options:
+            conn_options[ATTR_STMT_CACHE_SIZE] = stmt_cache_size
     else:
-        conn_options = {SQL_ATTR_AUTOCOMMIT : SQL_AUTOCOMMIT_OFF}
+        conn_options = {SQL_ATTR_AUTOCOMMIT : SQL_AUTOCOMMIT_OFF,
+                        ATTR_STMT_CACHE_SIZE : stmt_cache_size}
+    _add_tuning_options(conn_options, fetch_buffer_size, rowcount_prefetch,
+                        block_for_nrows, optimize_for_nrows, deferred_prepare)
 
     # If the dsn does not contain port and protocal adding database
     # and hostname is no good.  Add these when required, that is,
@@ -804,6 +998,40 @@ class Connection(object):
           raise _get_exception(inst)
         return self.current_schema
 
+    # Sets connection SQL_ATTR_QUERY_TIMEOUT attribute
+    def set_timeout(self, seconds):
+        """Input: number of seconds the statements of the connection may
+           run before they fail with OperationalError, 0 for no limit
+           Return: True on success or False on failure
+        """
+        try:
+          is_set = ibm_db.set_option(self.conn_handler, {SQL_ATTR_QUERY_TIMEOUT : seconds}, 1)
+        except Exception, inst:
+          raise _get_exception(inst)
+        return is_set
+
+    # Counts the requests the statements of the connection sent to the server
+    def round_trips(self, reset=False):
+        """Input: True to set the counters back to 0 once read
+           Return: dict of the number of prepare, describe and execute
+           requests, see ibm_db.round_trips()
+        """
+        try:
+          return ibm_db.round_trips(self.conn_handler, reset)
+        except Exception, inst:
+          raise _get_exception(inst)
+
+    def stats(self, reset=False):
+        """Input: True to set the counters back to 0 once read
+           Return: dict of the prepare, execute and fetch calls of the
+           connection, their time and the rows they handled, see
+           ibm_db.stats()
+        """
+        try:
+          return ibm_db.stats(self.conn_handler, reset)
+        except Exception, inst:
+          raise _get_exception(inst)
+
     # Retrieves the IBM Data Server version for a given Connection object
     def server_info(self):
         """Return: tuple (DBMS_NAME, DBMS_VER)
@@ -1036,58 +1264,20 @@ class Cursor(object):
         self.__description = []
         
         try:
-            num_columns = ibm_db.num_fields(self.stmt_handler)
+            columns = ibm_db.describe(self.stmt_handler)
             """ If the execute statement did not produce a result set return None.
             """
-            if num_columns == False:
+            if not columns:
                 self.__description = None
                 return None
-            for column_index in range(num_columns):
-                column_desc = []
-                column_desc.append(ibm_db.field_name(self.stmt_handler,
-                                                          column_index))
-                type = ibm_db.field_type(self.stmt_handler, column_index)
-                type = type.upper()
-                if STRING == type:
-                    column_desc.append(STRING)
-                elif TEXT == type:
-                    column_desc.append(TEXT)
-                elif XML == type:
-                    column_desc.append(XML)
-                elif BINARY == type:
-                    column_desc.append(BINARY)
-                elif NUMBER == type:
-                    column_desc.append(NUMBER)
-                elif BIGINT == type:
-                    column_desc.append(BIGINT) 
-                elif FLOAT == type:
-                    column_desc.append(FLOAT)                
-                elif DECIMAL == type:
-                    column_desc.append(DECIMAL)
-                elif DATE == type:
-                    column_desc.append(DATE)
-                elif TIME == type:
-                    column_desc.append(TIME)
-                elif DATETIME == type:
-                    column_desc.append(DATETIME)
-                elif ROWID == type:
-                    column_desc.append(ROWID)
-
-                column_desc.append(ibm_db.field_display_size(
-                                             self.stmt_handler, column_index))
-
-                column_desc.append(ibm_db.field_display_size(
-                                             self.stmt_handler, column_index))
-                
-                column_desc.append(ibm_db.field_precision(
-                                             self.stmt_handler, column_index))
-
-                column_desc.append(ibm_db.field_scale(self.stmt_handler,
-                                                                column_index))
-                                                                
-                column_desc.append(ibm_db.field_nullable(
-                                             self.stmt_handler, column_index))
-                                             
+            for (name, type, display_size, precision, scale,
+                 nullable) in columns:
+                column_desc = [name]
+                type_object = _field_type_objects.get(type.upper())
+                if type_object is not None:
+                    column_desc.append(type_object)
+                column_desc.extend((display_size, display_size, precision,
+                                    scale, nullable))
                 self.__description.append(column_desc)
         except Exception, inst:
             self.messages.append(_get_exception(inst))
@@ -1136,11 +1326,25 @@ class Cursor(object):
         self.__rowcount = -1
         self._result_set_produced = False
         self.__description = None
+        self.__converters = None
         self.conn_handler = conn_handler
         self.stmt_handler = None
         self._is_scrollable_cursor = False
         self.__connection = conn_object
         self.messages = []
+
+        # Seconds the statements of the cursor may run before they fail
+        # with OperationalError, the connection setting if None.
+        self.timeout = None
+
+        # Bytes of column buffers used to fetch a block of rows at a time,
+        # the connection setting if None.
+        self.fetch_buffer_size = None
+
+        # Parameter types given to setinputsizes() for the next execute,
+        # and character column sizes given to setoutputsize().
+        self._input_sizes = None
+        self._output_sizes = {}
     
     # This method closes the statemente associated with the cursor object.
     # It takes no argument.
@@ -1172,15 +1376,9 @@ class Cursor(object):
     # helper for calling procedure
     def _callproc_helper(self, procname, parameters=None):
         if parameters is not None:
-            buff = []
-            CONVERT_STR = (buffer)
-            # Convert date/time and binary objects to string for 
-            # inserting into the database. 
-            for param in parameters:
-                if isinstance(param, CONVERT_STR):
-                    param = str(param)
-                buff.append(param)
-            parameters = tuple(buff)
+            # Binary objects are bound by ibm_db from their buffer
+            # without being copied.
+            parameters = tuple(parameters)
             
             try:
                 result = ibm_db.callproc(self.conn_handler, procname,parameters)
@@ -1213,6 +1411,7 @@ class Cursor(object):
         result = self._callproc_helper(procname, parameters)
         return_value = None
         self.__description = None
+        self.__converters = None
         self._all_stmt_handlers = []
         if isinstance(result, types.TupleType):
             self.stmt_handler = result[0]
@@ -1231,13 +1430,43 @@ class Cursor(object):
 
         try:
             self.stmt_handler = ibm_db.prepare(self.conn_handler, operation)
+            if self.timeout is not None:
+                ibm_db.set_option(self.stmt_handler,
+                                  {SQL_ATTR_QUERY_TIMEOUT : self.timeout}, 0)
+            if self.fetch_buffer_size is not None:
+                ibm_db.set_option(self.stmt_handler,
+                                  {ATTR_FETCH_BUFFER_SIZE :
+                                   self.fetch_buffer_size}, 0)
+            if self._input_sizes is not None:
+                ibm_db.set_input_sizes(self.stmt_handler, self._input_sizes)
+                self._input_sizes = None
+            for column, size in self._output_sizes.items():
+                if column is None:
+                    ibm_db.set_output_size(self.stmt_handler, size)
+                else:
+                    ibm_db.set_output_size(self.stmt_handler, size, column)
         except Exception, inst:
             self.messages.append(_get_exception(inst))
             raise self.messages[len(self.messages) - 1]
 
-    # Helper for preparing an SQL statement.
+    def cancel(self):
+        """This method cancels the statement the cursor is executing or
+        fetching from, which then raises OperationalError.  It can be
+        called from another thread.
+        """
+        stmt_handler = self.stmt_handler
+        if stmt_handler is None:
+            return False
+        try:
+            return ibm_db.cancel(stmt_handler)
+        except Exception, inst:
+            raise _get_exception(inst)
+
+    # Helper for finding out whether an executed SQL statement produced
+    # a result set.  It is called after the execute, since describing a
+    # statement before it would send its deferred prepare on its own.
     def _set_cursor_helper(self):
-        if (ibm_db.get_option(self.stmt_handler, ibm_db.SQL_ATTR_CURSOR_TYPE, 0) != ibm_db.SQL_CURSOR_FORWARD_ONLY):
+        if ibm_db.cursor_type(self.stmt_handler):
             self._is_scrollable_cursor = True
         else:
             self._is_scrollable_cursor = False
@@ -1256,24 +1485,13 @@ class Cursor(object):
     # Helper for executing an SQL statement.
     def _execute_helper(self, parameters=None):
         if parameters is not None:
-            buff = []
-            CONVERT_STR = (buffer)
-            # Convert date/time and binary objects to string for 
-            # inserting into the database. 
-            for param in parameters:
-                if isinstance(param, CONVERT_STR):
-                    param = str(param)
-                buff.append(param)
-            parameters = tuple(buff)
+            # Binary objects are bound by ibm_db from their buffer
+            # without being copied.
+            parameters = tuple(parameters)
             try:                
                 return_value = ibm_db.execute(self.stmt_handler, parameters)
                 if not return_value:
-                    if ibm_db.conn_errormsg() is not None:
-                        self.messages.append(Error(str(ibm_db.conn_errormsg())))
-                        raise self.messages[len(self.messages) - 1]
-                    if ibm_db.stmt_errormsg() is not None:
-                        self.messages.append(Error(str(ibm_db.stmt_errormsg())))
-                        raise self.messages[len(self.messages) - 1]
+                    self._raise_last_error(self.stmt_handler)
             except Exception, inst:
                 self.messages.append(_get_exception(inst))
                 raise self.messages[len(self.messages) - 1]
@@ -1281,17 +1499,24 @@ class Cursor(object):
             try:
                 return_value = ibm_db.execute(self.stmt_handler)
                 if not return_value:
-                    if ibm_db.conn_errormsg() is not None:
-                        self.messages.append(Error(str(ibm_db.conn_errormsg())))
-                        raise self.messages[len(self.messages) - 1]
-                    if ibm_db.stmt_errormsg() is not None:
-                        self.messages.append(Error(str(ibm_db.stmt_errormsg())))
-                        raise self.messages[len(self.messages) - 1]
+                    self._raise_last_error(self.stmt_handler)
             except Exception, inst:
                 self.messages.append(_get_exception(inst))
                 raise self.messages[len(self.messages) - 1]
         return return_value
 
+    # Raises the error left on the statement or connection handle by
+    # a failed call. Errors are kept on the handles, so calls made
+    # from other threads cannot replace them.
+    def _raise_last_error(self, stmt_handler):
+        for handle in (stmt_handler, self.conn_handler):
+            message = ibm_db.last_errormsg(handle)
+            if message:
+                self.messages.append(_get_exception(Exception(message)))
+                raise self.messages[len(self.messages) - 1]
+        self.messages.append(Error(str(ibm_db.stmt_errormsg())))
+        raise self.messages[len(self.messages) - 1]
+
     # This method is used to set the rowcount after executing an SQL 
     # statement. 
     def _set_rowcount(self):
@@ -1344,12 +1569,7 @@ class Cursor(object):
                 else:
                   identity_val = None
             else:
-                if ibm_db.conn_errormsg() is not None:
-                    self.messages.append(Error(str(ibm_db.conn_errormsg())))
-                    raise self.messages[len(self.messages) - 1]
-                if ibm_db.stmt_errormsg() is not None:
-                    self.messages.append(Error(str(ibm_db.stmt_errormsg())))
-                    raise self.messages[len(self.messages) - 1]
+                self._raise_last_error(stmt_handler)
         except Exception, inst:
             self.messages.append(_get_exception(inst))
             raise self.messages[len(self.messages) - 1]
@@ -1372,10 +1592,12 @@ class Cursor(object):
                 self.messages.append(InterfaceError("execute parameters argument should be sequence."))
                 raise self.messages[len(self.messages) - 1]
         self.__description = None
+        self.__converters = None
         self._all_stmt_handlers = []
+        self._result_set_produced = False
         self._prepare_helper(operation)
-        self._set_cursor_helper()
         self._execute_helper(parameters)
+        self._set_cursor_helper()
         return self._set_rowcount()
 
     def executemany(self, operation, seq_parameters):
@@ -1397,21 +1619,13 @@ class Cursor(object):
             self.messages.append(InterfaceError("executemany expects the second argument to be of type list or tuple of sequence."))
             raise self.messages[len(self.messages) - 1]
         
-        CONVERT_STR = (buffer)
-        # Convert date/time and binary objects to string for
-        # inserting into the database.
-        buff = []
-        seq_buff = []
-        for index in range(len(seq_parameters)):
-            buff = []
-            for param in seq_parameters[index]:
-                if isinstance(param, CONVERT_STR):
-                    param = str(param)
-                buff.append(param)
-            seq_buff.append(tuple(buff))
-        seq_parameters = tuple(seq_buff)
+        # Binary objects are bound by ibm_db from their buffer
+        # without being copied.
+        seq_parameters = tuple([tuple(params) for params in seq_parameters])
         self.__description = None
+        self.__converters = None
         self._all_stmt_handlers = []
+        self._result_set_produced = False
         self.__rowcount = -1
         self._prepare_helper(operation)
         try:
@@ -1423,12 +1637,7 @@ class Cursor(object):
                 ibm_db.commit(self.conn_handler)
                 ibm_db.autocommit(self.conn_handler, autocommit)
             if self.__rowcount == -1:
-                if ibm_db.conn_errormsg() is not None:
-                    self.messages.append(Error(str(ibm_db.conn_errormsg())))
-                    raise self.messages[len(self.messages) - 1]
-                if ibm_db.stmt_errormsg() is not None:
-                    self.messages.append(Error(str(ibm_db.stmt_errormsg())))
-                    raise self.messages[len(self.messages) - 1]   
+                self._raise_last_error(self.stmt_handler)
         except Exception, inst:
             self._set_rowcount()
             self.messages.append(Error(inst))
@@ -1448,24 +1657,33 @@ class Cursor(object):
         if self._result_set_produced == False:
             self.messages.append(ProgrammingError("The last call to execute did not produce any result set."))
             raise  self.messages[len(self.messages) - 1]
-        row_list = []
-        rows_fetched = 0
-        while (fetch_size == -1) or \
-              (fetch_size != -1 and rows_fetched < fetch_size):
+        if fetch_size == 1:
             try:
                 row = ibm_db.fetch_tuple(self.stmt_handler)
             except Exception, inst:
                 self.messages.append(_get_exception(inst))
-                if len(row_list) == 0:
-                    raise self.messages[len(self.messages) - 1]
-                else:
-                    return row_list
-            
-            if row != False:
-                row_list.append(self._fix_return_data_type(row))
+                raise self.messages[len(self.messages) - 1]
+            if row == False:
+                return []
+            return [self._fix_return_data_type(row)]
+
+        # Several rows are fetched in blocks, converted and collected 
+        # into the list by the driver in a single call.
+        try:
+            if fetch_size == -1:
+                row_list = ibm_db.fetch_all(self.stmt_handler, True)
             else:
-                return row_list
-            rows_fetched = rows_fetched + 1
+                row_list = ibm_db.fetch_many(self.stmt_handler, fetch_size, True)
+        except Exception, inst:
+            self.messages.append(_get_exception(inst))
+            raise self.messages[len(self.messages) - 1]
+        # The rows fetched before an error are returned, as they were
+        # when rows were fetched one at a time. Only a fetch that came
+        # back short can have stopped on an error.
+        if fetch_size == -1 or len(row_list) < fetch_size:
+            message = ibm_db.last_errormsg(self.stmt_handler)
+            if message:
+                self.messages.append(_get_exception(Exception(message)))
         return row_list
 
     def fetchone(self):
@@ -1518,6 +1736,7 @@ class Cursor(object):
             # handler was the one created by the execute method.  It 
             # should be used to get next result set. 
             self.__description = None
+            self.__converters = None
             self._all_stmt_handlers.append(self.stmt_handler)
             self.stmt_handler = ibm_db.next_result(self._all_stmt_handlers[0])
         except Exception, inst:
@@ -1531,38 +1750,65 @@ class Cursor(object):
         return True
 
     def setinputsizes(self, sizes):
-        """This method currently does nothing."""
-        pass
-
-    def setoutputsize(self, size, column=-1):
-        """This method currently does nothing."""
-        pass
+        """This method declares the parameters of the next execute() or
+        executemany(), which then does not ask the server for their types.
+        sizes has an entry per parameter: a type object (NUMBER, BIGINT,
+        FLOAT, DATE, TIME or DATETIME), the maximum length of a string, a
+        (sql_type, precision[, scale]) tuple of ibm_db.SQL_* constants, or
+        None for a parameter to describe.
+        """
+        if sizes is None:
+            self._input_sizes = None
+            return
+        self._input_sizes = [_input_size(size) for size in sizes]
+
+    def setoutputsize(self, size, column=None):
+        """This method sets the number of characters bound to fetch the
+        character columns, or the 0-indexed column if given.  Longer values
+        are still fetched in full, with an extra request to the driver.
+        """
+        if column is not None and column < 0:
+            column = None
+        self._output_sizes[column] = size
+
+    # This method is used to get the list of (column index, converter)
+    # pairs for the columns of the result set that need a conversion.
+    # It is built once per executed statement.
+    def __get_converters(self):
+        if self.__converters is not None:
+            return self.__converters
+
+        converters = []
+        try:
+            num_columns = ibm_db.num_fields(self.stmt_handler)
+            if num_columns:
+                for index in range(num_columns):
+                    type = ibm_db.field_type(self.stmt_handler, index)
+                    type = type.upper()
+                    if type == 'BLOB':
+                        converters.append((index, buffer))
+                    elif type == 'DECIMAL':
+                        converters.append((index, _decimal_from_string))
+        except Exception, inst:
+            self.messages.append(_get_exception(inst))
+            raise self.messages[len(self.messages) - 1]
+        self.__converters = converters
+        return self.__converters
 
     # This method is used to convert a string representing decimal 
     # and binary data in a row tuple fetched from the database 
     # to decimal and binary objects, for returning it to the user.
     def _fix_return_data_type(self, row):
-        row_list = None
-        for index in range(len(row)):
-            if row[index] is not None:
-                type = ibm_db.field_type(self.stmt_handler, index)
-                type = type.upper()
+        converters = self.__get_converters()
+        if not converters:
+            return row
 
+        row_list = list(row)
+        for index, converter in converters:
+            if row_list[index] is not None:
                 try:
-                    if type == 'BLOB':
-                        if row_list is None:
-                            row_list = list(row)
-                        row_list[index] = buffer(row[index])
-
-                    elif type == 'DECIMAL':
-                        if row_list is None:
-                            row_list = list(row)
-                        row_list[index] = decimal.Decimal(str(row[index]).replace(",", "."))    
-
+                    row_list[index] = converter(row_list[index])
                 except Exception, inst:
                     self.messages.append(DataError("Data type format error: "+ str(inst)))
                     raise self.messages[len(self.messages) - 1]
-        if row_list is None:
-            return row
-        else:
-            return tuple(row_list)
+        return tuple(row_list)
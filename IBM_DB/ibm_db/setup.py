@@ -66,6 +66,8 @@ ibm_db = Extension('ibm_db',
                     sources = ['ibm_db.c'])
 
 modules = ['config', 'ibm_db_dbi', 'testfunctions', 'tests']
+if sys.version_info >= (3, 5):
+    modules.append('ibm_db_aio')
 extra = {}
 if sys.version_info >= (3, ):
     extra['use_2to3'] = True
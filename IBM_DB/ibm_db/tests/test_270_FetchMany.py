@@ -0,0 +1,84 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_270_FetchMany(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_270)
+
+  def run_test_270(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      stmt = ibm_db.exec_immediate(conn, "select * from animals order by id")
+      
+      rows = ibm_db.fetch_many( stmt, 3 )
+      while( rows ):
+        print "Fetched %d rows" % len(rows)
+        for cols in rows:
+          print "%s %s %s %s " % (cols[0], cols[1], cols[2], cols[3])
+        rows = ibm_db.fetch_many( stmt, 3 )
+      
+      print "Remaining rows: %d" % len(rows)
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#Fetched 3 rows
+#0 cat Pook             3.20 
+#1 dog Peaches          12.30 
+#2 horse Smarty           350.00 
+#Fetched 3 rows
+#3 gold fish Bubbles          0.10 
+#4 budgerigar Gizmo            0.20 
+#5 goat Rickety Ride     9.70 
+#Fetched 1 rows
+#6 llama Sweater          150.00 
+#Remaining rows: 0
+#__ZOS_EXPECTED__
+#Fetched 3 rows
+#0 cat Pook             3.20 
+#1 dog Peaches          12.30 
+#2 horse Smarty           350.00 
+#Fetched 3 rows
+#3 gold fish Bubbles          0.10 
+#4 budgerigar Gizmo            0.20 
+#5 goat Rickety Ride     9.70 
+#Fetched 1 rows
+#6 llama Sweater          150.00 
+#Remaining rows: 0
+#__SYSTEMI_EXPECTED__
+#Fetched 3 rows
+#0 cat Pook             3.20 
+#1 dog Peaches          12.30 
+#2 horse Smarty           350.00 
+#Fetched 3 rows
+#3 gold fish Bubbles          0.10 
+#4 budgerigar Gizmo            0.20 
+#5 goat Rickety Ride     9.70 
+#Fetched 1 rows
+#6 llama Sweater          150.00 
+#Remaining rows: 0
+#__IDS_EXPECTED__
+#Fetched 3 rows
+#0 cat Pook             3.20 
+#1 dog Peaches          12.30 
+#2 horse Smarty           350.00 
+#Fetched 3 rows
+#3 gold fish Bubbles          0.10 
+#4 budgerigar Gizmo            0.20 
+#5 goat Rickety Ride     9.70 
+#Fetched 1 rows
+#6 llama Sweater          150.00 
+#Remaining rows: 0
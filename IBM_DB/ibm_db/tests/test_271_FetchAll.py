@@ -0,0 +1,69 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_271_FetchAll(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_271)
+
+  def run_test_271(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      stmt = ibm_db.exec_immediate(conn, "select id, weight from animals order by id")
+      
+      rows = ibm_db.fetch_all( stmt, True )
+      for cols in rows:
+        print "%s %s %s" % (cols[0], cols[1], type(cols[1]).__name__)
+      
+      print "Number of rows: %d" % len(rows)
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#0 3.20 Decimal
+#1 12.30 Decimal
+#2 350.00 Decimal
+#3 0.10 Decimal
+#4 0.20 Decimal
+#5 9.70 Decimal
+#6 150.00 Decimal
+#Number of rows: 7
+#__ZOS_EXPECTED__
+#0 3.20 Decimal
+#1 12.30 Decimal
+#2 350.00 Decimal
+#3 0.10 Decimal
+#4 0.20 Decimal
+#5 9.70 Decimal
+#6 150.00 Decimal
+#Number of rows: 7
+#__SYSTEMI_EXPECTED__
+#0 3.20 Decimal
+#1 12.30 Decimal
+#2 350.00 Decimal
+#3 0.10 Decimal
+#4 0.20 Decimal
+#5 9.70 Decimal
+#6 150.00 Decimal
+#Number of rows: 7
+#__IDS_EXPECTED__
+#0 3.20 Decimal
+#1 12.30 Decimal
+#2 350.00 Decimal
+#3 0.10 Decimal
+#4 0.20 Decimal
+#5 9.70 Decimal
+#6 150.00 Decimal
+#Number of rows: 7
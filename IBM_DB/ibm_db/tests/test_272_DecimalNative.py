@@ -0,0 +1,55 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+from decimal import Decimal
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_272_DecimalNative(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_272)
+
+  def run_test_272(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      ibm_db.autocommit(conn, ibm_db.SQL_AUTOCOMMIT_OFF)
+      stmt = ibm_db.prepare(conn, "update animals set weight = ? where id = ?")
+      ibm_db.execute(stmt, (Decimal("12.5"), 0))
+      ibm_db.execute(stmt, (Decimal("1.5E+2"), 1))
+      ibm_db.execute(stmt, (Decimal("-0.01"), 2))
+
+      stmt = ibm_db.exec_immediate(conn, "select id, weight from animals where id < 3 order by id")
+      rows = ibm_db.fetch_many( stmt, 3, True )
+      for cols in rows:
+        print "%s %s %s" % (cols[0], cols[1], type(cols[1]).__name__)
+      
+      ibm_db.rollback(conn)
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#0 12.50 Decimal
+#1 150.00 Decimal
+#2 -0.01 Decimal
+#__ZOS_EXPECTED__
+#0 12.50 Decimal
+#1 150.00 Decimal
+#2 -0.01 Decimal
+#__SYSTEMI_EXPECTED__
+#0 12.50 Decimal
+#1 150.00 Decimal
+#2 -0.01 Decimal
+#__IDS_EXPECTED__
+#0 12.50 Decimal
+#1 150.00 Decimal
+#2 -0.01 Decimal
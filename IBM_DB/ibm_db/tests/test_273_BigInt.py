@@ -0,0 +1,91 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_273_BigInt(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_273)
+
+  def run_test_273(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      try:
+        ibm_db.exec_immediate(conn, "drop table tab_bigint")
+      except:
+        pass
+      ibm_db.exec_immediate(conn, "create table tab_bigint (id bigint, val bigint)")
+
+      stmt = ibm_db.prepare(conn, "insert into tab_bigint (id, val) values (?, ?)")
+      params = ((1, 9223372036854775807), (2, -9223372036854775807), (3, None), (4, 4294967296))
+      ibm_db.execute_many(stmt, params)
+
+      stmt = ibm_db.prepare(conn, "select id, val from tab_bigint where val = ?")
+      ibm_db.execute(stmt, (4294967296,))
+      row = ibm_db.fetch_tuple(stmt)
+      print "%s %s" % (row[0], row[1])
+
+      stmt = ibm_db.exec_immediate(conn, "select id, val from tab_bigint order by id")
+      for cols in ibm_db.fetch_all(stmt):
+        print "%s %s" % (cols[0], cols[1])
+
+      # INOUT parameters are read back from what they were bound from
+      try:
+        ibm_db.exec_immediate(conn, "drop procedure sp_bigint_273")
+      except:
+        pass
+      ibm_db.exec_immediate(conn, """CREATE PROCEDURE sp_bigint_273(INOUT val BIGINT)
+                 LANGUAGE SQL BEGIN SET val = val * 2; END""")
+      stmt, val = ibm_db.callproc(conn, 'sp_bigint_273', (4294967296,))
+      print val
+      stmt, val = ibm_db.callproc(conn, 'sp_bigint_273', ('21',))
+      print val
+      ibm_db.exec_immediate(conn, "drop procedure sp_bigint_273")
+
+      ibm_db.exec_immediate(conn, "drop table tab_bigint")
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#4 4294967296
+#1 9223372036854775807
+#2 -9223372036854775807
+#3 None
+#4 4294967296
+#8589934592
+#42
+#__ZOS_EXPECTED__
+#4 4294967296
+#1 9223372036854775807
+#2 -9223372036854775807
+#3 None
+#4 4294967296
+#8589934592
+#42
+#__SYSTEMI_EXPECTED__
+#4 4294967296
+#1 9223372036854775807
+#2 -9223372036854775807
+#3 None
+#4 4294967296
+#8589934592
+#42
+#__IDS_EXPECTED__
+#4 4294967296
+#1 9223372036854775807
+#2 -9223372036854775807
+#3 None
+#4 4294967296
+#8589934592
+#42
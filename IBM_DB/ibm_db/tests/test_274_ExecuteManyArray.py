@@ -0,0 +1,108 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+from decimal import Decimal
+import unittest, sys, datetime
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_274_ExecuteManyArray(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_274)
+
+  def run_test_274(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      for table in ("tab_array", "tab_array_nn", "tab_array_dbl"):
+        try:
+          ibm_db.exec_immediate(conn, "drop table %s" % table)
+        except:
+          pass
+      ibm_db.exec_immediate(conn, "create table tab_array (id integer, name varchar(32), amount decimal(16,2), created date)")
+
+      params = []
+      for i in range(50000):
+        name = None
+        if i % 10:
+          name = "name %d" % i
+        params.append((i, name, Decimal("%d.25" % i), datetime.date(2010, 1 + i % 12, 1)))
+
+      stmt = ibm_db.prepare(conn, "insert into tab_array (id, name, amount, created) values (?, ?, ?, ?)")
+      print ibm_db.execute_many(stmt, tuple(params))
+
+      stmt = ibm_db.exec_immediate(conn, "select count(*), count(name), sum(amount), max(created) from tab_array")
+      row = ibm_db.fetch_tuple(stmt)
+      print "%s %s %s %s" % (row[0], row[1], row[2], row[3])
+
+      # A failing row in the middle of the batch does not stop the others
+      ibm_db.exec_immediate(conn, "create table tab_array_nn (id integer not null, name varchar(32))")
+      stmt = ibm_db.prepare(conn, "insert into tab_array_nn (id, name) values (?, ?)")
+      try:
+        ibm_db.execute_many(stmt, ((1, 'first'), (None, 'null id'), (3, 'third')))
+      except Exception, inst:
+        print "Error 1:" in str(inst)
+        print ibm_db.num_rows(stmt)
+      stmt = ibm_db.exec_immediate(conn, "select id from tab_array_nn order by id")
+      row = ibm_db.fetch_tuple(stmt)
+      while (row):
+        print row[0]
+        row = ibm_db.fetch_tuple(stmt)
+
+      # A Decimal too long for a fixed size element is still bound
+      ibm_db.exec_immediate(conn, "create table tab_array_dbl (id integer, amount double)")
+      stmt = ibm_db.prepare(conn, "insert into tab_array_dbl (id, amount) values (?, ?)")
+      print ibm_db.execute_many(stmt, ((1, Decimal('1E-70')), (2, Decimal('2.5'))))
+      stmt = ibm_db.exec_immediate(conn, "select id from tab_array_dbl where amount > 0 and amount < 1")
+      print ibm_db.fetch_tuple(stmt)[0]
+
+      ibm_db.exec_immediate(conn, "drop table tab_array_dbl")
+      ibm_db.exec_immediate(conn, "drop table tab_array_nn")
+      ibm_db.exec_immediate(conn, "drop table tab_array")
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#50000
+#50000 45000 1249987500.00 2010-12-01
+#True
+#2
+#1
+#3
+#2
+#1
+#__ZOS_EXPECTED__
+#50000
+#50000 45000 1249987500.00 2010-12-01
+#True
+#2
+#1
+#3
+#2
+#1
+#__SYSTEMI_EXPECTED__
+#50000
+#50000 45000 1249987500.00 2010-12-01
+#True
+#2
+#1
+#3
+#2
+#1
+#__IDS_EXPECTED__
+#50000
+#50000 45000 1249987500.00 2010-12-01
+#True
+#2
+#1
+#3
+#2
+#1
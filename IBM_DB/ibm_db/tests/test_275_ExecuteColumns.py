@@ -0,0 +1,65 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, array
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_275_ExecuteColumns(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_275)
+
+  def run_test_275(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+      
+    if conn:
+      try:
+        ibm_db.exec_immediate(conn, "drop table tab_columns")
+      except:
+        pass
+      ibm_db.exec_immediate(conn, "create table tab_columns (id integer, weight double)")
+
+      ids = array.array('i', range(1000))
+      weights = array.array('d', [i * 0.5 for i in range(1000)])
+      nulls = bytearray([i % 4 == 0 for i in range(1000)])
+
+      insert = ibm_db.prepare(conn, "insert into tab_columns (id, weight) values (?, ?)")
+      print ibm_db.execute_columns(insert, (ids, weights), (None, nulls))
+
+      stmt = ibm_db.exec_immediate(conn, "select count(*), count(weight), sum(id), sum(weight) from tab_columns")
+      row = ibm_db.fetch_tuple(stmt)
+      print "%s %s %s %s" % (row[0], row[1], row[2], row[3])
+
+      try:
+        ibm_db.execute_columns(insert, (ids, weights[:10]))
+      except:
+        print "Columns of different lengths rejected"
+
+      ibm_db.exec_immediate(conn, "drop table tab_columns")
+      ibm_db.close(conn)
+    else:
+      print "Connection failed."
+
+#__END__
+#__LUW_EXPECTED__
+#1000
+#1000 750 499500 187500.0
+#Columns of different lengths rejected
+#__ZOS_EXPECTED__
+#1000
+#1000 750 499500 187500.0
+#Columns of different lengths rejected
+#__SYSTEMI_EXPECTED__
+#1000
+#1000 750 499500 187500.0
+#Columns of different lengths rejected
+#__IDS_EXPECTED__
+#1000
+#1000 750 499500 187500.0
+#Columns of different lengths rejected
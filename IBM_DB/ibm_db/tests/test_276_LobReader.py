@@ -0,0 +1,80 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_276_LobReader(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_276)
+
+  def run_test_276(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    picture = open('tests/pic1.jpg', 'rb').read()
+
+    result = ibm_db.exec_immediate(conn, "SELECT picture FROM animal_pics WHERE name = 'Helmut'")
+    ibm_db.fetch_row(result)
+    reader = ibm_db.lob_reader(result, 0, 1000)
+    chunks = [chunk for chunk in reader]
+    print 'Chunks of at most 1000 bytes:', max([len(chunk) for chunk in chunks]) <= 1000
+    print 'Are the files the same:', ''.join(chunks) == picture
+
+    result = ibm_db.exec_immediate(conn, "SELECT picture FROM animal_pics WHERE name = 'Helmut'")
+    ibm_db.fetch_row(result)
+    reader = ibm_db.lob_reader(result, 'PICTURE')
+    buf = bytearray(4096)
+    data = []
+    n = reader.readinto(buf)
+    while n:
+      data.append(str(buf[:n]))
+      n = reader.readinto(buf)
+    print 'Are the files the same:', ''.join(data) == picture
+    reader.close()
+
+    try:
+      ibm_db.lob_reader(result, 5)
+    except:
+      print 'Column out of range rejected'
+
+    result = ibm_db.exec_immediate(conn, "SELECT picture FROM animal_pics ORDER BY name")
+    ibm_db.fetch_row(result)
+    reader = ibm_db.lob_reader(result, 0, 1000)
+    reader.read(10)
+    ibm_db.fetch_row(result)
+    try:
+      reader.read(10)
+    except:
+      print 'Read after fetch rejected'
+
+#__END__
+#__LUW_EXPECTED__
+#Chunks of at most 1000 bytes: True
+#Are the files the same: True
+#Are the files the same: True
+#Column out of range rejected
+#Read after fetch rejected
+#__ZOS_EXPECTED__
+#Chunks of at most 1000 bytes: True
+#Are the files the same: True
+#Are the files the same: True
+#Column out of range rejected
+#Read after fetch rejected
+#__SYSTEMI_EXPECTED__
+#Chunks of at most 1000 bytes: True
+#Are the files the same: True
+#Are the files the same: True
+#Column out of range rejected
+#Read after fetch rejected
+#__IDS_EXPECTED__
+#Chunks of at most 1000 bytes: True
+#Are the files the same: True
+#Are the files the same: True
+#Column out of range rejected
+#Read after fetch rejected
@@ -0,0 +1,59 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_277_LobStream(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_277)
+
+  def run_test_277(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    ibm_db.autocommit(conn, ibm_db.SQL_AUTOCOMMIT_OFF)
+    picture = open('tests/pic1.jpg', 'rb').read()
+
+    insert = ibm_db.prepare(conn, "INSERT INTO animal_pics (name, picture) VALUES (?, ?)")
+    ibm_db.execute(insert, ('Streamed', open('tests/pic1.jpg', 'rb')))
+
+    def chunks(data, size):
+      for i in range(0, len(data), size):
+        yield data[i:i + size]
+    ibm_db.execute(insert, ('Generated', chunks(picture, 1000)))
+
+    for name in ('Streamed', 'Generated'):
+      result = ibm_db.exec_immediate(conn, "SELECT picture FROM animal_pics WHERE name = '%s'" % name)
+      row = ibm_db.fetch_tuple(result)
+      print 'Are the files the same:', row[0] == picture
+
+    try:
+      ibm_db.callproc(conn, 'match_animal', ('Peaches', open('tests/pic1.jpg', 'rb'), 0))
+    except:
+      print 'Stream rejected as output parameter'
+
+    ibm_db.rollback(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#Are the files the same: True
+#Are the files the same: True
+#Stream rejected as output parameter
+#__ZOS_EXPECTED__
+#Are the files the same: True
+#Are the files the same: True
+#Stream rejected as output parameter
+#__SYSTEMI_EXPECTED__
+#Are the files the same: True
+#Are the files the same: True
+#Stream rejected as output parameter
+#__IDS_EXPECTED__
+#Are the files the same: True
+#Are the files the same: True
+#Stream rejected as output parameter
@@ -0,0 +1,61 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_278_BufferParams(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_278)
+
+  def run_test_278(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    ibm_db.autocommit(conn, ibm_db.SQL_AUTOCOMMIT_OFF)
+    picture = open('tests/pic1.jpg', 'rb').read()
+
+    insert = ibm_db.prepare(conn, "INSERT INTO animal_pics (name, picture) VALUES (?, ?)")
+    ibm_db.execute(insert, ('Bytearray', bytearray(picture)))
+    ibm_db.execute(insert, ('Memoryview', memoryview(picture)))
+    ibm_db.execute(insert, ('Sliced', memoryview(bytearray(picture))[:1000]))
+
+    # The buffer is not held once the execute returned
+    data = bytearray(picture)
+    ibm_db.execute(insert, ('Resized', data))
+    data.extend(b'x')
+    print 'Resized after execute:', len(data)
+
+    for name in ('Bytearray', 'Memoryview', 'Sliced'):
+      result = ibm_db.exec_immediate(conn, "SELECT picture FROM animal_pics WHERE name = '%s'" % name)
+      row = ibm_db.fetch_tuple(result)
+      print 'Are the files the same:', row[0] == picture[:len(row[0])], len(row[0])
+
+    ibm_db.rollback(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#Resized after execute: 15399
+#Are the files the same: True 15398
+#Are the files the same: True 15398
+#Are the files the same: True 1000
+#__ZOS_EXPECTED__
+#Resized after execute: 15399
+#Are the files the same: True 15398
+#Are the files the same: True 15398
+#Are the files the same: True 1000
+#__SYSTEMI_EXPECTED__
+#Resized after execute: 15399
+#Are the files the same: True 15398
+#Are the files the same: True 15398
+#Are the files the same: True 1000
+#__IDS_EXPECTED__
+#Resized after execute: 15399
+#Are the files the same: True 15398
+#Are the files the same: True 15398
+#Are the files the same: True 1000
@@ -0,0 +1,60 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, threading
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_279_ThreadedConnections(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_279)
+
+  def run_test_279(self):
+    threads = 4
+    queries = 50
+    conns = [ibm_db.connect(config.database, config.user, config.password) for i in range(threads)]
+    results = [[] for conn in conns]
+    workers = [threading.Thread(target=self.worker, args=(conns[i], queries, results[i])) for i in range(threads)]
+    for worker in workers:
+      worker.start()
+    for worker in workers:
+      worker.join()
+    for conn in conns:
+      ibm_db.close(conn)
+
+    for i in range(threads):
+      print "Thread %d ran %d queries, all returned %s:" % (i, len(results[i]), results[i][0]), results[i] == [results[i][0]] * queries
+
+  def worker(self, conn, queries, results):
+    for i in range(queries):
+      stmt = ibm_db.exec_immediate(conn, "SELECT count(*) FROM animals")
+      results.append(ibm_db.fetch_tuple(stmt)[0])
+      ibm_db.free_stmt(stmt)
+
+#__END__
+#__LUW_EXPECTED__
+#Thread 0 ran 50 queries, all returned 7: True
+#Thread 1 ran 50 queries, all returned 7: True
+#Thread 2 ran 50 queries, all returned 7: True
+#Thread 3 ran 50 queries, all returned 7: True
+#__ZOS_EXPECTED__
+#Thread 0 ran 50 queries, all returned 7: True
+#Thread 1 ran 50 queries, all returned 7: True
+#Thread 2 ran 50 queries, all returned 7: True
+#Thread 3 ran 50 queries, all returned 7: True
+#__SYSTEMI_EXPECTED__
+#Thread 0 ran 50 queries, all returned 7: True
+#Thread 1 ran 50 queries, all returned 7: True
+#Thread 2 ran 50 queries, all returned 7: True
+#Thread 3 ran 50 queries, all returned 7: True
+#__IDS_EXPECTED__
+#Thread 0 ran 50 queries, all returned 7: True
+#Thread 1 ran 50 queries, all returned 7: True
+#Thread 2 ran 50 queries, all returned 7: True
+#Thread 3 ran 50 queries, all returned 7: True
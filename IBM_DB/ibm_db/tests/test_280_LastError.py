@@ -0,0 +1,83 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, threading
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_280_LastError(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_280)
+
+  def run_test_280(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+
+    good = ibm_db.prepare(conn, "SELECT name FROM animals WHERE id = ?")
+    bad = ibm_db.prepare(conn, "INSERT INTO animals (id) VALUES (?)")
+    try:
+      ibm_db.execute(bad, ('not a number',))
+    except:
+      pass
+    ibm_db.execute(good, (0,))
+
+    print 'Error kept on failed statement:', len(ibm_db.last_error(bad)) == 5, 'SQLCODE' in ibm_db.last_errormsg(bad)
+    print 'No error on other statement:', repr(ibm_db.last_errormsg(good))
+
+    # A later successful call forgets the error
+    try:
+      ibm_db.execute(good, ('not a number',))
+    except:
+      pass
+    ibm_db.execute(good, (1,))
+    print 'Error cleared by a later call:', repr(ibm_db.last_errormsg(good)), repr(ibm_db.last_errormsg(conn))
+
+    # An error raised in another thread is not seen here
+    main_error = ibm_db.stmt_errormsg()
+    def worker():
+      other = ibm_db.connect(config.database, config.user, config.password)
+      try:
+        ibm_db.exec_immediate(other, "SELECT * FROM no_such_table")
+      except:
+        pass
+      ibm_db.close(other)
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    print 'Thread errors are separate:', ibm_db.stmt_errormsg() == main_error
+
+    try:
+      ibm_db.last_errormsg(None)
+    except:
+      print 'Handle required'
+
+#__END__
+#__LUW_EXPECTED__
+#Error kept on failed statement: True True
+#No error on other statement: ''
+#Error cleared by a later call: '' ''
+#Thread errors are separate: True
+#Handle required
+#__ZOS_EXPECTED__
+#Error kept on failed statement: True True
+#No error on other statement: ''
+#Error cleared by a later call: '' ''
+#Thread errors are separate: True
+#Handle required
+#__SYSTEMI_EXPECTED__
+#Error kept on failed statement: True True
+#No error on other statement: ''
+#Error cleared by a later call: '' ''
+#Thread errors are separate: True
+#Handle required
+#__IDS_EXPECTED__
+#Error kept on failed statement: True True
+#No error on other statement: ''
+#Error cleared by a later call: '' ''
+#Thread errors are separate: True
+#Handle required
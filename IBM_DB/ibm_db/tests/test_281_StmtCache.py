@@ -0,0 +1,94 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_281_StmtCache(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_281)
+
+  def run_test_281(self):
+    conn = ibm_db.connect(config.database, config.user, config.password, {ibm_db.ATTR_STMT_CACHE_SIZE : 2})
+
+    sql = "SELECT name FROM animals WHERE id = ?"
+    for id in (0, 1, 2):
+      stmt = ibm_db.prepare(conn, sql)
+      ibm_db.execute(stmt, (id,))
+      print ibm_db.fetch_tuple(stmt)[0].strip()
+      ibm_db.free_stmt(stmt)
+    info = ibm_db.stmt_cache_info(conn)
+    print 'Cached:', info['entries'], 'hits:', info['hits'], 'misses:', info['misses']
+
+    # The least recently used statement is evicted
+    for sql in ("SELECT COUNT(*) FROM animals", "SELECT COUNT(*) FROM staff", "SELECT name FROM animals WHERE id = ?"):
+      stmt = ibm_db.prepare(conn, sql)
+      ibm_db.free_stmt(stmt)
+    info = ibm_db.stmt_cache_info(conn)
+    print 'Cached:', info['entries'], 'hits:', info['hits'], 'misses:', info['misses']
+
+    # A statement with attributes of its own is not returned to the cache
+    stmt = ibm_db.prepare(conn, "SELECT COUNT(*) FROM staff")
+    ibm_db.set_option(stmt, {ibm_db.SQL_ATTR_ROWCOUNT_PREFETCH : ibm_db.SQL_ROWCOUNT_PREFETCH_ON}, 0)
+    ibm_db.free_stmt(stmt)
+    print 'Cached after set_option:', ibm_db.stmt_cache_info(conn)['entries']
+
+    # DDL empties the cache
+    try:
+      ibm_db.exec_immediate(conn, "DROP TABLE stmt_cache_281")
+    except:
+      pass
+    print 'Cached after DDL:', ibm_db.stmt_cache_info(conn)['entries']
+
+    ibm_db.set_option(conn, {ibm_db.ATTR_STMT_CACHE_SIZE : 0}, 1)
+    stmt = ibm_db.prepare(conn, "SELECT COUNT(*) FROM animals")
+    ibm_db.free_stmt(stmt)
+    info = ibm_db.stmt_cache_info(conn)
+    print 'Disabled:', info['size'], info['entries'], info['misses']
+
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#Pook
+#Peaches
+#Smarty
+#Cached: 1 hits: 2 misses: 1
+#Cached: 2 hits: 2 misses: 4
+#Cached after set_option: 1
+#Cached after DDL: 0
+#Disabled: 0 0 4
+#__ZOS_EXPECTED__
+#Pook
+#Peaches
+#Smarty
+#Cached: 1 hits: 2 misses: 1
+#Cached: 2 hits: 2 misses: 4
+#Cached after set_option: 1
+#Cached after DDL: 0
+#Disabled: 0 0 4
+#__SYSTEMI_EXPECTED__
+#Pook
+#Peaches
+#Smarty
+#Cached: 1 hits: 2 misses: 1
+#Cached: 2 hits: 2 misses: 4
+#Cached after set_option: 1
+#Cached after DDL: 0
+#Disabled: 0 0 4
+#__IDS_EXPECTED__
+#Pook
+#Peaches
+#Smarty
+#Cached: 1 hits: 2 misses: 1
+#Cached: 2 hits: 2 misses: 4
+#Cached after set_option: 1
+#Cached after DDL: 0
+#Disabled: 0 0 4
@@ -0,0 +1,67 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_282_Describe(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_282)
+
+  def run_test_282(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    server = ibm_db.server_info( conn )
+    if (server.DBMS_NAME[0:3] == 'IDS'):
+      op = {ibm_db.ATTR_CASE: ibm_db.CASE_UPPER}
+      ibm_db.set_option(conn, op, 1)
+
+    stmt = ibm_db.exec_immediate(conn, "SELECT id, breed, name, weight FROM animals ORDER BY id")
+    columns = ibm_db.describe(stmt)
+    print len(columns)
+    for i in range(len(columns)):
+      expected = (ibm_db.field_name(stmt, i), ibm_db.field_type(stmt, i),
+                  ibm_db.field_display_size(stmt, i), ibm_db.field_precision(stmt, i),
+                  ibm_db.field_scale(stmt, i), ibm_db.field_nullable(stmt, i))
+      print columns[i][0], columns[i][1], columns[i] == expected
+
+    stmt = ibm_db.exec_immediate(conn, "UPDATE animals SET weight = weight WHERE id = -1")
+    print ibm_db.describe(stmt)
+
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#4
+#ID int True
+#BREED string True
+#NAME string True
+#WEIGHT decimal True
+#None
+#__ZOS_EXPECTED__
+#4
+#ID int True
+#BREED string True
+#NAME string True
+#WEIGHT decimal True
+#None
+#__SYSTEMI_EXPECTED__
+#4
+#ID int True
+#BREED string True
+#NAME string True
+#WEIGHT decimal True
+#None
+#__IDS_EXPECTED__
+#4
+#ID int True
+#BREED string True
+#NAME string True
+#WEIGHT decimal True
+#None
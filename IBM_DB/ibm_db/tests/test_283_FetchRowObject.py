@@ -0,0 +1,84 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, pickle, json
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_283_FetchRowObject(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_283)
+
+  def run_test_283(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    server = ibm_db.server_info( conn )
+    if (server.DBMS_NAME[0:3] == 'IDS'):
+      op = {ibm_db.ATTR_CASE: ibm_db.CASE_UPPER}
+      ibm_db.set_option(conn, op, 1)
+
+    stmt = ibm_db.exec_immediate(conn, "SELECT id, name FROM animals WHERE id < 2 ORDER BY id")
+    first = ibm_db.fetch_assoc(stmt)
+    second = ibm_db.fetch_assoc(stmt)
+    print type(first) is dict, len(first), sorted(first.keys())
+    print first['ID'], first.get('NAME').strip(), first.get('WEIGHT', 'none'), 'ID' in first, 0 in first
+    print sorted(first.keys())[0] is sorted(second.keys())[0]
+    print first == {'ID': 0, 'NAME': first['NAME']}, pickle.loads(pickle.dumps(second)) == second
+    print json.loads(json.dumps(first)) == first
+    try:
+      first[0]
+    except KeyError:
+      print 'No position in fetch_assoc'
+
+    second['ID'] = 10
+    second['EXTRA'] = 'x'
+    print sorted(second.keys()), second['ID']
+
+    stmt = ibm_db.exec_immediate(conn, "SELECT id, name FROM animals WHERE id = 2")
+    both = ibm_db.fetch_both(stmt)
+    print len(both), both[0] == both['ID'], both[1] is both['NAME']
+
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#True 2 ['ID', 'NAME']
+#0 Pook none True False
+#True
+#True True
+#True
+#No position in fetch_assoc
+#['EXTRA', 'ID', 'NAME'] 10
+#4 True True
+#__ZOS_EXPECTED__
+#True 2 ['ID', 'NAME']
+#0 Pook none True False
+#True
+#True True
+#True
+#No position in fetch_assoc
+#['EXTRA', 'ID', 'NAME'] 10
+#4 True True
+#__SYSTEMI_EXPECTED__
+#True 2 ['ID', 'NAME']
+#0 Pook none True False
+#True
+#True True
+#True
+#No position in fetch_assoc
+#['EXTRA', 'ID', 'NAME'] 10
+#4 True True
+#__IDS_EXPECTED__
+#True 2 ['ID', 'NAME']
+#0 Pook none True False
+#True
+#True True
+#True
+#No position in fetch_assoc
+#['EXTRA', 'ID', 'NAME'] 10
+#4 True True
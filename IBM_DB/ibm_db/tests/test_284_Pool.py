@@ -0,0 +1,102 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import ibm_db_dbi
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_284_Pool(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_284)
+
+  def run_test_284(self):
+    pool = ibm_db.Pool(config.database, 1, 2, validate=True, user=config.user, password=config.password)
+    info = pool.info()
+    print 'Idle:', info['idle'], 'in use:', info['in_use']
+
+    conn1 = pool.checkout()
+    conn2 = pool.checkout()
+    print 'Active:', ibm_db.active(conn1), ibm_db.active(conn2)
+    try:
+      pool.checkout()
+    except:
+      print 'Exhausted'
+
+    # Closing a pooled connection returns it to the pool
+    ibm_db.close(conn1)
+    conn3 = pool.checkout()
+    print 'Reused:', conn3 is conn1
+    pool.checkin(conn3)
+    try:
+      pool.checkin(conn3)
+    except:
+      print 'Already checked in'
+    info = pool.info()
+    print 'Idle:', info['idle'], 'in use:', info['in_use'], 'hits:', info['hits'], 'misses:', info['misses']
+
+    # Idle connections above min are disconnected after max_idle seconds
+    pool.checkin(conn2)
+    short = ibm_db.Pool(config.database, 0, 1, 0, user=config.user, password=config.password)
+    conn = short.checkout()
+    short.checkin(conn)
+    info = short.info()
+    print 'Idle:', info['idle'], 'discarded:', info['discarded']
+
+    # A pool brings its own connection arguments
+    try:
+      ibm_db_dbi.connect(config.database, pool=pool)
+    except ibm_db_dbi.InterfaceError:
+      print 'Arguments with a pool rejected'
+
+    pool.close()
+    info = pool.info()
+    print 'Closed idle:', info['idle'], 'discarded:', info['discarded']
+
+#__END__
+#__LUW_EXPECTED__
+#Idle: 1 in use: 0
+#Active: True True
+#Exhausted
+#Reused: True
+#Already checked in
+#Idle: 1 in use: 1 hits: 2 misses: 2
+#Idle: 0 discarded: 1
+#Arguments with a pool rejected
+#Closed idle: 0 discarded: 2
+#__ZOS_EXPECTED__
+#Idle: 1 in use: 0
+#Active: True True
+#Exhausted
+#Reused: True
+#Already checked in
+#Idle: 1 in use: 1 hits: 2 misses: 2
+#Idle: 0 discarded: 1
+#Arguments with a pool rejected
+#Closed idle: 0 discarded: 2
+#__SYSTEMI_EXPECTED__
+#Idle: 1 in use: 0
+#Active: True True
+#Exhausted
+#Reused: True
+#Already checked in
+#Idle: 1 in use: 1 hits: 2 misses: 2
+#Idle: 0 discarded: 1
+#Arguments with a pool rejected
+#Closed idle: 0 discarded: 2
+#__IDS_EXPECTED__
+#Idle: 1 in use: 0
+#Active: True True
+#Exhausted
+#Reused: True
+#Already checked in
+#Idle: 1 in use: 1 hits: 2 misses: 2
+#Idle: 0 discarded: 1
+#Arguments with a pool rejected
+#Closed idle: 0 discarded: 2
@@ -0,0 +1,80 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, os
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_285_AfterFork(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_285)
+
+  def run_test_285(self):
+    conn = ibm_db.pconnect(config.database, config.user, config.password)
+    pool = ibm_db.Pool(config.database, 1, 2, user=config.user, password=config.password)
+
+    # Nothing is inherited in the process that opened the connections
+    print 'Dropped:', ibm_db.after_fork()
+    print 'Active:', ibm_db.active(conn)
+
+    pid = os.fork()
+    if pid == 0:
+      # The child must get connections of its own
+      ibm_db.after_fork()
+      ok = True
+      try:
+        child_conn = ibm_db.pconnect(config.database, config.user, config.password)
+        ok = ok and child_conn is not conn
+        stmt = ibm_db.exec_immediate(child_conn, "SELECT COUNT(*) FROM animals")
+        ok = ok and ibm_db.fetch_tuple(stmt)[0] == 7
+        pooled = pool.checkout()
+        stmt = ibm_db.exec_immediate(pooled, "SELECT COUNT(*) FROM animals")
+        ok = ok and ibm_db.fetch_tuple(stmt)[0] == 7
+        ok = ok and pool.info()['misses'] == 2
+        pool.checkin(pooled)
+      except:
+        ok = False
+      os._exit(ok and 0 or 1)
+    status = os.waitpid(pid, 0)[1]
+    print 'Child:', status == 0
+
+    # The sessions of the parent are left intact
+    stmt = ibm_db.exec_immediate(conn, "SELECT COUNT(*) FROM animals")
+    print 'Count:', ibm_db.fetch_tuple(stmt)[0]
+    pooled = pool.checkout()
+    stmt = ibm_db.exec_immediate(pooled, "SELECT COUNT(*) FROM animals")
+    print 'Count:', ibm_db.fetch_tuple(stmt)[0]
+    pool.checkin(pooled)
+    pool.close()
+
+#__END__
+#__LUW_EXPECTED__
+#Dropped: 0
+#Active: True
+#Child: True
+#Count: 7
+#Count: 7
+#__ZOS_EXPECTED__
+#Dropped: 0
+#Active: True
+#Child: True
+#Count: 7
+#Count: 7
+#__SYSTEMI_EXPECTED__
+#Dropped: 0
+#Active: True
+#Child: True
+#Count: 7
+#Count: 7
+#__IDS_EXPECTED__
+#Dropped: 0
+#Active: True
+#Child: True
+#Count: 7
+#Count: 7
@@ -0,0 +1,81 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_286_QueryTimeout(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_286)
+
+  def run_test_286(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+
+    # The connection setting is given to each of its statements
+    ibm_db.set_option(conn, {ibm_db.SQL_ATTR_QUERY_TIMEOUT: 30}, 1)
+    stmt = ibm_db.exec_immediate(conn, "SELECT COUNT(*) FROM animals")
+    print 'Timeout:', ibm_db.get_option(stmt, ibm_db.SQL_ATTR_QUERY_TIMEOUT, 0)
+    print 'Count:', ibm_db.fetch_tuple(stmt)[0]
+
+    # Statement options override it
+    stmt = ibm_db.prepare(conn, "SELECT name FROM animals WHERE id = ?", {ibm_db.SQL_ATTR_QUERY_TIMEOUT: 5})
+    print 'Timeout:', ibm_db.get_option(stmt, ibm_db.SQL_ATTR_QUERY_TIMEOUT, 0)
+    ibm_db.execute(stmt, (0,))
+    print 'Name:', ibm_db.fetch_tuple(stmt)[0].strip()
+
+    ibm_db.set_option(conn, {ibm_db.SQL_ATTR_QUERY_TIMEOUT: 0}, 1)
+    stmt = ibm_db.exec_immediate(conn, "SELECT COUNT(*) FROM animals")
+    print 'Timeout:', ibm_db.get_option(stmt, ibm_db.SQL_ATTR_QUERY_TIMEOUT, 0)
+
+    # Cancelling a statement that is not running has no effect
+    print 'Cancelled:', ibm_db.cancel(stmt)
+    print 'Count:', ibm_db.fetch_tuple(stmt)[0]
+    ibm_db.free_stmt(stmt)
+    print 'Cancelled:', ibm_db.cancel(stmt)
+
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#Timeout: 30
+#Count: 7
+#Timeout: 5
+#Name: Pook
+#Timeout: 0
+#Cancelled: True
+#Count: 7
+#Cancelled: False
+#__ZOS_EXPECTED__
+#Timeout: 30
+#Count: 7
+#Timeout: 5
+#Name: Pook
+#Timeout: 0
+#Cancelled: True
+#Count: 7
+#Cancelled: False
+#__SYSTEMI_EXPECTED__
+#Timeout: 30
+#Count: 7
+#Timeout: 5
+#Name: Pook
+#Timeout: 0
+#Cancelled: True
+#Count: 7
+#Cancelled: False
+#__IDS_EXPECTED__
+#Timeout: 30
+#Count: 7
+#Timeout: 5
+#Name: Pook
+#Timeout: 0
+#Cancelled: True
+#Count: 7
+#Cancelled: False
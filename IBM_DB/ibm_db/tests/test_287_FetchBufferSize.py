@@ -0,0 +1,97 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import ibm_db_dbi
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_287_FetchBufferSize(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_287)
+
+  def run_test_287(self):
+    # A small buffer fetches the rows in several blocks, 0 one at a time
+    for size in (64, 0):
+      conn = ibm_db.connect(config.database, config.user, config.password, {ibm_db.ATTR_FETCH_BUFFER_SIZE: size})
+      stmt = ibm_db.exec_immediate(conn, "select id, name from animals order by id")
+      rows = ibm_db.fetch_many(stmt, 10)
+      print "Fetched %d rows" % len(rows)
+      print rows[0][1].strip(), rows[6][1].strip()
+      ibm_db.close(conn)
+
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    stmt = ibm_db.prepare(conn, "select id, name from animals order by id", {ibm_db.ATTR_FETCH_BUFFER_SIZE: 1 << 22})
+    ibm_db.execute(stmt)
+    rows = ibm_db.fetch_many(stmt, 10)
+    print "Fetched %d rows" % len(rows)
+    print rows[0][1].strip(), rows[6][1].strip()
+    try:
+      ibm_db.set_option(stmt, {ibm_db.ATTR_FETCH_BUFFER_SIZE: -1}, 0)
+    except:
+      print "Negative size rejected"
+    ibm_db.close(conn)
+
+    dbconn = ibm_db_dbi.connect(config.database, config.user, config.password, fetch_buffer_size=128, rowcount_prefetch=True)
+    cursor = dbconn.cursor()
+    cursor.execute("select id, name from animals order by id")
+    rows = cursor.fetchall()
+    print "Fetched %d rows" % len(rows)
+    print rows[0][1].strip(), rows[6][1].strip()
+    try:
+      ibm_db_dbi.connect(config.database, config.user, config.password, fetch_buffer_size='big')
+    except ibm_db_dbi.InterfaceError:
+      print "Invalid size rejected"
+    dbconn.close()
+
+#__END__
+#__LUW_EXPECTED__
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Negative size rejected
+#Fetched 7 rows
+#Pook Sweater
+#Invalid size rejected
+#__ZOS_EXPECTED__
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Negative size rejected
+#Fetched 7 rows
+#Pook Sweater
+#Invalid size rejected
+#__SYSTEMI_EXPECTED__
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Negative size rejected
+#Fetched 7 rows
+#Pook Sweater
+#Invalid size rejected
+#__IDS_EXPECTED__
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Fetched 7 rows
+#Pook Sweater
+#Negative size rejected
+#Fetched 7 rows
+#Pook Sweater
+#Invalid size rejected
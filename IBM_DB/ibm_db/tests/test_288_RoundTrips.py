@@ -0,0 +1,122 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import ibm_db_dbi
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_288_RoundTrips(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_288)
+
+  def print_round_trips(self, label, handle):
+    trips = ibm_db.round_trips(handle, True)
+    print "%s: prepare %d describe %d execute %d" % (label, trips['prepare'], trips['describe'], trips['execute'])
+
+  def run_test_288(self):
+    conn = ibm_db.connect(config.database, config.user, config.password, {ibm_db.SQL_ATTR_DEFERRED_PREPARE: ibm_db.SQL_DEFERRED_PREPARE_ON})
+
+    # The deferred prepare goes with the execute
+    stmt = ibm_db.prepare(conn, "SELECT id, name FROM animals WHERE id = 0")
+    ibm_db.execute(stmt)
+    print "Columns:", ibm_db.num_fields(stmt)
+    print ibm_db.fetch_tuple(stmt)[1].strip()
+    self.print_round_trips("Deferred", conn)
+
+    # Describing before the execute sends the prepare on its own
+    stmt = ibm_db.prepare(conn, "SELECT id, name FROM animals WHERE id = 1")
+    print "Columns:", ibm_db.num_fields(stmt)
+    ibm_db.execute(stmt)
+    print ibm_db.fetch_tuple(stmt)[1].strip()
+    self.print_round_trips("Described", stmt)
+    self.print_round_trips("Described", conn)
+
+    ibm_db.set_option(conn, {ibm_db.SQL_ATTR_DEFERRED_PREPARE: ibm_db.SQL_DEFERRED_PREPARE_OFF}, 1)
+    stmt = ibm_db.prepare(conn, "SELECT id, name FROM animals WHERE id = 2")
+    ibm_db.execute(stmt)
+    print ibm_db.fetch_tuple(stmt)[1].strip()
+    self.print_round_trips("Not deferred", conn)
+    ibm_db.close(conn)
+
+    dbconn = ibm_db_dbi.connect(config.database, config.user, config.password, deferred_prepare=True)
+    cursor = dbconn.cursor()
+    cursor.execute("SELECT id, name FROM animals WHERE id = 3")
+    print cursor.fetchone()[1].strip()
+    trips = dbconn.round_trips()
+    print "Cursor: prepare %d describe %d execute %d" % (trips['prepare'], trips['describe'], trips['execute'])
+
+    # A failed execute does not leave the previous result set behind
+    try:
+      cursor.execute("SELECT id FROM no_such_table_288")
+    except ibm_db_dbi.Error:
+      print 'Execute failed'
+    try:
+      cursor.fetchone()
+    except ibm_db_dbi.ProgrammingError:
+      print 'No result set'
+    dbconn.close()
+
+#__END__
+#__LUW_EXPECTED__
+#Columns: 2
+#Pook
+#Deferred: prepare 0 describe 0 execute 1
+#Columns: 2
+#Peaches
+#Described: prepare 0 describe 1 execute 1
+#Described: prepare 0 describe 1 execute 1
+#Smarty
+#Not deferred: prepare 1 describe 0 execute 1
+#Bubbles
+#Cursor: prepare 0 describe 0 execute 1
+#Execute failed
+#No result set
+#__ZOS_EXPECTED__
+#Columns: 2
+#Pook
+#Deferred: prepare 0 describe 0 execute 1
+#Columns: 2
+#Peaches
+#Described: prepare 0 describe 1 execute 1
+#Described: prepare 0 describe 1 execute 1
+#Smarty
+#Not deferred: prepare 1 describe 0 execute 1
+#Bubbles
+#Cursor: prepare 0 describe 0 execute 1
+#Execute failed
+#No result set
+#__SYSTEMI_EXPECTED__
+#Columns: 2
+#Pook
+#Deferred: prepare 0 describe 0 execute 1
+#Columns: 2
+#Peaches
+#Described: prepare 0 describe 1 execute 1
+#Described: prepare 0 describe 1 execute 1
+#Smarty
+#Not deferred: prepare 1 describe 0 execute 1
+#Bubbles
+#Cursor: prepare 0 describe 0 execute 1
+#Execute failed
+#No result set
+#__IDS_EXPECTED__
+#Columns: 2
+#Pook
+#Deferred: prepare 0 describe 0 execute 1
+#Columns: 2
+#Peaches
+#Described: prepare 0 describe 1 execute 1
+#Described: prepare 0 describe 1 execute 1
+#Smarty
+#Not deferred: prepare 1 describe 0 execute 1
+#Bubbles
+#Cursor: prepare 0 describe 0 execute 1
+#Execute failed
+#No result set
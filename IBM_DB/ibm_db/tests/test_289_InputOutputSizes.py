@@ -0,0 +1,130 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import ibm_db_dbi
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_289_InputOutputSizes(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_289)
+
+  def run_test_289(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+
+    # The parameter is described on the first execute only
+    stmt = ibm_db.prepare(conn, "SELECT name FROM animals WHERE id = ?")
+    ibm_db.round_trips(stmt, True)
+    ibm_db.execute(stmt, (0,))
+    print ibm_db.fetch_tuple(stmt)[0].strip()
+    ibm_db.execute(stmt, (1,))
+    print ibm_db.fetch_tuple(stmt)[0].strip()
+    print "Described:", ibm_db.round_trips(stmt)['describe']
+
+    # A declared parameter is not described
+    stmt = ibm_db.prepare(conn, "SELECT name FROM animals WHERE id = ?")
+    ibm_db.round_trips(stmt, True)
+    print ibm_db.set_input_sizes(stmt, ((ibm_db.SQL_INTEGER, 10),))
+    ibm_db.execute(stmt, (2,))
+    print ibm_db.fetch_tuple(stmt)[0].strip()
+    print "Declared:", ibm_db.round_trips(stmt)['describe']
+
+    # Values longer than the output size are fetched in full
+    stmt = ibm_db.prepare(conn, "SELECT id, name FROM animals WHERE id < 4 ORDER BY id")
+    print ibm_db.set_output_size(stmt, 4)
+    ibm_db.execute(stmt)
+    row = ibm_db.fetch_tuple(stmt)
+    while (row):
+      print row[0], row[1].strip()
+      row = ibm_db.fetch_tuple(stmt)
+    ibm_db.close(conn)
+
+    dbconn = ibm_db_dbi.connect(config.database, config.user, config.password)
+    cursor = dbconn.cursor()
+    cursor.setinputsizes([ibm_db_dbi.NUMBER])
+    cursor.setoutputsize(2, 0)
+    cursor.execute("SELECT name FROM animals WHERE id = ?", (5,))
+    print cursor.fetchone()[0].strip()
+    print "Cursor:", dbconn.round_trips()['describe']
+    cursor.close()
+
+    # The declaration stays with the cursor, not with the cached statement
+    cursor = dbconn.cursor()
+    dbconn.round_trips(True)
+    cursor.execute("SELECT name FROM animals WHERE id = ?", (4,))
+    print cursor.fetchone()[0].strip()
+    print "Fresh cursor:", dbconn.round_trips()['describe'], ibm_db.stmt_cache_info(dbconn.conn_handler)['hits']
+    dbconn.close()
+
+#__END__
+#__LUW_EXPECTED__
+#Pook
+#Peaches
+#Described: 1
+#True
+#Smarty
+#Declared: 0
+#True
+#0 Pook
+#1 Peaches
+#2 Smarty
+#3 Bubbles
+#Rickety Ride
+#Cursor: 0
+#Gizmo
+#Fresh cursor: 1 1
+#__ZOS_EXPECTED__
+#Pook
+#Peaches
+#Described: 1
+#True
+#Smarty
+#Declared: 0
+#True
+#0 Pook
+#1 Peaches
+#2 Smarty
+#3 Bubbles
+#Rickety Ride
+#Cursor: 0
+#Gizmo
+#Fresh cursor: 1 1
+#__SYSTEMI_EXPECTED__
+#Pook
+#Peaches
+#Described: 1
+#True
+#Smarty
+#Declared: 0
+#True
+#0 Pook
+#1 Peaches
+#2 Smarty
+#3 Bubbles
+#Rickety Ride
+#Cursor: 0
+#Gizmo
+#Fresh cursor: 1 1
+#__IDS_EXPECTED__
+#Pook
+#Peaches
+#Described: 1
+#True
+#Smarty
+#Declared: 0
+#True
+#0 Pook
+#1 Peaches
+#2 Smarty
+#3 Bubbles
+#Rickety Ride
+#Cursor: 0
+#Gizmo
+#Fresh cursor: 1 1
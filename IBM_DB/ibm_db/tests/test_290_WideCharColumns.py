@@ -0,0 +1,61 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_290_WideCharColumns(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_290)
+
+  def run_test_290(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+
+    try:
+      ibm_db.exec_immediate(conn, "DROP TABLE tab_wide")
+    except:
+      pass
+    ibm_db.exec_immediate(conn, "CREATE TABLE tab_wide (id INTEGER, col1 VARCHAR(2000), col2 VARCHAR(2000))")
+    stmt = ibm_db.prepare(conn, "INSERT INTO tab_wide VALUES (?, ?, ?)")
+    ibm_db.execute(stmt, (1, 'short', 'x' * 600))
+    ibm_db.execute(stmt, (2, 'y' * 1500, None))
+    ibm_db.execute(stmt, (3, 'z' * 2000, 'short'))
+
+    # Values longer than the inline buffer are read into the overflow buffer
+    stmt = ibm_db.prepare(conn, "SELECT id, col1, col2 FROM tab_wide ORDER BY id")
+    ibm_db.execute(stmt)
+    row = ibm_db.fetch_tuple(stmt)
+    while (row):
+      if row[2] is None:
+        print row[0], len(row[1]), row[1][-1], None
+      else:
+        print row[0], len(row[1]), row[1][-1], len(row[2]), row[2][-1]
+      row = ibm_db.fetch_tuple(stmt)
+
+    ibm_db.exec_immediate(conn, "DROP TABLE tab_wide")
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#1 5 t 600 x
+#2 1500 y None
+#3 2000 z 5 t
+#__ZOS_EXPECTED__
+#1 5 t 600 x
+#2 1500 y None
+#3 2000 z 5 t
+#__SYSTEMI_EXPECTED__
+#1 5 t 600 x
+#2 1500 y None
+#3 2000 z 5 t
+#__IDS_EXPECTED__
+#1 5 t 600 x
+#2 1500 y None
+#3 2000 z 5 t
@@ -0,0 +1,103 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_291_CharMode(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_291)
+
+  def run_test_291(self):
+    conn = ibm_db.connect(config.database, config.user, config.password, {ibm_db.ATTR_CHAR_MODE: ibm_db.CHAR_UTF8})
+
+    stmt = ibm_db.prepare(conn, "SELECT id, name FROM animals WHERE name = ?")
+    ibm_db.execute(stmt, (u'Peaches',))
+    row = ibm_db.fetch_tuple(stmt)
+    print row[0], row[1].strip(), isinstance(row[1], unicode)
+
+    # The mode of a statement can differ from the one of its connection
+    stmt = ibm_db.prepare(conn, "SELECT name FROM animals WHERE id < 3 ORDER BY id")
+    ibm_db.set_option(stmt, {ibm_db.ATTR_CHAR_MODE: ibm_db.CHAR_BYTES}, 0)
+    ibm_db.execute(stmt)
+    row = ibm_db.fetch_tuple(stmt)
+    while (row):
+      print row[0].strip().decode('utf-8'), isinstance(row[0], bytes)
+      row = ibm_db.fetch_tuple(stmt)
+
+    # 3 and 4 byte UTF-8 characters filling their columns
+    try:
+      ibm_db.exec_immediate(conn, "DROP TABLE char_mode_291")
+    except:
+      pass
+    ibm_db.exec_immediate(conn, "CREATE TABLE char_mode_291 (id INTEGER, g VARGRAPHIC(4), c VARCHAR(12))")
+    values = ((1, u'\u20ac\u20ac\u20ac\u20ac', u'\u20ac\u20ac\u20ac\u20ac'),
+              (2, u'\U0001F600\U0001F600', u'\U0001F600\U0001F600\U0001F600'))
+    stmt = ibm_db.prepare(conn, "INSERT INTO char_mode_291 VALUES (?, ?, ?)")
+    for value in values:
+      ibm_db.execute(stmt, value)
+    for output_size in (0, 1):
+      stmt = ibm_db.prepare(conn, "SELECT id, g, c FROM char_mode_291 ORDER BY id")
+      if output_size:
+        ibm_db.set_output_size(stmt, output_size)
+      ibm_db.execute(stmt)
+      row = ibm_db.fetch_tuple(stmt)
+      while (row):
+        print row[0], row == values[row[0] - 1]
+        row = ibm_db.fetch_tuple(stmt)
+    ibm_db.exec_immediate(conn, "DROP TABLE char_mode_291")
+
+    try:
+      ibm_db.set_option(conn, {ibm_db.ATTR_CHAR_MODE: 5}, 1)
+    except Exception, e:
+      print "Error:", e
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#1 Peaches True
+#Pook True
+#Peaches True
+#Smarty True
+#1 True
+#2 True
+#1 True
+#2 True
+#Error: ATTR_CHAR_MODE attribute must be one of CHAR_WCHAR, CHAR_UTF8, or CHAR_BYTES
+#__ZOS_EXPECTED__
+#1 Peaches True
+#Pook True
+#Peaches True
+#Smarty True
+#1 True
+#2 True
+#1 True
+#2 True
+#Error: ATTR_CHAR_MODE attribute must be one of CHAR_WCHAR, CHAR_UTF8, or CHAR_BYTES
+#__SYSTEMI_EXPECTED__
+#1 Peaches True
+#Pook True
+#Peaches True
+#Smarty True
+#1 True
+#2 True
+#1 True
+#2 True
+#Error: ATTR_CHAR_MODE attribute must be one of CHAR_WCHAR, CHAR_UTF8, or CHAR_BYTES
+#__IDS_EXPECTED__
+#1 Peaches True
+#Pook True
+#Peaches True
+#Smarty True
+#1 True
+#2 True
+#1 True
+#2 True
+#Error: ATTR_CHAR_MODE attribute must be one of CHAR_WCHAR, CHAR_UTF8, or CHAR_BYTES
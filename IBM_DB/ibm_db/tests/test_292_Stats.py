@@ -0,0 +1,88 @@
+# 
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_292_Stats(self):
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_292)
+
+  def run_test_292(self):
+    conn = ibm_db.connect(config.database, config.user, config.password)
+    ibm_db.autocommit(conn, ibm_db.SQL_AUTOCOMMIT_OFF)
+    ibm_db.stats(conn, True)
+
+    # Three rows, then the fetch finding no more
+    stmt = ibm_db.prepare(conn, "SELECT id FROM animals WHERE id < 3 ORDER BY id")
+    ibm_db.execute(stmt)
+    row = ibm_db.fetch_tuple(stmt)
+    while (row):
+      row = ibm_db.fetch_tuple(stmt)
+    stats = ibm_db.stats(stmt)
+    print "Prepare:", stats['prepare']
+    print "Execute:", stats['execute']
+    print "Fetch:", stats['fetch']
+    print "Rows fetched:", stats['rows_fetched']
+    total = stats['prepare_time'] + stats['execute_time'] + stats['fetch_time']
+    print "Released:", 0 <= stats['gil_released_time'] <= total
+
+    stmt = ibm_db.exec_immediate(conn, "UPDATE animals SET name = 'flyweight' WHERE weight < 10.0")
+    stats = ibm_db.stats(conn)
+    print "Connection execute:", stats['execute']
+    print "Rows affected:", stats['rows_affected']
+    ibm_db.rollback(conn)
+
+    print "Process:", ibm_db.stats()['execute'] >= stats['execute']
+    ibm_db.stats(conn, True)
+    print "Reset:", ibm_db.stats(conn)['execute']
+    ibm_db.close(conn)
+
+#__END__
+#__LUW_EXPECTED__
+#Prepare: 1
+#Execute: 1
+#Fetch: 4
+#Rows fetched: 3
+#Released: True
+#Connection execute: 2
+#Rows affected: 4
+#Process: True
+#Reset: 0
+#__ZOS_EXPECTED__
+#Prepare: 1
+#Execute: 1
+#Fetch: 4
+#Rows fetched: 3
+#Released: True
+#Connection execute: 2
+#Rows affected: 4
+#Process: True
+#Reset: 0
+#__SYSTEMI_EXPECTED__
+#Prepare: 1
+#Execute: 1
+#Fetch: 4
+#Rows fetched: 3
+#Released: True
+#Connection execute: 2
+#Rows affected: 4
+#Process: True
+#Reset: 0
+#__IDS_EXPECTED__
+#Prepare: 1
+#Execute: 1
+#Fetch: 4
+#Rows fetched: 3
+#Released: True
+#Connection execute: 2
+#Rows affected: 4
+#Process: True
+#Reset: 0
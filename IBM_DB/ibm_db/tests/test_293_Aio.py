@@ -0,0 +1,131 @@
+#
+#  Licensed Materials - Property of IBM
+#
+#  (c) Copyright IBM Corp. 2007-2008
+#
+
+import unittest, sys, threading
+import ibm_db
+import config
+from testfunctions import IbmDbTestFunctions
+
+class HeldCursor(object):
+  # Wraps an ibm_db_dbi cursor whose execute waits until released, like a
+  # statement still running on the server.
+  def __init__(self, dbi_cursor):
+    self.dbi_cursor = dbi_cursor
+    self.released = threading.Event()
+    self.events = []
+
+  def execute(self, operation, parameters=None):
+    self.released.wait(10)
+    self.events.append('execute returned')
+    return self.dbi_cursor.execute(operation, parameters)
+
+  def cancel(self):
+    self.events.append('cancel issued')
+    return self.dbi_cursor.cancel()
+
+class IbmDbTestCase(unittest.TestCase):
+
+  def test_293_Aio(self):
+    if sys.version_info < (3, 5):
+      raise unittest.SkipTest("ibm_db_aio requires Python 3.5")
+    obj = IbmDbTestFunctions()
+    obj.assert_expect(self.run_test_293)
+
+  def run_test_293(self):
+    import asyncio
+    import ibm_db_aio
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    run = loop.run_until_complete
+
+    conn = run(ibm_db_aio.connect(config.database, config.user, config.password))
+
+    # Iterating over the cursor fetches arraysize rows at a time
+    cursor = conn.cursor()
+    cursor.arraysize = 3
+    run(cursor.execute("SELECT id FROM animals ORDER BY id"))
+    ids = []
+    while True:
+      try:
+        row = run(cursor.__anext__())
+      except StopAsyncIteration:
+        break
+      ids.append(row[0])
+    print "Iterated:", ids
+
+    # Cancelling the awaiting task cancels the statement, and the connection
+    # stays locked until the executor thread returns
+    held = conn.cursor()
+    held.dbi_cursor = HeldCursor(held.dbi_cursor)
+    task = loop.create_task(held.execute("SELECT id FROM animals WHERE id = 0"))
+    run(asyncio.sleep(0.2))
+    task.cancel()
+    try:
+      run(task)
+    except asyncio.CancelledError:
+      print "Task cancelled"
+    following = loop.create_task(cursor.execute("SELECT count(*) FROM animals"))
+    run(asyncio.sleep(0.2))
+    print "Events:", held.dbi_cursor.events
+    print "Locked:", conn._lock.locked(), following.done()
+    held.dbi_cursor.released.set()
+    run(following)
+    print "Events:", held.dbi_cursor.events
+    print "Count:", run(cursor.fetchone())[0]
+    run(conn.close())
+
+    # acquire() waits for a connection of a full pool to be released
+    pool = run(ibm_db_aio.create_pool(config.database, config.user, config.password, min=1, max=1))
+    first = run(pool.acquire())
+    second = asyncio.ensure_future(pool.acquire())
+    run(asyncio.sleep(0.2))
+    print "Waiting:", not second.done()
+    run(pool.release(first))
+    second = run(second)
+    print "Acquired:", second.conn_handler is not None
+    run(pool.release(second))
+
+    loop.close()
+    asyncio.set_event_loop(None)
+
+#__END__
+#__LUW_EXPECTED__
+#Iterated: [0, 1, 2, 3, 4, 5, 6]
+#Task cancelled
+#Events: ['cancel issued']
+#Locked: True False
+#Events: ['cancel issued', 'execute returned']
+#Count: 7
+#Waiting: True
+#Acquired: True
+#__ZOS_EXPECTED__
+#Iterated: [0, 1, 2, 3, 4, 5, 6]
+#Task cancelled
+#Events: ['cancel issued']
+#Locked: True False
+#Events: ['cancel issued', 'execute returned']
+#Count: 7
+#Waiting: True
+#Acquired: True
+#__SYSTEMI_EXPECTED__
+#Iterated: [0, 1, 2, 3, 4, 5, 6]
+#Task cancelled
+#Events: ['cancel issued']
+#Locked: True False
+#Events: ['cancel issued', 'execute returned']
+#Count: 7
+#Waiting: True
+#Acquired: True
+#__IDS_EXPECTED__
+#Iterated: [0, 1, 2, 3, 4, 5, 6]
+#Task cancelled
+#Events: ['cancel issued']
+#Locked: True False
+#Events: ['cancel issued', 'execute returned']
+#Count: 7
+#Waiting: True
+#Acquired: True